@@ -12,35 +12,280 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from google.cloud import bigquery
-from datetime import datetime
+"""Benchmark the BigQuery client against a local fake of the API.
+
+Each scenario runs in its own process, against synthetic tables served by
+:mod:`fake_bigquery` from another process, so the results are reproducible
+without a project or network access. The results are written as JSON, to
+track regressions across releases.
+
+Usage: ``python benchmark.py [--rows N] [--output results.json]``
+"""
+
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import datetime
 import json
+import multiprocessing
+import platform
 import sys
+import time
+
+try:
+    import resource
+except ImportError:  # pragma: NO COVER
+    resource = None
+
+from google.auth.credentials import AnonymousCredentials
+import requests
+import requests.adapters
+
+from google.cloud import bigquery
+from google.cloud.bigquery import _helpers
+
+import fake_bigquery
+
+
+PROJECT = 'benchmark-project'
+_GOOGLEAPIS = 'https://www.googleapis.com'
+
+# Types which ``DataFrame.to_parquet`` can write from Python values.
+_PARQUET_TYPES = ('INTEGER', 'FLOAT', 'BOOLEAN', 'STRING', 'TIMESTAMP')
 
-if len(sys.argv) < 2:
-    raise Exception('need query file, usage: python {0} <queries.json>'.format(sys.argv[0]))
 
-with open(sys.argv[1], 'r') as f:
-    queries = json.loads(f.read())
+class _LocalAdapter(requests.adapters.HTTPAdapter):
+    """Send requests for the Google APIs host to the fake server instead."""
 
-client = bigquery.Client()
+    def __init__(self, base_url):
+        super(_LocalAdapter, self).__init__()
+        self._base_url = base_url
 
-for query in queries:
-    start_time = datetime.now()
-    job = client.query(query)
-    rows = job.result()
+    def send(self, request, **kwargs):
+        request.url = self._base_url + request.url[len(_GOOGLEAPIS):]
+        return super(_LocalAdapter, self).send(request, **kwargs)
 
+
+def _make_client(base_url):
+    session = requests.Session()
+    session.mount(_GOOGLEAPIS, _LocalAdapter(base_url))
+    return bigquery.Client(
+        project=PROJECT, credentials=AnonymousCredentials(), _http=session)
+
+
+def _table(client, table_id):
+    table_ref = client.dataset(fake_bigquery.DATASET_ID).table(table_id)
+    return bigquery.Table(table_ref, schema=fake_bigquery.SCHEMAS[table_id])
+
+
+def _python_rows(schema, num_rows):
+    """Build ``num_rows`` rows of native values for ``schema``."""
+    json_rows = [fake_bigquery.make_json_row(schema, index)
+                 for index in range(num_rows)]
+    return [row.values() for row in _helpers._rows_from_json(
+        json_rows, schema)]
+
+
+def _iterate(rows):
+    """Consume an iterator of rows, timing the first row."""
+    start = time.time()
+    time_to_first_row = None
     num_rows = 0
-    num_cols = None
-    first_byte_time = None
-
-    for row in rows:
-        if num_rows == 0:
-            num_cols = len(row)
-            first_byte_time = datetime.now() - start_time
-        elif num_cols != len(row):
-            raise Exception('found {0} columsn, expected {1}'.format(len(row), num_cols))
+    for _ in rows:
+        if time_to_first_row is None:
+            time_to_first_row = time.time() - start
         num_rows += 1
-    total_time = datetime.now() - start_time
-    print "query {0}: {1} rows, {2} cols, first byte {3} sec, total {4} sec"\
-        .format(query, num_rows, num_cols, first_byte_time.total_seconds(), total_time.total_seconds())
+    return num_rows, time_to_first_row
+
+
+def bench_list_rows(client, table_id, args):
+    rows = client.list_rows(
+        _table(client, table_id), page_size=args.page_size,
+        prefetch_pages=args.prefetch_pages)
+    return _iterate(rows)
+
+
+def bench_query(client, table_id, args):
+    job = client.query('SELECT * FROM `{}.{}`'.format(
+        fake_bigquery.DATASET_ID, table_id))
+    return _iterate(job.result(prefetch_pages=args.prefetch_pages))
+
+
+def bench_to_dataframe(client, table_id, args):
+    rows = client.list_rows(
+        _table(client, table_id), page_size=args.page_size,
+        prefetch_pages=args.prefetch_pages)
+    return len(rows.to_dataframe()), None
+
+
+def bench_insert_rows(client, table_id, args):
+    table = _table(client, table_id)
+    rows = _python_rows(table.schema, args.rows)
+    start = time.time()
+    for batch_start in range(0, len(rows), args.insert_batch_size):
+        batch = rows[batch_start:batch_start + args.insert_batch_size]
+        errors = client.insert_rows(table, batch)
+        assert not errors, errors
+    # Do not count building the rows.
+    return len(rows), None, time.time() - start
+
+
+def bench_load_table_from_dataframe(client, table_id, args):
+    import pandas
+
+    schema = [field for field in fake_bigquery.SCHEMAS[table_id]
+              if field.mode != 'REPEATED' and
+              field.field_type in _PARQUET_TYPES]
+    dataframe = pandas.DataFrame.from_records(
+        _python_rows(schema, args.rows),
+        columns=[field.name for field in schema])
+    start = time.time()
+    job = client.load_table_from_dataframe(
+        dataframe, client.dataset(fake_bigquery.DATASET_ID).table(table_id))
+    job.result()
+    return len(dataframe), None, time.time() - start
+
+
+SCENARIOS = (
+    ('list_rows', bench_list_rows, ('wide', 'deep')),
+    ('query', bench_query, ('wide', 'deep')),
+    ('to_dataframe', bench_to_dataframe, ('wide', 'deep')),
+    # insert_rows does not convert the values nested in RECORD fields.
+    ('insert_rows', bench_insert_rows, ('wide',)),
+    ('load_table_from_dataframe', bench_load_table_from_dataframe,
+     ('wide',)),
+)
+"""Tuple[Tuple[str, Callable, Tuple[str]]]: Scenario names, functions and
+the tables they run against."""
+
+
+def _peak_rss_bytes():
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    if sys.platform == 'darwin':
+        return max_rss
+    return max_rss * 1024
+
+
+def _run_scenario(function, table_id, base_url, args, results):
+    """Run one scenario and put its measurements on ``results``."""
+    client = _make_client(base_url)
+    try:
+        start = time.time()
+        outcome = function(client, table_id, args)
+        seconds = time.time() - start
+        if len(outcome) == 3:
+            num_rows, time_to_first_row, seconds = outcome
+        else:
+            num_rows, time_to_first_row = outcome
+    except Exception as exc:  # Report the failure, run the other scenarios.
+        results.put({'error': '{}: {}'.format(type(exc).__name__, exc)})
+        return
+    results.put({
+        'rows': num_rows,
+        'seconds': seconds,
+        'rows_per_second': num_rows / seconds if seconds else None,
+        'time_to_first_row': time_to_first_row,
+        'peak_rss_bytes': _peak_rss_bytes(),
+    })
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--rows', type=int, default=20000,
+        help='rows in each synthetic table')
+    parser.add_argument(
+        '--page-size', type=int, default=None,
+        help='rows per tabledata.list page (default: server limit)')
+    parser.add_argument(
+        '--max-page-rows', type=int, default=5000,
+        help='the most rows the fake server returns per page')
+    parser.add_argument(
+        '--prefetch-pages', type=int, default=None,
+        help='pages to read ahead when listing rows')
+    parser.add_argument(
+        '--insert-batch-size', type=int, default=500,
+        help='rows per insert_rows call')
+    parser.add_argument(
+        '--scenario', action='append', dest='scenarios',
+        choices=[name for name, _, _ in SCENARIOS],
+        help='scenario to run, may be repeated (default: all)')
+    parser.add_argument(
+        '--output', default=None,
+        help='file to write the JSON results to (default: stdout)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    addresses = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=fake_bigquery.serve,
+        args=(PROJECT, args.rows, args.max_page_rows, addresses))
+    server.daemon = True
+    server.start()
+    base_url = 'http://{}:{}'.format(*addresses.get(timeout=30))
+
+    results = []
+    try:
+        for name, function, table_ids in SCENARIOS:
+            if args.scenarios and name not in args.scenarios:
+                continue
+            for table_id in table_ids:
+                queue = multiprocessing.Queue()
+                worker = multiprocessing.Process(
+                    target=_run_scenario,
+                    args=(function, table_id, base_url, args, queue))
+                worker.start()
+                result = queue.get()
+                worker.join()
+
+                result.update({'scenario': name, 'table': table_id})
+                results.append(result)
+                print('{scenario:<26} {table:<5} {summary}'.format(
+                    summary=_summarize(result), **result), file=sys.stderr)
+    finally:
+        server.terminate()
+
+    report = {
+        'library': 'google-cloud-bigquery',
+        'version': bigquery.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': datetime.datetime.utcnow().isoformat() + 'Z',
+        'parameters': {
+            'rows': args.rows,
+            'page_size': args.page_size,
+            'max_page_rows': args.max_page_rows,
+            'prefetch_pages': args.prefetch_pages,
+            'insert_batch_size': args.insert_batch_size,
+        },
+        'results': results,
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+    else:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+
+
+def _summarize(result):
+    if 'error' in result:
+        return 'FAILED {}'.format(result['error'])
+    summary = '{rows_per_second:>12,.0f} rows/s'.format(**result)
+    if result['time_to_first_row'] is not None:
+        summary += '  first row {:.3f} s'.format(result['time_to_first_row'])
+    if result['peak_rss_bytes'] is not None:
+        summary += '  peak RSS {:,.0f} MiB'.format(
+            result['peak_rss_bytes'] / (1024 * 1024))
+    return summary
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,389 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A local, in-memory stand-in for the parts of the BigQuery API used by the
+benchmarks.
+
+Serves synthetic tables from ``tabledata.list``, completes every job
+immediately, answers ``jobs.getQueryResults`` and accepts ``insertAll`` and
+resumable or multipart load uploads (discarding the data).
+
+The tables live in the ``benchmark`` dataset of any project. Each schema in
+:data:`SCHEMAS` is a table of the same name, e.g. ``benchmark.wide``. A query
+reads the table whose name appears in its SQL.
+"""
+
+from __future__ import print_function
+
+import base64
+import itertools
+import json
+import re
+import threading
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib.parse import parse_qs
+from six.moves.urllib.parse import urlparse
+
+from google.cloud.bigquery.schema import SchemaField
+
+
+DATASET_ID = 'benchmark'
+
+_REPEATED_LENGTH = 3
+_SCALAR_TYPES = (
+    'INTEGER', 'FLOAT', 'NUMERIC', 'BOOLEAN', 'STRING', 'BYTES',
+    'TIMESTAMP', 'DATE', 'DATETIME', 'TIME',
+)
+
+
+def _wide_schema(num_columns=100):
+    """A flat schema of nullable scalar columns of every type."""
+    return [
+        SchemaField('{}_{}'.format(field_type.lower(), index), field_type)
+        for index, field_type in zip(
+            range(num_columns), itertools.cycle(_SCALAR_TYPES))
+    ]
+
+
+def _deep_schema(depth=4):
+    """A schema of records nested ``depth`` levels deep, with arrays."""
+    fields = [
+        SchemaField('id', 'INTEGER', mode='REQUIRED'),
+        SchemaField('name', 'STRING'),
+        SchemaField('tags', 'STRING', mode='REPEATED'),
+    ]
+    for level in range(depth):
+        fields = [
+            SchemaField('id', 'INTEGER', mode='REQUIRED'),
+            SchemaField('score', 'FLOAT'),
+            SchemaField('created', 'TIMESTAMP'),
+            SchemaField(
+                'child_{}'.format(level), 'RECORD', fields=fields),
+            SchemaField(
+                'items_{}'.format(level), 'RECORD', mode='REPEATED',
+                fields=fields[:2]),
+        ]
+    return fields
+
+
+SCHEMAS = {
+    'wide': _wide_schema(),
+    'deep': _deep_schema(),
+}
+"""Dict[str, List[SchemaField]]: The schemas of the synthetic tables."""
+
+
+def _scalar_cell(field_type, index):
+    """The JSON value of a scalar cell of row ``index``."""
+    if field_type in ('INTEGER', 'INT64'):
+        return str(index)
+    if field_type in ('FLOAT', 'FLOAT64'):
+        return str(index * 0.25)
+    if field_type == 'NUMERIC':
+        return '{}.125'.format(index)
+    if field_type in ('BOOLEAN', 'BOOL'):
+        return 'true' if index % 2 else 'false'
+    if field_type == 'STRING':
+        return 'value-{}'.format(index)
+    if field_type == 'BYTES':
+        return base64.standard_b64encode(
+            'bytes-{}'.format(index).encode('ascii')).decode('ascii')
+    if field_type == 'TIMESTAMP':
+        return '{}.5'.format(1500000000 + index)
+    if field_type == 'DATE':
+        return '2018-01-{:02d}'.format(index % 28 + 1)
+    if field_type == 'DATETIME':
+        return '2018-01-{:02d}T12:30:00.250000'.format(index % 28 + 1)
+    if field_type == 'TIME':
+        return '12:{:02d}:00'.format(index % 60)
+    raise ValueError('Unsupported field type: {}'.format(field_type))
+
+
+def _cell(field, index):
+    """The JSON value of a cell of row ``index``."""
+    if field.mode == 'REPEATED':
+        return [{'v': _single_cell(field, index + offset)}
+                for offset in range(_REPEATED_LENGTH)]
+    if field.mode == 'NULLABLE' and index % 10 == 9:
+        return None
+    return _single_cell(field, index)
+
+
+def _single_cell(field, index):
+    if field.field_type == 'RECORD':
+        return {'f': [{'v': _cell(subfield, index)}
+                      for subfield in field.fields]}
+    return _scalar_cell(field.field_type, index)
+
+
+def make_json_row(schema, index):
+    """Build row ``index`` of a synthetic table, as ``tabledata.list``."""
+    return {'f': [{'v': _cell(field, index)} for field in schema]}
+
+
+class _FakeBigQuery(object):
+    """The state of the fake API, shared by the request handlers."""
+
+    def __init__(self, project, num_rows, max_page_rows):
+        self.project = project
+        self.num_rows = num_rows
+        self.max_page_rows = max_page_rows
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._job_ids = itertools.count()
+        self._uploads = {}
+        self._upload_ids = itertools.count()
+        # Encode the rows up front, so that serving a page costs about the
+        # same whether or not it was requested before.
+        self._encoded_rows = {
+            table_id: [json.dumps(make_json_row(schema, index)).encode('utf-8')
+                       for index in range(num_rows)]
+            for table_id, schema in SCHEMAS.items()
+        }
+
+    def table_resource(self, table_id):
+        return {
+            'projectId': self.project,
+            'datasetId': DATASET_ID,
+            'tableId': table_id,
+        }
+
+    def list_rows(self, table_id, params):
+        """Build a ``tabledata.list`` response."""
+        if 'pageToken' in params:
+            start = int(params['pageToken'])
+        else:
+            start = int(params.get('startIndex', 0))
+        page_rows = self.max_page_rows
+        if 'maxResults' in params:
+            page_rows = min(page_rows, int(params['maxResults']))
+        stop = min(self.num_rows, start + page_rows)
+
+        page_token = b''
+        if stop < self.num_rows:
+            page_token = ', "pageToken": "{}"'.format(stop).encode('ascii')
+        return b''.join([
+            b'{"kind": "bigquery#tableDataList", ',
+            '"totalRows": "{}", "rows": ['.format(
+                self.num_rows).encode('ascii'),
+            b', '.join(self._encoded_rows[table_id][start:stop]),
+            b']',
+            page_token,
+            b'}',
+        ])
+
+    def insert_job(self, resource):
+        """Store a job, which completes immediately."""
+        resource = dict(resource)
+        reference = dict(resource.get('jobReference') or {})
+        reference.setdefault('projectId', self.project)
+        if not reference.get('jobId'):
+            reference['jobId'] = 'job-{}'.format(next(self._job_ids))
+        resource['jobReference'] = reference
+        resource['id'] = '{}:{}'.format(reference['projectId'],
+                                        reference['jobId'])
+        resource['status'] = {'state': 'DONE'}
+
+        configuration = resource.setdefault('configuration', {})
+        query = configuration.get('query')
+        if query is not None:
+            table_id = _table_in_query(query.get('query', ''))
+            query['destinationTable'] = self.table_resource(table_id)
+            resource['statistics'] = {'query': {
+                'totalBytesProcessed': '0'}}
+
+        with self._lock:
+            self._jobs[reference['jobId']] = resource
+        return resource
+
+    def get_job(self, job_id):
+        with self._lock:
+            return self._jobs[job_id]
+
+    def query_results(self, job_id):
+        """Build a ``jobs.getQueryResults`` response, without rows."""
+        job = self.get_job(job_id)
+        query = job['configuration']['query']
+        table_id = query['destinationTable']['tableId']
+        return {
+            'kind': 'bigquery#getQueryResultsResponse',
+            'jobReference': job['jobReference'],
+            'jobComplete': True,
+            'totalRows': str(self.num_rows),
+            'schema': {'fields': [
+                field.to_api_repr() for field in SCHEMAS[table_id]]},
+        }
+
+    def start_upload(self, metadata):
+        upload_id = str(next(self._upload_ids))
+        with self._lock:
+            self._uploads[upload_id] = metadata
+        return upload_id
+
+    def finish_upload(self, upload_id):
+        with self._lock:
+            metadata = self._uploads.pop(upload_id)
+        return self.insert_job(metadata)
+
+
+def _table_in_query(sql):
+    for table_id in SCHEMAS:
+        if re.search(r'\b{}\b'.format(table_id), sql):
+            return table_id
+    raise ValueError('Query does not read a benchmark table: {}'.format(sql))
+
+
+_TABLE_DATA_PATH = re.compile(
+    r'^/bigquery/v2/projects/[^/]+/datasets/[^/]+/tables/([^/]+)/data$')
+_INSERT_ALL_PATH = re.compile(
+    r'^/bigquery/v2/projects/[^/]+/datasets/[^/]+/tables/[^/]+/insertAll$')
+_JOBS_PATH = re.compile(r'^/bigquery/v2/projects/[^/]+/jobs$')
+_JOB_PATH = re.compile(r'^/bigquery/v2/projects/[^/]+/jobs/([^/]+)$')
+_QUERY_RESULTS_PATH = re.compile(
+    r'^/bigquery/v2/projects/[^/]+/queries/([^/]+)$')
+_UPLOAD_PATH = re.compile(r'^/upload/bigquery/v2/projects/[^/]+/jobs$')
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Route requests to the :class:`_FakeBigQuery` of the server."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def api(self):
+        return self.server.api
+
+    def _parse(self):
+        url = urlparse(self.path)
+        params = {key: values[-1]
+                  for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get('content-length') or 0)
+        body = self.rfile.read(length) if length else b''
+        return url.path, params, body
+
+    def _send(self, status, body=b'', headers=None):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path, params, _ = self._parse()
+        match = _TABLE_DATA_PATH.match(path)
+        if match:
+            return self._send(200, self.api.list_rows(match.group(1), params))
+        match = _QUERY_RESULTS_PATH.match(path)
+        if match:
+            return self._send(200, self.api.query_results(match.group(1)))
+        match = _JOB_PATH.match(path)
+        if match:
+            return self._send(200, self.api.get_job(match.group(1)))
+        self._send(404, {'error': {'message': 'Not found: ' + path}})
+
+    def do_POST(self):
+        path, params, body = self._parse()
+        if _INSERT_ALL_PATH.match(path):
+            return self._send(
+                200, {'kind': 'bigquery#tableDataInsertAllResponse'})
+        if _JOBS_PATH.match(path):
+            return self._send(
+                200, self.api.insert_job(json.loads(body.decode('utf-8'))))
+        if _UPLOAD_PATH.match(path):
+            if params.get('uploadType') == 'multipart':
+                metadata = _multipart_metadata(body)
+                return self._send(200, self.api.insert_job(metadata))
+            upload_id = self.api.start_upload(
+                json.loads(body.decode('utf-8')))
+            location = 'http://{}:{}{}?uploadType=resumable&upload_id={}'
+            location = location.format(
+                self.server.server_address[0], self.server.server_address[1],
+                path, upload_id)
+            return self._send(200, headers={'Location': location})
+        self._send(404, {'error': {'message': 'Not found: ' + path}})
+
+    def do_PUT(self):
+        path, params, body = self._parse()
+        if not _UPLOAD_PATH.match(path) or 'upload_id' not in params:
+            return self._send(404, {'error': {'message': 'Not found'}})
+        # Content-Range is "bytes START-END/TOTAL", where TOTAL is "*" until
+        # the final chunk, or "bytes */TOTAL" for an empty final chunk.
+        content_range = self.headers.get('content-range', '')
+        byte_range, _, total = content_range.partition(' ')[2].partition('/')
+        if total == '*':
+            end = byte_range.partition('-')[2]
+            return self._send(308, headers={'Range': 'bytes=0-' + end})
+        job = self.api.finish_upload(params['upload_id'])
+        self._send(200, job)
+
+
+def _multipart_metadata(body):
+    """Extract the JSON metadata part of a multipart upload body."""
+    start = body.index(b'{')
+    end = body.index(b'\r\n--', start)
+    return json.loads(body[start:end].decode('utf-8'))
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def make_server(project, num_rows, max_page_rows=10000,
+                host='127.0.0.1', port=0):
+    """Create the fake API server.
+
+    Args:
+        project (str): The project of the jobs and tables.
+        num_rows (int): The number of rows of each synthetic table.
+        max_page_rows (int):
+            The most rows returned in a ``tabledata.list`` page.
+        host (str): The interface to listen on.
+        port (int): The port to listen on, or 0 to pick an unused port.
+
+    Returns:
+        BaseHTTPServer.HTTPServer:
+            The server. Call ``serve_forever()`` to handle requests. Its base
+            URL is ``http://{server_address[0]}:{server_address[1]}``.
+    """
+    server = _Server((host, port), _Handler)
+    server.api = _FakeBigQuery(project, num_rows, max_page_rows)
+    return server
+
+
+def serve(project, num_rows, max_page_rows, address_queue):
+    """Run the server until the process is terminated.
+
+    Intended as the target of a :class:`multiprocessing.Process`, so that the
+    server does not compete with the benchmarked code for the GIL.
+
+    Args:
+        project (str): The project of the jobs and tables.
+        num_rows (int): The number of rows of each synthetic table.
+        max_page_rows (int):
+            The most rows returned in a ``tabledata.list`` page.
+        address_queue (multiprocessing.Queue):
+            Receives the ``(host, port)`` of the server once it listens.
+    """
+    server = make_server(project, num_rows, max_page_rows=max_page_rows)
+    address_queue.put(server.server_address)
+    server.serve_forever()
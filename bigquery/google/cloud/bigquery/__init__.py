@@ -59,12 +59,15 @@ from google.cloud.bigquery.job import SchemaUpdateOption
 from google.cloud.bigquery.job import SourceFormat
 from google.cloud.bigquery.job import UnknownJob
 from google.cloud.bigquery.job import WriteDisposition
+from google.cloud.bigquery.job_waiter import JobWaiter
 from google.cloud.bigquery.query import ArrayQueryParameter
 from google.cloud.bigquery.query import ScalarQueryParameter
 from google.cloud.bigquery.query import StructQueryParameter
 from google.cloud.bigquery.query import UDFResource
+from google.cloud.bigquery.query_cache import QueryCache
 from google.cloud.bigquery.retry import DEFAULT_RETRY
 from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.streaming import StreamingInserter
 from google.cloud.bigquery.table import EncryptionConfiguration
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TableReference
@@ -81,6 +84,7 @@ __all__ = [
     'ArrayQueryParameter',
     'ScalarQueryParameter',
     'StructQueryParameter',
+    'QueryCache',
     # Datasets
     'Dataset',
     'DatasetReference',
@@ -90,6 +94,7 @@ __all__ = [
     'Table',
     'TableReference',
     'Row',
+    'StreamingInserter',
     'CopyJob',
     'CopyJobConfig',
     'ExtractJob',
@@ -97,6 +102,7 @@ __all__ = [
     'LoadJob',
     'LoadJobConfig',
     'UnknownJob',
+    'JobWaiter',
     'TimePartitioningType',
     'TimePartitioning',
     # Shared helpers
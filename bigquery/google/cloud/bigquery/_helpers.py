@@ -15,8 +15,10 @@
 """Shared helper functions for BigQuery API classes."""
 
 import base64
+import collections
 import datetime
 import decimal
+import threading
 
 from google.cloud._helpers import UTC
 from google.cloud._helpers import _date_from_iso8601_date
@@ -182,11 +184,156 @@ _QUERY_PARAMS_FROM_JSON = dict(_CELLDATA_FROM_JSON)
 _QUERY_PARAMS_FROM_JSON['TIMESTAMP'] = _timestamp_query_param_from_json
 
 
+# Converters for non-null cells which need no other information from the
+# field. Used to skip the per-cell null check of ``_CELLDATA_FROM_JSON`` when
+# compiling a schema.
+_NOT_NULL_CELLDATA_FROM_JSON = {
+    'INTEGER': int,
+    'INT64': int,
+    'FLOAT': float,
+    'FLOAT64': float,
+    'NUMERIC': decimal.Decimal,
+    'TIMESTAMP': lambda value: _datetime_from_microseconds(1e6 * float(value)),
+    'DATE': _date_from_iso8601_date,
+    'TIME': _time_from_iso8601_time_naive,
+}
+
+_SCHEMA_CACHE_SIZE = 128
+"""int: The number of compiled schemas kept by :func:`_compile_schema`."""
+
+_schema_cache = collections.OrderedDict()
+_schema_cache_lock = threading.Lock()
+
+_CompiledSchema = collections.namedtuple(
+    '_CompiledSchema', ['converters', 'field_to_index'])
+"""The row decoder for a schema, built by :func:`_compile_schema`.
+
+Attributes:
+    converters (Tuple[Callable[[object], object]]):
+        One converter per field, taking the field's cell value (``cell['v']``)
+        from the JSON row, in schema order.
+    field_to_index (Dict[str, int]):
+        A mapping from schema field name to index of field, shared by every
+        :class:`~google.cloud.bigquery.table.Row` decoded with the schema.
+"""
+
+
 def _field_to_index_mapping(schema):
     """Create a mapping from schema field name to index of field."""
     return {f.name: i for i, f in enumerate(schema)}
 
 
+def _string_from_json_value(value):
+    """NOOP string -> string coercion of a compiled field."""
+    return value
+
+
+def _compile_field(field):
+    """Build a converter for the JSON cell values of a field.
+
+    The field's type and mode are resolved here, once, so that the returned
+    callable does no lookups per cell. They are compared case-insensitively,
+    as :class:`~google.cloud.bigquery.schema.SchemaField` compares them: the
+    compiled schemas are cached by field equality.
+
+    Args:
+        field (google.cloud.bigquery.schema.SchemaField): The field.
+
+    Returns:
+        Callable[[object], object]:
+            Converts a cell value (``cell['v']``) to a native value.
+    """
+    field_type = field.field_type.upper()
+    mode = field.mode.upper()
+
+    if field_type == 'RECORD':
+        subfields = [(subfield.name, _compile_field(subfield))
+                     for subfield in field.fields]
+
+        def convert(value):
+            cells = value['f']
+            return {name: sub_convert(cell['v'])
+                    for (name, sub_convert), cell in zip(subfields, cells)}
+    elif field_type == 'STRING' and mode != 'REPEATED':
+        # Strings need no conversion, even when null.
+        return _string_from_json_value
+    elif field_type in _NOT_NULL_CELLDATA_FROM_JSON:
+        convert = _NOT_NULL_CELLDATA_FROM_JSON[field_type]
+    else:
+        cell_converter = _CELLDATA_FROM_JSON.get(field_type)
+
+        def convert(value):
+            if cell_converter is None:
+                # Fail when decoding, not compiling, as the row-by-row
+                # conversion did: empty results of any type can be read.
+                raise KeyError(field.field_type)
+            return cell_converter(value, field)
+
+    if mode == 'REPEATED':
+        item_convert = convert
+
+        def convert(value):
+            return [item_convert(item['v']) for item in value]
+    elif mode == 'NULLABLE':
+        not_null_convert = convert
+
+        def convert(value):
+            if value is None:
+                return None
+            return not_null_convert(value)
+
+    return convert
+
+
+def _compile_schema(schema):
+    """Get the compiled row decoder for a schema.
+
+    Compiled schemas are cached, keyed by the schema's fields. The least
+    recently used entry is evicted once there are more than
+    ``_SCHEMA_CACHE_SIZE`` entries.
+
+    Args:
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema describing the cells of each row.
+
+    Returns:
+        _CompiledSchema: The decoder for rows of ``schema``.
+    """
+    key = tuple(schema)
+    with _schema_cache_lock:
+        compiled = _schema_cache.pop(key, None)
+        if compiled is not None:
+            # Re-insert to mark as the most recently used entry.
+            _schema_cache[key] = compiled
+            return compiled
+
+    compiled = _CompiledSchema(
+        tuple(_compile_field(field) for field in schema),
+        _field_to_index_mapping(schema))
+
+    with _schema_cache_lock:
+        _schema_cache[key] = compiled
+        while len(_schema_cache) > _SCHEMA_CACHE_SIZE:
+            _schema_cache.popitem(last=False)
+    return compiled
+
+
+def _row_tuple_from_cells(cells, converters):
+    """Convert the cells of a JSON row with a compiled schema's converters.
+
+    Args:
+        cells (Sequence[Dict[str, object]]):
+            The cells of the row, ``row['f']``.
+        converters (Tuple[Callable[[object], object]]):
+            The converters of a :class:`_CompiledSchema`.
+
+    Returns:
+        tuple: The row's values converted to native types.
+    """
+    return tuple([convert(cell['v'])
+                  for convert, cell in zip(converters, cells)])
+
+
 def _row_tuple_from_json(row, schema):
     """Convert JSON row data to row with appropriate types.
 
@@ -202,24 +349,45 @@ def _row_tuple_from_json(row, schema):
     :rtype: tuple
     :returns: A tuple of data converted to native types.
     """
-    row_data = []
-    for field, cell in zip(schema, row['f']):
-        converter = _CELLDATA_FROM_JSON[field.field_type]
-        if field.mode == 'REPEATED':
-            row_data.append([converter(item['v'], field)
-                             for item in cell['v']])
-        else:
-            row_data.append(converter(cell['v'], field))
+    return _row_tuple_from_cells(
+        row['f'], _compile_schema(schema).converters)
+
+
+def _row_iterator_page_columns(schema, response):
+    """Make a generator of all the columns in a page from tabledata.list.
+
+    This enables creating a :class:`pandas.DataFrame` and other
+    column-oriented data structures without constructing a
+    :class:`~google.cloud.bigquery.table.Row` for each row in the page.
+
+    Args:
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema describing the cells of each row.
+        response (Dict[str, object]):
+            The JSON API response for a page of rows.
+
+    Returns:
+        List[Iterable[object]]:
+            One lazily-evaluated iterable of converted values per field in
+            ``schema``.
+    """
+    rows = response.get('rows', ())
+
+    def get_column_data(field_index, convert):
+        for row in rows:
+            yield convert(row['f'][field_index]['v'])
 
-    return tuple(row_data)
+    return [get_column_data(field_index, convert)
+            for field_index, convert
+            in enumerate(_compile_schema(schema).converters)]
 
 
 def _rows_from_json(values, schema):
     """Convert JSON row data to rows with appropriate types."""
     from google.cloud.bigquery import Row
 
-    field_to_index = _field_to_index_mapping(schema)
-    return [Row(_row_tuple_from_json(r, schema), field_to_index)
+    converters, field_to_index = _compile_schema(schema)
+    return [Row(_row_tuple_from_cells(r['f'], converters), field_to_index)
             for r in values]
 
 
@@ -318,6 +486,41 @@ _SCALAR_VALUE_TO_JSON_ROW = {
 }
 
 
+def _row_to_json_converters(schema):
+    """Look up the JSON converter for each field of a schema, once.
+
+    Args:
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows to be converted.
+
+    Returns:
+        List[Tuple[str, Optional[Callable[[object], object]]]]:
+            The name and converter of each field in ``schema``. The converter
+            is :data:`None` for fields which need no conversion.
+    """
+    return [(field.name, _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type))
+            for field in schema]
+
+
+def _row_tuple_to_json(row, converters):
+    """Convert a row tuple to a JSON-compatible mapping.
+
+    Args:
+        row (Sequence[object]): The row values, in schema order.
+        converters (List[Tuple[str, Optional[Callable[[object], object]]]]):
+            The field converters, from :func:`_row_to_json_converters`.
+
+    Returns:
+        Dict[str, object]: The JSON-compatible row, keyed by field name.
+    """
+    json_row = {}
+    for (name, converter), value in zip(converters, row):
+        if converter is not None:  # STRING doesn't need converting
+            value = converter(value)
+        json_row[name] = value
+    return json_row
+
+
 # Converters used for scalar values marshalled as query parameters.
 _SCALAR_VALUE_TO_JSON_PARAM = _SCALAR_VALUE_TO_JSON_ROW.copy()
 _SCALAR_VALUE_TO_JSON_PARAM['TIMESTAMP'] = _timestamp_to_json_parameter
@@ -0,0 +1,492 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helper functions for connecting BigQuery and pandas."""
+
+import collections
+import os
+import threading
+
+import pkg_resources
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+from google.cloud.bigquery.schema import SchemaField
+
+
+_MIN_PYARROW_VERSION = pkg_resources.parse_version('0.11.1')
+_MAX_PYARROW_VERSION = pkg_resources.parse_version('0.15.0.dev0')
+"""The range of pyarrow releases :class:`ParquetStream` is tested with.
+
+Later releases convert the index of a DataFrame differently when given a
+schema.
+"""
+
+
+_DEFAULT_ROW_GROUP_BYTES = 16 * 1024 * 1024
+"""int: Default in-memory size of the rows converted to Arrow at a time.
+
+Smaller row groups bound the memory more tightly, but make writing the
+Parquet file slower.
+"""
+
+
+def parquet_stream_supported():
+    """Check whether the installed pyarrow can write a :class:`ParquetStream`.
+
+    Returns:
+        bool: :data:`True` if pyarrow is installed, in the tested range.
+    """
+    if pyarrow is None:
+        return False
+    version = pkg_resources.parse_version(pyarrow.__version__)
+    return _MIN_PYARROW_VERSION <= version < _MAX_PYARROW_VERSION
+
+
+class ParquetStream(object):
+    """Read a DataFrame as a Parquet file, written on a background thread.
+
+    The DataFrame is converted to Arrow and written to Parquet one row group
+    at a time. The writer thread blocks while ``chunk_size`` bytes are
+    waiting to be read, so the memory used does not grow with the size of
+    the DataFrame: it is bounded by a couple of chunks plus one row group.
+
+    The stream is readable sequentially. To retry a failed chunk of a
+    resumable upload, it can seek back over the bytes returned by the last
+    call to :meth:`read`, but no further.
+
+    Args:
+        dataframe (pandas.DataFrame): The data to write.
+        chunk_size (int):
+            The number of bytes read at a time. At most this many bytes are
+            buffered for the reader.
+        row_group_bytes (int):
+            (Optional) The approximate in-memory size of the DataFrame rows
+            in each row group.
+    """
+
+    mode = 'rb'
+
+    def __init__(self, dataframe, chunk_size,
+                 row_group_bytes=_DEFAULT_ROW_GROUP_BYTES):
+        self._chunk_size = chunk_size
+        self._rows_per_group = _rows_per_group(dataframe, row_group_bytes)
+        # The members below are shared with the writer thread; only access
+        # them with the condition's lock held.
+        self._condition = threading.Condition()
+        self._pending = collections.deque()
+        self._pending_size = 0
+        self._last_read = b''
+        self._position = 0
+        self._finished = False
+        self._error = None
+        self._closed = False
+
+        self._writer_thread = threading.Thread(
+            name='Thread-ParquetStreamWriter', target=self._write_all,
+            args=(dataframe,))
+        self._writer_thread.daemon = True
+        self._writer_thread.start()
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes, blocking until they are written.
+
+        Args:
+            size (int):
+                (Optional) The number of bytes to read. Reads to the end of
+                the file if negative.
+
+        Returns:
+            bytes:
+                The bytes read. Fewer than ``size`` bytes only at the end of
+                the file.
+
+        Raises:
+            Exception: Any error raised while writing the Parquet file.
+        """
+        if size < 0:
+            chunks = [self.read(self._chunk_size)]
+            while len(chunks[-1]) == self._chunk_size:
+                chunks.append(self.read(self._chunk_size))
+            data = b''.join(chunks)
+            with self._condition:
+                self._last_read = data
+            return data
+
+        with self._condition:
+            while not self._finished and self._pending_size < size:
+                self._condition.wait()
+            if self._error is not None:
+                raise self._error
+
+            pieces = []
+            remaining = size
+            while remaining and self._pending:
+                piece = self._pending.popleft()
+                if len(piece) > remaining:
+                    self._pending.appendleft(piece[remaining:])
+                    piece = piece[:remaining]
+                pieces.append(piece)
+                remaining -= len(piece)
+
+            data = b''.join(pieces)
+            self._pending_size -= len(data)
+            self._position += len(data)
+            self._last_read = data
+            self._condition.notify_all()
+            return data
+
+    def tell(self):
+        """Return the current position in the stream."""
+        with self._condition:
+            return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move to ``offset``, within the bytes read by the last read.
+
+        Args:
+            offset (int): The position to move to.
+            whence (int): (Optional) Must be :data:`os.SEEK_SET`.
+
+        Returns:
+            int: The new position.
+
+        Raises:
+            ValueError:
+                If ``whence`` is not :data:`os.SEEK_SET`, or if the stream
+                no longer holds the bytes from ``offset``.
+        """
+        if whence != os.SEEK_SET:
+            raise ValueError('ParquetStream only supports os.SEEK_SET.')
+        with self._condition:
+            rewind = self._position - offset
+            if rewind < 0 or rewind > len(self._last_read):
+                raise ValueError(
+                    'Cannot seek to {}: the stream is at {} and only holds '
+                    'the last {} bytes read.'.format(
+                        offset, self._position, len(self._last_read)))
+            if rewind:
+                self._pending.appendleft(self._last_read[-rewind:])
+                self._last_read = self._last_read[:-rewind]
+                self._pending_size += rewind
+                self._position = offset
+            return self._position
+
+    def close(self):
+        """Stop the writer thread and wait for it to exit."""
+        with self._condition:
+            self._closed = True
+            self._pending.clear()
+            self._pending_size = 0
+            self._condition.notify_all()
+        self._writer_thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write(self, data):
+        """Queue bytes written by the Parquet writer for reading.
+
+        Blocks while a full chunk is waiting to be read. Once the stream is
+        closed, the bytes are dropped: raising an error here would crash
+        the Parquet writer.
+        """
+        with self._condition:
+            while (not self._closed and
+                    self._pending_size >= self._chunk_size):
+                self._condition.wait()
+            if data and not self._closed:
+                self._pending.append(bytes(data))
+                self._pending_size += len(data)
+                self._condition.notify_all()
+
+    def _write_all(self, dataframe):
+        """Write the DataFrame, then mark the end of the stream.
+
+        Stops at the next row group once the stream is closed.
+        """
+        error = None
+        try:
+            schema, groups = dataframe_to_arrow_row_groups(
+                dataframe, self._rows_per_group)
+            writer = pyarrow.parquet.ParquetWriter(
+                _ParquetSink(self._write), schema)
+            try:
+                for group in groups:
+                    with self._condition:
+                        if self._closed:
+                            break
+                    writer.write_table(group)
+            finally:
+                writer.close()
+        except Exception as exc:
+            error = exc
+        with self._condition:
+            if not self._closed:
+                self._error = error
+            self._finished = True
+            self._condition.notify_all()
+
+
+class _ParquetSink(object):
+    """The file-like object the Parquet writer writes to.
+
+    Args:
+        write (Callable[[bytes], None]): Called with the written bytes.
+    """
+
+    closed = False
+
+    def __init__(self, write):
+        self._write = write
+        self._size = 0
+
+    def write(self, data):
+        self._write(data)
+        self._size += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._size
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def _rows_per_group(dataframe, group_size):
+    """Estimate how many rows of ``dataframe`` make ``group_size`` bytes.
+
+    The estimate uses the in-memory size of the DataFrame, without looking
+    into the Python objects of ``object`` columns.
+    """
+    if len(dataframe) == 0:
+        return 1
+    memory = dataframe.memory_usage(index=True, deep=False).sum()
+    row_size = max(1, memory // len(dataframe))
+    return max(1, int(group_size // row_size))
+
+
+def _arrow_schema(dataframe, first_schema):
+    """Get the Arrow schema for the row groups of ``dataframe``.
+
+    The types of ``object`` columns are guessed from their values. A column
+    with only missing values in the first row group has no type, so take its
+    type from its first value instead.
+
+    Args:
+        dataframe (pandas.DataFrame): All of the rows.
+        first_schema (pyarrow.Schema): The schema of the first row group.
+
+    Returns:
+        pyarrow.Schema: The schema to convert every row group with. This is
+        ``first_schema`` itself if no type was missing.
+    """
+    fields = list(first_schema)
+    for index, field in enumerate(fields):
+        if field.type == pyarrow.null() and field.name in dataframe:
+            values = dataframe[field.name].dropna()
+            if len(values):
+                fields[index] = pyarrow.field(
+                    field.name, pyarrow.array(values[:1]).type)
+    if fields == list(first_schema):
+        return first_schema
+    return pyarrow.schema(fields, metadata=first_schema.metadata)
+
+
+def dataframe_to_arrow_row_groups(dataframe, rows_per_group):
+    """Convert a DataFrame to Arrow, one row group at a time.
+
+    Unlike :meth:`pyarrow.Table.from_pandas`, only one row group at a time
+    is held in memory as Arrow.
+
+    Args:
+        dataframe (pandas.DataFrame): The data to convert.
+        rows_per_group (int): The number of rows in each row group.
+
+    Returns:
+        Tuple[pyarrow.Schema, Iterator[pyarrow.Table]]:
+            The schema shared by the row groups, and the row groups. An
+            empty DataFrame has one empty row group.
+    """
+    first_group = pyarrow.Table.from_pandas(
+        dataframe.iloc[:rows_per_group], preserve_index=True)
+    # Each access to ``Table.schema`` returns a new object.
+    first_schema = first_group.schema
+    schema = _arrow_schema(dataframe, first_schema)
+    # The index is converted after the columns, so its fields come last.
+    # They are left out of the schema the other groups are converted with:
+    # pyarrow looks up every field of that schema in the DataFrame columns.
+    column_schema = pyarrow.schema(list(schema)[:len(dataframe.columns)])
+
+    def row_groups():
+        for start in range(0, max(len(dataframe), 1), rows_per_group):
+            if start == 0 and schema is first_schema:
+                group = first_group
+            else:
+                group = pyarrow.Table.from_pandas(
+                    dataframe.iloc[start:start + rows_per_group],
+                    schema=column_schema, preserve_index=True)
+            # The pandas metadata differs between groups when a column has
+            # no values in some of them.
+            yield group.replace_schema_metadata(schema.metadata)
+
+    return schema, row_groups()
+
+
+def _bq_to_arrow_scalars():
+    """Map BigQuery scalar types to functions returning the Arrow type."""
+    return {
+        'BOOL': pyarrow.bool_,
+        'BOOLEAN': pyarrow.bool_,
+        'BYTES': pyarrow.binary,
+        'DATE': pyarrow.date32,
+        'DATETIME': lambda: pyarrow.timestamp('us'),
+        'FLOAT': pyarrow.float64,
+        'FLOAT64': pyarrow.float64,
+        'GEOGRAPHY': pyarrow.string,
+        'INT64': pyarrow.int64,
+        'INTEGER': pyarrow.int64,
+        'NUMERIC': lambda: pyarrow.decimal128(38, 9),
+        'STRING': pyarrow.string,
+        'TIME': lambda: pyarrow.time64('us'),
+        'TIMESTAMP': lambda: pyarrow.timestamp('us', tz='UTC'),
+    }
+
+
+def bq_to_arrow_data_type(field):
+    """Get the Arrow type for a BigQuery field.
+
+    Args:
+        field (google.cloud.bigquery.schema.SchemaField): The field.
+
+    Returns:
+        Optional[pyarrow.DataType]:
+            The Arrow type, or :data:`None` if the BigQuery type is unknown.
+    """
+    if field.mode == 'REPEATED':
+        value_type = bq_to_arrow_data_type(
+            SchemaField(field.name, field.field_type, fields=field.fields))
+        if value_type is None:
+            return None
+        return pyarrow.list_(value_type)
+
+    if field.field_type in ('RECORD', 'STRUCT'):
+        arrow_fields = [bq_to_arrow_field(subfield)
+                        for subfield in field.fields]
+        if any(arrow_field is None for arrow_field in arrow_fields):
+            return None
+        return pyarrow.struct(arrow_fields)
+
+    data_type = _bq_to_arrow_scalars().get(field.field_type)
+    if data_type is None:
+        return None
+    return data_type()
+
+
+def bq_to_arrow_field(field):
+    """Get the Arrow field for a BigQuery field.
+
+    Returns:
+        Optional[pyarrow.Field]:
+            The Arrow field, or :data:`None` if the BigQuery type is unknown.
+    """
+    data_type = bq_to_arrow_data_type(field)
+    if data_type is None:
+        return None
+    return pyarrow.field(
+        field.name, data_type, nullable=field.mode != 'REQUIRED')
+
+
+def bq_to_arrow_schema(bq_schema):
+    """Get the Arrow schema for a BigQuery schema.
+
+    Args:
+        bq_schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The BigQuery fields.
+
+    Returns:
+        Optional[pyarrow.Schema]:
+            The Arrow schema, or :data:`None` if the type of any field is
+            unknown.
+    """
+    arrow_fields = [bq_to_arrow_field(field) for field in bq_schema]
+    if any(arrow_field is None for arrow_field in arrow_fields):
+        return None
+    return pyarrow.schema(arrow_fields)
+
+
+def bq_to_arrow_array(values, field):
+    """Convert a column of values decoded from BigQuery to an Arrow array.
+
+    Args:
+        values (Sequence[object]): The values, as decoded into rows.
+        field (google.cloud.bigquery.schema.SchemaField): Their field.
+
+    Returns:
+        pyarrow.Array: The values. Their type is inferred if the BigQuery
+        type is unknown.
+    """
+    return pyarrow.array(values, type=bq_to_arrow_data_type(field))
+
+
+def _has_timestamps(field):
+    if field.field_type in ('TIMESTAMP', 'DATETIME'):
+        return True
+    return any(_has_timestamps(subfield) for subfield in field.fields)
+
+
+def _value_from_arrow(value, field):
+    """Convert timestamps of a value read from Arrow to ``datetime``."""
+    if value is None:
+        return None
+    if field.mode == 'REPEATED':
+        item_field = SchemaField(
+            field.name, field.field_type, fields=field.fields)
+        return [_value_from_arrow(item, item_field) for item in value]
+    if field.field_type in ('RECORD', 'STRUCT'):
+        return {subfield.name: _value_from_arrow(value[subfield.name],
+                                                 subfield)
+                for subfield in field.fields}
+    # Arrow gives pandas Timestamps when pandas is installed.
+    if hasattr(value, 'to_pydatetime'):
+        return value.to_pydatetime()
+    return value
+
+
+def arrow_to_bq_values(array, field):
+    """Convert an Arrow column back to the values decoded from BigQuery.
+
+    The inverse of :func:`bq_to_arrow_array`.
+
+    Args:
+        array (Union[pyarrow.Array, pyarrow.Column]): The values.
+        field (google.cloud.bigquery.schema.SchemaField): Their field.
+
+    Returns:
+        List[object]: The values.
+    """
+    values = array.to_pylist()
+    if not _has_timestamps(field):
+        return values
+    return [_value_from_arrow(value, field) for value in values]
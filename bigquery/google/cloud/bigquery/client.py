@@ -32,13 +32,16 @@ import google.cloud._helpers
 from google.cloud import exceptions
 from google.cloud.client import ClientWithProject
 
-from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
+from google.cloud.bigquery._helpers import _row_to_json_converters
+from google.cloud.bigquery._helpers import _row_tuple_to_json
 from google.cloud.bigquery._helpers import _str_or_none
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery._http import Connection
 from google.cloud.bigquery.dataset import Dataset
 from google.cloud.bigquery.dataset import DatasetListItem
 from google.cloud.bigquery.dataset import DatasetReference
 from google.cloud.bigquery import job
+from google.cloud.bigquery.job_waiter import JobWaiter
 from google.cloud.bigquery.query import _QueryResults
 from google.cloud.bigquery.retry import DEFAULT_RETRY
 from google.cloud.bigquery.table import Table
@@ -713,8 +716,9 @@ class Client(ClientWithProject):
             all_users (bool, optional):
                 If true, include jobs owned by all users in the project.
                 Defaults to :data:`False`.
-            state_filter (str, optional):
-                If set, include only jobs matching the given state. One of:
+            state_filter (Union[str, Sequence[str]], optional):
+                If set, include only jobs matching the given state, or any
+                of the given states. One of:
                     * ``"done"``
                     * ``"pending"``
                     * ``"running"``
@@ -762,6 +766,33 @@ class Client(ClientWithProject):
             max_results=max_results,
             extra_params=extra_params)
 
+    def wait_all(self, jobs, timeout=None, retry=DEFAULT_RETRY):
+        """Wait for many jobs, polling them all from one thread.
+
+        Use a :class:`~google.cloud.bigquery.job_waiter.JobWaiter` directly
+        to handle the jobs as they complete.
+
+        Args:
+            jobs (Iterable[google.cloud.bigquery.job._AsyncJob]):
+                The jobs to wait for. Jobs which have not been started are
+                started.
+            timeout (float, optional):
+                The most seconds to wait. If not all jobs are done within
+                ``timeout``, return anyway.
+            retry (google.api_core.retry.Retry, optional):
+                How to retry the RPCs.
+
+        Returns:
+            google.cloud.bigquery.job_waiter.DoneAndNotDoneJobs:
+                A named pair of lists of the jobs which are done and of
+                those which are not. Failed jobs are done: check their
+                ``error_result``.
+        """
+        with JobWaiter(retry=retry) as waiter:
+            for job_ in jobs:
+                waiter.add(job_)
+            return waiter.wait(timeout=timeout)
+
     def load_table_from_uri(
             self, source_uris, destination,
             job_id=None,
@@ -940,10 +971,15 @@ class Client(ClientWithProject):
             ImportError:
                 If a usable parquet engine cannot be found. This method
                 requires :mod:`pyarrow` to be installed.
-        """
-        buffer = six.BytesIO()
-        dataframe.to_parquet(buffer)
 
+        .. note::
+
+            With :mod:`pyarrow` 0.11.1 to 0.14, the Parquet file is written
+            one row group at a time on a background thread, while it is
+            uploaded, so it is never held in memory as a whole. Otherwise
+            the file is built in memory with
+            :meth:`pandas.DataFrame.to_parquet`, then uploaded.
+        """
         if job_config is None:
             job_config = job.LoadJobConfig()
         job_config.source_format = job.SourceFormat.PARQUET
@@ -951,16 +987,26 @@ class Client(ClientWithProject):
         if location is None:
             location = self.location
 
-        return self.load_table_from_file(
-            buffer, destination,
-            num_retries=num_retries,
-            rewind=True,
-            job_id=job_id,
-            job_id_prefix=job_id_prefix,
-            location=location,
-            project=project,
-            job_config=job_config,
-        )
+        if not _pandas_helpers.parquet_stream_supported():
+            stream = six.BytesIO()
+            dataframe.to_parquet(stream)
+        else:
+            stream = _pandas_helpers.ParquetStream(
+                dataframe, _DEFAULT_CHUNKSIZE)
+
+        try:
+            return self.load_table_from_file(
+                stream, destination,
+                num_retries=num_retries,
+                rewind=True,
+                job_id=job_id,
+                job_id_prefix=job_id_prefix,
+                location=location,
+                project=project,
+                job_config=job_config,
+            )
+        finally:
+            stream.close()
 
     def _do_resumable_upload(self, stream, metadata, num_retries):
         """Perform a resumable upload.
@@ -1284,19 +1330,12 @@ class Client(ClientWithProject):
             raise TypeError('table should be Table or TableReference')
 
         json_rows = []
+        converters = _row_to_json_converters(schema)
 
-        for index, row in enumerate(rows):
+        for row in rows:
             if isinstance(row, dict):
                 row = _row_from_mapping(row, schema)
-            json_row = {}
-
-            for field, value in zip(schema, row):
-                converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
-                if converter is not None:  # STRING doesn't need converting
-                    value = converter(value)
-                json_row[field.name] = value
-
-            json_rows.append(json_row)
+            json_rows.append(_row_tuple_to_json(row, converters))
 
         return self.insert_rows_json(table, json_rows, **kwargs)
 
@@ -1414,7 +1453,7 @@ class Client(ClientWithProject):
 
     def list_rows(self, table, selected_fields=None, max_results=None,
                   page_token=None, start_index=None, page_size=None,
-                  retry=DEFAULT_RETRY):
+                  retry=DEFAULT_RETRY, prefetch_pages=None):
         """List the rows of the table.
 
         See
@@ -1461,6 +1500,12 @@ class Client(ClientWithProject):
         :type retry: :class:`google.api_core.retry.Retry`
         :param retry: (Optional) How to retry the RPC.
 
+        :type prefetch_pages: int
+        :param prefetch_pages: (Optional) The number of pages to read ahead,
+                               concurrently, on background threads. Only use
+                               this when the table is not modified while it
+                               is being read.
+
         :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns: Iterator of row data
                   :class:`~google.cloud.bigquery.table.Row`-s. During each
@@ -1496,7 +1541,8 @@ class Client(ClientWithProject):
             page_token=page_token,
             max_results=max_results,
             page_size=page_size,
-            extra_params=params)
+            extra_params=params,
+            prefetch_pages=prefetch_pages)
         return row_iterator
 
 
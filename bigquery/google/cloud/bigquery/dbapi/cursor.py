@@ -15,6 +15,8 @@
 """Cursor for the Google BigQuery DB-API."""
 
 import collections
+import itertools
+import re
 
 import six
 
@@ -34,6 +36,12 @@ Column = collections.namedtuple(
         'scale', 'null_ok',
     ])
 
+# Queries which only read data: they begin with SELECT or WITH, after any
+# comments and opening parentheses.
+_READ_ONLY_OPERATION_RE = re.compile(
+    r'^(?:\s|\(|--[^\n]*|#[^\n]*|/\*.*?\*/)*(?:SELECT|WITH)\b',
+    re.IGNORECASE | re.DOTALL)
+
 
 class Cursor(object):
     """DB-API Cursor to Google BigQuery.
@@ -134,6 +142,55 @@ class Cursor(object):
         """
         self._query_data = None
         self._query_job = None
+        query_job = self._start_query(operation, parameters, job_id=job_id)
+        self._finish_query(query_job)
+
+    def executemany(self, operation, seq_of_parameters):
+        """Prepare and execute a database operation multiple times.
+
+        If ``operation`` only reads data (a ``SELECT`` query), all of the
+        queries are started before waiting for any of them, so they run
+        concurrently. Other statements, such as DML, are run one at a time
+        in order, and stop at the first which fails: the statements before
+        it stay applied. The cursor then reflects the last query.
+
+        :type operation: str
+        :param operation: A Google BigQuery query string.
+
+        :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
+        :param parameters: Sequence of many sets of parameter values.
+
+        :raises: :class:`~google.cloud.bigquery.dbapi.DatabaseError`
+            if any of the queries fails.
+        """
+        self._query_data = None
+        self._query_job = None
+        if not _READ_ONLY_OPERATION_RE.match(operation):
+            for parameters in seq_of_parameters:
+                self._finish_query(self._start_query(operation, parameters))
+            return
+
+        query_jobs = [
+            self._start_query(operation, parameters)
+            for parameters in seq_of_parameters]
+        for query_job in query_jobs:
+            self._finish_query(query_job)
+
+    def _start_query(self, operation, parameters, job_id=None):
+        """Start a query job, without waiting for it.
+
+        :type operation: str
+        :param operation: A Google BigQuery query string.
+
+        :type parameters: Mapping[str, Any] or Sequence[Any]
+        :param parameters: Parameter values, or :data:`None`.
+
+        :type job_id: str
+        :param job_id: (Optional) The job_id to use.
+
+        :rtype: :class:`~google.cloud.bigquery.job.QueryJob`
+        :returns: The running query job.
+        """
         client = self.connection._client
 
         # The DB-API uses the pyformat formatting, since the way BigQuery does
@@ -147,31 +204,30 @@ class Cursor(object):
         config = job.QueryJobConfig()
         config.query_parameters = query_parameters
         config.use_legacy_sql = False
-        self._query_job = client.query(
+        return client.query(
             formatted_operation, job_config=config, job_id=job_id)
 
+    def _finish_query(self, query_job):
+        """Wait for a query job and describe its results.
+
+        :type query_job: :class:`~google.cloud.bigquery.job.QueryJob`
+        :param query_job: A query job started by :meth:`_start_query`.
+
+        :raises: :class:`~google.cloud.bigquery.dbapi.DatabaseError`
+            if the query fails.
+        """
+        self._query_job = query_job
+
         # Wait for the query to finish.
         try:
-            self._query_job.result()
+            query_job.result()
         except google.cloud.exceptions.GoogleCloudError:
-            raise exceptions.DatabaseError(self._query_job.errors)
+            raise exceptions.DatabaseError(query_job.errors)
 
-        query_results = self._query_job._query_results
+        query_results = query_job._query_results
         self._set_rowcount(query_results)
         self._set_description(query_results.schema)
 
-    def executemany(self, operation, seq_of_parameters):
-        """Prepare and execute a database operation multiple times.
-
-        :type operation: str
-        :param operation: A Google BigQuery query string.
-
-        :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
-        :param parameters: Sequence of many sets of parameter values.
-        """
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
-
     def _try_fetch(self, size=None):
         """Try to start fetching data, if not yet started.
 
@@ -193,9 +249,25 @@ class Cursor(object):
             rows_iter = client.list_rows(
                 self._query_job.destination,
                 selected_fields=self._query_job._query_results.schema,
-                page_size=self.arraysize
+                page_size=self._page_size(size),
             )
-            self._query_data = iter(rows_iter)
+            self._query_data = _row_tuples(rows_iter)
+
+    def _page_size(self, size):
+        """Get the number of rows to request per page.
+
+        :type size: int
+        :param size: The number of rows the first fetch asks for, if any.
+
+        :rtype: int
+        :returns: The larger of ``size`` and ``arraysize``, or :data:`None`
+            to let the API choose if both are one row or less: requesting a
+            single row at a time costs one API call per row.
+        """
+        page_size = max(size or 0, self.arraysize or 0)
+        if page_size <= 1:
+            return None
+        return page_size
 
     def fetchone(self):
         """Fetch a single row from the results of the last ``execute*()`` call.
@@ -217,9 +289,9 @@ class Cursor(object):
         """Fetch multiple results from the last ``execute*()`` call.
 
         .. note::
-            The size parameter is not used for the request/response size.
-            Set the ``arraysize`` attribute before calling ``execute()`` to
-            set the batch size.
+            Rows are requested in pages of ``arraysize`` rows, or of ``size``
+            rows if the first fetch asks for more. Set the ``arraysize``
+            attribute before the first fetch to set the page size.
 
         :type size: int
         :param size:
@@ -235,14 +307,7 @@ class Cursor(object):
             size = self.arraysize
 
         self._try_fetch(size=size)
-        rows = []
-
-        for row in self._query_data:
-            rows.append(row)
-            if len(rows) >= size:
-                break
-
-        return rows
+        return list(itertools.islice(self._query_data, size))
 
     def fetchall(self):
         """Fetch all remaining results from the last ``execute*()`` call.
@@ -262,6 +327,23 @@ class Cursor(object):
         """No-op."""
 
 
+def _row_tuples(rows_iter):
+    """Generate the rows of a row iterator as plain tuples.
+
+    The cells of each page are decoded column by column, so no
+    :class:`~google.cloud.bigquery.table.Row` objects are created.
+
+    :type rows_iter: :class:`~google.cloud.bigquery.table.RowIterator`
+    :param rows_iter: The rows to read.
+
+    :rtype: Iterator[tuple]
+    :returns: The values of each row.
+    """
+    for page in rows_iter.pages:
+        for row in six.moves.zip(*page._columns):
+            yield row
+
+
 def _format_operation_list(operation, parameters):
     """Formats parameters in operation in the way BigQuery expects.
 
@@ -2525,7 +2525,7 @@ class QueryJob(_AsyncJob):
         self._done_timeout = timeout
         super(QueryJob, self)._blocking_poll(timeout=timeout)
 
-    def result(self, timeout=None, retry=DEFAULT_RETRY):
+    def result(self, timeout=None, retry=DEFAULT_RETRY, prefetch_pages=None):
         """Start the job and wait for it to complete and get the result.
 
         :type timeout: float
@@ -2536,6 +2536,11 @@ class QueryJob(_AsyncJob):
         :type retry: :class:`google.api_core.retry.Retry`
         :param retry: (Optional) How to retry the call that retrieves rows.
 
+        :type prefetch_pages: int
+        :param prefetch_pages:
+            (Optional) The number of result pages to read ahead, concurrently,
+            on background threads.
+
         :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns:
             Iterator of row data :class:`~google.cloud.bigquery.table.Row`-s.
@@ -2566,7 +2571,8 @@ class QueryJob(_AsyncJob):
         schema = self._query_results.schema
         dest_table_ref = self.destination
         dest_table = Table(dest_table_ref, schema=schema)
-        return self._client.list_rows(dest_table, retry=retry)
+        return self._client.list_rows(
+            dest_table, retry=retry, prefetch_pages=prefetch_pages)
 
     def to_dataframe(self):
         """Return a pandas DataFrame from a QueryJob
@@ -2581,6 +2587,19 @@ class QueryJob(_AsyncJob):
         """
         return self.result().to_dataframe()
 
+    def to_arrow(self):
+        """Return a pyarrow Table from a QueryJob
+
+        Returns:
+            A :class:`pyarrow.Table` populated with row data and column
+            headers from the query results. The column headers are derived
+            from the destination table's schema.
+
+        Raises:
+            ValueError: If the `pyarrow` library cannot be imported.
+        """
+        return self.result().to_arrow()
+
     def __iter__(self):
         return iter(self.result())
 
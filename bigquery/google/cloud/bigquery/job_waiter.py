@@ -0,0 +1,329 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wait for many jobs at once, polling them from a single thread."""
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+import time
+
+from concurrent import futures
+
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_DONE_STATE = 'DONE'
+_ACTIVE_STATES = ['pending', 'running']
+
+_LIST_MIN_JOBS = 3
+"""int: Jobs in a project from which listing the active jobs is cheaper than
+reloading each of them."""
+
+DoneAndNotDoneJobs = collections.namedtuple(
+    'DoneAndNotDoneJobs', ['done', 'not_done'])
+"""The jobs which completed, and those which did not, in
+:meth:`JobWaiter.wait`."""
+
+
+class JobWaiter(object):
+    """Wait for many jobs from one polling thread.
+
+    Calling :meth:`~google.cloud.bigquery.job.QueryJob.result` on each of
+    many jobs polls every job from its own thread, with its own backoff.
+    A waiter instead polls all of its jobs in rounds, from one thread.
+
+    Each round, for each project with several jobs in flight, the waiter
+    lists the pending and running jobs with one ``jobs.list`` call and only
+    reloads the jobs which are no longer listed. Jobs in other projects are
+    reloaded one by one. The delay between rounds starts at
+    ``initial_delay`` and grows by ``multiplier`` after each round in which
+    no job completed, up to ``max_delay``.
+
+    Once a job completes, its result or exception is set, so its
+    ``result()`` returns without polling again, and its done callbacks run
+    on the polling thread.
+
+    Example:
+
+        >>> from google.cloud import bigquery
+        >>> client = bigquery.Client()
+        >>> with bigquery.JobWaiter() as waiter:
+        ...     for uri in uris:
+        ...         waiter.add(client.load_table_from_uri(uri, table_ref))
+        ...     for job in waiter.as_completed(timeout=3600):
+        ...         print(job.job_id, job.exception())
+
+    Args:
+        initial_delay (float):
+            (Optional) Seconds to wait before the first round.
+        max_delay (float):
+            (Optional) The most seconds to wait between two rounds.
+        multiplier (float):
+            (Optional) How much the delay grows after a round in which no job
+            completed.
+        retry (google.api_core.retry.Retry):
+            (Optional) How to retry the API calls.
+    """
+
+    def __init__(self, initial_delay=1.0, max_delay=20.0, multiplier=1.5,
+                 retry=DEFAULT_RETRY):
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._multiplier = multiplier
+        self._retry = retry
+        # The members below are shared with the polling thread; only access
+        # them with the condition's lock held.
+        self._condition = threading.Condition()
+        self._jobs = []
+        self._pending = []
+        self._completed = []
+        self._callbacks = {}
+        self._closed = False
+        self._polling_thread = None
+
+    def add(self, job, callback=None):
+        """Wait for a job, starting it if it has not been started.
+
+        Args:
+            job (google.cloud.bigquery.job._AsyncJob): The job to wait for.
+            callback (Callable[[google.cloud.bigquery.job._AsyncJob], None]):
+                (Optional) Called with the job once it completes, on the
+                polling thread, or right away if the job is already done.
+
+        Returns:
+            google.cloud.bigquery.job._AsyncJob: The job.
+
+        Raises:
+            ValueError: If the waiter is closed.
+        """
+        if job.state is None:
+            job._begin(retry=self._retry)
+
+        with self._condition:
+            if self._closed:
+                raise ValueError('Cannot add jobs: waiter is closed.')
+            self._jobs.append(job)
+            if callback is not None:
+                self._callbacks[id(job)] = callback
+            if job.state != _DONE_STATE:
+                self._pending.append(job)
+                self._ensure_polling_locked()
+                self._condition.notify_all()
+                return job
+
+        self._complete(job)
+        return job
+
+    def as_completed(self, timeout=None):
+        """Iterate over the jobs as they complete.
+
+        Only the jobs added before the call are included. Jobs which are
+        already done are yielded first.
+
+        Args:
+            timeout (float):
+                (Optional) The most seconds to wait for all of the jobs.
+
+        Yields:
+            google.cloud.bigquery.job._AsyncJob:
+                The jobs, in the order they completed.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+                If some jobs are not done within ``timeout``.
+            ValueError: If the waiter is closed while jobs are not done.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._condition:
+            remaining = set(id(job) for job in self._jobs)
+        index = 0
+
+        while remaining:
+            with self._condition:
+                while index >= len(self._completed):
+                    if self._closed:
+                        raise ValueError(
+                            'Cannot wait for jobs: waiter is closed.')
+                    wait_for = None
+                    if deadline is not None:
+                        wait_for = deadline - time.time()
+                        if wait_for <= 0:
+                            raise futures.TimeoutError(
+                                '{} (of {}) jobs not done.'.format(
+                                    len(remaining), len(self._jobs)))
+                    self._condition.wait(wait_for)
+                job = self._completed[index]
+                index += 1
+            if id(job) in remaining:
+                remaining.discard(id(job))
+                yield job
+
+    def wait(self, timeout=None):
+        """Wait for all of the jobs added so far.
+
+        Unlike ``result()``, failed jobs do not raise an exception: check
+        ``job.exception()`` or ``job.error_result``.
+
+        Args:
+            timeout (float):
+                (Optional) The most seconds to wait. If not all jobs are done
+                within ``timeout``, return anyway.
+
+        Returns:
+            DoneAndNotDoneJobs:
+                A named pair of lists of the jobs which are done and of those
+                which are not, each in the order the jobs were added.
+        """
+        try:
+            for _ in self.as_completed(timeout=timeout):
+                pass
+        except futures.TimeoutError:
+            pass
+
+        with self._condition:
+            completed = set(id(job) for job in self._completed)
+            jobs = list(self._jobs)
+        return DoneAndNotDoneJobs(
+            [job for job in jobs if id(job) in completed],
+            [job for job in jobs if id(job) not in completed])
+
+    def close(self):
+        """Stop polling. The jobs which are not done keep running."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            polling_thread = self._polling_thread
+
+        if (polling_thread is not None and
+                polling_thread is not threading.current_thread()):
+            polling_thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _ensure_polling_locked(self):
+        """Start the polling thread. Call with the condition's lock held."""
+        if self._polling_thread is not None:
+            return
+        self._polling_thread = threading.Thread(
+            name='Thread-PollJobWaiter', target=self._poll_loop)
+        self._polling_thread.daemon = True
+        self._polling_thread.start()
+
+    def _poll_loop(self):
+        """Poll the pending jobs in rounds until the waiter is closed."""
+        delay = self._initial_delay
+        while True:
+            with self._condition:
+                deadline = time.time() + delay
+                while not self._closed and (
+                        not self._pending or time.time() < deadline):
+                    if self._pending:
+                        self._condition.wait(deadline - time.time())
+                    else:
+                        self._condition.wait()
+                        deadline = time.time() + self._initial_delay
+                if self._closed:
+                    return
+                jobs = list(self._pending)
+
+            completed = self._poll(jobs)
+            for job in completed:
+                self._complete(job)
+
+            if completed:
+                delay = self._initial_delay
+            else:
+                delay = min(delay * self._multiplier, self._max_delay)
+
+    def _poll(self, jobs):
+        """Refresh the jobs which may have completed.
+
+        Args:
+            jobs (List[google.cloud.bigquery.job._AsyncJob]):
+                The jobs which were not done in the last round.
+
+        Returns:
+            List[google.cloud.bigquery.job._AsyncJob]:
+                The jobs which are now done.
+        """
+        by_project = collections.OrderedDict()
+        for job in jobs:
+            key = (id(job._client), job.project)
+            by_project.setdefault(key, []).append(job)
+
+        completed = []
+        for project_jobs in by_project.values():
+            if len(project_jobs) >= _LIST_MIN_JOBS:
+                project_jobs = self._filter_active(project_jobs)
+            for job in project_jobs:
+                try:
+                    job.reload(retry=self._retry)
+                except Exception as exc:
+                    _LOGGER.exception('Failed to reload job %s.', job.job_id)
+                    job.set_exception(exc)
+                    completed.append(job)
+                    continue
+                if job.state == _DONE_STATE:
+                    completed.append(job)
+        return completed
+
+    def _filter_active(self, jobs):
+        """Drop the jobs which are listed as pending or running.
+
+        All of ``jobs`` must belong to the same client and project.
+
+        Args:
+            jobs (List[google.cloud.bigquery.job._AsyncJob]):
+                Jobs which were not done in the last round.
+
+        Returns:
+            List[google.cloud.bigquery.job._AsyncJob]:
+                The jobs which need to be reloaded to know if they are done.
+        """
+        client = jobs[0]._client
+        try:
+            active = set(
+                listed.job_id for listed in client.list_jobs(
+                    project=jobs[0].project, state_filter=_ACTIVE_STATES,
+                    retry=self._retry))
+        except Exception:
+            _LOGGER.exception('Failed to list jobs, reloading each job.')
+            return jobs
+        return [job for job in jobs if job.job_id not in active]
+
+    def _complete(self, job):
+        """Set the job's result and run the callbacks for a done job."""
+        job._set_future_result()
+        with self._condition:
+            if job in self._pending:
+                self._pending.remove(job)
+            self._completed.append(job)
+            callback = self._callbacks.pop(id(job), None)
+            self._condition.notify_all()
+
+        if callback is not None:
+            try:
+                callback(job)
+            except Exception:
+                _LOGGER.exception(
+                    'Error in done callback for job %s.', job.job_id)
@@ -0,0 +1,433 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache the results of repeated queries on the client."""
+
+from __future__ import absolute_import
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import _pandas_helpers
+from google.cloud.bigquery.job import QueryJobConfig
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.schema import _build_schema_resource
+from google.cloud.bigquery.schema import _parse_schema_resource
+from google.cloud.bigquery.table import _columns_to_arrow
+from google.cloud.bigquery.table import _EmptyRowIterator
+from google.cloud.bigquery.table import _NO_PANDAS_ERROR
+from google.cloud.bigquery.table import _NO_PYARROW_ERROR
+from google.cloud.bigquery.table import Row
+from google.cloud.bigquery.table import pandas
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_MAX_ENTRIES = 128
+"""int: Default number of results kept in memory."""
+
+_DEFAULT_TTL = 300.0
+"""float: Default seconds for which results are reused."""
+
+_DEFAULT_MAX_ROWS = 100000
+"""int: Default number of rows above which results are not cached."""
+
+_CACHEABLE_STATEMENT_TYPES = (None, 'SELECT')
+
+_IGNORED_CONFIG_PROPERTIES = ('priority', 'useQueryCache')
+"""Query job properties which do not change the results."""
+
+_SQL_OPAQUE = re.compile(
+    r"""('''.*?'''|\"\"\".*?\"\"\"|'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|"""
+    r"""`(?:[^`\\]|\\.)*`|--[^\n]*|#[^\n]*|/\*.*?\*/)""",
+    re.DOTALL)
+"""Quoted strings, identifiers and comments, whose whitespace matters."""
+
+_WHITESPACE = re.compile(r'\s+')
+
+_CacheEntry = collections.namedtuple(
+    '_CacheEntry', ['schema', 'rows', 'expires'])
+
+
+def _normalize_query(query):
+    """Collapse whitespace outside of quotes and comments in SQL."""
+    parts = _SQL_OPAQUE.split(query)
+    # Even parts are plain SQL; odd parts are the split separators.
+    for index in range(0, len(parts), 2):
+        parts[index] = _WHITESPACE.sub(' ', parts[index])
+    return ''.join(parts).strip()
+
+
+def _cache_key(query, job_config, project, location):
+    """Build the key of the results of a query.
+
+    Args:
+        query (str): The SQL.
+        job_config (google.cloud.bigquery.job.QueryJobConfig):
+            The configuration of the query job, or :data:`None`.
+        project (str): The project which runs the query.
+        location (str): The location where the query runs, or :data:`None`.
+
+    Returns:
+        str: The key.
+    """
+    if job_config is None:
+        job_config = QueryJobConfig()
+    resource = job_config.to_api_repr()
+    resource.pop('labels', None)
+    query_config = resource.setdefault('query', {})
+    # QueryJob sets this on the configuration when the query runs.
+    query_config.setdefault('useLegacySql', False)
+    for name in _IGNORED_CONFIG_PROPERTIES:
+        query_config.pop(name, None)
+    return json.dumps(
+        [_normalize_query(query), project, location, resource],
+        sort_keys=True)
+
+
+class CachedRowIterator(object):
+    """Iterate over query results held by a :class:`QueryCache`.
+
+    Offers the same attributes and methods as
+    :class:`~google.cloud.bigquery.table.RowIterator`, without making any
+    API requests. Unlike a :class:`~google.cloud.bigquery.table.RowIterator`,
+    it can be iterated more than once.
+
+    Args:
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the results.
+        rows (Sequence[Tuple[object]]): The values of each row.
+    """
+
+    def __init__(self, schema, rows):
+        self._schema = list(schema)
+        self._rows = rows
+        self._field_to_index = _helpers._field_to_index_mapping(
+            self._schema)
+
+    @property
+    def schema(self):
+        """List[google.cloud.bigquery.schema.SchemaField]: Results' schema."""
+        return list(self._schema)
+
+    @property
+    def total_rows(self):
+        """int: The total number of rows in the results."""
+        return len(self._rows)
+
+    @property
+    def pages(self):
+        """Iterator[List[google.cloud.bigquery.table.Row]]: A single page
+        holding all of the rows."""
+        return iter([list(self)])
+
+    def __iter__(self):
+        field_to_index = self._field_to_index
+        for values in self._rows:
+            yield Row(values, field_to_index)
+
+    def to_dataframe(self):
+        """Create a pandas DataFrame from the query results.
+
+        Returns:
+            pandas.DataFrame:
+                A :class:`~pandas.DataFrame` populated with row data and
+                column headers from the query results.
+
+        Raises:
+            ValueError: If the :mod:`pandas` library cannot be imported.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+
+        column_names = [field.name for field in self._schema]
+        if not self._rows:
+            return pandas.DataFrame(columns=column_names)
+        return pandas.DataFrame.from_records(
+            list(self._rows), columns=column_names)
+
+    def to_arrow_iterable(self):
+        """Iterate over the query results as Arrow record batches.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]: A single record batch.
+
+        Raises:
+            ValueError: If the :mod:`pyarrow` library cannot be imported.
+        """
+        if _pandas_helpers.pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        columns = list(zip(*self._rows)) or [[] for _ in self._schema]
+        return iter([_columns_to_arrow(
+            columns, self._schema,
+            _pandas_helpers.bq_to_arrow_schema(self._schema))])
+
+    def to_arrow(self):
+        """Create a :class:`pyarrow.Table` from the query results.
+
+        Returns:
+            pyarrow.Table:
+                The rows, with the Arrow schema derived from the schema of
+                the results.
+
+        Raises:
+            ValueError: If the :mod:`pyarrow` library cannot be imported.
+        """
+        record_batches = list(self.to_arrow_iterable())
+        return _pandas_helpers.pyarrow.Table.from_batches(record_batches)
+
+
+class QueryCache(object):
+    """Reuse the results of queries which ran recently.
+
+    The results are keyed on the SQL, with whitespace outside of strings,
+    identifiers and comments collapsed, the query parameters and the other
+    properties of the job configuration, the project and the location.
+
+    Results are kept in memory for ``ttl`` seconds. The least recently used
+    results are dropped once more than ``max_entries`` are cached. If a
+    ``directory`` is given, results are also stored there as Arrow files,
+    to be shared between processes or kept across restarts. Expired files
+    are deleted when they are read.
+
+    Only the results of ``SELECT`` queries without a destination table are
+    cached. Dry runs, DML and DDL statements, and results with more than
+    ``max_rows`` rows are passed through.
+
+    Example:
+
+        >>> from google.cloud import bigquery
+        >>> client = bigquery.Client()
+        >>> cache = bigquery.QueryCache(ttl=60)
+        >>> rows = cache.query(client, 'SELECT 17 AS answer')
+        >>> rows = cache.query(client, 'SELECT 17  AS answer')  # No request.
+
+    Args:
+        max_entries (int):
+            (Optional) The number of results kept in memory.
+        ttl (float):
+            (Optional) The number of seconds for which results are reused.
+        max_rows (int):
+            (Optional) Results with more rows are not cached.
+        directory (str):
+            (Optional) A directory to store the results in. Requires
+            :mod:`pyarrow`.
+
+    Raises:
+        ValueError: If ``directory`` is set and :mod:`pyarrow` is missing.
+    """
+
+    def __init__(self, max_entries=_DEFAULT_MAX_ENTRIES, ttl=_DEFAULT_TTL,
+                 max_rows=_DEFAULT_MAX_ROWS, directory=None):
+        if directory is not None and _pandas_helpers.pyarrow is None:
+            raise ValueError(
+                'The pyarrow library is required to store results in a '
+                'directory.')
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._max_rows = max_rows
+        self._directory = directory
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def query(self, client, query, job_config=None, job_id_prefix=None,
+              location=None, project=None, timeout=None,
+              retry=DEFAULT_RETRY):
+        """Get the results of a query, running it if they are not cached.
+
+        Args:
+            client (google.cloud.bigquery.client.Client):
+                The client used to run the query on a cache miss.
+            query (str): The SQL to run.
+            job_config (google.cloud.bigquery.job.QueryJobConfig):
+                (Optional) Extra configuration options for the job.
+            job_id_prefix (str):
+                (Optional) The prefix of the job ID, if the query runs.
+            location (str):
+                (Optional) Where to run the query. Defaults to the
+                client's location.
+            project (str):
+                (Optional) The project which runs the query. Defaults to
+                the client's project.
+            timeout (float):
+                (Optional) How long to wait for the query to complete.
+            retry (google.api_core.retry.Retry):
+                (Optional) How to retry the RPCs.
+
+        Returns:
+            Union[CachedRowIterator, \
+                  google.cloud.bigquery.table.RowIterator]:
+                The rows. A :class:`CachedRowIterator` if the results were
+                cached, or could be cached.
+        """
+        if project is None:
+            project = client.project
+        if location is None:
+            location = client.location
+
+        cacheable = job_config is None or (
+            not job_config.dry_run and job_config.destination is None)
+        key = _cache_key(query, job_config, project, location)
+        if cacheable:
+            entry = self._get(key)
+            if entry is not None:
+                return CachedRowIterator(entry.schema, entry.rows)
+
+        query_job = client.query(
+            query, job_config=job_config, job_id_prefix=job_id_prefix,
+            location=location, project=project, retry=retry)
+        rows = query_job.result(timeout=timeout, retry=retry)
+        if (not cacheable or isinstance(rows, _EmptyRowIterator) or
+                query_job.statement_type not in _CACHEABLE_STATEMENT_TYPES):
+            return rows
+
+        values = []
+        for page in rows.pages:
+            if rows.total_rows is not None and (
+                    rows.total_rows > self._max_rows):
+                # Read the results again, from the first page.
+                return query_job.result(timeout=timeout, retry=retry)
+            values.extend(row.values() for row in page)
+
+        entry = _CacheEntry(
+            list(rows.schema), values, time.time() + self._ttl)
+        self._put(key, entry)
+        return CachedRowIterator(entry.schema, entry.rows)
+
+    def clear(self):
+        """Drop all of the cached results, in memory and in the directory."""
+        with self._lock:
+            self._entries.clear()
+        if self._directory is None:
+            return
+        for name in os.listdir(self._directory):
+            if name.endswith('.arrow'):
+                _remove(os.path.join(self._directory, name))
+
+    def _get(self, key):
+        """Get unexpired results from memory, or else from the directory."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires > time.time():
+                    # Mark the entry as the most recently used.
+                    self._entries[key] = self._entries.pop(key)
+                    return entry
+                del self._entries[key]
+
+        if self._directory is None:
+            return None
+        entry = self._read_file(key)
+        if entry is not None:
+            self._put_in_memory(key, entry)
+        return entry
+
+    def _put(self, key, entry):
+        self._put_in_memory(key, entry)
+        if self._directory is not None:
+            self._write_file(key, entry)
+
+    def _put_in_memory(self, key, entry):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self._directory, digest + '.arrow')
+
+    def _write_file(self, key, entry):
+        """Store results as an Arrow file, replacing it atomically."""
+        pyarrow = _pandas_helpers.pyarrow
+        table = CachedRowIterator(entry.schema, entry.rows).to_arrow()
+        table = table.replace_schema_metadata({
+            'key': key,
+            'expires': repr(entry.expires),
+            'schema': json.dumps(_build_schema_resource(entry.schema)),
+        })
+
+        handle, temp_path = tempfile.mkstemp(
+            dir=self._directory, suffix='.tmp')
+        os.close(handle)
+        try:
+            sink = pyarrow.OSFile(temp_path, 'wb')
+            try:
+                writer = pyarrow.RecordBatchFileWriter(sink, table.schema)
+                writer.write_table(table)
+                writer.close()
+            finally:
+                sink.close()
+            getattr(os, 'replace', os.rename)(temp_path, self._path(key))
+        except Exception:
+            _LOGGER.exception('Failed to store query results.')
+            _remove(temp_path)
+
+    def _read_file(self, key):
+        """Read unexpired results stored in the directory.
+
+        Returns:
+            Optional[_CacheEntry]: The results, if found.
+        """
+        pyarrow = _pandas_helpers.pyarrow
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            source = pyarrow.OSFile(path, 'rb')
+            try:
+                table = pyarrow.RecordBatchFileReader(source).read_all()
+            finally:
+                source.close()
+            metadata = table.schema.metadata
+            if metadata[b'key'].decode('utf-8') != key:
+                return None
+            expires = float(metadata[b'expires'])
+            if expires <= time.time():
+                _remove(path)
+                return None
+            schema = _parse_schema_resource({
+                'fields': json.loads(metadata[b'schema'].decode('utf-8'))})
+            columns = [
+                _pandas_helpers.arrow_to_bq_values(table.column(index), field)
+                for index, field in enumerate(schema)]
+        except Exception:
+            _LOGGER.exception('Failed to read stored query results.')
+            return None
+
+        rows = list(zip(*columns)) or [()] * table.num_rows
+        return _CacheEntry(schema, rows, expires)
+
+
+def _remove(path):
+    """Delete a file, if it still exists."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,335 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch rows from many threads into streaming insert requests."""
+
+from __future__ import absolute_import
+
+import json
+import logging
+import threading
+import time
+import uuid
+
+from concurrent import futures
+
+from google.cloud.bigquery._helpers import _row_to_json_converters
+from google.cloud.bigquery._helpers import _row_tuple_to_json
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.table import Table
+from google.cloud.bigquery.table import TableReference
+from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+from google.cloud.bigquery.table import _row_from_mapping
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_MAX_ROWS = 500
+"""int: Rows per ``insertAll`` request recommended by the API docs."""
+
+_DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+"""int: Default request payload size; the API rejects requests over 10 MB."""
+
+_DEFAULT_MAX_LATENCY = 0.05
+"""float: Default seconds a row may wait before its batch is sent."""
+
+_ROW_OVERHEAD_BYTES = 2
+"""int: Bytes added to a request by each row besides its JSON, i.e. ``, ``."""
+
+
+class _Batch(object):
+    """Rows waiting to be sent in one ``insertAll`` request.
+
+    Args:
+        deadline (float): The time by which the batch should be sent.
+    """
+
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.json_rows = []
+        self.row_ids = []
+        self.futures = []
+        self.size = 0
+
+
+class StreamingInserter(object):
+    """Insert rows from many threads using batched streaming inserts.
+
+    Rows passed to :meth:`insert` or :meth:`insert_json` are packed into
+    ``insertAll`` requests of at most ``max_rows`` rows and ``max_bytes``
+    bytes. A partially filled batch is sent once its oldest row has waited
+    ``max_latency`` seconds. Requests are sent on a pool of background
+    threads.
+
+    Each row gets a :class:`concurrent.futures.Future`. Its result is the
+    list of mappings describing the insert errors for that row, which is
+    empty if the row was inserted. If the whole request fails, the exception
+    is set on the futures of all rows in the request.
+
+    See
+    https://cloud.google.com/bigquery/docs/reference/rest/v2/tabledata/insertAll
+
+    Example:
+
+        >>> from google.cloud import bigquery
+        >>> client = bigquery.Client()
+        >>> table = client.get_table(client.dataset('ds').table('events'))
+        >>> with bigquery.StreamingInserter(client, table) as inserter:
+        ...     future = inserter.insert(('click', 3))
+        >>> future.result()
+        []
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client used to send the requests.
+        table (Union[google.cloud.bigquery.table.Table, \
+                     google.cloud.bigquery.table.TableReference]):
+            The destination table for the rows, or a reference to it.
+        selected_fields (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            (Optional) The fields of the rows passed to :meth:`insert`.
+            Required to use :meth:`insert` if ``table`` is a
+            :class:`~google.cloud.bigquery.table.TableReference`.
+        max_rows (int):
+            (Optional) The maximum number of rows per request.
+        max_bytes (int):
+            (Optional) The maximum size of the rows in a request, in bytes.
+        max_latency (float):
+            (Optional) The maximum time, in seconds, a row waits before it
+            is sent. If ``float('inf')``, batches are only sent when they are
+            full or when :meth:`flush` is called.
+        max_workers (int):
+            (Optional) The maximum number of concurrent requests.
+        skip_invalid_rows (bool):
+            (Optional) Insert all valid rows of a request, even if invalid
+            rows exist.
+        ignore_unknown_values (bool):
+            (Optional) Accept rows that contain values that do not match the
+            schema.
+        template_suffix (str):
+            (Optional) Treat the table as a template table and provide a
+            suffix.
+        retry (google.api_core.retry.Retry):
+            (Optional) How to retry the ``insertAll`` requests.
+
+    Raises:
+        TypeError: If ``table`` is not a table or table reference.
+    """
+
+    def __init__(self, client, table, selected_fields=None,
+                 max_rows=_DEFAULT_MAX_ROWS, max_bytes=_DEFAULT_MAX_BYTES,
+                 max_latency=_DEFAULT_MAX_LATENCY, max_workers=4,
+                 skip_invalid_rows=None, ignore_unknown_values=None,
+                 template_suffix=None, retry=DEFAULT_RETRY):
+        if selected_fields is not None:
+            schema = list(selected_fields)
+        elif isinstance(table, Table):
+            schema = table.schema
+        elif isinstance(table, TableReference):
+            schema = []
+        else:
+            raise TypeError('table should be Table or TableReference')
+
+        self._client = client
+        self._table = table
+        self._schema = schema
+        self._converters = _row_to_json_converters(schema)
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._max_latency = max_latency
+        self._insert_kwargs = {
+            'skip_invalid_rows': skip_invalid_rows,
+            'ignore_unknown_values': ignore_unknown_values,
+            'template_suffix': template_suffix,
+            'retry': retry,
+        }
+
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        # The members below are shared with the monitor thread; only access
+        # them with the condition's lock held.
+        self._condition = threading.Condition()
+        self._batch = None
+        self._closed = False
+        self._monitor_thread = None
+
+    @property
+    def table(self):
+        """Union[google.cloud.bigquery.table.Table, \
+        google.cloud.bigquery.table.TableReference]: The destination table.
+        """
+        return self._table
+
+    def insert(self, row, row_id=None):
+        """Queue a row to be inserted.
+
+        Args:
+            row (Union[Tuple[object], Dict[str, object]]):
+                The row. A tuple must contain the value of each schema field,
+                in schema order. A mapping must include all the required
+                fields of the schema.
+            row_id (str):
+                (Optional) A unique ID for the row, used by the API to
+                de-duplicate retried inserts. Created if omitted.
+
+        Returns:
+            concurrent.futures.Future:
+                Resolves to the list of insert errors for the row.
+
+        Raises:
+            ValueError: If the inserter has no schema or is closed.
+        """
+        if not self._schema:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+        if isinstance(row, dict):
+            row = _row_from_mapping(row, self._schema)
+        return self.insert_json(
+            _row_tuple_to_json(row, self._converters), row_id=row_id)
+
+    def insert_json(self, json_row, row_id=None):
+        """Queue a row to be inserted, without local type conversions.
+
+        Args:
+            json_row (Dict[str, object]):
+                The row. Keys must match the table schema fields and values
+                must be JSON-compatible representations.
+            row_id (str):
+                (Optional) A unique ID for the row, used by the API to
+                de-duplicate retried inserts. Created if omitted.
+
+        Returns:
+            concurrent.futures.Future:
+                Resolves to the list of insert errors for the row.
+
+        Raises:
+            ValueError: If the inserter is closed.
+        """
+        if row_id is None:
+            row_id = str(uuid.uuid4())
+        size = (len(json.dumps(json_row)) + len(row_id) +
+                _ROW_OVERHEAD_BYTES)
+        future = futures.Future()
+
+        with self._condition:
+            if self._closed:
+                raise ValueError('Cannot insert rows: inserter is closed.')
+
+            batch = self._batch
+            if batch is not None and (
+                    batch.size + size > self._max_bytes or
+                    len(batch.json_rows) >= self._max_rows):
+                self._commit_locked()
+                batch = None
+
+            if batch is None:
+                batch = self._batch = _Batch(time.time() + self._max_latency)
+                self._ensure_monitor_locked()
+                self._condition.notify()
+
+            batch.json_rows.append(json_row)
+            batch.row_ids.append(row_id)
+            batch.futures.append(future)
+            batch.size += size
+
+            if len(batch.json_rows) >= self._max_rows:
+                self._commit_locked()
+
+        return future
+
+    def flush(self):
+        """Send the rows queued so far, without waiting for the result."""
+        with self._condition:
+            self._commit_locked()
+
+    def close(self):
+        """Send the rows queued so far and wait for all requests to finish.
+
+        No rows may be inserted once the inserter is closed.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._commit_locked()
+            self._condition.notify()
+            monitor_thread = self._monitor_thread
+
+        if monitor_thread is not None:
+            monitor_thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _ensure_monitor_locked(self):
+        """Start the thread which sends batches once their deadline passes.
+
+        Must be called with the condition's lock held.
+        """
+        if self._monitor_thread is not None:
+            return
+        if self._max_latency >= float('inf'):
+            return
+        self._monitor_thread = threading.Thread(
+            name='Thread-MonitorStreamingInserter', target=self._monitor)
+        self._monitor_thread.daemon = True
+        self._monitor_thread.start()
+
+    def _monitor(self):
+        """Send each batch once its oldest row has waited long enough."""
+        with self._condition:
+            while not self._closed:
+                if self._batch is None:
+                    self._condition.wait()
+                    continue
+                remaining = self._batch.deadline - time.time()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                _LOGGER.debug('Sending batch after max_latency elapsed.')
+                self._commit_locked()
+
+    def _commit_locked(self):
+        """Hand the current batch to a worker thread to be sent.
+
+        Must be called with the condition's lock held.
+        """
+        batch = self._batch
+        self._batch = None
+        if batch is not None:
+            self._executor.submit(self._commit, batch)
+
+    def _commit(self, batch):
+        """Send a batch and resolve the futures of its rows.
+
+        Args:
+            batch (_Batch): The rows to send.
+        """
+        try:
+            errors = self._client.insert_rows_json(
+                self._table, batch.json_rows, row_ids=batch.row_ids,
+                **self._insert_kwargs)
+        except Exception as exc:
+            _LOGGER.exception(
+                'Failed to insert %s rows.', len(batch.futures))
+            for future in batch.futures:
+                future.set_exception(exc)
+            return
+
+        row_errors = {}
+        for error in errors:
+            row_errors[error['index']] = error['errors']
+        for index, future in enumerate(batch.futures):
+            future.set_result(row_errors.get(index, []))
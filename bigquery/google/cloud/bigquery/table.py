@@ -16,21 +16,29 @@
 
 from __future__ import absolute_import
 
+import collections
 import copy
 import datetime
 import operator
 import warnings
 
+from concurrent import futures
 import six
 try:
     import pandas
 except ImportError:  # pragma: NO COVER
     pandas = None
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
 
 from google.api_core.page_iterator import HTTPIterator
+from google.api_core.page_iterator import Page
 
 import google.cloud._helpers
 from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery.schema import _build_schema_resource
 from google.cloud.bigquery.schema import _parse_schema_resource
@@ -41,6 +49,10 @@ _NO_PANDAS_ERROR = (
     'The pandas library is not installed, please install '
     'pandas to use the to_dataframe() function.'
 )
+_NO_PYARROW_ERROR = (
+    'The pyarrow library is not installed, please install '
+    'pyarrow to use the to_arrow() function.'
+)
 _TABLE_HAS_NO_SCHEMA = 'Table has no schema:  call "client.get_table()"'
 _MARKER = object()
 
@@ -1080,19 +1092,33 @@ class RowIterator(HTTPIterator):
         page_size (int, optional): The number of items to return per page.
         extra_params (Dict[str, object]):
             Extra query string parameters for the API call.
+        prefetch_pages (int, optional):
+            If set, read up to this many pages ahead of the caller on a pool
+            of background threads. Once the first page reports the total
+            number of rows, the remaining pages are requested concurrently
+            by ``startIndex`` and yielded in order. Only enable this for
+            tables which are not modified while being read, such as query
+            results.
     """
 
     def __init__(self, client, api_request, path, schema, page_token=None,
-                 max_results=None, page_size=None, extra_params=None):
+                 max_results=None, page_size=None, extra_params=None,
+                 prefetch_pages=None):
         super(RowIterator, self).__init__(
             client, api_request, path, item_to_value=_item_to_row,
             items_key='rows', page_token=page_token, max_results=max_results,
             extra_params=extra_params, page_start=_rows_page_start,
             next_token='pageToken')
+        if prefetch_pages is not None and prefetch_pages < 1:
+            raise ValueError('prefetch_pages must be a positive integer')
         self._schema = schema
-        self._field_to_index = _helpers._field_to_index_mapping(schema)
+        compiled_schema = _helpers._compile_schema(schema)
+        self._row_converters = compiled_schema.converters
+        self._field_to_index = compiled_schema.field_to_index
         self._total_rows = None
         self._page_size = page_size
+        self._prefetch_pages = prefetch_pages
+        self._prefetched_responses = None
 
     def _get_next_page_response(self):
         """Requests the next page from the path provided.
@@ -1109,6 +1135,178 @@ class RowIterator(HTTPIterator):
             path=self.path,
             query_params=params)
 
+    def _next_page(self):
+        """Get the next page in the iterator.
+
+        Returns:
+            Optional[google.api_core.page_iterator.Page]:
+                The next page in the iterator or :data:`None` if there are no
+                pages left.
+        """
+        if self._prefetch_pages is None:
+            return super(RowIterator, self)._next_page()
+
+        if self._prefetched_responses is None:
+            self._prefetched_responses = self._prefetch_page_responses()
+        response = six.next(self._prefetched_responses, None)
+        if response is None:
+            return None
+        items = response.get(self._items_key, ())
+        page = Page(self, items, self.item_to_value)
+        self._page_start(self, page, response)
+        self.next_page_token = response.get(self._next_token)
+        return page
+
+    def _fetch_page(self, page_token=None, start_index=None,
+                    max_results=None):
+        """Request a single page without touching the iterator's state.
+
+        This is safe to call from a background thread.
+
+        Args:
+            page_token (str, optional): The token of the page to request.
+            start_index (int, optional): The index of the first row to read.
+            max_results (int, optional): The maximum number of rows to read.
+
+        Returns:
+            Dict[str, object]: The parsed JSON response of the page.
+        """
+        params = dict(self.extra_params)
+        if page_token is not None:
+            params[self._PAGE_TOKEN] = page_token
+        if start_index is not None:
+            params['startIndex'] = start_index
+        if max_results is not None:
+            params[self._MAX_RESULTS] = max_results
+        return self.api_request(
+            method=self._HTTP_METHOD,
+            path=self.path,
+            query_params=params)
+
+    def _prefetch_page_responses(self):
+        """Generate page responses in order, reading ahead of the caller.
+
+        The first page is requested in the caller's thread. If the read
+        started at a known row (no ``page_token`` was given) and the response
+        includes ``totalRows``, the rest of the rows are split into ranges of
+        one page each which are requested concurrently by ``startIndex``.
+        Otherwise the ``pageToken`` chain is followed, with the request for
+        the next page in flight while the current page is consumed.
+
+        Yields:
+            Dict[str, object]: The parsed JSON response of each page.
+        """
+        executor = futures.ThreadPoolExecutor(
+            max_workers=self._prefetch_pages)
+        try:
+            resumed = self.next_page_token is not None
+            limit = self.max_results
+            page_size = self._page_size
+            if limit is not None and (page_size is None or limit < page_size):
+                page_size = limit
+
+            response = self._fetch_page(
+                page_token=self.next_page_token, max_results=page_size)
+            fetched = len(response.get(self._items_key, ()))
+            total_rows = response.get('totalRows')
+            page_token = response.get(self._next_token)
+
+            if resumed or total_rows is None:
+                for response in self._prefetch_by_token(
+                        executor, response, limit, page_size):
+                    yield response
+                return
+
+            yield response
+            if page_token is None or fetched == 0:
+                return
+
+            start = int(self.extra_params.get('startIndex', 0))
+            end = int(total_rows)
+            if limit is not None:
+                end = min(end, start + limit)
+            for response in self._prefetch_by_range(
+                    executor, start + fetched, end, page_size or fetched):
+                yield response
+        finally:
+            executor.shutdown(wait=False)
+
+    def _prefetch_by_token(self, executor, response, limit, page_size):
+        """Follow the ``pageToken`` chain, one request ahead of the caller.
+
+        Args:
+            executor (concurrent.futures.Executor): Runs the page requests.
+            response (Dict[str, object]): The first page response.
+            limit (Optional[int]): The maximum number of rows to read.
+            page_size (Optional[int]): The maximum number of rows per page.
+
+        Yields:
+            Dict[str, object]: The parsed JSON response of each page.
+        """
+        fetched = 0
+        while True:
+            fetched += len(response.get(self._items_key, ()))
+            page_token = response.get(self._next_token)
+            next_response = None
+            if page_token is not None and (limit is None or fetched < limit):
+                max_results = page_size
+                if limit is not None:
+                    max_results = min(page_size, limit - fetched)
+                next_response = executor.submit(
+                    self._fetch_page, page_token=page_token,
+                    max_results=max_results)
+            yield response
+            if next_response is None:
+                return
+            response = next_response.result()
+
+    def _prefetch_by_range(self, executor, start, end, page_size):
+        """Request rows ``[start, end)`` one page per request, concurrently.
+
+        At most ``prefetch_pages`` requests are in flight, and their
+        responses are yielded in row order. If the API returns fewer rows
+        than requested for a range, the remainder is requested next.
+
+        Args:
+            executor (concurrent.futures.Executor): Runs the page requests.
+            start (int): The index of the first row to read.
+            end (int): One past the index of the last row to read.
+            page_size (int): The maximum number of rows per request.
+
+        Yields:
+            Dict[str, object]: The parsed JSON response of each page.
+        """
+        pending = collections.deque()
+
+        def submit(range_start, range_size):
+            future = executor.submit(
+                self._fetch_page, start_index=range_start,
+                max_results=range_size)
+            return range_start, range_size, future
+
+        next_start = start
+        try:
+            while pending or next_start < end:
+                while (next_start < end and
+                       len(pending) < self._prefetch_pages):
+                    range_size = min(page_size, end - next_start)
+                    pending.append(submit(next_start, range_size))
+                    next_start += range_size
+
+                range_start, range_size, future = pending.popleft()
+                response = future.result()
+                fetched = len(response.get(self._items_key, ()))
+                if fetched == 0:
+                    # The table has fewer rows than reported. Stop reading.
+                    return
+                if fetched < range_size:
+                    pending.appendleft(
+                        submit(range_start + fetched, range_size - fetched))
+                yield response
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
     @property
     def schema(self):
         """List[google.cloud.bigquery.schema.SchemaField]: Table's schema."""
@@ -1135,10 +1333,56 @@ class RowIterator(HTTPIterator):
         if pandas is None:
             raise ValueError(_NO_PANDAS_ERROR)
 
-        column_headers = [field.name for field in self.schema]
-        rows = [row.values() for row in iter(self)]
+        column_names = [field.name for field in self._schema]
+        frames = [_page_to_dataframe(page, column_names)
+                  for page in iter(self.pages)]
+
+        if not frames:
+            return pandas.DataFrame(columns=column_names)
+        if len(frames) == 1:
+            return frames[0]
+        return pandas.concat(frames, ignore_index=True)
+
+    def to_arrow_iterable(self):
+        """Iterate over the query results as Arrow record batches.
 
-        return pandas.DataFrame(rows, columns=column_headers)
+        Each page of results is decoded column by column into one
+        :class:`pyarrow.RecordBatch`, so only one page is held in memory at
+        a time. RECORD and REPEATED fields become Arrow structs and lists.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]:
+                One record batch per page, with the Arrow schema derived
+                from the schema of the results.
+
+        Raises:
+            ValueError: If the :mod:`pyarrow` library cannot be imported.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        arrow_schema = _pandas_helpers.bq_to_arrow_schema(self._schema)
+        return (_columns_to_arrow(page._columns, self._schema, arrow_schema)
+                for page in iter(self.pages))
+
+    def to_arrow(self):
+        """Create a :class:`pyarrow.Table` from the query results.
+
+        Returns:
+            pyarrow.Table:
+                A :class:`pyarrow.Table` populated with row data and column
+                headers from the query results. The column headers are
+                derived from the destination table's schema.
+
+        Raises:
+            ValueError: If the :mod:`pyarrow` library cannot be imported.
+        """
+        record_batches = list(self.to_arrow_iterable())
+        if not record_batches:
+            record_batches.append(_columns_to_arrow(
+                [[] for _ in self._schema], self._schema,
+                _pandas_helpers.bq_to_arrow_schema(self._schema)))
+        return pyarrow.Table.from_batches(record_batches)
 
 
 class _EmptyRowIterator(object):
@@ -1157,6 +1401,17 @@ class _EmptyRowIterator(object):
             raise ValueError(_NO_PANDAS_ERROR)
         return pandas.DataFrame()
 
+    def to_arrow_iterable(self):
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+        return iter(())
+
+    def to_arrow(self):
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+        return pyarrow.Table.from_batches(
+            [pyarrow.RecordBatch.from_arrays([], [])])
+
     def __iter__(self):
         return iter(())
 
@@ -1305,10 +1560,58 @@ def _item_to_row(iterator, resource):
     :rtype: :class:`~google.cloud.bigquery.table.Row`
     :returns: The next row in the page.
     """
-    return Row(_helpers._row_tuple_from_json(resource, iterator.schema),
+    return Row(_helpers._row_tuple_from_cells(
+                   resource['f'], iterator._row_converters),
                iterator._field_to_index)
 
 
+def _page_to_dataframe(page, column_names):
+    """Create a :class:`pandas.DataFrame` from a page of rows.
+
+    The cells are decoded column-at-a-time from the raw page response, so no
+    :class:`~google.cloud.bigquery.table.Row` objects are created.
+
+    :type page: :class:`~google.api_core.page_iterator.Page`
+    :param page: A page of rows, started by :func:`_rows_page_start`.
+
+    :type column_names: list
+    :param column_names: The names of the columns, in schema order.
+
+    :rtype: :class:`pandas.DataFrame`
+    :returns: The rows in the page.
+    """
+    columns = {name: list(column)
+               for name, column in zip(column_names, page._columns)}
+    return pandas.DataFrame(columns, columns=column_names)
+
+
+def _columns_to_arrow(columns, schema, arrow_schema):
+    """Create a :class:`pyarrow.RecordBatch` from decoded columns.
+
+    :type columns: list
+    :param columns: One iterable of decoded values per field, such as the
+                    ``_columns`` of a page started by
+                    :func:`_rows_page_start`.
+
+    :type schema: list
+    :param schema: The :class:`~google.cloud.bigquery.schema.SchemaField`
+                   of each column.
+
+    :type arrow_schema: :class:`pyarrow.Schema`
+    :param arrow_schema: The schema of the record batch, or :data:`None` to
+                         infer the types of the columns.
+
+    :rtype: :class:`pyarrow.RecordBatch`
+    :returns: The columns.
+    """
+    arrays = [_pandas_helpers.bq_to_arrow_array(list(column), field)
+              for column, field in zip(columns, schema)]
+    if arrow_schema is None:
+        return pyarrow.RecordBatch.from_arrays(
+            arrays, [field.name for field in schema])
+    return pyarrow.RecordBatch.from_arrays(arrays, arrow_schema)
+
+
 # pylint: disable=unused-argument
 def _rows_page_start(iterator, page, response):
     """Grab total rows when :class:`~google.cloud.iterator.Page` starts.
@@ -1326,4 +1629,8 @@ def _rows_page_start(iterator, page, response):
     if total_rows is not None:
         total_rows = int(total_rows)
     iterator._total_rows = total_rows
+    # Keep a lazy, column-oriented view of the page for ``to_dataframe`` and
+    # ``to_arrow``.
+    page._columns = _helpers._row_iterator_page_columns(
+        iterator._schema, response)
 # pylint: enable=unused-argument
@@ -37,7 +37,7 @@ extras = {
     'pandas': 'pandas>=0.17.1',
     # Exclude PyArrow dependency from Windows Python 2.7.
     'pyarrow: platform_system != "Windows" or python_version >= "3.4"':
-        'pyarrow>=0.4.1',
+        'pyarrow>=0.11.1',
 }
 
 
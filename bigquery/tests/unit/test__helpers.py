@@ -13,10 +13,13 @@
 # limitations under the License.
 
 import base64
+import collections
 import datetime
 import decimal
 import unittest
 
+import mock
+
 
 class Test_not_null(unittest.TestCase):
 
@@ -421,6 +424,106 @@ class Test_field_to_index_mapping(unittest.TestCase):
             {'first': 0, 'second': 1, 'third': 2})
 
 
+class Test_compile_schema(unittest.TestCase):
+
+    def _call_fut(self, schema):
+        from google.cloud.bigquery._helpers import _compile_schema
+
+        return _compile_schema(schema)
+
+    def test_w_scalar_fields(self):
+        schema = [
+            _Field('REQUIRED', 'name', 'STRING'),
+            _Field('NULLABLE', 'age', 'INTEGER'),
+            _Field('NULLABLE', 'score', 'FLOAT64'),
+            _Field('NULLABLE', 'joined', 'BOOLEAN'),
+        ]
+
+        converters, field_to_index = self._call_fut(schema)
+
+        self.assertEqual(
+            field_to_index, {'name': 0, 'age': 1, 'score': 2, 'joined': 3})
+        self.assertEqual(
+            [convert(value) for convert, value
+             in zip(converters, ['Phred', '32', '1.5', 'true'])],
+            ['Phred', 32, 1.5, True])
+        self.assertEqual(
+            [convert(None) for convert in converters[1:]],
+            [None, None, None])
+
+    def test_w_required_record_and_repeated_fields(self):
+        area_code = _Field('REQUIRED', 'area_code', 'STRING')
+        rank = _Field('NULLABLE', 'rank', 'INTEGER')
+        phone = _Field('REQUIRED', 'phone', 'RECORD', fields=[area_code, rank])
+        color = _Field('REPEATED', 'color', 'STRING')
+
+        (convert_phone, convert_color), _ = self._call_fut([phone, color])
+
+        self.assertEqual(
+            convert_phone({'f': [{'v': '800'}, {'v': None}]}),
+            {'area_code': '800', 'rank': None})
+        self.assertEqual(
+            convert_color([{'v': 'orange'}, {'v': 'black'}]),
+            ['orange', 'black'])
+
+    def test_w_unknown_field_type(self):
+        geo = _Field('NULLABLE', 'geo', 'UNKNOWN')
+
+        (convert,), _ = self._call_fut([geo])
+
+        self.assertIsNone(convert(None))
+        with self.assertRaises(KeyError):
+            convert('POINT(1 2)')
+
+    def test_caches_compiled_schema(self):
+        schema = [_Field('REQUIRED', 'name', 'STRING')]
+
+        compiled = self._call_fut(schema)
+
+        self.assertIs(self._call_fut(list(schema)), compiled)
+
+    def test_w_mode_and_type_spellings(self):
+        from google.cloud.bigquery import _helpers
+        from google.cloud.bigquery.schema import SchemaField
+
+        lower_schema = [SchemaField('x', 'integer', 'nullable')]
+        upper_schema = [SchemaField('x', 'INTEGER', 'NULLABLE')]
+        null_row = {'f': [{'v': None}]}
+        row = {'f': [{'v': '1'}]}
+
+        with mock.patch.object(
+                _helpers, '_schema_cache', new=collections.OrderedDict()):
+            self.assertEqual(
+                _helpers._row_tuple_from_json(row, lower_schema), (1,))
+            self.assertEqual(
+                _helpers._row_tuple_from_json(null_row, lower_schema),
+                (None,))
+            self.assertEqual(
+                _helpers._row_tuple_from_json(null_row, upper_schema),
+                (None,))
+            self.assertEqual(
+                _helpers._row_tuple_from_json(row, upper_schema), (1,))
+
+    def test_evicts_least_recently_used(self):
+        from google.cloud.bigquery import _helpers
+
+        schema_1 = [_Field('REQUIRED', 'one', 'STRING')]
+        schema_2 = [_Field('REQUIRED', 'two', 'STRING')]
+        schema_3 = [_Field('REQUIRED', 'three', 'STRING')]
+
+        with mock.patch.object(_helpers, '_SCHEMA_CACHE_SIZE', new=2), \
+                mock.patch.object(
+                    _helpers, '_schema_cache',
+                    new=collections.OrderedDict()):
+            compiled_1 = self._call_fut(schema_1)
+            compiled_2 = self._call_fut(schema_2)
+            self.assertIs(self._call_fut(schema_1), compiled_1)
+            self._call_fut(schema_3)
+
+            self.assertIs(self._call_fut(schema_1), compiled_1)
+            self.assertIsNot(self._call_fut(schema_2), compiled_2)
+
+
 class Test_row_tuple_from_json(unittest.TestCase):
 
     def _call_fut(self, row, schema):
@@ -566,6 +669,9 @@ class Test_rows_from_json(unittest.TestCase):
         ]
         coerced = self._call_fut(rows, schema)
         self.assertEqual(coerced, expected)
+        # All of the rows share a single field-to-index mapping.
+        self.assertIs(
+            coerced[0]._xxx_field_to_index, coerced[1]._xxx_field_to_index)
 
     def test_w_int64_float64_bool(self):
         from google.cloud.bigquery.table import Row
@@ -606,6 +712,52 @@ class Test_rows_from_json(unittest.TestCase):
         self.assertEqual(coerced, expected)
 
 
+class Test_row_iterator_page_columns(unittest.TestCase):
+
+    def _call_fut(self, schema, response):
+        from google.cloud.bigquery._helpers import _row_iterator_page_columns
+
+        return _row_iterator_page_columns(schema, response)
+
+    def test_w_empty_response(self):
+        name = _Field('REQUIRED', 'name', 'STRING')
+        columns = self._call_fut([name], {})
+        self.assertEqual([list(column) for column in columns], [[]])
+
+    def test_w_repeated_and_record(self):
+        name = _Field('REQUIRED', 'name', 'STRING')
+        age = _Field('NULLABLE', 'age', 'INTEGER')
+        color = _Field('REPEATED', 'color', 'STRING')
+        area_code = _Field('REQUIRED', 'area_code', 'STRING')
+        phone = _Field('NULLABLE', 'phone', 'RECORD', fields=[area_code])
+        schema = [name, age, color, phone]
+        response = {'rows': [
+            {'f': [
+                {'v': 'Phred Phlyntstone'},
+                {'v': '32'},
+                {'v': [{'v': 'orange'}, {'v': 'black'}]},
+                {'v': {'f': [{'v': '800'}]}},
+            ]},
+            {'f': [
+                {'v': 'Bharney Rhubble'},
+                {'v': None},
+                {'v': []},
+                {'v': None},
+            ]},
+        ]}
+
+        columns = self._call_fut(schema, response)
+
+        self.assertEqual(
+            [list(column) for column in columns],
+            [
+                ['Phred Phlyntstone', 'Bharney Rhubble'],
+                [32, None],
+                [['orange', 'black'], []],
+                [{'area_code': '800'}, None],
+            ])
+
+
 class Test_int_to_json(unittest.TestCase):
 
     def _call_fut(self, value):
@@ -0,0 +1,421 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import mock
+import six
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+    import pyarrow.parquet
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
+
+
+def _parquet_stream_supported():
+    from google.cloud.bigquery._pandas_helpers import parquet_stream_supported
+
+    return parquet_stream_supported()
+
+
+@unittest.skipIf(pandas is None, 'Requires `pandas`')
+class Test_parquet_stream_supported(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut():
+        from google.cloud.bigquery._pandas_helpers import (
+            parquet_stream_supported)
+
+        return parquet_stream_supported()
+
+    def test_wo_pyarrow(self):
+        with mock.patch(
+                'google.cloud.bigquery._pandas_helpers.pyarrow', new=None):
+            self.assertFalse(self._call_fut())
+
+    def _call_fut_w_version(self, version):
+        pyarrow_module = mock.Mock(__version__=version, spec=['__version__'])
+        with mock.patch(
+                'google.cloud.bigquery._pandas_helpers.pyarrow',
+                new=pyarrow_module):
+            return self._call_fut()
+
+    def test_w_tested_versions(self):
+        self.assertTrue(self._call_fut_w_version('0.11.1'))
+        self.assertTrue(self._call_fut_w_version('0.14.1'))
+
+    def test_w_untested_versions(self):
+        self.assertFalse(self._call_fut_w_version('0.9.0'))
+        self.assertFalse(self._call_fut_w_version('0.15.0'))
+
+
+@unittest.skipUnless(
+    _parquet_stream_supported(), 'Requires a `pyarrow` release in range')
+class TestParquetStream(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._pandas_helpers import ParquetStream
+
+        return ParquetStream
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_dataframe(num_rows):
+        return pandas.DataFrame({
+            'name': ['name-{}'.format(i) for i in range(num_rows)],
+            'score': [i * 0.5 for i in range(num_rows)],
+        })
+
+    @staticmethod
+    def _read_all(stream, chunk_size):
+        chunks = []
+        while True:
+            chunk = stream.read(chunk_size)
+            chunks.append(chunk)
+            if len(chunk) < chunk_size:
+                return b''.join(chunks)
+
+    def test_read_in_chunks(self):
+        dataframe = self._make_dataframe(1000)
+
+        with self._make_one(dataframe, 1024, row_group_bytes=1024) as stream:
+            self.assertEqual(stream.mode, 'rb')
+            self.assertEqual(stream.tell(), 0)
+            data = self._read_all(stream, 1024)
+            self.assertEqual(stream.tell(), len(data))
+
+        parquet_file = pyarrow.parquet.ParquetFile(six.BytesIO(data))
+        self.assertGreater(parquet_file.num_row_groups, 1)
+        self.assertTrue(parquet_file.read().to_pandas().equals(dataframe))
+
+    def test_read_in_chunks_w_index(self):
+        dataframe = self._make_dataframe(1000)
+        dataframe.index = pandas.Index(
+            ['key-{}'.format(i) for i in range(1000)], name='key')
+
+        with self._make_one(dataframe, 1024, row_group_bytes=1024) as stream:
+            data = self._read_all(stream, 1024)
+
+        parquet_file = pyarrow.parquet.ParquetFile(six.BytesIO(data))
+        self.assertGreater(parquet_file.num_row_groups, 1)
+        self.assertTrue(parquet_file.read().to_pandas().equals(dataframe))
+        self.assertEqual(
+            list(parquet_file.read().to_pandas().index), list(dataframe.index))
+
+    def test_read_all(self):
+        dataframe = self._make_dataframe(10)
+
+        with self._make_one(dataframe, 1024) as stream:
+            data = stream.read()
+
+        received = pyarrow.parquet.read_table(six.BytesIO(data)).to_pandas()
+        self.assertTrue(received.equals(dataframe))
+
+    def test_read_empty_dataframe(self):
+        dataframe = pandas.DataFrame({'score': []}, dtype='float64')
+
+        with self._make_one(dataframe, 1024) as stream:
+            data = stream.read()
+
+        received = pyarrow.parquet.read_table(six.BytesIO(data)).to_pandas()
+        self.assertEqual(list(received.columns), ['score'])
+        self.assertEqual(len(received), 0)
+
+    def test_read_w_missing_values_in_first_row_group(self):
+        dataframe = pandas.DataFrame({
+            'name': [None] * 100 + ['name-{}'.format(i) for i in range(100)],
+        })
+
+        with self._make_one(dataframe, 256, row_group_bytes=256) as stream:
+            data = stream.read()
+
+        received = pyarrow.parquet.read_table(six.BytesIO(data))
+        self.assertEqual(
+            received.schema.field_by_name('name').type, pyarrow.string())
+        self.assertTrue(received.to_pandas().equals(dataframe))
+
+    def test_read_w_only_missing_values(self):
+        dataframe = pandas.DataFrame({
+            'name': [None] * 10,
+            'score': [i * 0.5 for i in range(10)],
+        })
+
+        with self._make_one(dataframe, 256, row_group_bytes=64) as stream:
+            data = stream.read()
+
+        received = pyarrow.parquet.read_table(six.BytesIO(data))
+        self.assertEqual(
+            received.schema.field_by_name('name').type, pyarrow.null())
+        self.assertEqual(received.num_rows, 10)
+
+    def test_row_groups_reuse_first_row_group(self):
+        from google.cloud.bigquery import _pandas_helpers
+
+        dataframe = self._make_dataframe(10)
+        pyarrow_module = mock.Mock(wraps=pyarrow)
+
+        with mock.patch.object(_pandas_helpers, 'pyarrow', new=pyarrow_module):
+            _, groups = _pandas_helpers.dataframe_to_arrow_row_groups(
+                dataframe, 100)
+            groups = list(groups)
+
+        self.assertEqual(len(groups), 1)
+        pyarrow_module.Table.from_pandas.assert_called_once_with(
+            mock.ANY, preserve_index=True)
+
+    def test_read_raises_writer_error(self):
+        dataframe = pandas.DataFrame({'mixed': [1, 'two', 3.0]})
+
+        with self._make_one(dataframe, 1024) as stream:
+            with self.assertRaises(pyarrow.ArrowException):
+                stream.read(1024)
+
+    def test_seek_within_last_read(self):
+        dataframe = self._make_dataframe(1000)
+
+        with self._make_one(dataframe, 1024) as stream:
+            stream.read(1024)
+            second = stream.read(1024)
+            self.assertEqual(stream.seek(1024 + 100), 1024 + 100)
+            self.assertEqual(stream.tell(), 1024 + 100)
+            self.assertEqual(stream.read(924), second[100:])
+            self.assertEqual(stream.tell(), 2048)
+
+    def test_seek_before_last_read(self):
+        dataframe = self._make_dataframe(1000)
+
+        with self._make_one(dataframe, 1024) as stream:
+            stream.read(1024)
+            stream.read(1024)
+            with self.assertRaises(ValueError):
+                stream.seek(0)
+            with self.assertRaises(ValueError):
+                stream.seek(4096)
+            with self.assertRaises(ValueError):
+                stream.seek(0, os.SEEK_END)
+
+    def test_close_stops_writer(self):
+        dataframe = self._make_dataframe(10000)
+        stream = self._make_one(dataframe, 256, row_group_bytes=256)
+
+        stream.read(256)
+        stream.close()
+
+        self.assertFalse(stream._writer_thread.is_alive())
+
+    def test_resumable_upload(self):
+        from google import resumable_media
+        from google.resumable_media.requests import ResumableUpload
+
+        chunk_size = resumable_media.UPLOAD_CHUNK_SIZE
+        dataframe = self._make_dataframe(100000)
+        uploaded = []
+
+        def request(method, url, data=None, headers=None, **kwargs):
+            response = mock.Mock(headers={}, spec=['headers', 'status_code'])
+            if method == 'POST':
+                response.status_code = 200
+                response.headers['location'] = 'http://test.invalid/upload'
+                return response
+            uploaded.append(data)
+            if headers['content-range'].endswith('*'):
+                response.status_code = resumable_media.PERMANENT_REDIRECT
+                response.headers['range'] = 'bytes=0-{}'.format(
+                    sum(len(chunk) for chunk in uploaded) - 1)
+            else:
+                response.status_code = 200
+            return response
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = request
+        upload = ResumableUpload('http://test.invalid', chunk_size)
+
+        with self._make_one(dataframe, chunk_size) as stream:
+            upload.initiate(
+                transport, stream, {}, 'application/octet-stream',
+                stream_final=False)
+            while not upload.finished:
+                upload.transmit_next_chunk(transport)
+
+        self.assertGreater(len(uploaded), 1)
+        data = b''.join(uploaded)
+        received = pyarrow.parquet.read_table(six.BytesIO(data)).to_pandas()
+        self.assertTrue(received.equals(dataframe))
+
+
+class Test_ParquetSink(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._pandas_helpers import _ParquetSink
+
+        return _ParquetSink
+
+    def test_file_interface(self):
+        written = []
+        sink = self._get_target_class()(written.append)
+
+        self.assertEqual(sink.write(b'abc'), 3)
+        self.assertEqual(sink.write(b'de'), 2)
+        sink.flush()
+        self.assertEqual(sink.tell(), 5)
+        self.assertFalse(sink.closed)
+        sink.close()
+
+        self.assertTrue(sink.closed)
+        self.assertEqual(written, [b'abc', b'de'])
+
+
+@unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+class Test_bq_to_arrow_data_type(unittest.TestCase):
+
+    def _call_fut(self, field):
+        from google.cloud.bigquery._pandas_helpers import (
+            bq_to_arrow_data_type)
+
+        return bq_to_arrow_data_type(field)
+
+    def test_scalars(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        expected = {
+            'BOOL': pyarrow.bool_(),
+            'BYTES': pyarrow.binary(),
+            'DATE': pyarrow.date32(),
+            'DATETIME': pyarrow.timestamp('us'),
+            'FLOAT': pyarrow.float64(),
+            'INTEGER': pyarrow.int64(),
+            'NUMERIC': pyarrow.decimal128(38, 9),
+            'STRING': pyarrow.string(),
+            'TIME': pyarrow.time64('us'),
+            'TIMESTAMP': pyarrow.timestamp('us', tz='UTC'),
+        }
+        for field_type, data_type in expected.items():
+            self.assertEqual(
+                self._call_fut(SchemaField('x', field_type)), data_type)
+
+    def test_repeated_record(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        field = SchemaField('people', 'RECORD', mode='REPEATED', fields=[
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('tags', 'STRING', mode='REPEATED'),
+        ])
+
+        self.assertEqual(
+            self._call_fut(field),
+            pyarrow.list_(pyarrow.struct([
+                pyarrow.field('name', pyarrow.string(), nullable=False),
+                pyarrow.field('tags', pyarrow.list_(pyarrow.string())),
+            ])))
+
+    def test_unknown(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        self.assertIsNone(self._call_fut(SchemaField('x', 'UNKNOWN')))
+        self.assertIsNone(self._call_fut(
+            SchemaField('x', 'RECORD', fields=[SchemaField('y', 'UNKNOWN')])))
+        self.assertIsNone(self._call_fut(
+            SchemaField('x', 'UNKNOWN', mode='REPEATED')))
+
+
+@unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+class Test_bq_to_arrow_schema(unittest.TestCase):
+
+    def _call_fut(self, bq_schema):
+        from google.cloud.bigquery._pandas_helpers import bq_to_arrow_schema
+
+        return bq_to_arrow_schema(bq_schema)
+
+    def test_known_types(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        bq_schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER'),
+        ]
+
+        self.assertEqual(self._call_fut(bq_schema), pyarrow.schema([
+            pyarrow.field('name', pyarrow.string(), nullable=False),
+            pyarrow.field('age', pyarrow.int64()),
+        ]))
+
+    def test_unknown_type(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        bq_schema = [
+            SchemaField('name', 'STRING'),
+            SchemaField('shape', 'UNKNOWN'),
+        ]
+
+        self.assertIsNone(self._call_fut(bq_schema))
+
+
+@unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+class Test_arrow_to_bq_values(unittest.TestCase):
+
+    def _round_trip(self, values, field):
+        from google.cloud.bigquery._pandas_helpers import arrow_to_bq_values
+        from google.cloud.bigquery._pandas_helpers import bq_to_arrow_array
+
+        return arrow_to_bq_values(bq_to_arrow_array(values, field), field)
+
+    def test_timestamps(self):
+        import datetime
+        import pytz
+        from google.cloud.bigquery.schema import SchemaField
+
+        values = [
+            datetime.datetime(2018, 1, 2, 3, 4, 5, 6, tzinfo=pytz.utc), None]
+        result = self._round_trip(values, SchemaField('ts', 'TIMESTAMP'))
+
+        self.assertEqual(result, values)
+        self.assertIsInstance(result[0], datetime.datetime)
+
+    def test_nested_timestamps(self):
+        import datetime
+        from google.cloud.bigquery.schema import SchemaField
+
+        field = SchemaField('events', 'RECORD', mode='REPEATED', fields=[
+            SchemaField('name', 'STRING'),
+            SchemaField('at', 'DATETIME'),
+        ])
+        values = [
+            [{'name': 'start', 'at': datetime.datetime(2018, 1, 2, 3, 4)},
+             {'name': 'stop', 'at': None}],
+            [],
+        ]
+
+        self.assertEqual(self._round_trip(values, field), values)
+
+    def test_scalars(self):
+        import decimal
+        from google.cloud.bigquery.schema import SchemaField
+
+        self.assertEqual(
+            self._round_trip([b'\x00', None], SchemaField('b', 'BYTES')),
+            [b'\x00', None])
+        self.assertEqual(
+            self._round_trip(
+                [decimal.Decimal('1.5')], SchemaField('n', 'NUMERIC')),
+            [decimal.Decimal('1.5')])
@@ -36,6 +36,12 @@ except (ImportError, AttributeError):  # pragma: NO COVER
 from google.cloud.bigquery.dataset import DatasetReference
 
 
+def _parquet_stream_supported():
+    from google.cloud.bigquery._pandas_helpers import parquet_stream_supported
+
+    return parquet_stream_supported()
+
+
 def _make_credentials():
     import google.auth.credentials
 
@@ -1976,6 +1982,58 @@ class TestClient(unittest.TestCase):
                 'maxCreationTime': str(end_time_millis),
             })
 
+    def test_wait_all(self):
+        from google.cloud.bigquery.job import CopyJob
+        from google.cloud.bigquery.job_waiter import JobWaiter
+
+        SOURCE_TABLE = {
+            'projectId': self.PROJECT,
+            'datasetId': self.DS_ID,
+            'tableId': 'source_table',
+        }
+        DESTINATION_TABLE = {
+            'projectId': self.PROJECT,
+            'datasetId': self.DS_ID,
+            'tableId': 'destination_table',
+        }
+
+        def make_resource(job_id, state):
+            return {
+                'jobReference': {'projectId': self.PROJECT, 'jobId': job_id},
+                'configuration': {
+                    'copy': {
+                        'sourceTables': [SOURCE_TABLE],
+                        'destinationTable': DESTINATION_TABLE,
+                    },
+                },
+                'status': {'state': state},
+            }
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _make_connection(
+            make_resource('running_job', 'DONE'))
+        done_job = CopyJob.from_api_repr(
+            make_resource('done_job', 'DONE'), client)
+        running_job = CopyJob.from_api_repr(
+            make_resource('running_job', 'RUNNING'), client)
+
+        def make_waiter(retry):
+            return JobWaiter(initial_delay=0.0, retry=retry)
+
+        waiter_patch = mock.patch(
+            'google.cloud.bigquery.client.JobWaiter', side_effect=make_waiter)
+        with waiter_patch:
+            done, not_done = client.wait_all([done_job, running_job])
+
+        self.assertEqual(done, [done_job, running_job])
+        self.assertEqual(not_done, [])
+        self.assertIs(running_job.result(), running_job)
+        conn.api_request.assert_called_once_with(
+            method='GET',
+            path='/projects/%s/jobs/running_job' % self.PROJECT,
+            query_params={})
+
     def test_load_table_from_uri(self):
         from google.cloud.bigquery.job import LoadJob
 
@@ -3485,6 +3543,35 @@ class TestClient(unittest.TestCase):
             self.assertEqual(req[1]['query_params'], test[1],
                              'for kwargs %s' % test[0])
 
+    def test_list_rows_w_prefetch_pages(self):
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        page_1 = {
+            'totalRows': '3',
+            'rows': [{'f': [{'v': '31'}]}, {'f': [{'v': '32'}]}],
+            'pageToken': 'next',
+        }
+        page_2 = {
+            'totalRows': '3',
+            'rows': [{'f': [{'v': '33'}]}],
+        }
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=http)
+        conn = client._connection = _make_connection(page_1, page_2)
+        table = Table(self.TABLE_REF,
+                      schema=[SchemaField('age', 'INTEGER', mode='NULLABLE')])
+
+        iterator = client.list_rows(table, page_size=2, prefetch_pages=2)
+        ages = [row.age for row in iterator]
+
+        self.assertEqual(ages, [31, 32, 33])
+        self.assertEqual(iterator._prefetch_pages, 2)
+        req = conn.api_request.call_args_list[1]
+        self.assertEqual(
+            req[1]['query_params'], {'startIndex': 2, 'maxResults': 1})
+
     def test_list_rows_repeated_fields(self):
         from google.cloud.bigquery.table import SchemaField
 
@@ -3922,6 +4009,23 @@ class TestClientUpload(object):
         with pytest.raises(ValueError):
             client.load_table_from_file(file_obj, self.TABLE_REF)
 
+    @staticmethod
+    def _read_sent_file(load_table_from_file):
+        """Read the file passed to a mock ``load_table_from_file``.
+
+        The file is read during the call, since a streamed DataFrame is
+        closed once the upload finishes.
+        """
+        sent = []
+
+        def read_file(client, file_obj, destination, **kwargs):
+            if kwargs.get('rewind'):
+                file_obj.seek(0)
+            sent.append(file_obj.read())
+
+        load_table_from_file.side_effect = read_file
+        return sent
+
     @unittest.skipIf(pandas is None, 'Requires `pandas`')
     @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
     def test_load_table_from_dataframe(self):
@@ -3939,6 +4043,7 @@ class TestClientUpload(object):
             'google.cloud.bigquery.client.Client.load_table_from_file',
             autospec=True)
         with load_patch as load_table_from_file:
+            sent = self._read_sent_file(load_table_from_file)
             client.load_table_from_dataframe(dataframe, self.TABLE_REF)
 
         load_table_from_file.assert_called_once_with(
@@ -3946,8 +4051,7 @@ class TestClientUpload(object):
             rewind=True, job_id=None, job_id_prefix=None, location=None,
             project=None, job_config=mock.ANY)
 
-        sent_file = load_table_from_file.mock_calls[0][1][1]
-        sent_bytes = sent_file.getvalue()
+        sent_bytes, = sent
         assert isinstance(sent_bytes, bytes)
         assert len(sent_bytes) > 0
 
@@ -3971,6 +4075,7 @@ class TestClientUpload(object):
             'google.cloud.bigquery.client.Client.load_table_from_file',
             autospec=True)
         with load_patch as load_table_from_file:
+            sent = self._read_sent_file(load_table_from_file)
             client.load_table_from_dataframe(dataframe, self.TABLE_REF)
 
         load_table_from_file.assert_called_once_with(
@@ -3983,8 +4088,7 @@ class TestClientUpload(object):
             job_config=mock.ANY,
         )
 
-        sent_file = load_table_from_file.mock_calls[0][1][1]
-        sent_bytes = sent_file.getvalue()
+        sent_bytes, = sent
         assert isinstance(sent_bytes, bytes)
         assert len(sent_bytes) > 0
 
@@ -4029,6 +4133,89 @@ class TestClientUpload(object):
         assert sent_config is job_config
         assert sent_config.source_format == job.SourceFormat.PARQUET
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_load_table_from_dataframe_writes_parquet(self):
+        import pyarrow.parquet
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame({
+            'name': [None] * 50 + ['name-{}'.format(i) for i in range(50)],
+            'age': list(range(100)),
+        })
+
+        load_patch = mock.patch(
+            'google.cloud.bigquery.client.Client.load_table_from_file',
+            autospec=True)
+        chunk_patch = mock.patch(
+            'google.cloud.bigquery.client._DEFAULT_CHUNKSIZE', new=256)
+        with load_patch as load_table_from_file, chunk_patch:
+            sent = self._read_sent_file(load_table_from_file)
+            client.load_table_from_dataframe(dataframe, self.TABLE_REF)
+
+        received = pyarrow.parquet.read_table(six.BytesIO(sent[0]))
+        assert received.to_pandas().equals(dataframe)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_load_table_from_dataframe_wo_pyarrow_helpers(self):
+        client = self._make_client()
+        dataframe = pandas.DataFrame({'age': [100, 60]})
+
+        load_patch = mock.patch(
+            'google.cloud.bigquery.client.Client.load_table_from_file',
+            autospec=True)
+        pyarrow_patch = mock.patch(
+            'google.cloud.bigquery._pandas_helpers.pyarrow', new=None)
+        with load_patch as load_table_from_file, pyarrow_patch:
+            sent = self._read_sent_file(load_table_from_file)
+            client.load_table_from_dataframe(dataframe, self.TABLE_REF)
+
+        sent_file = load_table_from_file.call_args[0][1]
+        assert isinstance(sent_file, six.BytesIO)
+        assert sent_file.closed
+        assert sent[0].startswith(b'PAR1')
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_load_table_from_dataframe_w_untested_pyarrow(self):
+        client = self._make_client()
+        dataframe = pandas.DataFrame({'age': [100, 60]})
+
+        load_patch = mock.patch(
+            'google.cloud.bigquery.client.Client.load_table_from_file',
+            autospec=True)
+        supported_patch = mock.patch(
+            'google.cloud.bigquery._pandas_helpers.parquet_stream_supported',
+            return_value=False)
+        with load_patch as load_table_from_file, supported_patch:
+            sent = self._read_sent_file(load_table_from_file)
+            client.load_table_from_dataframe(dataframe, self.TABLE_REF)
+
+        sent_file = load_table_from_file.call_args[0][1]
+        assert isinstance(sent_file, six.BytesIO)
+        assert sent[0].startswith(b'PAR1')
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    @unittest.skipUnless(
+        _parquet_stream_supported(), 'Requires a `pyarrow` release in range')
+    def test_load_table_from_dataframe_closes_stream_on_error(self):
+        client = self._make_client()
+        dataframe = pandas.DataFrame({'age': list(range(10000))})
+
+        load_patch = mock.patch(
+            'google.cloud.bigquery.client.Client.load_table_from_file',
+            autospec=True, side_effect=ValueError('upload failed'))
+        chunk_patch = mock.patch(
+            'google.cloud.bigquery.client._DEFAULT_CHUNKSIZE', new=256)
+        with load_patch as load_table_from_file, chunk_patch:
+            with pytest.raises(ValueError):
+                client.load_table_from_dataframe(dataframe, self.TABLE_REF)
+
+        # The writer thread stops instead of waiting for a reader.
+        sent_file = load_table_from_file.call_args[0][1]
+        assert not sent_file._writer_thread.is_alive()
+
     # Low-level tests
 
     @classmethod
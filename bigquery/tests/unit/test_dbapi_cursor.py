@@ -41,9 +41,18 @@ class TestCursor(unittest.TestCase):
             total_rows=total_rows,
             schema=schema,
             num_dml_affected_rows=num_dml_affected_rows)
-        mock_client.list_rows.return_value = rows
+        mock_client.list_rows.return_value = self._mock_rows(rows)
         return mock_client
 
+    def _mock_rows(self, rows):
+        from google.cloud.bigquery import table
+
+        mock_rows = mock.create_autospec(table.RowIterator)
+        mock_page = mock.Mock(spec=['_columns'])
+        mock_page._columns = list(zip(*rows or ()))
+        mock_rows.pages = iter([mock_page])
+        return mock_rows
+
     def _mock_job(
             self, total_rows=0, schema=None, num_dml_affected_rows=None):
         from google.cloud.bigquery import job
@@ -161,6 +170,49 @@ class TestCursor(unittest.TestCase):
         third_page = cursor.fetchmany()
         self.assertEqual(third_page, [])
 
+    def test_fetch_page_size(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(rows=[(1,)])
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute('SELECT 1;')
+        self.assertEqual(cursor.fetchone(), (1,))
+        # One row per page would cost one request per row.
+        self.assertIsNone(client.list_rows.call_args[1]['page_size'])
+
+        client = self._mock_client(rows=[(1,)])
+        cursor = dbapi.connect(client).cursor()
+        cursor.arraysize = 100
+        cursor.execute('SELECT 1;')
+        cursor.fetchmany(size=10)
+        self.assertEqual(client.list_rows.call_args[1]['page_size'], 100)
+
+        client = self._mock_client(rows=[(1,)])
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute('SELECT 1;')
+        cursor.fetchmany(size=500)
+        self.assertEqual(client.list_rows.call_args[1]['page_size'], 500)
+
+    def test_fetch_w_row_tuples_from_pages(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery import table
+
+        first_page = mock.Mock(spec=['_columns'])
+        first_page._columns = [iter([1, 2]), iter(['a', 'b'])]
+        second_page = mock.Mock(spec=['_columns'])
+        second_page._columns = [iter([3]), iter(['c'])]
+        rows = mock.create_autospec(table.RowIterator)
+        rows.pages = iter([first_page, second_page])
+        client = self._mock_client(rows=[])
+        client.list_rows.return_value = rows
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute('SELECT a, b;')
+
+        fetched = cursor.fetchmany(size=2) + cursor.fetchall()
+
+        self.assertEqual(fetched, [(1, 'a'), (2, 'b'), (3, 'c')])
+        self.assertTrue(all(type(row) is tuple for row in fetched))
+
     def test_fetchall_wo_execute_raises_error(self):
         from google.cloud.bigquery import dbapi
         connection = dbapi.connect(self._mock_client())
@@ -269,6 +321,89 @@ class TestCursor(unittest.TestCase):
         self.assertIsNone(cursor.description)
         self.assertEqual(cursor.rowcount, 12)
 
+    def _executemany_call_names(self, operation, num_queries):
+        from google.cloud.bigquery.dbapi import connect
+        client = self._mock_client(rows=[], num_dml_affected_rows=0)
+        jobs = [
+            self._mock_job(num_dml_affected_rows=num_rows)
+            for num_rows in range(1, num_queries + 1)]
+        client.query.side_effect = jobs
+        calls = mock.Mock()
+        calls.attach_mock(client.query, 'query')
+        for index, query_job in enumerate(jobs):
+            calls.attach_mock(query_job.result, 'result_{}'.format(index))
+        cursor = connect(client).cursor()
+
+        cursor.executemany(
+            operation, [(str(index),) for index in range(num_queries)])
+
+        self.assertIs(cursor._query_job, jobs[-1])
+        return [name for name, _, _ in calls.mock_calls]
+
+    def test_executemany_starts_all_selects_before_waiting(self):
+        call_names = self._executemany_call_names(
+            'SELECT * FROM UserSessions WHERE user_id = %s;', 3)
+
+        self.assertEqual(
+            call_names,
+            ['query', 'query', 'query', 'result_0', 'result_1', 'result_2'])
+
+    def test_executemany_starts_all_with_selects_before_waiting(self):
+        call_names = self._executemany_call_names(
+            '-- Sessions.\n'
+            '/* Of a user. */ (WITH s AS (SELECT * FROM UserSessions)\n'
+            'SELECT * FROM s WHERE user_id = %s);', 2)
+
+        self.assertEqual(
+            call_names, ['query', 'query', 'result_0', 'result_1'])
+
+    def test_executemany_runs_dml_in_order(self):
+        call_names = self._executemany_call_names(
+            'DELETE FROM UserSessions WHERE user_id = %s;', 3)
+
+        self.assertEqual(
+            call_names,
+            ['query', 'result_0', 'query', 'result_1', 'query', 'result_2'])
+
+    def test_executemany_raises_if_any_select_fails(self):
+        import google.cloud.exceptions
+
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.dbapi import exceptions
+        client = self._mock_client(rows=[], num_dml_affected_rows=0)
+        jobs = [self._mock_job(num_dml_affected_rows=1) for _ in range(2)]
+        jobs[0].result.side_effect = (
+            google.cloud.exceptions.GoogleCloudError(''))
+        client.query.side_effect = jobs
+        cursor = connect(client).cursor()
+
+        with self.assertRaises(exceptions.DatabaseError):
+            cursor.executemany(
+                'SELECT * FROM UserSessions WHERE user_id = %s;',
+                (('a',), ('b',)))
+
+        self.assertEqual(client.query.call_count, 2)
+
+    def test_executemany_stops_dml_at_first_failure(self):
+        import google.cloud.exceptions
+
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.dbapi import exceptions
+        client = self._mock_client(rows=[], num_dml_affected_rows=0)
+        jobs = [self._mock_job(num_dml_affected_rows=1) for _ in range(3)]
+        jobs[1].result.side_effect = (
+            google.cloud.exceptions.GoogleCloudError(''))
+        client.query.side_effect = jobs
+        cursor = connect(client).cursor()
+
+        with self.assertRaises(exceptions.DatabaseError):
+            cursor.executemany(
+                'DELETE FROM UserSessions WHERE user_id = %s;',
+                (('a',), ('b',), ('c',)))
+
+        self.assertEqual(client.query.call_count, 2)
+        self.assertIs(cursor._query_job, jobs[1])
+
     def test__format_operation_w_dict(self):
         from google.cloud.bigquery.dbapi import cursor
         formatted_operation = cursor._format_operation(
@@ -21,6 +21,10 @@ try:
     import pandas
 except (ImportError, AttributeError):  # pragma: NO COVER
     pandas = None
+try:
+    import pyarrow
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
 
 
 def _make_credentials():
@@ -4274,6 +4278,43 @@ class TestQueryJob(unittest.TestCase, _Base):
         self.assertEqual(len(df), 4)  # verify the number of rows
         self.assertEqual(list(df), ['name', 'age'])  # verify the column names
 
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow(self):
+        begun_resource = self._make_resource()
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_ID,
+            },
+            'totalRows': '4',
+            'schema': {
+                'fields': [
+                    {'name': 'name', 'type': 'STRING', 'mode': 'NULLABLE'},
+                    {'name': 'age', 'type': 'INTEGER', 'mode': 'NULLABLE'},
+                ],
+            },
+            'rows': [
+                {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'}]},
+                {'f': [{'v': 'Bharney Rhubble'}, {'v': '33'}]},
+                {'f': [{'v': 'Wylma Phlyntstone'}, {'v': '29'}]},
+                {'f': [{'v': 'Bhettye Rhubble'}, {'v': '27'}]},
+            ],
+        }
+        done_resource = copy.deepcopy(begun_resource)
+        done_resource['status'] = {'state': 'DONE'}
+        connection = _make_connection(
+            begun_resource, query_resource, done_resource, query_resource)
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        table = job.to_arrow()
+
+        self.assertIsInstance(table, pyarrow.Table)
+        self.assertEqual(table.num_rows, 4)
+        self.assertEqual(
+            [field.name for field in table.schema], ['name', 'age'])
+
     def test_iter(self):
         import types
 
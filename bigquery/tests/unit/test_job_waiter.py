@@ -0,0 +1,309 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestJobWaiter(unittest.TestCase):
+    PROJECT = 'prahj-ekt'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.job_waiter import JobWaiter
+
+        return JobWaiter
+
+    def _make_one(self, *args, **kw):
+        kw.setdefault('initial_delay', 0.0)
+        return self._get_target_class()(*args, **kw)
+
+    def _make_client(self, reloads_until_done, error_result=None,
+                     active_jobs=None):
+        """Make a client whose jobs finish after some reloads.
+
+        Args:
+            reloads_until_done (Dict[str, int]):
+                For each job ID, the number of reloads returning a running
+                job before the job is done.
+            error_result (Dict[str, object]):
+                The error result of the done jobs, if any.
+            active_jobs (List[str]):
+                The job IDs listed by ``list_jobs``.
+        """
+        client = mock.Mock(spec=['_call_api', 'list_jobs', 'project'])
+        client.project = self.PROJECT
+
+        def call_api(retry, method=None, path=None, query_params=None):
+            job_id = path.split('/')[-1]
+            reloads_until_done[job_id] -= 1
+            state = 'RUNNING'
+            if reloads_until_done[job_id] < 0:
+                state = 'DONE'
+            return self._make_resource(job_id, state, error_result)
+
+        client._call_api.side_effect = call_api
+        client.list_jobs.return_value = [
+            mock.Mock(job_id=job_id, spec=['job_id'])
+            for job_id in active_jobs or ()]
+        return client
+
+    def _make_resource(self, job_id, state, error_result=None):
+        resource = {
+            'jobReference': {'projectId': self.PROJECT, 'jobId': job_id},
+            'configuration': {
+                'copy': {
+                    'sourceTables': [{
+                        'projectId': self.PROJECT,
+                        'datasetId': 'dataset',
+                        'tableId': 'source',
+                    }],
+                    'destinationTable': {
+                        'projectId': self.PROJECT,
+                        'datasetId': 'dataset',
+                        'tableId': 'destination',
+                    },
+                },
+            },
+            'status': {'state': state},
+        }
+        if error_result is not None:
+            resource['status']['errorResult'] = error_result
+        return resource
+
+    def _make_job(self, client, job_id, state='RUNNING'):
+        from google.cloud.bigquery.job import CopyJob
+
+        return CopyJob.from_api_repr(
+            self._make_resource(job_id, state), client)
+
+    def test_add_done_job(self):
+        client = self._make_client({})
+        job = self._make_job(client, 'job-1', state='DONE')
+        callback = mock.Mock()
+
+        with self._make_one() as waiter:
+            self.assertIs(waiter.add(job, callback=callback), job)
+            self.assertEqual(list(waiter.as_completed()), [job])
+
+        callback.assert_called_once_with(job)
+        self.assertIs(job.result(), job)
+        client._call_api.assert_not_called()
+        self.assertIsNone(waiter._polling_thread)
+
+    def test_add_starts_job(self):
+        client = self._make_client({'job-1': 0})
+        job = self._make_job(client, 'job-1')
+        job._properties['status'] = {}
+
+        def begin(retry=None):
+            job._properties['status'] = {'state': 'RUNNING'}
+
+        with mock.patch.object(job, '_begin', side_effect=begin) as patched:
+            with self._make_one() as waiter:
+                waiter.add(job)
+                done, not_done = waiter.wait(timeout=5)
+
+        patched.assert_called_once_with(retry=mock.ANY)
+        self.assertEqual(done, [job])
+        self.assertEqual(not_done, [])
+
+    def test_add_after_close(self):
+        client = self._make_client({})
+        waiter = self._make_one()
+        waiter.close()
+
+        with self.assertRaises(ValueError):
+            waiter.add(self._make_job(client, 'job-1'))
+
+    def test_as_completed_in_completion_order(self):
+        reloads_until_done = {'slow': 3, 'fast': 1}
+        client = self._make_client(reloads_until_done)
+        slow = self._make_job(client, 'slow')
+        fast = self._make_job(client, 'fast')
+        callback = mock.Mock()
+
+        with self._make_one(initial_delay=0.05) as waiter:
+            waiter.add(slow, callback=callback)
+            waiter.add(fast, callback=callback)
+            completed = list(waiter.as_completed(timeout=5))
+
+        self.assertEqual(completed, [fast, slow])
+        self.assertEqual(
+            callback.mock_calls, [mock.call(fast), mock.call(slow)])
+        self.assertEqual(reloads_until_done, {'slow': -1, 'fast': -1})
+        client.list_jobs.assert_not_called()
+        self.assertIs(slow.result(), slow)
+
+    def test_as_completed_skips_jobs_added_later(self):
+        reloads_until_done = {'slow': 3}
+        client = self._make_client(reloads_until_done)
+        done = self._make_job(client, 'done', state='DONE')
+        slow = self._make_job(client, 'slow')
+        later = self._make_job(client, 'later', state='DONE')
+
+        with self._make_one(initial_delay=0.05) as waiter:
+            waiter.add(done)
+            waiter.add(slow)
+            completed = waiter.as_completed(timeout=5)
+            self.assertIs(next(completed), done)
+            # Completes before ``slow``, but was not added when waiting began.
+            waiter.add(later)
+            self.assertEqual(list(completed), [slow])
+            self.assertEqual(list(waiter.as_completed()), [done, later, slow])
+
+    def test_as_completed_timeout(self):
+        from concurrent import futures
+
+        client = self._make_client({'job-1': float('inf')})
+        job = self._make_job(client, 'job-1')
+
+        with self._make_one() as waiter:
+            waiter.add(job)
+            with self.assertRaises(futures.TimeoutError):
+                list(waiter.as_completed(timeout=0.05))
+
+    def test_as_completed_after_close(self):
+        client = self._make_client({'job-1': float('inf')})
+        waiter = self._make_one()
+        waiter.add(self._make_job(client, 'job-1'))
+        waiter.close()
+
+        with self.assertRaises(ValueError):
+            list(waiter.as_completed())
+
+    def test_wait_timeout(self):
+        client = self._make_client({'done': 0, 'running': float('inf')})
+        done_job = self._make_job(client, 'done')
+        running_job = self._make_job(client, 'running')
+
+        with self._make_one() as waiter:
+            waiter.add(running_job)
+            waiter.add(done_job)
+            done, not_done = waiter.wait(timeout=0.2)
+
+        self.assertEqual(done, [done_job])
+        self.assertEqual(not_done, [running_job])
+
+    def test_wait_lists_active_jobs(self):
+        from google.cloud.bigquery.job_waiter import _ACTIVE_STATES
+
+        reloads_until_done = {
+            'job-1': 0, 'job-2': 0, 'job-3': 0, 'job-4': 0}
+        client = self._make_client(
+            reloads_until_done, active_jobs=['job-1', 'job-3', 'job-4'])
+        jobs = [
+            self._make_job(client, job_id)
+            for job_id in sorted(reloads_until_done)]
+
+        # Delay the first round until all of the jobs are added.
+        with self._make_one(initial_delay=0.05) as waiter:
+            for job in jobs:
+                waiter.add(job)
+            done, not_done = waiter.wait(timeout=0.3)
+
+        # Only the job which is not listed as active is reloaded.
+        self.assertEqual(done, [jobs[1]])
+        self.assertEqual(not_done, [jobs[0], jobs[2], jobs[3]])
+        self.assertEqual(reloads_until_done, {
+            'job-1': 0, 'job-2': -1, 'job-3': 0, 'job-4': 0})
+        client.list_jobs.assert_called_with(
+            project=self.PROJECT, state_filter=_ACTIVE_STATES,
+            retry=mock.ANY)
+
+    def test_wait_reloads_each_job_when_list_fails(self):
+        reloads_until_done = {'job-1': 0, 'job-2': 0, 'job-3': 0}
+        client = self._make_client(reloads_until_done)
+        client.list_jobs.side_effect = ValueError('list failed')
+        jobs = [
+            self._make_job(client, job_id)
+            for job_id in sorted(reloads_until_done)]
+
+        with self._make_one() as waiter:
+            for job in jobs:
+                waiter.add(job)
+            done, not_done = waiter.wait(timeout=5)
+
+        self.assertEqual(done, jobs)
+        self.assertEqual(not_done, [])
+
+    def test_wait_w_failed_job(self):
+        from google.cloud import exceptions
+
+        error_result = {'reason': 'invalid', 'message': 'bad'}
+        client = self._make_client({'job-1': 0}, error_result=error_result)
+        job = self._make_job(client, 'job-1')
+
+        with self._make_one() as waiter:
+            waiter.add(job)
+            done, _ = waiter.wait(timeout=5)
+
+        self.assertEqual(done, [job])
+        self.assertIsInstance(job.exception(), exceptions.BadRequest)
+
+    def test_wait_w_reload_error(self):
+        from google.api_core import exceptions
+
+        client = self._make_client({})
+        exc = exceptions.NotFound('missing')
+        client._call_api.side_effect = exc
+        job = self._make_job(client, 'job-1')
+
+        with self._make_one() as waiter:
+            waiter.add(job)
+            done, _ = waiter.wait(timeout=5)
+
+        self.assertEqual(done, [job])
+        self.assertIs(job.exception(), exc)
+
+    def test_callback_error_is_logged(self):
+        client = self._make_client({'job-1': 0, 'job-2': 0})
+        jobs = [self._make_job(client, 'job-1'),
+                self._make_job(client, 'job-2')]
+        callback = mock.Mock(side_effect=ValueError('callback failed'))
+
+        with self._make_one() as waiter:
+            for job in jobs:
+                waiter.add(job, callback=callback)
+            done, _ = waiter.wait(timeout=5)
+
+        self.assertEqual(done, jobs)
+        self.assertEqual(callback.call_count, 2)
+
+    def test_backoff_grows_without_completions(self):
+        client = self._make_client({'job-1': float('inf')})
+        job = self._make_job(client, 'job-1')
+        waiter = self._make_one(
+            initial_delay=0.01, max_delay=0.04, multiplier=2.0)
+        now = [0.0]
+        delays = []
+
+        def wait(timeout=None):
+            if timeout is not None:
+                delays.append(round(timeout, 2))
+                now[0] += timeout
+            if len(delays) >= 5:
+                waiter._closed = True
+
+        time_patch = mock.patch(
+            'google.cloud.bigquery.job_waiter.time.time',
+            side_effect=lambda: now[0])
+        wait_patch = mock.patch.object(
+            waiter._condition, 'wait', side_effect=wait)
+        with time_patch, wait_patch:
+            waiter.add(job)
+            waiter._polling_thread.join()
+
+        self.assertEqual(delays, [0.01, 0.02, 0.04, 0.04, 0.04])
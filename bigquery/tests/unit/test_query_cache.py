@@ -0,0 +1,569 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
+
+
+class Test__normalize_query(unittest.TestCase):
+
+    def _call_fut(self, query):
+        from google.cloud.bigquery.query_cache import _normalize_query
+
+        return _normalize_query(query)
+
+    def test_collapses_whitespace(self):
+        self.assertEqual(
+            self._call_fut('\n  SELECT  a,\n\tb\nFROM   t  \n'),
+            'SELECT a, b FROM t')
+
+    def test_keeps_quoted_whitespace(self):
+        query = (
+            "SELECT  'a  b', \"c\\\"  d\",  `my  col`, '''e\n\n f'''  "
+            "FROM t")
+        self.assertEqual(
+            self._call_fut(query),
+            "SELECT 'a  b', \"c\\\"  d\", `my  col`, '''e\n\n f''' FROM t")
+
+    def test_keeps_comments(self):
+        query = 'SELECT 1  -- one  comment\n  , 2  /* two\n  three */  #  x'
+        self.assertEqual(
+            self._call_fut(query),
+            'SELECT 1 -- one  comment , 2 /* two\n  three */ #  x')
+
+
+class Test__cache_key(unittest.TestCase):
+    PROJECT = 'prahj-ekt'
+
+    def _call_fut(self, query, job_config=None, project=PROJECT,
+                  location=None):
+        from google.cloud.bigquery.query_cache import _cache_key
+
+        return _cache_key(query, job_config, project, location)
+
+    @staticmethod
+    def _make_config(**kw):
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        config = QueryJobConfig()
+        for name, value in kw.items():
+            setattr(config, name, value)
+        return config
+
+    def test_ignores_properties_which_do_not_change_results(self):
+        config = self._make_config(
+            priority='BATCH', use_query_cache=False, labels={'a': 'b'},
+            use_legacy_sql=False)
+
+        self.assertEqual(
+            self._call_fut('SELECT 1', config), self._call_fut(' SELECT  1'))
+
+    def test_differs_by_parameters(self):
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        query = 'SELECT @x'
+        one = self._make_config(
+            query_parameters=[ScalarQueryParameter('x', 'INT64', 1)])
+        two = self._make_config(
+            query_parameters=[ScalarQueryParameter('x', 'INT64', 2)])
+
+        self.assertNotEqual(
+            self._call_fut(query, one), self._call_fut(query, two))
+
+    def test_differs_by_dialect(self):
+        legacy = self._make_config(use_legacy_sql=True)
+
+        self.assertNotEqual(
+            self._call_fut('SELECT 1', legacy), self._call_fut('SELECT 1'))
+
+    def test_differs_by_project_and_location(self):
+        key = self._call_fut('SELECT 1')
+
+        self.assertNotEqual(key, self._call_fut('SELECT 1', project='other'))
+        self.assertNotEqual(key, self._call_fut('SELECT 1', location='EU'))
+
+
+class TestCachedRowIterator(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.query_cache import CachedRowIterator
+
+        return CachedRowIterator
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_schema():
+        from google.cloud.bigquery.schema import SchemaField
+
+        return [
+            SchemaField('name', 'STRING'),
+            SchemaField('age', 'INTEGER'),
+        ]
+
+    def test_rows(self):
+        schema = self._make_schema()
+        iterator = self._make_one(schema, [('Phred', 32), ('Bharney', 33)])
+
+        self.assertEqual(iterator.schema, schema)
+        self.assertEqual(iterator.total_rows, 2)
+        rows = list(iterator)
+        self.assertEqual(rows[0].values(), ('Phred', 32))
+        self.assertEqual(rows[1]['age'], 33)
+        self.assertEqual(rows[1].name, 'Bharney')
+        # Cached rows can be read again.
+        pages = list(iterator.pages)
+        self.assertEqual(len(pages), 1)
+        self.assertEqual([row.values() for row in pages[0]],
+                         [('Phred', 32), ('Bharney', 33)])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe(self):
+        iterator = self._make_one(
+            self._make_schema(), [('Phred', 32), ('Bharney', 33)])
+
+        df = iterator.to_dataframe()
+
+        self.assertEqual(list(df.columns), ['name', 'age'])
+        self.assertEqual(list(df['name']), ['Phred', 'Bharney'])
+        self.assertEqual(list(df['age']), [32, 33])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_empty(self):
+        df = self._make_one(self._make_schema(), []).to_dataframe()
+
+        self.assertEqual(list(df.columns), ['name', 'age'])
+        self.assertEqual(len(df), 0)
+
+    @mock.patch('google.cloud.bigquery.query_cache.pandas', new=None)
+    def test_to_dataframe_error_if_pandas_is_none(self):
+        iterator = self._make_one(self._make_schema(), [])
+
+        with self.assertRaises(ValueError):
+            iterator.to_dataframe()
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow(self):
+        iterator = self._make_one(
+            self._make_schema(), [('Phred', 32), ('Bharney', None)])
+
+        table = iterator.to_arrow()
+
+        self.assertEqual(table.schema, pyarrow.schema([
+            pyarrow.field('name', pyarrow.string()),
+            pyarrow.field('age', pyarrow.int64()),
+        ]))
+        self.assertEqual(table.column(1).to_pylist(), [32, None])
+        record_batches = list(iterator.to_arrow_iterable())
+        self.assertEqual(len(record_batches), 1)
+        self.assertEqual(record_batches[0].num_rows, 2)
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow_empty(self):
+        table = self._make_one(self._make_schema(), []).to_arrow()
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(
+            [field.name for field in table.schema], ['name', 'age'])
+
+    @mock.patch('google.cloud.bigquery._pandas_helpers.pyarrow', new=None)
+    def test_to_arrow_error_if_pyarrow_is_none(self):
+        iterator = self._make_one(self._make_schema(), [])
+
+        with self.assertRaises(ValueError):
+            iterator.to_arrow()
+
+
+class TestQueryCache(unittest.TestCase):
+    PROJECT = 'prahj-ekt'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.query_cache import QueryCache
+
+        return QueryCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        return directory
+
+    @staticmethod
+    def _make_schema():
+        from google.cloud.bigquery.schema import SchemaField
+
+        return [
+            SchemaField('name', 'STRING'),
+            SchemaField('age', 'INTEGER'),
+        ]
+
+    @staticmethod
+    def _make_rows(schema, pages):
+        from google.cloud.bigquery.table import Row
+
+        field_to_index = {field.name: i for i, field in enumerate(schema)}
+        rows = mock.Mock(spec=['pages', 'schema', 'total_rows'])
+        rows.schema = schema
+        rows.total_rows = sum(len(page) for page in pages)
+        rows.pages = iter([
+            [Row(values, field_to_index) for values in page]
+            for page in pages])
+        return rows
+
+    def _make_client(self, pages=None, schema=None, statement_type='SELECT'):
+        if schema is None:
+            schema = self._make_schema()
+        if pages is None:
+            pages = [[('Phred', 32), ('Bharney', 33)], [('Wylma', 29)]]
+        client = mock.Mock(spec=['location', 'project', 'query'])
+        client.project = self.PROJECT
+        client.location = None
+
+        def query(*args, **kwargs):
+            query_job = mock.Mock(spec=['result', 'statement_type'])
+            query_job.statement_type = statement_type
+            query_job.result.side_effect = (
+                lambda **kw: self._make_rows(schema, pages))
+            return query_job
+
+        client.query.side_effect = query
+        return client
+
+    def test_ctor_defaults(self):
+        from google.cloud.bigquery import query_cache
+
+        cache = self._make_one()
+
+        self.assertEqual(cache._max_entries, query_cache._DEFAULT_MAX_ENTRIES)
+        self.assertEqual(cache._ttl, query_cache._DEFAULT_TTL)
+        self.assertEqual(cache._max_rows, query_cache._DEFAULT_MAX_ROWS)
+        self.assertIsNone(cache._directory)
+        self.assertEqual(len(cache), 0)
+
+    @mock.patch('google.cloud.bigquery._pandas_helpers.pyarrow', new=None)
+    def test_ctor_w_directory_wo_pyarrow(self):
+        with self.assertRaises(ValueError):
+            self._make_one(directory='/tmp')
+
+    def test_query_hit(self):
+        from google.cloud.bigquery.query_cache import CachedRowIterator
+
+        client = self._make_client()
+        cache = self._make_one()
+
+        first = cache.query(client, 'SELECT name, age FROM t')
+        second = cache.query(client, 'SELECT name, age\n  FROM t')
+
+        client.query.assert_called_once_with(
+            'SELECT name, age FROM t', job_config=None, job_id_prefix=None,
+            location=None, project=self.PROJECT, retry=mock.ANY)
+        self.assertIsInstance(second, CachedRowIterator)
+        expected = [('Phred', 32), ('Bharney', 33), ('Wylma', 29)]
+        self.assertEqual([row.values() for row in first], expected)
+        self.assertEqual([row.values() for row in second], expected)
+        self.assertEqual(second.schema, self._make_schema())
+        self.assertEqual(len(cache), 1)
+
+    def test_query_w_project_and_location(self):
+        client = self._make_client()
+        cache = self._make_one()
+
+        cache.query(client, 'SELECT 1', project='other', location='EU')
+        cache.query(client, 'SELECT 1')
+
+        self.assertEqual(client.query.call_count, 2)
+        client.query.assert_any_call(
+            'SELECT 1', job_config=None, job_id_prefix=None,
+            location='EU', project='other', retry=mock.ANY)
+
+    def test_query_miss_after_ttl(self):
+        client = self._make_client()
+        cache = self._make_one(ttl=10.0)
+
+        with mock.patch('time.time', return_value=1000.0):
+            cache.query(client, 'SELECT 1')
+        with mock.patch('time.time', return_value=1009.0):
+            cache.query(client, 'SELECT 1')
+        self.assertEqual(client.query.call_count, 1)
+
+        with mock.patch('time.time', return_value=1010.0):
+            cache.query(client, 'SELECT 1')
+        self.assertEqual(client.query.call_count, 2)
+
+    def test_query_evicts_least_recently_used(self):
+        client = self._make_client()
+        cache = self._make_one(max_entries=2)
+
+        cache.query(client, 'SELECT 1')
+        cache.query(client, 'SELECT 2')
+        cache.query(client, 'SELECT 1')  # Hit; SELECT 2 is now the oldest.
+        cache.query(client, 'SELECT 3')
+        self.assertEqual(client.query.call_count, 3)
+        self.assertEqual(len(cache), 2)
+
+        cache.query(client, 'SELECT 1')
+        self.assertEqual(client.query.call_count, 3)
+        cache.query(client, 'SELECT 2')
+        self.assertEqual(client.query.call_count, 4)
+
+    def test_query_bypasses_dry_run_and_destination(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.table import TableReference
+
+        client = self._make_client()
+        cache = self._make_one()
+        dry_run = QueryJobConfig()
+        dry_run.dry_run = True
+        destination = QueryJobConfig()
+        destination.destination = TableReference.from_string(
+            '{}.dataset.table'.format(self.PROJECT))
+
+        for job_config in (dry_run, dry_run, destination, destination):
+            cache.query(client, 'SELECT 1', job_config=job_config)
+
+        self.assertEqual(client.query.call_count, 4)
+        self.assertEqual(len(cache), 0)
+
+    def test_query_does_not_cache_dml(self):
+        client = self._make_client(statement_type='DELETE')
+        cache = self._make_one()
+
+        cache.query(client, 'DELETE FROM t WHERE true')
+        cache.query(client, 'DELETE FROM t WHERE true')
+
+        self.assertEqual(client.query.call_count, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_query_does_not_cache_empty_row_iterator(self):
+        from google.cloud.bigquery.table import _EmptyRowIterator
+
+        client = self._make_client()
+        query_job = mock.Mock(spec=['result', 'statement_type'])
+        query_job.statement_type = None
+        query_job.result.return_value = _EmptyRowIterator()
+        client.query.side_effect = None
+        client.query.return_value = query_job
+        cache = self._make_one()
+
+        rows = cache.query(client, 'CREATE VIEW v AS SELECT 1')
+
+        self.assertIsInstance(rows, _EmptyRowIterator)
+        self.assertEqual(len(cache), 0)
+
+    def test_query_does_not_cache_many_rows(self):
+        from google.cloud.bigquery.query_cache import CachedRowIterator
+
+        client = self._make_client()
+        cache = self._make_one(max_rows=2)
+
+        rows = cache.query(client, 'SELECT 1')
+
+        self.assertNotIsInstance(rows, CachedRowIterator)
+        # The results are read again from the start.
+        self.assertEqual(
+            [row.values() for page in rows.pages for row in page],
+            [('Phred', 32), ('Bharney', 33), ('Wylma', 29)])
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        client = self._make_client()
+        cache = self._make_one()
+        cache.query(client, 'SELECT 1')
+
+        cache.clear()
+        cache.query(client, 'SELECT 1')
+
+        self.assertEqual(client.query.call_count, 2)
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_clear_w_directory(self):
+        directory = self._make_directory()
+        other_path = os.path.join(directory, 'other.txt')
+        with open(other_path, 'w'):
+            pass
+        client = self._make_client()
+        cache = self._make_one(directory=directory)
+        cache.query(client, 'SELECT 1')
+        self.assertEqual(len(os.listdir(directory)), 2)
+
+        cache.clear()
+        cache.query(client, 'SELECT 1')
+
+        self.assertEqual(client.query.call_count, 2)
+        # Only the stored results are removed.
+        self.assertTrue(os.path.exists(other_path))
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_query_w_directory(self):
+        import pytz
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [
+            SchemaField('ts', 'TIMESTAMP'),
+            SchemaField('dt', 'DATETIME'),
+            SchemaField('num', 'NUMERIC'),
+            SchemaField('blob', 'BYTES'),
+            SchemaField('tags', 'STRING', mode='REPEATED'),
+            SchemaField('person', 'RECORD', fields=[
+                SchemaField('name', 'STRING'),
+                SchemaField('born', 'DATE'),
+            ]),
+        ]
+        values = (
+            datetime.datetime(2018, 1, 2, 3, 4, 5, 6, tzinfo=pytz.utc),
+            datetime.datetime(2018, 1, 2, 3, 4, 5),
+            decimal.Decimal('1.25'),
+            b'\x00\x01',
+            ['a', 'b'],
+            {'name': 'Phred', 'born': datetime.date(1990, 1, 2)},
+        )
+        empty = (None, None, None, None, [], None)
+        directory = self._make_directory()
+        client = self._make_client(pages=[[values, empty]], schema=schema)
+
+        self._make_one(directory=directory).query(client, 'SELECT x')
+        self.assertEqual(len(os.listdir(directory)), 1)
+        rows = self._make_one(directory=directory).query(client, 'SELECT x')
+
+        self.assertEqual(client.query.call_count, 1)
+        self.assertEqual(rows.schema, schema)
+        self.assertEqual([row.values() for row in rows], [values, empty])
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_query_w_directory_removes_expired_file(self):
+        directory = self._make_directory()
+        client = self._make_client()
+
+        with mock.patch('time.time', return_value=1000.0):
+            self._make_one(directory=directory, ttl=10.0).query(
+                client, 'SELECT 1')
+        with mock.patch('time.time', return_value=1010.0):
+            cache = self._make_one(directory=directory, ttl=10.0)
+            self.assertIsNone(cache._read_file(self._key('SELECT 1')))
+
+        self.assertEqual(os.listdir(directory), [])
+
+    def _key(self, query):
+        from google.cloud.bigquery.query_cache import _cache_key
+
+        return _cache_key(query, None, self.PROJECT, None)
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_query_w_directory_ignores_corrupt_file(self):
+        directory = self._make_directory()
+        client = self._make_client()
+        cache = self._make_one(directory=directory)
+        with open(cache._path(self._key('SELECT 1')), 'wb') as file_obj:
+            file_obj.write(b'not arrow')
+
+        rows = cache.query(client, 'SELECT 1')
+
+        self.assertEqual(client.query.call_count, 1)
+        self.assertEqual(rows.total_rows, 3)
+        # The corrupt file is replaced.
+        self.assertEqual(
+            self._make_one(directory=directory).query(
+                client, 'SELECT 1').total_rows, 3)
+        self.assertEqual(client.query.call_count, 1)
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_query_w_directory_write_fails(self):
+        directory = self._make_directory()
+        client = self._make_client()
+        cache = self._make_one(directory=directory)
+        # A directory in the way makes replacing the file fail.
+        path = cache._path(self._key('SELECT 1'))
+        os.mkdir(path)
+
+        rows = cache.query(client, 'SELECT 1')
+
+        self.assertEqual(rows.total_rows, 3)
+        # The temporary file is removed, and the results stay in memory.
+        self.assertEqual(os.listdir(directory), [os.path.basename(path)])
+        cache.query(client, 'SELECT 1')
+        self.assertEqual(client.query.call_count, 1)
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_query_w_directory_missing_file(self):
+        directory = self._make_directory()
+        client = self._make_client()
+        self._make_one(directory=directory).query(client, 'SELECT 1')
+        cache = self._make_one(directory=directory)
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+
+        self.assertIsNone(cache._read_file(self._key('SELECT 1')))
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_query_w_directory_ignores_file_of_other_key(self):
+        directory = self._make_directory()
+        client = self._make_client()
+        cache = self._make_one(directory=directory)
+        cache.query(client, 'SELECT 1')
+        os.rename(
+            cache._path(self._key('SELECT 1')),
+            cache._path(self._key('SELECT 2')))
+
+        cache = self._make_one(directory=directory)
+
+        self.assertIsNone(cache._read_file(self._key('SELECT 2')))
+
+
+class Test__remove(unittest.TestCase):
+
+    def _call_fut(self, path):
+        from google.cloud.bigquery.query_cache import _remove
+
+        return _remove(path)
+
+    def test_removes_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'results.arrow')
+        with open(path, 'w'):
+            pass
+
+        self._call_fut(path)
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_w_error(self):
+        patch = mock.patch(
+            'google.cloud.bigquery.query_cache.os.remove',
+            side_effect=OSError('gone'))
+
+        with patch as remove:
+            self._call_fut('/nonexistent/results.arrow')
+
+        remove.assert_called_once_with('/nonexistent/results.arrow')
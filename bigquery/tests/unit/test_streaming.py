@@ -0,0 +1,253 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestStreamingInserter(unittest.TestCase):
+    PROJECT = 'prahj-ekt'
+    DS_ID = 'dataset_name'
+    TABLE_ID = 'table_name'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.streaming import StreamingInserter
+
+        return StreamingInserter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_table(self):
+        from google.cloud.bigquery.dataset import DatasetReference
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        table_ref = DatasetReference(self.PROJECT, self.DS_ID).table(
+            self.TABLE_ID)
+        schema = [
+            SchemaField('full_name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+            SchemaField('joined', 'BOOLEAN', mode='NULLABLE'),
+        ]
+        return Table(table_ref, schema=schema)
+
+    @staticmethod
+    def _make_client(errors=()):
+        client = mock.Mock(spec=['insert_rows_json'])
+        client.insert_rows_json.return_value = list(errors)
+        return client
+
+    def test_ctor_w_invalid_table(self):
+        with self.assertRaises(TypeError):
+            self._make_one(self._make_client(), object())
+
+    def test_insert_wo_schema(self):
+        table = self._make_table()
+        inserter = self._make_one(self._make_client(), table.reference)
+
+        with self.assertRaises(ValueError):
+            inserter.insert(('Phred Phlyntstone', 32, True))
+
+    def test_insert_converts_rows(self):
+        client = self._make_client()
+        table = self._make_table()
+        inserter = self._make_one(
+            client, table, max_latency=float('inf'), skip_invalid_rows=True)
+
+        future_1 = inserter.insert(('Phred Phlyntstone', 32, True), 'id-1')
+        future_2 = inserter.insert(
+            {'full_name': 'Bharney Rhubble', 'age': 33}, 'id-2')
+        inserter.close()
+
+        self.assertIs(inserter.table, table)
+        self.assertEqual(future_1.result(), [])
+        self.assertEqual(future_2.result(), [])
+        client.insert_rows_json.assert_called_once_with(
+            table,
+            [
+                {'full_name': 'Phred Phlyntstone', 'age': '32',
+                 'joined': 'true'},
+                {'full_name': 'Bharney Rhubble', 'age': '33',
+                 'joined': None},
+            ],
+            row_ids=['id-1', 'id-2'],
+            skip_invalid_rows=True,
+            ignore_unknown_values=None,
+            template_suffix=None,
+            retry=mock.ANY)
+
+    def test_insert_json_w_selected_fields(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = self._make_client()
+        table = self._make_table()
+        inserter = self._make_one(
+            client, table.reference, max_latency=float('inf'),
+            selected_fields=[SchemaField('age', 'INTEGER')])
+
+        inserter.insert((32,), 'id-1')
+        inserter.insert_json({'age': 'thirty-three'}, 'id-2')
+        inserter.close()
+
+        client.insert_rows_json.assert_called_once_with(
+            table.reference, [{'age': '32'}, {'age': 'thirty-three'}],
+            row_ids=['id-1', 'id-2'], skip_invalid_rows=None,
+            ignore_unknown_values=None, template_suffix=None,
+            retry=mock.ANY)
+
+    def test_insert_creates_row_ids(self):
+        client = self._make_client()
+        inserter = self._make_one(
+            client, self._make_table(), max_latency=float('inf'))
+
+        inserter.insert(('Phred Phlyntstone', 32, True))
+        inserter.insert(('Bharney Rhubble', 33, False))
+        inserter.close()
+
+        row_ids = client.insert_rows_json.call_args[1]['row_ids']
+        self.assertEqual(len(row_ids), 2)
+        self.assertNotEqual(row_ids[0], row_ids[1])
+
+    def test_insert_splits_batches_at_max_rows(self):
+        client = self._make_client()
+        inserter = self._make_one(
+            client, self._make_table(), max_rows=2,
+            max_latency=float('inf'))
+
+        for age in range(5):
+            inserter.insert(('Phred Phlyntstone', age, True))
+        inserter.close()
+
+        batches = [
+            call[0][1] for call in client.insert_rows_json.call_args_list]
+        self.assertEqual(
+            sorted(len(batch) for batch in batches), [1, 2, 2])
+
+    def test_insert_splits_batches_at_max_bytes(self):
+        client = self._make_client()
+        inserter = self._make_one(
+            client, self._make_table(), max_bytes=150,
+            max_latency=float('inf'))
+
+        for age in range(4):
+            inserter.insert(('Phred Phlyntstone', age, True), 'id')
+        inserter.close()
+
+        # Each row takes 68 bytes, so no more than two fit in a request.
+        batches = [
+            call[0][1] for call in client.insert_rows_json.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 2])
+
+    def test_insert_resolves_futures_w_errors(self):
+        errors = [{'index': 1, 'errors': [{'reason': 'invalid'}]}]
+        client = self._make_client(errors)
+        inserter = self._make_one(
+            client, self._make_table(), max_latency=float('inf'))
+
+        future_1 = inserter.insert(('Phred Phlyntstone', 32, True))
+        future_2 = inserter.insert(('Bharney Rhubble', 33, False))
+        inserter.close()
+
+        self.assertEqual(future_1.result(), [])
+        self.assertEqual(future_2.result(), [{'reason': 'invalid'}])
+
+    def test_insert_sets_exception_on_failure(self):
+        from google.api_core import exceptions
+
+        client = self._make_client()
+        exc = exceptions.BadRequest('bad')
+        client.insert_rows_json.side_effect = exc
+        inserter = self._make_one(
+            client, self._make_table(), max_latency=float('inf'))
+
+        future_1 = inserter.insert(('Phred Phlyntstone', 32, True))
+        future_2 = inserter.insert(('Bharney Rhubble', 33, False))
+        inserter.close()
+
+        self.assertIs(future_1.exception(), exc)
+        self.assertIs(future_2.exception(), exc)
+
+    def test_insert_sends_batch_after_max_latency(self):
+        client = self._make_client()
+        inserter = self._make_one(
+            client, self._make_table(), max_latency=0.01)
+
+        future = inserter.insert(('Phred Phlyntstone', 32, True))
+
+        self.assertEqual(future.result(timeout=5), [])
+        client.insert_rows_json.assert_called_once()
+        inserter.close()
+
+    def test_insert_reuses_monitor_for_later_batches(self):
+        client = self._make_client()
+        inserter = self._make_one(
+            client, self._make_table(), max_latency=0.01)
+
+        future_1 = inserter.insert(('Phred Phlyntstone', 32, True))
+        self.assertEqual(future_1.result(timeout=5), [])
+        monitor_thread = inserter._monitor_thread
+
+        future_2 = inserter.insert(('Bharney Rhubble', 33, False))
+        self.assertEqual(future_2.result(timeout=5), [])
+        self.assertIs(inserter._monitor_thread, monitor_thread)
+        inserter.close()
+
+        self.assertEqual(client.insert_rows_json.call_count, 2)
+
+    def test_insert_wo_max_latency_sends_on_size_or_flush(self):
+        client = self._make_client()
+        inserter = self._make_one(
+            client, self._make_table(), max_rows=2,
+            max_latency=float('inf'))
+
+        future_1 = inserter.insert(('Phred Phlyntstone', 32, True))
+        future_2 = inserter.insert(('Bharney Rhubble', 33, False))
+        self.assertEqual(future_2.result(timeout=5), [])
+        self.assertEqual(future_1.result(timeout=5), [])
+
+        future_3 = inserter.insert(('Wylma Phlyntstone', 31, True))
+        self.assertFalse(future_3.done())
+        self.assertEqual(client.insert_rows_json.call_count, 1)
+
+        inserter.flush()
+        self.assertEqual(future_3.result(timeout=5), [])
+        self.assertIsNone(inserter._monitor_thread)
+        inserter.close()
+
+        self.assertEqual(client.insert_rows_json.call_count, 2)
+
+    def test_flush(self):
+        client = self._make_client()
+        inserter = self._make_one(
+            client, self._make_table(), max_latency=float('inf'))
+
+        future = inserter.insert(('Phred Phlyntstone', 32, True))
+        inserter.flush()
+
+        self.assertEqual(future.result(timeout=5), [])
+        inserter.close()
+        client.insert_rows_json.assert_called_once()
+
+    def test_close_is_idempotent_and_rejects_rows(self):
+        client = self._make_client()
+        with self._make_one(client, self._make_table()) as inserter:
+            pass
+        inserter.close()
+
+        with self.assertRaises(ValueError):
+            inserter.insert(('Phred Phlyntstone', 32, True))
+        client.insert_rows_json.assert_not_called()
@@ -20,6 +20,10 @@ try:
     import pandas
 except (ImportError, AttributeError):  # pragma: NO COVER
     pandas = None
+try:
+    import pyarrow
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
 
 from google.cloud.bigquery.dataset import DatasetReference
 
@@ -1148,6 +1152,24 @@ class Test_EmptyRowIterator(unittest.TestCase):
         self.assertIsInstance(df, pandas.DataFrame)
         self.assertEqual(len(df), 0)  # verify the number of rows
 
+    @mock.patch('google.cloud.bigquery.table.pyarrow', new=None)
+    def test_to_arrow_error_if_pyarrow_is_none(self):
+        from google.cloud.bigquery.table import _EmptyRowIterator
+        row_iterator = _EmptyRowIterator()
+        with self.assertRaises(ValueError):
+            row_iterator.to_arrow()
+        with self.assertRaises(ValueError):
+            row_iterator.to_arrow_iterable()
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow(self):
+        from google.cloud.bigquery.table import _EmptyRowIterator
+        row_iterator = _EmptyRowIterator()
+        table = row_iterator.to_arrow()
+        self.assertIsInstance(table, pyarrow.Table)
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(list(row_iterator.to_arrow_iterable()), [])
+
 
 class TestRowIterator(unittest.TestCase):
 
@@ -1232,6 +1254,189 @@ class TestRowIterator(unittest.TestCase):
             method='GET', path=path, query_params={
                 'maxResults': row_iterator._page_size})
 
+    def test_constructor_w_invalid_prefetch_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        with self.assertRaises(ValueError):
+            RowIterator(
+                mock.sentinel.client, mock.sentinel.api_request, '/foo', [],
+                prefetch_pages=0)
+
+    @staticmethod
+    def _make_tabledata_api_request(num_rows, short_page_size=None,
+                                    total_rows=None):
+        """Fake ``tabledata.list`` over rows ``0 .. num_rows - 1``.
+
+        Page tokens are the string form of the next row's index. If
+        ``short_page_size`` is set, no page has more rows than that. If
+        ``total_rows`` is set, it is reported instead of ``num_rows``.
+        """
+        if total_rows is None:
+            total_rows = num_rows
+
+        def api_request(method, path, query_params):
+            if 'pageToken' in query_params:
+                start = int(query_params['pageToken'])
+            else:
+                start = int(query_params.get('startIndex', 0))
+            stop = num_rows
+            if 'maxResults' in query_params:
+                stop = min(stop, start + query_params['maxResults'])
+            if short_page_size is not None:
+                stop = min(stop, start + short_page_size)
+            response = {
+                'totalRows': str(total_rows),
+                'rows': [{'f': [{'v': str(index)}]}
+                         for index in range(start, stop)],
+            }
+            if stop < num_rows:
+                response['pageToken'] = str(stop)
+            return response
+
+        return mock.Mock(side_effect=api_request)
+
+    def _make_prefetch_iterator(self, api_request, **kwargs):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('index', 'INTEGER', mode='REQUIRED')]
+        return RowIterator(
+            mock.sentinel.client, api_request, '/foo', schema, **kwargs)
+
+    def test_iterate_w_prefetch_pages(self):
+        api_request = self._make_tabledata_api_request(7)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, page_size=2, prefetch_pages=2)
+
+        indexes = [row.index for row in row_iterator]
+
+        self.assertEqual(indexes, list(range(7)))
+        self.assertEqual(row_iterator.total_rows, 7)
+        self.assertEqual(row_iterator.num_results, 7)
+        self.assertEqual(api_request.call_count, 4)
+        api_request.assert_any_call(
+            method='GET', path='/foo', query_params={'maxResults': 2})
+        api_request.assert_any_call(
+            method='GET', path='/foo',
+            query_params={'startIndex': 2, 'maxResults': 2})
+        api_request.assert_any_call(
+            method='GET', path='/foo',
+            query_params={'startIndex': 6, 'maxResults': 1})
+
+    def test_iterate_w_prefetch_pages_and_short_pages(self):
+        api_request = self._make_tabledata_api_request(
+            10, short_page_size=3)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, page_size=4, prefetch_pages=3)
+
+        pages = [[row.index for row in page] for page in row_iterator.pages]
+
+        self.assertEqual(
+            pages, [[0, 1, 2], [3, 4, 5], [6], [7, 8, 9]])
+
+    def test_iterate_w_prefetch_pages_and_start_index(self):
+        api_request = self._make_tabledata_api_request(7)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, page_size=2, prefetch_pages=2, max_results=3,
+            extra_params={'startIndex': 3})
+
+        indexes = [row.index for row in row_iterator]
+
+        self.assertEqual(indexes, [3, 4, 5])
+        self.assertEqual(api_request.call_count, 2)
+
+    def test_iterate_w_prefetch_pages_single_page(self):
+        api_request = self._make_tabledata_api_request(2)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, page_size=4, prefetch_pages=2)
+
+        indexes = [row.index for row in row_iterator]
+
+        self.assertEqual(indexes, [0, 1])
+        api_request.assert_called_once_with(
+            method='GET', path='/foo', query_params={'maxResults': 4})
+
+    def test_iterate_w_prefetch_pages_and_small_max_results(self):
+        api_request = self._make_tabledata_api_request(7)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, page_size=4, prefetch_pages=2, max_results=3)
+
+        indexes = [row.index for row in row_iterator]
+
+        self.assertEqual(indexes, [0, 1, 2])
+        api_request.assert_called_once_with(
+            method='GET', path='/foo', query_params={'maxResults': 3})
+
+    def test_iterate_w_prefetch_pages_and_fewer_rows_than_reported(self):
+        api_request = self._make_tabledata_api_request(4, total_rows=7)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, page_size=2, prefetch_pages=2)
+
+        indexes = [row.index for row in row_iterator]
+
+        self.assertEqual(indexes, [0, 1, 2, 3])
+        # Reading stops at the first empty range.
+        self.assertEqual(
+            [call[1]['query_params'].get('startIndex')
+             for call in api_request.call_args_list[1:3]],
+            [2, 4])
+
+    def test_iterate_w_prefetch_pages_and_page_token(self):
+        api_request = self._make_tabledata_api_request(7)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, page_token='2', page_size=2, prefetch_pages=4)
+
+        indexes = [row.index for row in row_iterator]
+
+        self.assertEqual(indexes, [2, 3, 4, 5, 6])
+        self.assertEqual(
+            [call[1]['query_params'].get('pageToken')
+             for call in api_request.call_args_list],
+            ['2', '4', '6'])
+
+    def test_iterate_w_prefetch_pages_page_token_and_small_max_results(self):
+        api_request = self._make_tabledata_api_request(7)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, page_token='2', page_size=4, prefetch_pages=2,
+            max_results=3)
+
+        indexes = [row.index for row in row_iterator]
+
+        self.assertEqual(indexes, [2, 3, 4])
+        api_request.assert_called_once_with(
+            method='GET', path='/foo',
+            query_params={'pageToken': '2', 'maxResults': 3})
+
+    def test_iterate_w_prefetch_pages_page_token_and_max_results(self):
+        api_request = self._make_tabledata_api_request(7)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, page_token='2', page_size=2, prefetch_pages=2,
+            max_results=3)
+
+        indexes = [row.index for row in row_iterator]
+
+        self.assertEqual(indexes, [2, 3, 4])
+        # The last page only requests the rows left to read.
+        self.assertEqual(
+            [call[1]['query_params']['maxResults']
+             for call in api_request.call_args_list],
+            [2, 1])
+
+    def test_iterate_w_prefetch_pages_wo_total_rows(self):
+        responses = [
+            {'rows': [{'f': [{'v': '0'}]}], 'pageToken': 'next'},
+            {'rows': [{'f': [{'v': '1'}]}]},
+        ]
+        api_request = mock.Mock(side_effect=responses)
+        row_iterator = self._make_prefetch_iterator(
+            api_request, prefetch_pages=2)
+
+        indexes = [row.index for row in row_iterator]
+
+        self.assertEqual(indexes, [0, 1])
+        api_request.assert_called_with(
+            method='GET', path='/foo', query_params={'pageToken': 'next'})
+
     @unittest.skipIf(pandas is None, 'Requires `pandas`')
     def test_to_dataframe(self):
         from google.cloud.bigquery.table import RowIterator
@@ -1260,6 +1465,58 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(df.name.dtype.name, 'object')
         self.assertEqual(df.age.dtype.name, 'int64')
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_multiple_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+            SchemaField('colors', 'STRING', mode='REPEATED'),
+        ]
+        page_1 = {
+            'rows': [
+                {'f': [
+                    {'v': 'Phred Phlyntstone'},
+                    {'v': '32'},
+                    {'v': [{'v': 'orange'}, {'v': 'black'}]},
+                ]},
+                {'f': [
+                    {'v': 'Bharney Rhubble'},
+                    {'v': '33'},
+                    {'v': []},
+                ]},
+            ],
+            'pageToken': 'next-page',
+        }
+        page_2 = {
+            'rows': [
+                {'f': [
+                    {'v': 'Wylma Phlyntstone'},
+                    {'v': '29'},
+                    {'v': [{'v': 'red'}]},
+                ]},
+            ],
+        }
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[page_1, page_2])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertIsInstance(df, pandas.DataFrame)
+        self.assertEqual(list(df), ['name', 'age', 'colors'])
+        self.assertEqual(list(df.index), [0, 1, 2])
+        self.assertEqual(
+            list(df.name),
+            ['Phred Phlyntstone', 'Bharney Rhubble', 'Wylma Phlyntstone'])
+        self.assertEqual(df.age.dtype.name, 'int64')
+        self.assertEqual(list(df.age), [32, 33, 29])
+        self.assertEqual(list(df.colors), [['orange', 'black'], [], ['red']])
+        self.assertEqual(api_request.call_count, 2)
+
     @unittest.skipIf(pandas is None, 'Requires `pandas`')
     def test_to_dataframe_w_empty_results(self):
         from google.cloud.bigquery.table import RowIterator
@@ -1280,6 +1537,31 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(len(df), 0)  # verify the number of rows
         self.assertEqual(list(df), ['name', 'age'])  # verify the column names
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_wo_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED')
+        ]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': []})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+        patch = mock.patch.object(
+            type(row_iterator), 'pages', new_callable=mock.PropertyMock,
+            return_value=iter([]))
+
+        with patch:
+            df = row_iterator.to_dataframe()
+
+        self.assertIsInstance(df, pandas.DataFrame)
+        self.assertEqual(len(df), 0)
+        self.assertEqual(list(df), ['name', 'age'])
+        api_request.assert_not_called()
+
     @unittest.skipIf(pandas is None, 'Requires `pandas`')
     def test_to_dataframe_w_various_types_nullable(self):
         import datetime
@@ -1382,6 +1664,223 @@ class TestRowIterator(unittest.TestCase):
         with self.assertRaises(ValueError):
             row_iterator.to_dataframe()
 
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER'),
+        ]
+        rows = [
+            {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'}]},
+            {'f': [{'v': 'Bharney Rhubble'}, {'v': None}]},
+        ]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': rows})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        table = row_iterator.to_arrow()
+
+        self.assertIsInstance(table, pyarrow.Table)
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema, pyarrow.schema([
+            pyarrow.field('name', pyarrow.string(), nullable=False),
+            pyarrow.field('age', pyarrow.int64()),
+        ]))
+        self.assertEqual(
+            table.column(0).to_pylist(),
+            ['Phred Phlyntstone', 'Bharney Rhubble'])
+        self.assertEqual(table.column(1).to_pylist(), [32, None])
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow_w_nested_fields(self):
+        import datetime
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('colors', 'STRING', mode='REPEATED'),
+            SchemaField('person', 'RECORD', fields=[
+                SchemaField('name', 'STRING'),
+                SchemaField('born', 'DATE'),
+            ]),
+        ]
+        rows = [
+            {'f': [
+                {'v': [{'v': 'orange'}, {'v': 'black'}]},
+                {'v': {'f': [{'v': 'Phred'}, {'v': '1990-01-02'}]}},
+            ]},
+            {'f': [{'v': []}, {'v': None}]},
+        ]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': rows})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        table = row_iterator.to_arrow()
+
+        self.assertEqual(
+            table.schema.field_by_name('colors').type,
+            pyarrow.list_(pyarrow.string()))
+        self.assertEqual(
+            table.schema.field_by_name('person').type,
+            pyarrow.struct([
+                pyarrow.field('name', pyarrow.string()),
+                pyarrow.field('born', pyarrow.date32()),
+            ]))
+        self.assertEqual(
+            table.column(0).to_pylist(), [['orange', 'black'], []])
+        self.assertEqual(
+            table.column(1).to_pylist(),
+            [{'name': 'Phred', 'born': datetime.date(1990, 1, 2)}, None])
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow_iterable_w_multiple_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+        ]
+        page_1 = {
+            'rows': [
+                {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'}]},
+                {'f': [{'v': 'Bharney Rhubble'}, {'v': '33'}]},
+            ],
+            'pageToken': 'next-page',
+        }
+        page_2 = {
+            'rows': [
+                {'f': [{'v': 'Wylma Phlyntstone'}, {'v': '29'}]},
+            ],
+        }
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[page_1, page_2])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        record_batches = row_iterator.to_arrow_iterable()
+
+        # Pages are only requested as the record batches are consumed.
+        api_request.assert_not_called()
+        first = next(record_batches)
+        self.assertIsInstance(first, pyarrow.RecordBatch)
+        self.assertEqual(first.num_rows, 2)
+        self.assertEqual(api_request.call_count, 1)
+        rest = list(record_batches)
+        self.assertEqual(len(rest), 1)
+        self.assertEqual(rest[0].num_rows, 1)
+        self.assertEqual(rest[0].schema, first.schema)
+        self.assertEqual(rest[0].column(1).to_pylist(), [29])
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow_w_empty_results(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED')
+        ]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': []})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        table = row_iterator.to_arrow()
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(
+            [field.name for field in table.schema], ['name', 'age'])
+        self.assertEqual(table.schema.field_by_name('age').type,
+                         pyarrow.int64())
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow_wo_record_batches(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED')
+        ]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': []})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+        patch = mock.patch.object(
+            row_iterator, 'to_arrow_iterable', return_value=iter([]))
+
+        with patch:
+            table = row_iterator.to_arrow()
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema, pyarrow.schema([
+            pyarrow.field('name', pyarrow.string(), nullable=False),
+            pyarrow.field('age', pyarrow.int64(), nullable=False),
+        ]))
+
+    @mock.patch('google.cloud.bigquery.table.pyarrow', new=None)
+    def test_to_arrow_error_if_pyarrow_is_none(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('name', 'STRING', mode='REQUIRED')]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': []})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        with self.assertRaises(ValueError):
+            row_iterator.to_arrow()
+        with self.assertRaises(ValueError):
+            row_iterator.to_arrow_iterable()
+        api_request.assert_not_called()
+
+
+@unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+class Test_columns_to_arrow(unittest.TestCase):
+
+    def _call_fut(self, columns, schema, arrow_schema):
+        from google.cloud.bigquery.table import _columns_to_arrow
+
+        return _columns_to_arrow(columns, schema, arrow_schema)
+
+    def test_w_arrow_schema(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER', mode='REQUIRED')]
+        arrow_schema = pyarrow.schema([
+            pyarrow.field('age', pyarrow.int64(), nullable=False)])
+
+        record_batch = self._call_fut([[32, 33]], schema, arrow_schema)
+
+        self.assertEqual(record_batch.schema, arrow_schema)
+        self.assertEqual(record_batch.column(0).to_pylist(), [32, 33])
+
+    def test_wo_arrow_schema(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('shape', 'UNKNOWN'),
+        ]
+
+        record_batch = self._call_fut(
+            [['Phred', 'Bharney'], ['POINT(1 2)', None]], schema, None)
+
+        # The types are inferred from the values.
+        self.assertEqual(
+            [field.name for field in record_batch.schema], ['name', 'shape'])
+        self.assertEqual(
+            record_batch.schema.field_by_name('shape').type, pyarrow.string())
+        self.assertEqual(
+            record_batch.column(1).to_pylist(), ['POINT(1 2)', None])
+
 
 class TestTimePartitioning(unittest.TestCase):
 
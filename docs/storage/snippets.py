@@ -256,6 +256,93 @@ def policy_document(client, to_delete):
     # [END policy_document]
 
 
+@snippet
+def transfer_manager_upload_many(client, to_delete):
+    # [START transfer_manager_upload_many]
+    import os
+
+    from google.cloud.storage import transfer_manager
+
+    client = storage.Client()
+    bucket = client.get_bucket('my-bucket')
+    file_blob_pairs = [
+        (os.path.join('my-directory', name), name)
+        for name in os.listdir('my-directory')]
+    results = transfer_manager.upload_many_from_filenames(
+        bucket, file_blob_pairs, max_workers=16)
+    for result in results:
+        if result.error is not None:
+            print('Failed to upload {}: {}'.format(
+                result.filename, result.error))
+    # [END transfer_manager_upload_many]
+
+    to_delete.extend(
+        bucket.blob(blob_name) for _, blob_name in file_blob_pairs)
+
+
+@snippet
+def blob_open(client, to_delete):
+    # [START blob_open]
+    import os
+
+    client = storage.Client()
+    bucket = client.get_bucket('my-bucket')
+
+    with bucket.blob('log.txt').open('w') as writer:
+        for number in range(1000):
+            writer.write(u'line {}\n'.format(number))
+
+    with bucket.blob('data.parquet').open('rb') as reader:
+        reader.seek(-8, os.SEEK_END)
+        footer = reader.read()
+    # [END blob_open]
+
+    to_delete.append(bucket.blob('log.txt'))
+    return footer
+
+
+@snippet
+def adaptive_chunk_size(client, to_delete):
+    # [START adaptive_chunk_size]
+    import logging
+
+    from google.cloud.storage.chunking import AdaptiveChunkSizer
+
+    client = storage.Client()
+    bucket = client.get_bucket('my-bucket')
+
+    # Hold at most 16 MB per upload, and send a chunk about every second.
+    sizer = AdaptiveChunkSizer(max_size=16 * 1024 * 1024, target_seconds=1)
+    bucket.blob('video.mp4').upload_from_filename(
+        'video.mp4', chunk_sizer=sizer)
+    logging.info('Uploaded video.mp4: %s', sizer.stats.to_dict())
+    # [END adaptive_chunk_size]
+
+    to_delete.append(bucket.blob('video.mp4'))
+
+
+@snippet
+def url_signer(client, to_delete):
+    # [START url_signer]
+    import datetime
+    import json
+
+    from google.cloud.storage import URLSigner
+
+    client = storage.Client()
+    bucket = client.get_bucket('my-bucket')
+    blobs = [bucket.blob('image-{}.png'.format(index))
+             for index in range(1000)]
+
+    with open('service-account.json') as key_file:
+        info = json.load(key_file)
+    with URLSigner.from_service_account_info(info, processes=4) as signer:
+        urls = signer.sign_many(blobs, datetime.timedelta(hours=1))
+    # [END url_signer]
+
+    return urls
+
+
 def _line_no(func):
     code = getattr(func, '__code__', None) or getattr(func, 'func_code')
     return code.co_firstlineno
@@ -0,0 +1,168 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for publishing messages to many topics.
+
+Compares the default thread-per-batch
+:class:`~google.cloud.pubsub_v1.publisher.batch.thread.Batch` against
+:class:`~google.cloud.pubsub_v1.publisher.batch.scheduled.Batch`, which
+shares one timer thread and a bounded commit pool. Publish requests go to a
+fake API which answers after ``--rpc-latency`` seconds: no project,
+credentials or network access are needed.
+
+Usage: ``python publish_batches.py [--messages N] [--topics N] [--repeat N]``
+"""
+
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import threading
+import time
+
+import grpc
+
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher.batch import scheduled
+from google.cloud.pubsub_v1.publisher.batch import thread
+
+
+try:
+    _cpu_time = time.process_time
+except AttributeError:  # Python 2.7
+    _cpu_time = time.clock
+
+
+class FakePublisherApi(object):
+    """Stand-in for the GAPIC publisher, answering after a fixed latency."""
+
+    def __init__(self, latency):
+        self._latency = latency
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def publish(self, topic, messages):
+        time.sleep(self._latency)
+        with self._lock:
+            first = self._next_id
+            self._next_id += len(messages)
+        return types.PublishResponse(
+            message_ids=[str(index) for index in range(first, self._next_id)])
+
+
+class ThreadCounter(object):
+    """Count the threads started while the counter is active."""
+
+    def __init__(self):
+        self.started = 0
+        self._lock = threading.Lock()
+        self._original_start = None
+
+    def __enter__(self):
+        counter = self
+        self._original_start = original_start = threading.Thread.start
+
+        def start(thread_self):
+            with counter._lock:
+                counter.started += 1
+            return original_start(thread_self)
+
+        threading.Thread.start = start
+        return self
+
+    def __exit__(self, *exc_info):
+        threading.Thread.start = self._original_start
+
+
+def make_client(batch_class, args):
+    """Build a publisher client around the fake API."""
+    client = publisher.Client(
+        batch_class=batch_class,
+        batch_settings=types.BatchSettings(max_latency=args.max_latency),
+        # The channel is never used, so it never connects.
+        channel=grpc.insecure_channel('localhost:1'),
+    )
+    client.api = FakePublisherApi(args.rpc_latency)
+    return client
+
+
+def publish(client, args):
+    """Publish messages round-robin to the topics, at a fixed rate.
+
+    Returns:
+        Tuple[float, float, int]: The wall and CPU seconds taken, and the
+            number of threads started.
+    """
+    topics = ['projects/benchmark/topics/topic-{:03d}'.format(index)
+              for index in range(args.topics)]
+    data = b'x' * args.message_size
+    interval = 1.0 / args.rate
+    futures = []
+
+    with ThreadCounter() as counter:
+        wall_start = time.time()
+        cpu_start = _cpu_time()
+        for index in range(args.messages):
+            futures.append(
+                client.publish(topics[index % args.topics], data))
+            # Pace the publisher, so batches are committed by their
+            # deadline rather than filled up.
+            delay = wall_start + index * interval - time.time()
+            if delay > 0:
+                time.sleep(delay)
+        for future in futures:
+            future.result()
+        wall = time.time() - wall_start
+        cpu = _cpu_time() - cpu_start
+
+    return wall, cpu, counter.started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--messages', type=int, default=50000,
+                        help='messages published per timing run')
+    parser.add_argument('--topics', type=int, default=200,
+                        help='topics the messages are spread over')
+    parser.add_argument('--rate', type=float, default=50000,
+                        help='messages published per second')
+    parser.add_argument('--message-size', type=int, default=100,
+                        help='bytes of data in each message')
+    parser.add_argument('--max-latency', type=float, default=0.05,
+                        help='max_latency of the batch settings, in seconds')
+    parser.add_argument('--rpc-latency', type=float, default=0.02,
+                        help='seconds taken by each publish request')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='timing runs; the fastest is reported')
+    args = parser.parse_args()
+
+    scenarios = (
+        ('thread.Batch', thread.Batch),
+        ('scheduled.Batch', scheduled.Batch),
+    )
+    print('{:<16} {:>12} {:>10} {:>10}'.format(
+        'batch class', 'msgs/s', 'CPU s', 'threads'))
+    for name, batch_class in scenarios:
+        client = make_client(batch_class, args)
+        # Warm up, so the commit pool of the scheduler is already full.
+        publish(client, args)
+        runs = [publish(client, args) for _ in range(args.repeat)]
+        wall, cpu, started = min(runs)
+        print('{:<16} {:>12,.0f} {:>10.3f} {:>10,d}'.format(
+            name, args.messages / wall, cpu, started))
+
+
+if __name__ == '__main__':
+    main()
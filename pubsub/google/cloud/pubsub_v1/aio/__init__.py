@@ -0,0 +1,35 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Publisher and subscriber clients for :mod:`asyncio` applications.
+
+They share the batching, leasing and flow control of the threaded clients,
+but resolve publishing into :class:`asyncio.Future` objects and run
+coroutine callbacks on the event loop.
+
+.. note::
+
+    This package requires Python 3.5 or newer.
+"""
+
+from __future__ import absolute_import
+
+from google.cloud.pubsub_v1.aio.publisher import AsyncPublisher
+from google.cloud.pubsub_v1.aio.subscriber import AsyncSubscriber
+
+
+__all__ = (
+    'AsyncPublisher',
+    'AsyncSubscriber',
+)
@@ -0,0 +1,181 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import asyncio
+import logging
+import time
+
+import google.api_core.exceptions
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import client
+from google.cloud.pubsub_v1.publisher.batch import base
+from google.cloud.pubsub_v1.publisher.batch import thread
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Flow control behaviors which never block the event loop.
+_NON_BLOCKING_BEHAVIORS = (
+    types.LimitExceededBehavior.IGNORE,
+    types.LimitExceededBehavior.RAISE,
+)
+
+
+class Batch(thread.Batch):
+    """A batch of messages, committed from an :mod:`asyncio` event loop.
+
+    The batch is created, published to and committed on the event loop of
+    the thread which creates it. Its ``max_latency`` is waited out with a
+    timer of the loop, rather than a thread, and the futures of its messages
+    are :class:`asyncio.Future` objects.
+
+    The publish request is made with the synchronous API client, on the
+    default executor of the loop.
+
+    Args:
+        client (~.pubsub_v1.aio.AsyncPublisher): The publisher client used
+            to create this batch.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        settings (~.pubsub_v1.types.BatchSettings): The settings for batch
+            publishing. These should be considered immutable once the batch
+            has been opened.
+        autocommit (bool): Whether to autocommit the batch when the time
+            has elapsed. Defaults to True unless ``settings.max_latency`` is
+            inf.
+    """
+    def __init__(self, client, topic, settings, autocommit=True):
+        super(Batch, self).__init__(
+            client, topic, settings, autocommit=False)
+        self._loop = asyncio.get_event_loop()
+
+        self._timer = None
+        if autocommit and self._settings.max_latency < float('inf'):
+            self._timer = self._loop.call_later(
+                self._settings.max_latency, self.commit)
+
+    def _make_future(self):
+        """Return a future for a message published to this batch.
+
+        Returns:
+            asyncio.Future: A newly created future, on the loop of the batch.
+        """
+        return self._loop.create_future()
+
+    def commit(self):
+        """Actually publish all of the messages on the active batch.
+
+        .. note::
+
+            This method is non-blocking. It schedules a task on the event
+            loop, which waits for the publish request.
+
+        If the current batch is **not** accepting messages, this method
+        does nothing.
+        """
+        # Set the status to "starting" synchronously, to ensure that
+        # this batch will necessarily not accept new messages.
+        with self._state_lock:
+            if self._status == base.BatchStatus.ACCEPTING_MESSAGES:
+                self._status = base.BatchStatus.STARTING
+            else:
+                return
+
+        if self._timer is not None:
+            self._timer.cancel()
+        self._loop.create_task(self._commit_async())
+
+    async def _commit_async(self):
+        """Actually publish all of the messages on the active batch.
+
+        This is the coroutine version of :meth:`_commit`. The state lock is
+        not held while waiting for the request: once the batch is in
+        progress, nothing else changes its messages.
+        """
+        with self._state_lock:
+            if self._status in thread._CAN_COMMIT:
+                self._status = base.BatchStatus.IN_PROGRESS
+            else:
+                _LOGGER.debug('Batch is already in progress, exiting commit')
+                return
+
+        # Sanity check: If there are no messages, no-op.
+        if not self._messages:
+            _LOGGER.debug('No messages to publish, exiting commit')
+            self._status = base.BatchStatus.SUCCESS
+            return
+
+        start = time.time()
+        try:
+            response = await self._loop.run_in_executor(
+                None, self._client.api.publish, self._topic, self._messages)
+        except google.api_core.exceptions.GoogleAPICallError as exc:
+            self._set_exception(exc)
+            return
+
+        end = time.time()
+        _LOGGER.debug('gRPC Publish took %s seconds.', end - start)
+
+        self._set_response(response)
+
+
+class AsyncPublisher(client.Client):
+    """A publisher client for :mod:`asyncio` applications.
+
+    This client batches messages like the
+    :class:`~.pubsub_v1.publisher.client.Client`, but :meth:`publish`
+    returns an :class:`asyncio.Future`, which can be awaited. It must be
+    used from the thread running the event loop.
+
+    .. code-block:: python
+
+        from google.cloud.pubsub_v1 import aio
+
+        publisher = aio.AsyncPublisher()
+
+        async def publish_all(topic, payloads):
+            futures = [publisher.publish(topic, data) for data in payloads]
+            return await asyncio.gather(*futures)
+
+    Args:
+        batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
+            settings for batch publishing.
+        batch_class (Optional[Type]): A class that describes how to handle
+            batches. Defaults to :class:`Batch`, which uses the event loop.
+        flow_control (~google.cloud.pubsub_v1.types.PublishFlowControl): The
+            limits on the messages which are published but not sent yet.
+            Since waiting would block the event loop, the
+            ``limit_exceeded_behavior`` can only be ``IGNORE`` or ``RAISE``.
+        kwargs (dict): Any additional arguments provided are sent as keyword
+            arguments to the underlying
+            :class:`~.gapic.pubsub.v1.publisher_client.PublisherClient`.
+
+    Raises:
+        ValueError: If the flow control settings could block the loop.
+    """
+    def __init__(self, batch_settings=(), batch_class=Batch,
+                 flow_control=(), **kwargs):
+        flow_control = types.PublishFlowControl(*flow_control)
+        if flow_control.limit_exceeded_behavior not in _NON_BLOCKING_BEHAVIORS:
+            raise ValueError(
+                'The flow control of an asynchronous publisher can not '
+                'block; use LimitExceededBehavior.RAISE instead.')
+
+        super(AsyncPublisher, self).__init__(
+            batch_settings=batch_settings,
+            batch_class=batch_class,
+            flow_control=flow_control,
+            **kwargs)
@@ -0,0 +1,229 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import asyncio
+import functools
+import logging
+
+from six.moves import queue
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import client
+from google.cloud.pubsub_v1.subscriber import scheduler
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncioScheduler(scheduler.Scheduler):
+    """A scheduler which runs callbacks on an :mod:`asyncio` event loop.
+
+    Callbacks may be scheduled from any thread. Callbacks which return a
+    coroutine are run as tasks of the loop, so that any number of them can
+    wait concurrently on one thread.
+
+    Args:
+        loop (Optional[asyncio.AbstractEventLoop]): The event loop. Defaults
+            to the event loop of the current thread.
+    """
+    def __init__(self, loop=None):
+        self._queue = queue.Queue()
+        self._loop = loop or asyncio.get_event_loop()
+        # These are only accessed from the loop.
+        self._tasks = set()
+        self._stopped = False
+
+    @property
+    def queue(self):
+        """Queue: A thread-safe queue used for communication between callbacks
+        and the scheduling thread."""
+        return self._queue
+
+    @property
+    def loop(self):
+        """asyncio.AbstractEventLoop: The event loop running the callbacks."""
+        return self._loop
+
+    def schedule(self, callback, *args, **kwargs):
+        """Schedule the callback to be called on the event loop.
+
+        Args:
+            callback (Callable): The function to call.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            None
+        """
+        self._loop.call_soon_threadsafe(
+            functools.partial(self._run, callback, *args, **kwargs))
+
+    def _run(self, callback, *args, **kwargs):
+        """Call a callback, and start a task if it returns a coroutine.
+
+        .. note::
+
+            This is called on the event loop.
+        """
+        if self._stopped:
+            return
+
+        result = callback(*args, **kwargs)
+        if asyncio.iscoroutine(result):
+            task = self._loop.create_task(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _cancel_tasks(self):
+        """Stop running callbacks, and cancel the running tasks.
+
+        .. note::
+
+            This is called on the event loop.
+        """
+        self._stopped = True
+        for task in list(self._tasks):
+            task.cancel()
+
+    def shutdown(self):
+        """Shuts down the scheduler and immediately end all pending callbacks.
+        """
+        try:
+            self._loop.call_soon_threadsafe(self._cancel_tasks)
+        except RuntimeError:
+            # The loop is already closed, so no callback runs anymore.
+            _LOGGER.debug('Event loop closed before scheduler shutdown.')
+
+
+async def _run_callback(callback, message):
+    """Await a coroutine callback, and nack the message if it fails.
+
+    Args:
+        callback (Callable[~.pubsub_v1.subscriber.message.Message, Awaitable]):
+            The user's coroutine function.
+        message (~.pubsub_v1.subscriber.message.Message): The Pub/Sub message.
+    """
+    try:
+        await callback(message)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        _LOGGER.exception(
+            'Top-level exception occurred in callback while processing a '
+            'message')
+        message.nack()
+
+
+def _set_future_result(future, reason):
+    """Resolve the future of a subscription, once its manager closed.
+
+    .. note::
+
+        This is called on the event loop.
+    """
+    if future.done():
+        return
+    if reason is None:
+        future.set_result(True)
+    else:
+        future.set_exception(reason)
+
+
+class AsyncSubscriber(client.Client):
+    """A subscriber client for :mod:`asyncio` applications.
+
+    This client pulls, leases and flow controls messages like the
+    :class:`~.pubsub_v1.subscriber.client.Client`, but runs coroutine
+    callbacks as tasks of an event loop. The stream is still read, and
+    requests are still sent, by the helper threads of the streaming pull
+    manager.
+
+    Args:
+        kwargs (dict): Any additional arguments provided are sent as keyword
+            arguments to the underlying
+            :class:`~.gapic.pubsub.v1.subscriber_client.SubscriberClient`.
+    """
+
+    def subscribe(self, subscription, callback, flow_control=(), loop=None):
+        """Start receiving messages on a given subscription.
+
+        The ``callback`` is a coroutine function, which is called with each
+        :class:`~.pubsub_v1.subscriber.message.Message` and awaited on the
+        event loop. It is responsible for calling ``ack()`` or ``nack()`` on
+        the message. If it raises an exception, the exception is logged and
+        the message is nacked.
+
+        Messages are leased until they are acked or nacked, and the flow
+        control settings bound the messages which are leased, and so the
+        callbacks which run at once.
+
+        .. code-block:: python
+
+            from google.cloud.pubsub_v1 import aio
+
+            subscriber = aio.AsyncSubscriber()
+
+            async def callback(message):
+                await handle(message.data)
+                message.ack()
+
+            # Cancelling the task awaiting the future also cancels the
+            # future, which stops receiving messages.
+            await subscriber.subscribe(subscription, callback)
+
+        Args:
+            subscription (str): The name of the subscription.
+            callback (Callable[~.pubsub_v1.subscriber.message.Message,
+                Awaitable]): The coroutine function.
+            flow_control (~.pubsub_v1.types.FlowControl): The flow control
+                settings.
+            loop (Optional[asyncio.AbstractEventLoop]): The event loop to run
+                the callbacks on. Defaults to the event loop of the current
+                thread.
+
+        Returns:
+            asyncio.Future: A future which resolves once the stream stops, or
+                fails if it stops with an error. Cancel it to stop receiving
+                messages.
+        """
+        loop = loop or asyncio.get_event_loop()
+        flow_control = types.FlowControl(*flow_control)
+
+        manager = streaming_pull_manager.StreamingPullManager(
+            self, subscription, flow_control=flow_control,
+            scheduler=AsyncioScheduler(loop))
+
+        future = loop.create_future()
+
+        def on_close(manager, reason):
+            try:
+                loop.call_soon_threadsafe(_set_future_result, future, reason)
+            except RuntimeError:
+                _LOGGER.debug('Event loop closed before the stream stopped.')
+
+        def on_done(future):
+            if future.cancelled():
+                # Closing the manager joins its threads, so it must not run
+                # on the loop.
+                loop.run_in_executor(None, manager.close)
+
+        manager.add_close_callback(on_close)
+        future.add_done_callback(on_done)
+
+        manager.open(functools.partial(_run_callback, callback))
+
+        return future
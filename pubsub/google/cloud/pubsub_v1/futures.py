@@ -49,6 +49,9 @@ class Future(google.api_core.future.Future):
         self._result = self._SENTINEL
         self._exception = self._SENTINEL
         self._callbacks = []
+        # Guards the callbacks, so that a callback added while the future
+        # completes is called exactly once.
+        self._callbacks_lock = threading.Lock()
         if completed is None:
             completed = threading.Event()
         self._completed = completed
@@ -146,9 +149,11 @@ class Future(google.api_core.future.Future):
         The provided function is called, with this future as its only argument,
         when the future finishes running.
         """
-        if self.done():
-            return fn(self)
-        self._callbacks.append(fn)
+        with self._callbacks_lock:
+            if not self.done():
+                self._callbacks.append(fn)
+                return
+        return fn(self)
 
     def set_result(self, result):
         """Set the result of the future to the provided result.
@@ -187,6 +192,8 @@ class Future(google.api_core.future.Future):
         Args:
             message_id (str): The message ID, as a string.
         """
-        self._completed.set()
-        for callback in self._callbacks:
+        with self._callbacks_lock:
+            self._completed.set()
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
             callback(self)
@@ -149,6 +149,25 @@ class Batch(object):
         """
         raise NotImplementedError
 
+    def drop(self, future, exception):
+        """Remove a message which is not being sent yet from the batch.
+
+        This is called by the publisher's flow control, to make room for
+        newer messages. Batches which can not drop messages do not need to
+        override it.
+
+        Args:
+            future (~google.api_core.future.Future): The future of the
+                message, as returned by :meth:`publish`.
+            exception (Exception): The exception to set on the future if the
+                message is dropped.
+
+        Returns:
+            bool: Whether the message was dropped. This implementation never
+                drops messages.
+        """
+        return False
+
 
 class BatchStatus(object):
     """An enum-like class representing valid statuses for a batch.
@@ -0,0 +1,285 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batches which share one timer thread and a bounded pool of committers.
+
+The default :class:`~.pubsub_v1.publisher.batch.thread.Batch` starts a
+thread for every batch to wait out ``max_latency``, and another one to
+commit it. Publishing at high rates to many topics, that is thousands of
+short-lived threads per second. A :class:`Batch` from this module instead
+registers its deadline with a :class:`CommitScheduler`: one timer thread
+keeps the deadlines of all batches in a heap, and commits each batch when
+it is due on a thread pool of bounded size, shared by all topics. Once the
+pool has started its threads, publishing starts no more.
+
+To use it, pass it as the ``batch_class`` of the publisher client:
+
+.. code-block:: python
+
+    from google.cloud import pubsub
+    from google.cloud.pubsub_v1.publisher.batch import scheduled
+
+    client = pubsub.PublisherClient(batch_class=scheduled.Batch)
+"""
+
+from __future__ import absolute_import
+
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+
+from google.cloud.pubsub_v1.publisher.batch import base
+from google.cloud.pubsub_v1.publisher.batch import thread
+
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 100
+"""The most batches committed at once by a :class:`CommitScheduler`.
+
+Each worker waits on one publish request, so this bounds the requests in
+flight across all topics.
+"""
+
+_DEFAULT_SCHEDULER = None
+_DEFAULT_SCHEDULER_LOCK = threading.Lock()
+
+
+def _make_commit_executor(max_workers):
+    # Python 2.7 and 3.6+ have the thread_name_prefix argument, which is useful
+    # for debugging.
+    executor_kwargs = {}
+    if sys.version_info[:2] == (2, 7) or sys.version_info >= (3, 6):
+        executor_kwargs['thread_name_prefix'] = (
+            'ThreadPoolExecutor-CommitScheduler')
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers,
+        **executor_kwargs
+    )
+
+
+class CommitScheduler(object):
+    """Commit batches when they are due, from one timer thread.
+
+    The timer thread is started when the first batch is scheduled. Commits
+    run on a thread pool, so a slow publish request does not delay the
+    batches of other topics.
+
+    Args:
+        max_workers (int): The most batches committed at once. Defaults to
+            :data:`DEFAULT_MAX_WORKERS`.
+    """
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        self._executor = _make_commit_executor(max_workers)
+        self._condition = threading.Condition()
+        # These members are all communicated between threads; ensure that
+        # any access to them holds the condition's lock.
+        self._deadlines = []
+        self._sequence = itertools.count()
+        self._thread = None
+        self._stopped = False
+
+    def schedule(self, batch, delay):
+        """Commit a batch once some time has elapsed.
+
+        Args:
+            batch (~.pubsub_v1.publisher.batch.base.Batch): The batch to
+                commit. Its ``commit()`` method is called from the timer
+                thread, so it must not block.
+            delay (float): The number of seconds to wait.
+
+        Raises:
+            RuntimeError: If the scheduler was shut down.
+        """
+        deadline = time.time() + delay
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError('The commit scheduler was shut down.')
+            # The sequence number breaks ties, so batches are never compared.
+            heapq.heappush(
+                self._deadlines, (deadline, next(self._sequence), batch))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    name='Thread-CommitScheduler',
+                    target=self._run,
+                )
+                self._thread.daemon = True
+                self._thread.start()
+            elif self._deadlines[0][2] is batch:
+                # The earliest deadline changed, so wake the timer up.
+                self._condition.notify()
+
+    def submit(self, func, *args, **kwargs):
+        """Run a commit on the thread pool.
+
+        Args:
+            func (Callable): The function to call.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            ~concurrent.futures.Future: The future of the call.
+        """
+        return self._executor.submit(func, *args, **kwargs)
+
+    def _pop_due(self):
+        """Wait until some batches are due, and remove them from the heap.
+
+        Returns:
+            List[~.pubsub_v1.publisher.batch.base.Batch]: The due batches,
+                or all of the scheduled batches once the scheduler is shut
+                down.
+        """
+        with self._condition:
+            while True:
+                if self._stopped:
+                    due = [batch for _, _, batch in self._deadlines]
+                    self._deadlines = []
+                    return due
+
+                now = time.time()
+                due = []
+                while self._deadlines and self._deadlines[0][0] <= now:
+                    due.append(heapq.heappop(self._deadlines)[2])
+                if due:
+                    return due
+
+                if self._deadlines:
+                    self._condition.wait(self._deadlines[0][0] - now)
+                else:
+                    self._condition.wait()
+
+    def _run(self):
+        """Commit batches as they are due, until the scheduler is shut down.
+
+        .. note::
+
+            This blocks; it is run on the timer thread.
+        """
+        while True:
+            for batch in self._pop_due():
+                try:
+                    batch.commit()
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception('Failed to commit a batch.')
+            with self._condition:
+                if self._stopped and not self._deadlines:
+                    _LOGGER.debug('Commit scheduler is exiting.')
+                    return
+
+    def shutdown(self):
+        """Commit the scheduled batches now, and wait for all commits.
+
+        Batches can not be scheduled once this has been called.
+        """
+        with self._condition:
+            self._stopped = True
+            thread = self._thread
+            self._condition.notify()
+        if thread is not None:
+            thread.join()
+        self._executor.shutdown()
+
+
+def default_scheduler():
+    """Return the scheduler shared by batches which do not set one.
+
+    Returns:
+        CommitScheduler: The scheduler, created on the first call.
+    """
+    global _DEFAULT_SCHEDULER
+    with _DEFAULT_SCHEDULER_LOCK:
+        if _DEFAULT_SCHEDULER is None:
+            _DEFAULT_SCHEDULER = CommitScheduler()
+        return _DEFAULT_SCHEDULER
+
+
+class Batch(thread.Batch):
+    """A batch of messages, committed by a shared :class:`CommitScheduler`.
+
+    This batch publishes messages like
+    :class:`~.pubsub_v1.publisher.batch.thread.Batch`, but does not start
+    any thread of its own.
+
+    The batches of all clients use the :func:`default_scheduler`. To use
+    another scheduler, for instance to bound commits differently, set it on
+    a subclass:
+
+    .. code-block:: python
+
+        class Batch(scheduled.Batch):
+            scheduler = scheduled.CommitScheduler(max_workers=4)
+
+        client = pubsub.PublisherClient(batch_class=Batch)
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client used to
+            create this batch.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        settings (~.pubsub_v1.types.BatchSettings): The settings for batch
+            publishing. These should be considered immutable once the batch
+            has been opened.
+        autocommit (bool): Whether to autocommit the batch when the time
+            has elapsed. Defaults to True unless ``settings.max_latency`` is
+            inf.
+    """
+
+    scheduler = None
+    """Optional[CommitScheduler]: The scheduler which commits the batches.
+
+    If :data:`None`, the :func:`default_scheduler` is used.
+    """
+
+    def __init__(self, client, topic, settings, autocommit=True):
+        super(Batch, self).__init__(
+            client, topic, settings, autocommit=False)
+
+        if autocommit and self._settings.max_latency < float('inf'):
+            self._get_scheduler().schedule(self, self._settings.max_latency)
+
+    def _get_scheduler(self):
+        """Return the scheduler of this batch.
+
+        Returns:
+            CommitScheduler: The scheduler.
+        """
+        if self.scheduler is None:
+            return default_scheduler()
+        return self.scheduler
+
+    def commit(self):
+        """Actually publish all of the messages on the active batch.
+
+        .. note::
+
+            This method is non-blocking. It submits :meth:`_commit`, which
+            does block, to the thread pool of the scheduler.
+
+        If the current batch is **not** accepting messages, this method
+        does nothing.
+        """
+        # Set the status to "starting" synchronously, to ensure that
+        # this batch will necessarily not accept new messages.
+        with self._state_lock:
+            if self._status == base.BatchStatus.ACCEPTING_MESSAGES:
+                self._status = base.BatchStatus.STARTING
+            else:
+                return
+
+        self._get_scheduler().submit(self._commit)
@@ -100,6 +100,14 @@ class Batch(base.Batch):
         """
         return threading.Lock()
 
+    def _make_future(self):
+        """Return a future for a message published to this batch.
+
+        Returns:
+            ~.pubsub_v1.publisher.futures.Future: A newly created future.
+        """
+        return futures.Future(completed=threading.Event())
+
     @property
     def client(self):
         """~.pubsub_v1.client.PublisherClient: A publisher client."""
@@ -209,39 +217,89 @@ class Batch(base.Batch):
             except google.api_core.exceptions.GoogleAPICallError as exc:
                 # We failed to publish, set the exception on all futures and
                 # exit.
-                self._status = base.BatchStatus.ERROR
-
-                for future in self._futures:
-                    future.set_exception(exc)
-
-                _LOGGER.exception(
-                    'Failed to publish %s messages.', len(self._futures))
+                self._set_exception(exc)
                 return
 
             end = time.time()
             _LOGGER.debug('gRPC Publish took %s seconds.', end - start)
 
-            if len(response.message_ids) == len(self._futures):
-                # Iterate over the futures on the queue and return the response
-                # IDs. We are trusting that there is a 1:1 mapping, and raise
-                # an exception if not.
-                self._status = base.BatchStatus.SUCCESS
-                zip_iter = six.moves.zip(response.message_ids, self._futures)
-                for message_id, future in zip_iter:
-                    future.set_result(message_id)
+            self._set_response(response)
+
+    def _set_exception(self, exc):
+        """Fail the futures of all messages, after a publish request failed.
+
+        Args:
+            exc (~google.api_core.exceptions.GoogleAPICallError): The error
+                of the publish request.
+        """
+        self._status = base.BatchStatus.ERROR
+
+        for future in self._futures:
+            future.set_exception(exc)
+
+        _LOGGER.exception(
+            'Failed to publish %s messages.', len(self._futures))
+
+    def _set_response(self, response):
+        """Resolve the futures of all messages with their message IDs.
+
+        Args:
+            response (~.pubsub_v1.types.PublishResponse): The response to the
+                publish request.
+        """
+        if len(response.message_ids) == len(self._futures):
+            # Iterate over the futures on the queue and return the response
+            # IDs. We are trusting that there is a 1:1 mapping, and raise
+            # an exception if not.
+            self._status = base.BatchStatus.SUCCESS
+            zip_iter = six.moves.zip(response.message_ids, self._futures)
+            for message_id, future in zip_iter:
+                future.set_result(message_id)
+        else:
+            # Sanity check: If the number of message IDs is not equal to
+            # the number of futures I have, then something went wrong.
+            self._status = base.BatchStatus.ERROR
+            exception = exceptions.PublishError(
+                'Some messages were not successfully published.')
+
+            for future in self._futures:
+                future.set_exception(exception)
+
+            _LOGGER.error(
+                'Only %s of %s messages were published.',
+                len(response.message_ids), len(self._futures))
+
+    def drop(self, future, exception):
+        """Remove a message which is not being sent yet from the batch.
+
+        Args:
+            future (~google.api_core.future.Future): The future of the
+                message, as returned by :meth:`publish`.
+            exception (Exception): The exception to set on the future if the
+                message is dropped.
+
+        Returns:
+            bool: Whether the message was dropped. Messages can not be
+                dropped once the batch is being committed.
+        """
+        with self._state_lock:
+            if self._status not in _CAN_COMMIT:
+                return False
+
+            for index, batch_future in enumerate(self._futures):
+                if batch_future is future:
+                    break
             else:
-                # Sanity check: If the number of message IDs is not equal to
-                # the number of futures I have, then something went wrong.
-                self._status = base.BatchStatus.ERROR
-                exception = exceptions.PublishError(
-                    'Some messages were not successfully published.')
+                return False
 
-                for future in self._futures:
-                    future.set_exception(exception)
+            message = self._messages.pop(index)
+            del self._futures[index]
+            self._size -= message.ByteSize()
 
-                _LOGGER.error(
-                    'Only %s of %s messages were published.',
-                    len(response.message_ids), len(self._futures))
+        # Resolve the future without the lock held, since its callbacks may
+        # publish again.
+        future.set_exception(exception)
+        return True
 
     def monitor(self):
         """Commit this batch after sufficient time has elapsed.
@@ -301,7 +359,7 @@ class Batch(base.Batch):
 
                 # Track the future on this batch (so that the result of the
                 # future can be set).
-                future = futures.Future(completed=threading.Event())
+                future = self._make_future()
                 self._futures.append(future)
 
         # Try to commit, but it must be **without** the lock held, since
@@ -26,6 +26,7 @@ from google.api_core import grpc_helpers
 from google.cloud.pubsub_v1 import _gapic
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import publisher_client
+from google.cloud.pubsub_v1.publisher import flow_controller
 from google.cloud.pubsub_v1.publisher.batch import thread
 
 
@@ -51,6 +52,9 @@ class Client(object):
             is based on :class:`threading.Thread`. This class should also have
             a class method (or static method) that takes no arguments and
             produces a lock that can be used as a context manager.
+        flow_control (~google.cloud.pubsub_v1.types.PublishFlowControl): The
+            limits on the messages which are published but not sent yet,
+            across all topics. By default, there are no limits.
         kwargs (dict): Any additional arguments provided are sent as keyword
             arguments to the underlying
             :class:`~.gapic.pubsub.v1.publisher_client.PublisherClient`.
@@ -59,7 +63,8 @@ class Client(object):
             be added if ``credentials`` are passed explicitly or if the
             Pub / Sub emulator is detected as running.
     """
-    def __init__(self, batch_settings=(), batch_class=thread.Batch, **kwargs):
+    def __init__(self, batch_settings=(), batch_class=thread.Batch,
+                 flow_control=(), **kwargs):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -86,6 +91,8 @@ class Client(object):
         # client.
         self.api = publisher_client.PublisherClient(**kwargs)
         self.batch_settings = types.BatchSettings(*batch_settings)
+        self._flow_controller = flow_controller.FlowController(
+            types.PublishFlowControl(*flow_control))
 
         # The batches on the publisher client are responsible for holding
         # messages. One batch exists for each topic.
@@ -176,6 +183,11 @@ class Client(object):
         Returns:
             ~concurrent.futures.Future: An object conforming to the
             ``concurrent.futures.Future`` interface.
+
+        Raises:
+            ~google.cloud.pubsub_v1.publisher.exceptions.FlowControlLimitError:
+                If the message exceeds the flow control limits of the client,
+                and its ``limit_exceeded_behavior`` is to raise.
         """
         # Sanity check: Is the data being sent as a bytestring?
         # If it is literally anything else, complain loudly about it.
@@ -200,12 +212,21 @@ class Client(object):
         # Create the Pub/Sub message object.
         message = types.PubsubMessage(data=data, attributes=attrs)
 
-        # Delegate the publishing to the batch.
-        batch = self.batch(topic)
-        future = None
-        while future is None:
-            future = batch.publish(message)
-            if future is None:
-                batch = self.batch(topic, create=True)
+        # Wait for room for the message, if the client has too many
+        # outstanding messages.
+        self._flow_controller.add(message)
 
+        # Delegate the publishing to the batch.
+        try:
+            batch = self.batch(topic)
+            future = None
+            while future is None:
+                future = batch.publish(message)
+                if future is None:
+                    batch = self.batch(topic, create=True)
+        except Exception:
+            self._flow_controller.release(message)
+            raise
+
+        self._flow_controller.track(message, future, batch)
         return future
@@ -22,7 +22,16 @@ class PublishError(GoogleAPICallError):
     pass
 
 
+class FlowControlLimitError(Exception):
+    """Raised when a message exceeds the flow control limits of a publisher.
+
+    It is also set on the futures of messages dropped to make room for newer
+    ones.
+    """
+
+
 __all__ = (
+    'FlowControlLimitError',
     'PublishError',
     'TimeoutError',
 )
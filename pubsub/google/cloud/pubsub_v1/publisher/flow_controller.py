@@ -0,0 +1,183 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import functools
+import logging
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FlowController(object):
+    """Limit the messages and bytes which a publisher has outstanding.
+
+    A message is outstanding from the time it is published until its future
+    is done, which is when its batch was committed, or when it was dropped.
+    The limits apply across the batches of all topics.
+
+    Args:
+        settings (~.pubsub_v1.types.PublishFlowControl): The limits, and what
+            to do when publishing a message would exceed them.
+    """
+    def __init__(self, settings):
+        self._settings = settings
+        self._condition = threading.Condition()
+
+        # These members are all communicated between threads; ensure that
+        # any access to them holds the condition's lock.
+        self._message_count = 0
+        self._total_bytes = 0
+        # The futures of the messages which may be dropped, oldest first,
+        # mapped to their batch.
+        self._droppable = collections.OrderedDict()
+
+    @property
+    def settings(self):
+        """~.pubsub_v1.types.PublishFlowControl: The flow control settings."""
+        return self._settings
+
+    @property
+    def message_count(self):
+        """int: The number of outstanding messages."""
+        return self._message_count
+
+    @property
+    def total_bytes(self):
+        """int: The total size of the outstanding messages, in bytes."""
+        return self._total_bytes
+
+    @property
+    def _enabled(self):
+        return (self._settings.limit_exceeded_behavior !=
+                types.LimitExceededBehavior.IGNORE)
+
+    def _fits(self, size):
+        """Return True if a message of the given size is within the limits.
+
+        .. note::
+
+            The caller must hold the condition's lock.
+        """
+        return (
+            self._message_count + 1 <= self._settings.max_messages and
+            self._total_bytes + size <= self._settings.max_bytes
+        )
+
+    def add(self, message):
+        """Reserve room for a message which is about to be published.
+
+        Depending on the ``limit_exceeded_behavior`` of the settings, this
+        blocks, raises, or drops the oldest outstanding messages until the
+        message fits.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                message does not fit, and the behavior is to raise, or if the
+                message is larger than the limits.
+        """
+        if not self._enabled:
+            return
+
+        behavior = self._settings.limit_exceeded_behavior
+        size = message.ByteSize()
+        if (self._settings.max_messages < 1 or
+                size > self._settings.max_bytes):
+            raise exceptions.FlowControlLimitError(
+                'A message of {} bytes exceeds the flow control limits '
+                'of {} bytes.'.format(size, self._settings.max_bytes))
+
+        while True:
+            with self._condition:
+                if self._fits(size):
+                    self._message_count += 1
+                    self._total_bytes += size
+                    return
+
+                if behavior == types.LimitExceededBehavior.RAISE:
+                    raise exceptions.FlowControlLimitError(
+                        'Flow control limits exceeded: {} messages and {} '
+                        'bytes are outstanding.'.format(
+                            self._message_count, self._total_bytes))
+
+                if (behavior != types.LimitExceededBehavior.DROP_OLDEST or
+                        not self._droppable):
+                    _LOGGER.debug('Blocking until messages are published.')
+                    self._condition.wait()
+                    continue
+
+                future, batch = self._droppable.popitem(last=False)
+
+            # Drop without holding the lock: the batch takes its own lock,
+            # which is held while it resolves futures, and the dropped
+            # future releases its room.
+            batch.drop(future, exceptions.FlowControlLimitError(
+                'The message was dropped to make room for newer messages.'))
+
+    def track(self, message, future, batch):
+        """Release the room of a published message once its future is done.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message,
+                which room was reserved for with :meth:`add`.
+            future (~.pubsub_v1.publisher.futures.Future): The future of the
+                message.
+            batch (~.pubsub_v1.publisher.batch.base.Batch): The batch the
+                message was published to, which can drop it.
+        """
+        if not self._enabled:
+            return
+
+        behavior = self._settings.limit_exceeded_behavior
+        if behavior == types.LimitExceededBehavior.DROP_OLDEST:
+            with self._condition:
+                self._droppable[future] = batch
+        future.add_done_callback(
+            functools.partial(self._release, message.ByteSize()))
+
+    def release(self, message):
+        """Release the room of a message which was not published.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message,
+                which room was reserved for with :meth:`add`.
+        """
+        if not self._enabled:
+            return
+
+        self._release(message.ByteSize())
+
+    def _release(self, size, future=None):
+        """Release the room of a message, and wake up blocked publishers.
+
+        Args:
+            size (int): The size of the message, in bytes.
+            future (Optional[~.pubsub_v1.publisher.futures.Future]): The done
+                future of the message, if any.
+        """
+        with self._condition:
+            self._message_count -= 1
+            self._total_bytes -= size
+            if future is not None:
+                self._droppable.pop(future, None)
+            self._condition.notify_all()
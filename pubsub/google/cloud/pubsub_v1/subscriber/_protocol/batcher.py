@@ -0,0 +1,152 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import logging
+import threading
+import time
+
+
+_LOGGER = logging.getLogger(__name__)
+_BATCH_WORKER_NAME = 'Thread-CallbackBatcher'
+
+
+class Batcher(object):
+    """Collect received messages into batches for a batch callback.
+
+    With a ``max_latency`` of 0, the messages of each streaming pull
+    response are flushed as they are added, in batches of at most
+    ``max_messages``. Otherwise, messages are collected across responses,
+    and flushed once ``max_messages`` are collected or ``max_latency``
+    seconds after the first one, by a helper thread.
+
+    Args:
+        settings (~.pubsub_v1.types.CallbackBatchSettings): The batch
+            settings.
+        flush (Callable[Sequence[~.pubsub_v1.subscriber.message.Message]]):
+            Called with each batch of messages.
+    """
+    def __init__(self, settings, flush):
+        self._settings = settings
+        self._flush = flush
+        self._thread = None
+        self._operational_lock = threading.Lock()
+        self._condition = threading.Condition()
+
+        # These members are all communicated between threads; ensure that
+        # any access to them holds the condition's lock.
+        self._messages = []
+        self._deadline = None
+        self._stopped = False
+
+    def add(self, messages):
+        """Add received messages, flushing the batches which are full.
+
+        Args:
+            messages (Sequence[~.pubsub_v1.subscriber.message.Message]): The
+                messages.
+        """
+        max_messages = self._settings.max_messages
+        if not self._settings.max_latency:
+            for start in range(0, len(messages), max_messages):
+                self._flush(messages[start:start + max_messages])
+            return
+
+        batches = []
+        with self._condition:
+            if not self._messages:
+                self._deadline = time.time() + self._settings.max_latency
+                self._condition.notify()
+            self._messages.extend(messages)
+            while len(self._messages) >= max_messages:
+                batches.append(self._messages[:max_messages])
+                self._messages = self._messages[max_messages:]
+            if batches and self._messages:
+                # The remaining messages start a new window.
+                self._deadline = time.time() + self._settings.max_latency
+
+        for batch in batches:
+            self._flush(batch)
+
+    def _take_due(self):
+        """Wait until the current window is due, and take its messages.
+
+        Returns:
+            Optional[Sequence[~.pubsub_v1.subscriber.message.Message]]: The
+                messages, or :data:`None` once the batcher is stopped.
+        """
+        with self._condition:
+            while not self._stopped:
+                if not self._messages:
+                    self._condition.wait()
+                    continue
+                timeout = self._deadline - time.time()
+                if timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+                messages, self._messages = self._messages, []
+                return messages
+            return None
+
+    def flush_windows(self):
+        """Flush the collected messages as each window is due.
+
+        .. note::
+
+            This blocks; it is run on the helper thread.
+        """
+        while True:
+            messages = self._take_due()
+            if messages is None:
+                break
+            self._flush(messages)
+
+        _LOGGER.info('%s exiting.', _BATCH_WORKER_NAME)
+
+    def start(self):
+        """Start the helper thread, if messages are collected in windows."""
+        with self._operational_lock:
+            if self._thread is not None:
+                raise ValueError('Batcher is already running.')
+            if not self._settings.max_latency:
+                return
+
+            # Create and start the helper thread.
+            with self._condition:
+                self._stopped = False
+            thread = threading.Thread(
+                name=_BATCH_WORKER_NAME,
+                target=self.flush_windows)
+            thread.daemon = True
+            thread.start()
+            _LOGGER.debug('Started helper thread %s', thread.name)
+            self._thread = thread
+
+    def stop(self):
+        """Stop the helper thread, discarding the collected messages.
+
+        The messages stay leased until the manager stops leasing, after
+        which Pub/Sub redelivers them.
+        """
+        with self._operational_lock:
+            with self._condition:
+                self._stopped = True
+                self._messages = []
+                self._condition.notify()
+
+            if self._thread is not None:
+                self._thread.join()
+
+            self._thread = None
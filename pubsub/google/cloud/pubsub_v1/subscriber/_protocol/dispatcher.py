@@ -84,11 +84,20 @@ class Dispatcher(object):
             return
 
         batched_commands = collections.defaultdict(list)
+        count = 0
 
         for item in items:
-            batched_commands[item.__class__].append(item)
-
-        _LOGGER.debug('Handling %d batched requests', len(items))
+            # Message batches queue the requests for all of their messages
+            # as a single list.
+            if isinstance(item, list):
+                for request in item:
+                    batched_commands[request.__class__].append(request)
+                count += len(item)
+            else:
+                batched_commands[item.__class__].append(item)
+                count += 1
+
+        _LOGGER.debug('Handling %d batched requests', count)
 
         if batched_commands[requests.LeaseRequest]:
             self.lease(batched_commands.pop(requests.LeaseRequest))
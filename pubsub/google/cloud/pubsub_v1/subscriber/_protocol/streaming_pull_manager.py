@@ -24,6 +24,7 @@ import six
 
 from google.api_core import exceptions
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import batcher
 from google.cloud.pubsub_v1.subscriber._protocol import bidi
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
@@ -58,9 +59,13 @@ def _wrap_callback_errors(callback, message):
     Args:
         callback (Callable[None, Message]): The user callback.
         message (~Message): The Pub/Sub message.
+
+    Returns:
+        Any: The result of the callback, which schedulers running coroutine
+            callbacks wait for.
     """
     try:
-        callback(message)
+        return callback(message)
     except Exception:
         # Note: the likelihood of this failing is extremely low. This just adds
         # a message to a queue, so if this doesn't work the world is in an
@@ -71,6 +76,27 @@ def _wrap_callback_errors(callback, message):
         message.nack()
 
 
+def _wrap_batch_callback_errors(callback, batch):
+    """Wraps a user batch callback so that if an exception occurs the
+    messages of the batch are nacked.
+
+    Args:
+        callback (Callable[None, MessageBatch]): The user callback.
+        batch (~MessageBatch): The batch of Pub/Sub messages.
+
+    Returns:
+        Any: The result of the callback, which schedulers running coroutine
+            callbacks wait for.
+    """
+    try:
+        return callback(batch)
+    except Exception:
+        _LOGGER.exception(
+            'Top-level exception occurred in callback while processing a '
+            'batch of messages')
+        batch.nack_all()
+
+
 class StreamingPullManager(object):
     """The streaming pull manager coordinates pulling messages from Pub/Sub,
     leasing them, and scheduling them to be processed.
@@ -86,6 +112,11 @@ class StreamingPullManager(object):
         scheduler (~google.cloud.pubsub_v1.scheduler.Scheduler): The scheduler
             to use to process messages. If not provided, a thread pool-based
             scheduler will be used.
+        callback_batch_settings (~google.cloud.pubsub_v1.types.\
+            CallbackBatchSettings): If provided, the callback is called with
+            a :class:`~google.cloud.pubsub_v1.subscriber.message.MessageBatch`
+            of messages at a time, according to these settings, instead of
+            with each message.
     """
 
     _UNARY_REQUESTS = True
@@ -93,7 +124,7 @@ class StreamingPullManager(object):
     RPC instead of over the streaming RPC."""
 
     def __init__(self, client, subscription, flow_control=types.FlowControl(),
-                 scheduler=None):
+                 scheduler=None, callback_batch_settings=None):
         self._client = client
         self._subscription = subscription
         self._flow_control = flow_control
@@ -105,6 +136,7 @@ class StreamingPullManager(object):
         self._closing = threading.Lock()
         self._closed = False
         self._close_callbacks = []
+        self._callback_batch_settings = callback_batch_settings
 
         if scheduler is None:
             self._scheduler = (
@@ -117,6 +149,7 @@ class StreamingPullManager(object):
         self._leaser = None
         self._consumer = None
         self._heartbeater = None
+        self._batcher = None
 
     @property
     def is_active(self):
@@ -133,6 +166,13 @@ class StreamingPullManager(object):
         settings."""
         return self._flow_control
 
+    @property
+    def callback_batch_settings(self):
+        """Optional[google.cloud.pubsub_v1.types.CallbackBatchSettings]: The
+        batch callback settings, or :data:`None` if the callback is called with
+        each message."""
+        return self._callback_batch_settings
+
     @property
     def dispatcher(self):
         """google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher:
@@ -286,7 +326,8 @@ class StreamingPullManager(object):
         Args:
             callback (Callable[None, google.cloud.pubsub_v1.message.Messages]):
                 A callback that will be called for each message received on the
-                stream.
+                stream, or with each batch of messages if the manager has
+                callback batch settings.
         """
         if self.is_active:
             raise ValueError('This manager is already open.')
@@ -295,7 +336,11 @@ class StreamingPullManager(object):
             raise ValueError(
                 'This manager has been closed and can not be re-used.')
 
-        self._callback = functools.partial(_wrap_callback_errors, callback)
+        if self._callback_batch_settings is None:
+            self._callback = functools.partial(_wrap_callback_errors, callback)
+        else:
+            self._callback = functools.partial(
+                _wrap_batch_callback_errors, callback)
 
         # Create the RPC
         self._rpc = bidi.ResumableBidiRpc(
@@ -310,6 +355,9 @@ class StreamingPullManager(object):
             self._rpc, self._on_response)
         self._leaser = leaser.Leaser(self)
         self._heartbeater = heartbeater.Heartbeater(self)
+        if self._callback_batch_settings is not None:
+            self._batcher = batcher.Batcher(
+                self._callback_batch_settings, self._schedule_batch)
 
         # Start the thread to pass the requests.
         self._dispatcher.start()
@@ -323,6 +371,10 @@ class StreamingPullManager(object):
         # Start the stream heartbeater thread.
         self._heartbeater.start()
 
+        # Start the callback batcher thread, if batches wait for messages.
+        if self._batcher is not None:
+            self._batcher.start()
+
     def close(self, reason=None):
         """Stop consuming messages and shutdown all helper threads.
 
@@ -344,6 +396,10 @@ class StreamingPullManager(object):
             self._consumer = None
 
             # Shutdown all helper threads
+            if self._batcher is not None:
+                _LOGGER.debug('Stopping callback batcher.')
+                self._batcher.stop()
+                self._batcher = None
             _LOGGER.debug('Stopping scheduler.')
             self._scheduler.shutdown()
             self._scheduler = None
@@ -415,6 +471,11 @@ class StreamingPullManager(object):
             for message in response.received_messages
         ]
         self._dispatcher.modify_ack_deadline(items)
+
+        if self._batcher is not None:
+            self._on_batch_response(response)
+            return
+
         for received_message in response.received_messages:
             message = google.cloud.pubsub_v1.subscriber.message.Message(
                 received_message.message,
@@ -423,6 +484,41 @@ class StreamingPullManager(object):
             # TODO: Immediately lease instead of using the callback queue.
             self._scheduler.schedule(self._callback, message)
 
+    def _on_batch_response(self, response):
+        """Lease the received messages at once, and hand them to the batcher.
+
+        Each message would otherwise queue its own lease request; instead,
+        all of them are queued as a single item.
+        """
+        messages = [
+            google.cloud.pubsub_v1.subscriber.message.Message(
+                received_message.message,
+                received_message.ack_id,
+                self._scheduler.queue,
+                autolease=False)
+            for received_message in response.received_messages
+        ]
+        if not messages:
+            return
+
+        self._scheduler.queue.put([
+            requests.LeaseRequest(
+                ack_id=message.ack_id, byte_size=message.size)
+            for message in messages
+        ])
+        self._batcher.add(messages)
+
+    def _schedule_batch(self, messages):
+        """Schedule the callback with a batch of messages.
+
+        Args:
+            messages (Sequence[google.cloud.pubsub_v1.subscriber.message.\
+                Message]): The messages.
+        """
+        batch = google.cloud.pubsub_v1.subscriber.message.MessageBatch(
+            messages, self._scheduler.queue)
+        self._scheduler.schedule(self._callback, batch)
+
     def _should_recover(self, exception):
         """Determine if an error on the RPC stream should be recovered.
 
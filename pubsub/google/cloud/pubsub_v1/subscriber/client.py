@@ -91,7 +91,7 @@ class Client(object):
 
     def subscribe(
             self, subscription, callback, flow_control=(),
-            scheduler=None):
+            scheduler=None, callback_batch_settings=None):
         """Asynchronously start receiving messages on a given subscription.
 
         This method starts a background thread to begin pulling messages from
@@ -113,6 +113,15 @@ class Client(object):
         settings may lead to faster throughput for messages that do not take
         a long time to process.
 
+        The ``callback_batch_settings`` argument switches the callback to
+        batches: it is then called with a
+        :class:`google.cloud.pubsub_v1.subscriber.message.MessageBatch` of
+        messages at a time, which can be acknowledged together with
+        ``ack_all()`` or ``nack_all()``. This amortizes the per-message
+        overhead of scheduling and acknowledging for high-volume
+        subscriptions. If an exception occurs in a batch callback, all of the
+        messages of the batch are ``nack()`` ed.
+
         This method starts the receiver in the background and returns a
         *Future* representing its execution. Waiting on the future (calling
         ``result()``) will block forever or until a non-recoverable error
@@ -163,15 +172,25 @@ class Client(object):
             scheduler (~.pubsub_v1.subscriber.scheduler.Scheduler): An optional
                 *scheduler* to use when executing the callback. This controls
                 how callbacks are executed concurrently.
+            callback_batch_settings (~.pubsub_v1.types.CallbackBatchSettings):
+                If provided, the callback is called with batches of messages
+                instead of individual messages. With a ``max_latency`` of 0,
+                each batch holds the messages of one streaming pull response;
+                otherwise, messages are collected for up to ``max_latency``
+                seconds.
 
         Returns:
             google.cloud.pubsub_v1.futures.StreamingPullFuture: A Future object
                 that can be used to manage the background stream.
         """
         flow_control = types.FlowControl(*flow_control)
+        if callback_batch_settings is not None:
+            callback_batch_settings = types.CallbackBatchSettings(
+                *callback_batch_settings)
 
         manager = streaming_pull_manager.StreamingPullManager(
-            self, subscription, flow_control=flow_control, scheduler=scheduler)
+            self, subscription, flow_control=flow_control, scheduler=scheduler,
+            callback_batch_settings=callback_batch_settings)
 
         future = futures.StreamingPullFuture(manager)
 
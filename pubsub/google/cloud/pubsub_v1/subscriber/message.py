@@ -70,7 +70,7 @@ class Message(object):
             published.
     """
 
-    def __init__(self, message, ack_id, request_queue):
+    def __init__(self, message, ack_id, request_queue, autolease=True):
         """Construct the Message.
 
         .. note::
@@ -85,6 +85,9 @@ class Message(object):
             request_queue (queue.Queue): A queue provided by the policy that
                 can accept requests; the policy is responsible for handling
                 those requests.
+            autolease (bool): Whether to lease the message on construction.
+                Defaults to True. If False, the caller is responsible for
+                leasing it, for instance along with other messages.
         """
         self._message = message
         self._ack_id = ack_id
@@ -98,7 +101,8 @@ class Message(object):
 
         # The policy should lease this message, telling PubSub that it has
         # it until it is acked or otherwise dropped.
-        self.lease()
+        if autolease:
+            self.lease()
 
     def __repr__(self):
         # Get an abbreviated version of the data.
@@ -183,13 +187,19 @@ class Message(object):
             ensure that your processing code is idempotent, as you may
             receive any given message more than once.
         """
+        self._request_queue.put(self._ack_request())
+
+    def _ack_request(self):
+        """Return the request to acknowledge this message.
+
+        Returns:
+            ~.pubsub_v1.subscriber._protocol.requests.AckRequest: The request.
+        """
         time_to_ack = math.ceil(time.time() - self._received_timestamp)
-        self._request_queue.put(
-            requests.AckRequest(
-                ack_id=self._ack_id,
-                byte_size=self.size,
-                time_to_ack=time_to_ack
-            )
+        return requests.AckRequest(
+            ack_id=self._ack_id,
+            byte_size=self.size,
+            time_to_ack=time_to_ack
         )
 
     def drop(self):
@@ -259,3 +269,70 @@ class Message(object):
                 byte_size=self.size
             )
         )
+
+
+class MessageBatch(object):
+    """A batch of messages, handed to batch callbacks.
+
+    Batch callbacks receive the messages of a subscription together, rather
+    than one at a time; see the ``callback_batch_settings`` argument of
+    :meth:`~.pubsub_v1.subscriber.client.Client.subscribe`. A batch is a
+    sequence of :class:`Message` objects, which can be acknowledged one by
+    one, or all at once with :meth:`ack_all` and :meth:`nack_all`.
+
+    Args:
+        messages (Sequence[Message]): The messages in the batch.
+        request_queue (queue.Queue): A queue provided by the policy that
+            can accept requests; the policy is responsible for handling
+            those requests.
+    """
+
+    def __init__(self, messages, request_queue):
+        self._messages = list(messages)
+        self._request_queue = request_queue
+
+    def __len__(self):
+        return len(self._messages)
+
+    def __iter__(self):
+        return iter(self._messages)
+
+    def __getitem__(self, index):
+        return self._messages[index]
+
+    def __repr__(self):
+        return '<MessageBatch of {} messages>'.format(len(self._messages))
+
+    @property
+    def messages(self):
+        """Sequence[Message]: The messages in the batch."""
+        return self._messages
+
+    def ack_all(self):
+        """Acknowledge all of the messages in the batch.
+
+        The acknowledgements are queued at once, as a single item, so they
+        are sent in the same request.
+
+        .. warning::
+            Acks in Pub/Sub are best effort. You should always
+            ensure that your processing code is idempotent, as you may
+            receive any given message more than once.
+        """
+        if self._messages:
+            self._request_queue.put(
+                [message._ack_request() for message in self._messages])
+
+    def nack_all(self):
+        """Decline to acknowledge all of the messages in the batch.
+
+        This will cause the messages to be re-delivered to the subscription.
+        """
+        if self._messages:
+            self._request_queue.put([
+                requests.NackRequest(
+                    ack_id=message.ack_id,
+                    byte_size=message.size,
+                )
+                for message in self._messages
+            ])
@@ -20,11 +20,20 @@ each message.
 
 import abc
 import concurrent.futures
+import copy
+import functools
+import logging
 import sys
 
 import six
 from six.moves import queue
 
+from google.cloud.pubsub_v1.subscriber import message as message_module
+from google.cloud.pubsub_v1.subscriber._protocol import requests
+
+
+_LOGGER = logging.getLogger(__name__)
+
 
 @six.add_metaclass(abc.ABCMeta)
 class Scheduler(object):
@@ -124,3 +133,185 @@ class ThreadScheduler(object):
         except queue.Empty:
             pass
         self._executor.shutdown()
+
+
+class _RequestCollector(object):
+    """Collects the requests of messages handled in a worker process.
+
+    This stands in for the request queue of the scheduler, which can not be
+    shared with worker processes.
+    """
+    def __init__(self):
+        self.requests = []
+
+    def put(self, item):
+        """Collect a request, or a list of requests.
+
+        Args:
+            item (Union[tuple, list]): The request(s).
+        """
+        self.requests.append(item)
+
+
+def _detach(arg):
+    """Copy a message or message batch without its request queue.
+
+    Arguments which are neither are returned unchanged.
+
+    Args:
+        arg (Any): The argument to send to a worker process.
+
+    Returns:
+        Any: The argument, ready to be pickled.
+    """
+    if isinstance(arg, message_module.Message):
+        detached = copy.copy(arg)
+        detached._request_queue = None
+        return detached
+    if isinstance(arg, message_module.MessageBatch):
+        return message_module.MessageBatch(
+            [_detach(message) for message in arg], None)
+    return arg
+
+
+def _attach(arg, collector):
+    """Point a detached message or message batch at a request collector."""
+    if isinstance(arg, message_module.Message):
+        arg._request_queue = collector
+    elif isinstance(arg, message_module.MessageBatch):
+        arg._request_queue = collector
+        for message in arg:
+            message._request_queue = collector
+
+
+def _run_in_worker(callback, args, kwargs):
+    """Call a callback in a worker process, and collect its requests.
+
+    Args:
+        callback (Callable): The function to call.
+        args (tuple): Positional arguments passed to the function.
+        kwargs (dict): Key-word arguments passed to the function.
+
+    Returns:
+        List[Union[tuple, list]]: The requests (ack, nack, modack, ...) the
+            callback made for its messages, to be queued in the parent
+            process.
+    """
+    collector = _RequestCollector()
+    for arg in args + tuple(kwargs.values()):
+        _attach(arg, collector)
+    callback(*args, **kwargs)
+    return collector.requests
+
+
+def _nack_requests(arg):
+    """Return the requests to nack a message or message batch.
+
+    Args:
+        arg (Any): An argument which was sent to a worker process.
+
+    Returns:
+        List[~.pubsub_v1.subscriber._protocol.requests.NackRequest]: The
+            requests, which are empty for other arguments.
+    """
+    if isinstance(arg, message_module.Message):
+        return [requests.NackRequest(ack_id=arg.ack_id, byte_size=arg.size)]
+    if isinstance(arg, message_module.MessageBatch):
+        return [
+            request for message in arg for request in _nack_requests(message)]
+    return []
+
+
+class ProcessScheduler(Scheduler):
+    """A process pool-based scheduler.
+
+    This scheduler is useful in CPU-bound message processing, where callbacks
+    in threads would serialize on the global interpreter lock.
+
+    Messages are copied to the worker processes. The acks, nacks and other
+    requests a callback makes for them are collected in the worker, and put
+    onto this scheduler's queue in the parent process once the callback
+    returns. Until then, the messages stay leased by the parent process,
+    just as with a :class:`ThreadScheduler`. If a callback can not be run, for
+    example because a worker process died, its messages are nacked.
+
+    .. note::
+
+        The callback is pickled to be sent to the worker processes, so it
+        must be a module-level function (or a picklable callable object).
+
+    Args:
+        executor(concurrent.futures.ProcessPoolExecutor): An optional executor
+            to use. If not specified, a default one will be created, with one
+            worker process per CPU.
+    """
+    def __init__(self, executor=None):
+        self._queue = queue.Queue()
+        if executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor()
+        else:
+            self._executor = executor
+
+    @property
+    def queue(self):
+        """Queue: A thread-safe queue used for communication between callbacks
+        and the scheduling thread."""
+        return self._queue
+
+    def schedule(self, callback, *args, **kwargs):
+        """Schedule the callback to be called in a worker process.
+
+        Args:
+            callback (Callable): The function to call.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            None
+        """
+        future = self._executor.submit(
+            _run_in_worker,
+            callback,
+            tuple(_detach(arg) for arg in args),
+            {key: _detach(arg) for key, arg in six.iteritems(kwargs)})
+        future.add_done_callback(
+            functools.partial(self._on_done, args=args, kwargs=kwargs))
+
+    def _on_done(self, future, args, kwargs):
+        """Queue the requests of a finished callback.
+
+        .. note::
+
+            This is called on a thread of the executor, in the parent process.
+        """
+        if future.cancelled():
+            # The messages stay leased until the manager shuts down, after
+            # which Pub/Sub redelivers them.
+            return
+
+        exception = future.exception()
+        if exception is None:
+            for item in future.result():
+                self._queue.put(item)
+            return
+
+        _LOGGER.error(
+            'Failed to run callback in a worker process: %r', exception)
+        nacks = [
+            request for arg in args + tuple(kwargs.values())
+            for request in _nack_requests(arg)]
+        if nacks:
+            self._queue.put(nacks)
+
+    def shutdown(self):
+        """Shuts down the scheduler and immediately end all pending callbacks.
+
+        Callbacks which already run in a worker process are waited for.
+        """
+        # Drop all pending items from the executor. Without this, the
+        # executor will block until all pending items are complete, which is
+        # undesirable.
+        for work_item in list(
+                getattr(self._executor, '_pending_work_items', {}).values()):
+            work_item.future.cancel()
+        self._executor.shutdown()
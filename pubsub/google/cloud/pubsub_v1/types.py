@@ -67,6 +67,65 @@ FlowControl.__new__.__defaults__ = (
 )
 
 
+# Define the type class and default values for batch callbacks.
+#
+# This class is used when subscribing, to hand the callback a batch of
+# messages at a time. A ``max_latency`` of 0 hands over the messages of each
+# streaming pull response as they arrive.
+CallbackBatchSettings = collections.namedtuple(
+    'CallbackBatchSettings',
+    ['max_messages', 'max_latency'],
+)
+CallbackBatchSettings.__new__.__defaults__ = (
+    1000,  # max_messages: 1,000
+    0,     # max_latency: each streaming pull response
+)
+
+
+class LimitExceededBehavior(object):
+    """An enum-like class of what to do when publishing exceeds flow control.
+
+    It is used as the ``limit_exceeded_behavior`` of
+    :class:`PublishFlowControl`.
+    """
+    IGNORE = 'ignore'
+    """Publish without limits; flow control is disabled."""
+
+    BLOCK = 'block'
+    """Block publishing until enough outstanding messages are published."""
+
+    RAISE = 'raise'
+    """Raise an error from publishing.
+
+    The error is a
+    :class:`~.pubsub_v1.publisher.exceptions.FlowControlLimitError`.
+    """
+
+    DROP_OLDEST = 'drop_oldest'
+    """Drop the oldest messages which are not being sent yet.
+
+    The futures of dropped messages fail with
+    :class:`~.pubsub_v1.publisher.exceptions.FlowControlLimitError`. When all
+    outstanding messages are being sent, publishing blocks.
+    """
+
+
+# Define the type class and default values for publisher flow control.
+#
+# This class is used when creating a publisher client, to bound the messages
+# which were published but are not sent yet, across all topics. By default,
+# flow control is disabled.
+PublishFlowControl = collections.namedtuple(
+    'PublishFlowControl',
+    ['max_messages', 'max_bytes', 'limit_exceeded_behavior'],
+)
+PublishFlowControl.__new__.__defaults__ = (
+    10 * 1000,                     # max_messages: 10,000
+    100 * 1024 * 1024,             # max_bytes: 100mb
+    LimitExceededBehavior.IGNORE,  # limit_exceeded_behavior: no limits
+)
+
+
 _shared_modules = [
     http_pb2,
     iam_policy_pb2,
@@ -84,7 +143,10 @@ _local_modules = [
 ]
 
 
-names = ['BatchSettings', 'FlowControl']
+names = [
+    'BatchSettings', 'CallbackBatchSettings', 'FlowControl',
+    'LimitExceededBehavior', 'PublishFlowControl',
+]
 
 
 for module in _shared_modules:
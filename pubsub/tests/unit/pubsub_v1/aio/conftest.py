@@ -0,0 +1,24 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+
+# The asyncio clients use ``async def``, which older Pythons can not parse.
+collect_ignore = []
+if sys.version_info < (3, 5):
+    collect_ignore.extend([
+        'test_aio_publisher.py',
+        'test_aio_subscriber.py',
+    ])
@@ -0,0 +1,191 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+
+import mock
+import pytest
+
+import google.api_core.exceptions
+from google.auth import credentials
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.aio import publisher
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher.batch.base import BatchStatus
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+def create_client(**kwargs):
+    creds = mock.Mock(spec=credentials.Credentials)
+    return publisher.AsyncPublisher(credentials=creds, **kwargs)
+
+
+def create_batch(autocommit=False, **batch_settings):
+    settings = types.BatchSettings(**batch_settings)
+    return publisher.Batch(
+        create_client(), 'topic_name', settings, autocommit=autocommit)
+
+
+def test_init_no_thread(loop):
+    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+        batch = create_batch(autocommit=True, max_latency=60)
+
+    Thread.assert_not_called()
+    assert batch._timer is not None
+    batch._timer.cancel()
+
+
+def test_init_infinite_latency(loop):
+    batch = create_batch(autocommit=True, max_latency=float('inf'))
+
+    assert batch._timer is None
+
+
+def test_init_blocking_flow_control(loop):
+    flow_control = types.PublishFlowControl(
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK)
+
+    with pytest.raises(ValueError):
+        create_client(flow_control=flow_control)
+
+
+def test_publish_returns_asyncio_future(loop):
+    batch = create_batch()
+
+    future = batch.publish(types.PubsubMessage(data=b'foo'))
+
+    assert isinstance(future, asyncio.Future)
+    assert not future.done()
+    assert batch._futures == [future]
+
+
+def test_commit_once(loop):
+    batch = create_batch()
+    batch.publish(types.PubsubMessage(data=b'foo'))
+
+    with mock.patch.object(loop, 'create_task') as create_task:
+        batch.commit()
+        batch.commit()
+
+    assert create_task.call_count == 1
+    create_task.call_args[0][0].close()
+    assert batch.status == BatchStatus.STARTING
+
+
+def test_commit_async_already_in_progress(loop):
+    batch = create_batch()
+    batch.publish(types.PubsubMessage(data=b'foo'))
+    batch._status = BatchStatus.IN_PROGRESS
+    patch = mock.patch.object(type(batch.client.api), 'publish')
+
+    with patch as publish_rpc:
+        loop.run_until_complete(batch._commit_async())
+
+    publish_rpc.assert_not_called()
+    assert batch.status == BatchStatus.IN_PROGRESS
+
+
+def test_publish_after_max_latency(loop):
+    client = create_client(batch_settings=types.BatchSettings(
+        max_latency=0.01))
+    response = types.PublishResponse(message_ids=['a', 'b'])
+    patch = mock.patch.object(
+        type(client.api), 'publish', return_value=response)
+
+    async def publish():
+        return await asyncio.gather(
+            client.publish('topic_name', b'foo'),
+            client.publish('topic_name', b'bar'))
+
+    with patch as publish_rpc:
+        message_ids = loop.run_until_complete(publish())
+
+    assert message_ids == ['a', 'b']
+    publish_rpc.assert_called_once_with('topic_name', [
+        types.PubsubMessage(data=b'foo'),
+        types.PubsubMessage(data=b'bar'),
+    ])
+
+
+def test_publish_error(loop):
+    batch = create_batch()
+    future = batch.publish(types.PubsubMessage(data=b'foo'))
+    error = google.api_core.exceptions.InternalServerError('uh oh')
+    patch = mock.patch.object(
+        type(batch.client.api), 'publish', side_effect=error)
+
+    with patch:
+        batch.commit()
+        with pytest.raises(google.api_core.exceptions.InternalServerError):
+            loop.run_until_complete(future)
+
+    assert batch.status == BatchStatus.ERROR
+
+
+def test_publish_wrong_messageid_length(loop):
+    batch = create_batch()
+    future = batch.publish(types.PubsubMessage(data=b'foo'))
+    response = types.PublishResponse(message_ids=[])
+    patch = mock.patch.object(
+        type(batch.client.api), 'publish', return_value=response)
+
+    with patch:
+        batch.commit()
+        with pytest.raises(exceptions.PublishError):
+            loop.run_until_complete(future)
+
+    assert batch.status == BatchStatus.ERROR
+
+
+def test_commit_no_messages(loop):
+    batch = create_batch()
+    patch = mock.patch.object(type(batch.client.api), 'publish')
+
+    with patch as publish_rpc:
+        loop.run_until_complete(batch._commit_async())
+
+    publish_rpc.assert_not_called()
+    assert batch.status == BatchStatus.SUCCESS
+
+
+def test_flow_control_released(loop):
+    flow_control = types.PublishFlowControl(
+        max_messages=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.RAISE)
+    client = create_client(
+        flow_control=flow_control,
+        batch_settings=types.BatchSettings(max_latency=0.01))
+    response = types.PublishResponse(message_ids=['a'])
+    patch = mock.patch.object(
+        type(client.api), 'publish', return_value=response)
+
+    async def publish():
+        first = await client.publish('topic_name', b'foo')
+        # The first message was released, so there is room again.
+        second = client.publish('topic_name', b'bar')
+        with pytest.raises(exceptions.FlowControlLimitError):
+            client.publish('topic_name', b'baz')
+        return first, await second
+
+    with patch:
+        assert loop.run_until_complete(publish()) == ('a', 'a')
@@ -0,0 +1,269 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import functools
+import threading
+
+import mock
+import pytest
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.aio import subscriber
+from google.cloud.pubsub_v1.subscriber import message
+from google.cloud.pubsub_v1.subscriber._protocol import requests
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+def create_message(queue):
+    return message.Message(
+        types.PubsubMessage(data=b'foo', message_id='1'), 'ack-id', queue)
+
+
+def test_scheduler_runs_coroutines(loop):
+    scheduler = subscriber.AsyncioScheduler(loop)
+    results = []
+
+    async def callback(value):
+        await asyncio.sleep(0)
+        results.append(value)
+
+    scheduler.schedule(callback, 'a')
+    scheduler.schedule(callback, value='b')
+    loop.run_until_complete(asyncio.sleep(0.01))
+
+    assert sorted(results) == ['a', 'b']
+    assert scheduler._tasks == set()
+
+
+def test_scheduler_runs_plain_callbacks(loop):
+    scheduler = subscriber.AsyncioScheduler(loop)
+    callback = mock.Mock(spec=(), return_value=None)
+
+    scheduler.schedule(callback, 'a')
+    loop.run_until_complete(asyncio.sleep(0))
+
+    callback.assert_called_once_with('a')
+
+
+def test_scheduler_schedule_from_thread(loop):
+    scheduler = subscriber.AsyncioScheduler(loop)
+    done = loop.create_future()
+
+    async def callback():
+        done.set_result(threading.current_thread())
+
+    thread = threading.Thread(target=scheduler.schedule, args=(callback,))
+    thread.start()
+    thread.join()
+
+    assert loop.run_until_complete(done) is threading.current_thread()
+
+
+def test_scheduler_shutdown_cancels_tasks(loop):
+    scheduler = subscriber.AsyncioScheduler(loop)
+    callback = mock.Mock(spec=())
+
+    async def wait_forever():
+        await loop.create_future()
+
+    scheduler.schedule(wait_forever)
+    loop.run_until_complete(asyncio.sleep(0))
+    task, = scheduler._tasks
+
+    scheduler.shutdown()
+    scheduler.schedule(callback)
+    loop.run_until_complete(asyncio.sleep(0.01))
+
+    assert task.cancelled()
+    callback.assert_not_called()
+
+
+def test_scheduler_shutdown_closed_loop():
+    loop = asyncio.new_event_loop()
+    scheduler = subscriber.AsyncioScheduler(loop)
+    loop.close()
+
+    scheduler.shutdown()
+
+
+def test_run_callback_ok(loop):
+    queue = mock.Mock(spec=['put'])
+    msg = create_message(queue)
+
+    async def callback(message):
+        message.ack()
+
+    loop.run_until_complete(subscriber._run_callback(callback, msg))
+
+    assert isinstance(queue.put.call_args[0][0], requests.AckRequest)
+
+
+def test_run_callback_error_nacks(loop):
+    queue = mock.Mock(spec=['put'])
+    msg = create_message(queue)
+
+    async def callback(message):
+        raise ValueError('bad')
+
+    loop.run_until_complete(subscriber._run_callback(callback, msg))
+
+    assert isinstance(queue.put.call_args[0][0], requests.NackRequest)
+
+
+def test_run_callback_cancelled(loop):
+    queue = mock.Mock(spec=['put'])
+    msg = create_message(queue)
+
+    async def callback(message):
+        await loop.create_future()
+
+    task = loop.create_task(subscriber._run_callback(callback, msg))
+    loop.run_until_complete(asyncio.sleep(0))
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        loop.run_until_complete(task)
+
+    # A cancelled callback leaves the message leased, instead of nacking it.
+    assert not any(
+        isinstance(call[0][0], requests.NackRequest)
+        for call in queue.put.call_args_list)
+
+
+def test_set_future_result_already_done(loop):
+    future = loop.create_future()
+    future.cancel()
+
+    subscriber._set_future_result(future, ValueError('stream failed'))
+
+    assert future.cancelled()
+
+
+def create_subscriber():
+    creds = mock.Mock(spec=credentials.Credentials)
+    return subscriber.AsyncSubscriber(credentials=creds)
+
+
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager.'
+    'StreamingPullManager.open', autospec=True)
+def test_subscribe(manager_open, loop):
+    client = create_subscriber()
+    flow_control = types.FlowControl(max_messages=42)
+
+    future = client.subscribe(
+        'sub_name_a', mock.sentinel.callback, flow_control=flow_control)
+
+    assert isinstance(future, asyncio.Future)
+    manager = manager_open.call_args[0][0]
+    assert manager._subscription == 'sub_name_a'
+    assert manager.flow_control == flow_control
+    assert isinstance(manager._scheduler, subscriber.AsyncioScheduler)
+    assert manager._scheduler.loop is loop
+
+    # The callback the manager runs awaits the user's coroutine function.
+    callback = manager_open.call_args[0][1]
+    assert callback.func is subscriber._run_callback
+    assert callback.args == (mock.sentinel.callback,)
+
+
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager.'
+    'StreamingPullManager.open', autospec=True)
+def test_subscribe_resolves_on_close(manager_open, loop):
+    client = create_subscriber()
+    future = client.subscribe('sub_name_a', mock.sentinel.callback)
+    manager = manager_open.call_args[0][0]
+    error = ValueError('stream failed')
+
+    for close_callback in manager._close_callbacks:
+        close_callback(manager, error)
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(future)
+
+
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager.'
+    'StreamingPullManager.open', autospec=True)
+def test_subscribe_resolves_on_clean_close(manager_open, loop):
+    client = create_subscriber()
+    future = client.subscribe('sub_name_a', mock.sentinel.callback)
+    manager = manager_open.call_args[0][0]
+
+    for close_callback in manager._close_callbacks:
+        close_callback(manager, None)
+
+    assert loop.run_until_complete(future) is True
+
+
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager.'
+    'StreamingPullManager.open', autospec=True)
+def test_subscribe_close_after_loop_closed(manager_open, loop):
+    client = create_subscriber()
+    future = client.subscribe('sub_name_a', mock.sentinel.callback)
+    manager = manager_open.call_args[0][0]
+    loop.close()
+
+    for close_callback in manager._close_callbacks:
+        close_callback(manager, None)
+
+    assert not future.done()
+
+
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager.'
+    'StreamingPullManager.close', autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager.'
+    'StreamingPullManager.open', autospec=True)
+def test_subscribe_cancel_closes_manager(manager_open, manager_close, loop):
+    client = create_subscriber()
+    future = client.subscribe('sub_name_a', mock.sentinel.callback)
+    manager = manager_open.call_args[0][0]
+
+    future.cancel()
+    loop.run_until_complete(asyncio.sleep(0.01))
+
+    manager_close.assert_called_once_with(manager)
+
+
+def test_wrapped_callback_runs_as_task(loop):
+    scheduler = subscriber.AsyncioScheduler(loop)
+    handled = loop.create_future()
+
+    async def callback(message):
+        await asyncio.sleep(0)
+        handled.set_result(message.data)
+
+    # This is how the streaming pull manager wraps the callback given to
+    # ``open()`` by ``AsyncSubscriber.subscribe``.
+    wrapped = functools.partial(
+        streaming_pull_manager._wrap_callback_errors,
+        functools.partial(subscriber._run_callback, callback))
+    scheduler.schedule(wrapped, create_message(scheduler.queue))
+
+    assert loop.run_until_complete(handled) == b'foo'
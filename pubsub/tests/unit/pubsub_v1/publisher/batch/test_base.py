@@ -19,6 +19,7 @@ import mock
 from google.auth import credentials
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher.batch import base
 from google.cloud.pubsub_v1.publisher.batch.base import BatchStatus
 from google.cloud.pubsub_v1.publisher.batch.thread import Batch
 
@@ -76,3 +77,10 @@ def test_will_not_accept_number():
     )
     message = types.PubsubMessage(data=b'abc')
     assert batch.will_accept(message) is False
+
+
+def test_drop_not_supported():
+    batch = create_batch(status=BatchStatus.ACCEPTING_MESSAGES)
+    future = mock.Mock(spec=())
+    with mock.patch.object(Batch, 'drop', new=base.Batch.drop):
+        assert not batch.drop(future, ValueError('dropped'))
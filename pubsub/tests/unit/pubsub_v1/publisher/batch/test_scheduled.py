@@ -0,0 +1,199 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import mock
+import pytest
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher.batch.base import BatchStatus
+from google.cloud.pubsub_v1.publisher.batch import scheduled
+
+
+def create_client():
+    creds = mock.Mock(spec=credentials.Credentials)
+    return publisher.Client(credentials=creds)
+
+
+def create_batch(scheduler, autocommit=True, **batch_settings):
+    """Return a batch which uses the given scheduler.
+
+    Args:
+        scheduler (~.pubsub_v1.publisher.batch.scheduled.CommitScheduler):
+            The scheduler of the batch.
+        autocommit (bool): Whether the batch should commit after
+            ``max_latency`` seconds.
+        kwargs (dict): Arguments passed on to the
+            :class:``~.pubsub_v1.types.BatchSettings`` constructor.
+
+    Returns:
+        ~.pubsub_v1.publisher.batch.scheduled.Batch: A batch object.
+    """
+    class Batch(scheduled.Batch):
+        pass
+
+    Batch.scheduler = scheduler
+    settings = types.BatchSettings(**batch_settings)
+    return Batch(
+        create_client(), 'topic_name', settings, autocommit=autocommit)
+
+
+class FakeBatch(object):
+    def __init__(self, name, committed):
+        self.name = name
+        self._committed = committed
+
+    def commit(self):
+        self._committed.append(self.name)
+
+
+def test_init_schedules_commit():
+    scheduler = mock.Mock(spec=scheduled.CommitScheduler)
+    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+        batch = create_batch(scheduler, max_latency=0.5)
+
+    Thread.assert_not_called()
+    scheduler.schedule.assert_called_once_with(batch, 0.5)
+
+
+def test_init_infinite_latency():
+    scheduler = mock.Mock(spec=scheduled.CommitScheduler)
+    create_batch(scheduler, max_latency=float('inf'))
+
+    scheduler.schedule.assert_not_called()
+
+
+def test_init_no_autocommit():
+    scheduler = mock.Mock(spec=scheduled.CommitScheduler)
+    create_batch(scheduler, autocommit=False)
+
+    scheduler.schedule.assert_not_called()
+
+
+def test_commit_submits_once():
+    scheduler = mock.Mock(spec=scheduled.CommitScheduler)
+    batch = create_batch(scheduler, autocommit=False)
+
+    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+        batch.commit()
+        batch.commit()
+
+    Thread.assert_not_called()
+    scheduler.submit.assert_called_once_with(batch._commit)
+    assert batch.status == BatchStatus.STARTING
+
+
+def test_publish_overflow_submits_commit():
+    scheduler = mock.Mock(spec=scheduled.CommitScheduler)
+    batch = create_batch(scheduler, autocommit=False, max_messages=1)
+
+    assert batch.publish(types.PubsubMessage(data=b'foo')) is not None
+    scheduler.submit.assert_called_once_with(batch._commit)
+    assert batch.publish(types.PubsubMessage(data=b'bar')) is None
+
+
+def test_commit_publishes_on_pool():
+    scheduler = scheduled.CommitScheduler(max_workers=1)
+    batch = create_batch(scheduler, max_latency=0.01)
+    publish_response = types.PublishResponse(message_ids=['a'])
+    patch = mock.patch.object(
+        type(batch.client.api), 'publish', return_value=publish_response)
+
+    with patch as publish:
+        future = batch.publish(types.PubsubMessage(data=b'foo'))
+        assert future.result(timeout=5) == 'a'
+        scheduler.shutdown()
+
+    publish.assert_called_once_with(
+        'topic_name', [types.PubsubMessage(data=b'foo')])
+    assert batch.status == BatchStatus.SUCCESS
+
+
+def test_default_scheduler():
+    batch = create_batch(None, autocommit=False)
+
+    with mock.patch.object(scheduled, '_DEFAULT_SCHEDULER', new=None):
+        scheduler = batch._get_scheduler()
+        assert isinstance(scheduler, scheduled.CommitScheduler)
+        assert scheduled.default_scheduler() is scheduler
+
+
+def test_scheduler_commits_in_deadline_order():
+    scheduler = scheduled.CommitScheduler(max_workers=1)
+    committed = []
+    done = threading.Event()
+    last = FakeBatch('last', committed)
+    last.commit = lambda: (committed.append('last'), done.set())
+
+    scheduler.schedule(last, 0.03)
+    scheduler.schedule(FakeBatch('second', committed), 0.02)
+    scheduler.schedule(FakeBatch('first', committed), 0.01)
+
+    assert done.wait(timeout=5)
+    assert committed == ['first', 'second', 'last']
+    scheduler.shutdown()
+
+
+def test_scheduler_starts_one_thread():
+    scheduler = scheduled.CommitScheduler()
+    committed = []
+
+    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+        scheduler.schedule(FakeBatch('one', committed), 60)
+        scheduler.schedule(FakeBatch('two', committed), 60)
+
+    Thread.assert_called_once_with(
+        name='Thread-CommitScheduler', target=scheduler._run)
+    Thread.return_value.start.assert_called_once_with()
+    assert Thread.return_value.daemon
+
+
+def test_scheduler_shutdown_commits_pending():
+    scheduler = scheduled.CommitScheduler()
+    committed = []
+    scheduler.schedule(FakeBatch('pending', committed), 60)
+
+    start = time.time()
+    scheduler.shutdown()
+
+    assert committed == ['pending']
+    assert time.time() - start < 5
+    with pytest.raises(RuntimeError):
+        scheduler.schedule(FakeBatch('late', committed), 0)
+
+
+def test_scheduler_logs_commit_errors():
+    scheduler = scheduled.CommitScheduler()
+    batch = mock.Mock(spec=['commit'])
+    batch.commit.side_effect = ValueError('bad')
+
+    with mock.patch.object(scheduled, '_LOGGER') as logger:
+        scheduler.schedule(batch, 60)
+        scheduler.shutdown()
+
+    batch.commit.assert_called_once_with()
+    logger.exception.assert_called_once_with('Failed to commit a batch.')
+
+
+def test_scheduler_submit():
+    scheduler = scheduled.CommitScheduler(max_workers=1)
+
+    future = scheduler.submit(lambda value: value * 2, 21)
+
+    assert future.result(timeout=5) == 42
+    scheduler.shutdown()
@@ -322,3 +322,32 @@ def test_publish_dict():
         data=b'foobarbaz', attributes={'spam': 'eggs'})
     assert batch.messages == [expected_message]
     assert batch._futures == [future]
+
+
+def test_drop():
+    batch = create_batch()
+    messages = (
+        types.PubsubMessage(data=b'foobarbaz'),
+        types.PubsubMessage(data=b'spameggs'),
+    )
+    first, second = [batch.publish(message) for message in messages]
+    exception = exceptions.FlowControlLimitError('dropped')
+
+    assert batch.drop(first, exception)
+
+    assert first.exception() is exception
+    assert batch.messages == [messages[1]]
+    assert batch._futures == [second]
+    assert batch.size == messages[1].ByteSize()
+    assert not batch.drop(first, exception)
+
+
+def test_drop_in_progress():
+    batch = create_batch()
+    future = batch.publish(types.PubsubMessage(data=b'foobarbaz'))
+    batch._status = BatchStatus.IN_PROGRESS
+
+    assert not batch.drop(future, exceptions.FlowControlLimitError('dropped'))
+
+    assert not future.done()
+    assert batch._futures == [future]
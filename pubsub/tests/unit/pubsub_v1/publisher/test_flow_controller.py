@@ -0,0 +1,199 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import threading
+
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import flow_controller
+from google.cloud.pubsub_v1.publisher import futures
+from google.cloud.pubsub_v1.publisher.batch import base
+
+
+def create_controller(behavior, max_messages=2, max_bytes=100):
+    settings = types.PublishFlowControl(
+        max_messages=max_messages,
+        max_bytes=max_bytes,
+        limit_exceeded_behavior=behavior,
+    )
+    return flow_controller.FlowController(settings)
+
+
+def make_message(size):
+    message = types.PubsubMessage(data=b'x' * (size - 2))
+    assert message.ByteSize() == size
+    return message
+
+
+def add_and_track(controller, message, batch=None):
+    controller.add(message)
+    future = futures.Future()
+    controller.track(message, future, batch or mock.Mock(spec=base.Batch))
+    return future
+
+
+def test_ignore_does_not_limit():
+    controller = create_controller(types.LimitExceededBehavior.IGNORE)
+
+    for _ in range(5):
+        add_and_track(controller, make_message(50))
+
+    assert controller.message_count == 0
+    assert controller.total_bytes == 0
+
+
+def test_ignore_release_unpublished():
+    controller = flow_controller.FlowController(types.PublishFlowControl())
+    message = make_message(30)
+
+    controller.add(message)
+    controller.release(message)
+
+    assert controller.message_count == 0
+    assert controller.total_bytes == 0
+
+
+def test_add_and_release_on_done():
+    controller = create_controller(types.LimitExceededBehavior.RAISE)
+
+    future = add_and_track(controller, make_message(30))
+    assert controller.message_count == 1
+    assert controller.total_bytes == 30
+
+    future.set_result('1')
+    assert controller.message_count == 0
+    assert controller.total_bytes == 0
+
+
+def test_release_unpublished():
+    controller = create_controller(types.LimitExceededBehavior.RAISE)
+    message = make_message(30)
+
+    controller.add(message)
+    controller.release(message)
+
+    assert controller.message_count == 0
+    assert controller.total_bytes == 0
+
+
+def test_raise_on_too_many_messages():
+    controller = create_controller(types.LimitExceededBehavior.RAISE)
+    add_and_track(controller, make_message(10))
+    add_and_track(controller, make_message(10))
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(make_message(10))
+    assert controller.message_count == 2
+
+
+def test_raise_on_too_many_bytes():
+    controller = create_controller(types.LimitExceededBehavior.RAISE)
+    add_and_track(controller, make_message(60))
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(make_message(60))
+    assert controller.total_bytes == 60
+
+
+def test_message_larger_than_limit():
+    controller = create_controller(types.LimitExceededBehavior.BLOCK)
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(make_message(101))
+    assert controller.message_count == 0
+
+
+def test_block_until_released():
+    controller = create_controller(types.LimitExceededBehavior.BLOCK)
+    first = add_and_track(controller, make_message(60))
+    added = threading.Event()
+
+    def add():
+        controller.add(make_message(60))
+        added.set()
+
+    thread = threading.Thread(target=add)
+    thread.start()
+    assert not added.wait(timeout=0.1)
+
+    first.set_exception(ValueError('failed'))
+    assert added.wait(timeout=5)
+    thread.join()
+    assert controller.message_count == 1
+    assert controller.total_bytes == 60
+
+
+def test_drop_oldest():
+    controller = create_controller(types.LimitExceededBehavior.DROP_OLDEST)
+    batch = mock.Mock(spec=base.Batch)
+
+    def drop(future, exception):
+        future.set_exception(exception)
+        return True
+
+    batch.drop.side_effect = drop
+    oldest = add_and_track(controller, make_message(10), batch)
+    newer = add_and_track(controller, make_message(10), batch)
+
+    add_and_track(controller, make_message(10), batch)
+
+    batch.drop.assert_called_once_with(oldest, mock.ANY)
+    assert isinstance(oldest.exception(), exceptions.FlowControlLimitError)
+    assert not newer.done()
+    assert controller.message_count == 2
+
+
+def test_drop_oldest_skips_messages_being_sent():
+    controller = create_controller(types.LimitExceededBehavior.DROP_OLDEST)
+    sending = mock.Mock(spec=base.Batch)
+    sending.drop.return_value = False
+    accepting = mock.Mock(spec=base.Batch)
+    accepting.drop.side_effect = (
+        lambda future, exception: future.set_exception(exception))
+    in_flight = add_and_track(controller, make_message(10), sending)
+    queued = add_and_track(controller, make_message(10), accepting)
+
+    add_and_track(controller, make_message(10), accepting)
+
+    sending.drop.assert_called_once_with(in_flight, mock.ANY)
+    accepting.drop.assert_called_once_with(queued, mock.ANY)
+    assert not in_flight.done()
+    assert controller.message_count == 2
+
+
+def test_drop_oldest_blocks_without_droppable_messages():
+    controller = create_controller(
+        types.LimitExceededBehavior.DROP_OLDEST, max_messages=1)
+    sending = mock.Mock(spec=base.Batch)
+    sending.drop.return_value = False
+    in_flight = add_and_track(controller, make_message(10), sending)
+    added = threading.Event()
+
+    def add():
+        controller.add(make_message(10))
+        added.set()
+
+    thread = threading.Thread(target=add)
+    thread.start()
+    assert not added.wait(timeout=0.1)
+
+    in_flight.set_result('1')
+    assert added.wait(timeout=5)
+    thread.join()
+    sending.drop.assert_called_once_with(in_flight, mock.ANY)
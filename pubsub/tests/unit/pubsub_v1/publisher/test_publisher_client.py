@@ -22,6 +22,8 @@ import pytest
 from google.cloud.pubsub_v1.gapic import publisher_client
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import futures
 
 
 def test_init():
@@ -203,6 +205,73 @@ def test_publish_attrs_type_error():
         client.publish(topic, b'foo', answer=42)
 
 
+def test_init_flow_control():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        max_messages=10,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    client = publisher.Client(credentials=creds, flow_control=flow_control)
+
+    assert client._flow_controller.settings == flow_control
+
+
+def test_publish_flow_control_tracks_future():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    flow_controller = mock.Mock(spec=client._flow_controller)
+    client._flow_controller = flow_controller
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.return_value = mock.sentinel.future
+    topic = 'topic/path'
+    client._batches[topic] = batch
+
+    future = client.publish(topic, b'foo')
+
+    assert future is mock.sentinel.future
+    message_pb = types.PubsubMessage(data=b'foo')
+    flow_controller.add.assert_called_once_with(message_pb)
+    flow_controller.track.assert_called_once_with(
+        message_pb, mock.sentinel.future, batch)
+    flow_controller.release.assert_not_called()
+
+
+def test_publish_flow_control_limit_error():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        max_messages=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.RAISE,
+    )
+    client = publisher.Client(credentials=creds, flow_control=flow_control)
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.return_value = futures.Future()
+    topic = 'topic/path'
+    client._batches[topic] = batch
+
+    client.publish(topic, b'foo')
+    with pytest.raises(exceptions.FlowControlLimitError):
+        client.publish(topic, b'bar')
+
+    batch.publish.assert_called_once_with(types.PubsubMessage(data=b'foo'))
+
+
+def test_publish_flow_control_released_on_error():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK)
+    client = publisher.Client(credentials=creds, flow_control=flow_control)
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.side_effect = ValueError('bad')
+    topic = 'topic/path'
+    client._batches[topic] = batch
+
+    with pytest.raises(ValueError):
+        client.publish(topic, b'foo')
+
+    assert client._flow_controller.message_count == 0
+    assert client._flow_controller.total_bytes == 0
+
+
 def test_gapic_instance_method():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
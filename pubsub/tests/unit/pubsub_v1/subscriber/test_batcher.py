@@ -0,0 +1,129 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import batcher
+
+import mock
+import pytest
+
+
+def make_batcher(**settings):
+    flush = mock.Mock(spec=())
+    return batcher.Batcher(types.CallbackBatchSettings(**settings), flush)
+
+
+def test_add_per_response():
+    batcher_ = make_batcher(max_messages=2)
+
+    batcher_.add(['a', 'b', 'c'])
+    batcher_.add(['d'])
+
+    assert batcher_._flush.mock_calls == [
+        mock.call(['a', 'b']), mock.call(['c']), mock.call(['d'])]
+
+
+def test_add_per_response_empty():
+    batcher_ = make_batcher()
+
+    batcher_.add([])
+
+    batcher_._flush.assert_not_called()
+
+
+def test_add_collects_until_full():
+    batcher_ = make_batcher(max_messages=3, max_latency=60)
+
+    batcher_.add(['a', 'b'])
+    batcher_._flush.assert_not_called()
+
+    batcher_.add(['c', 'd'])
+
+    batcher_._flush.assert_called_once_with(['a', 'b', 'c'])
+    assert batcher_._messages == ['d']
+
+
+def test_flush_windows():
+    batcher_ = make_batcher(max_latency=0.01)
+    flushed = threading.Event()
+    batcher_._flush.side_effect = lambda messages: flushed.set()
+
+    batcher_.start()
+    try:
+        batcher_.add(['a', 'b'])
+        assert flushed.wait(5)
+    finally:
+        batcher_.stop()
+
+    batcher_._flush.assert_called_once_with(['a', 'b'])
+
+
+@mock.patch('threading.Thread', autospec=True)
+def test_start(thread):
+    batcher_ = make_batcher(max_latency=1)
+
+    batcher_.start()
+
+    thread.assert_called_once_with(
+        name=batcher._BATCH_WORKER_NAME,
+        target=batcher_.flush_windows)
+
+    thread.return_value.start.assert_called_once()
+
+    assert batcher_._thread is not None
+
+
+@mock.patch('threading.Thread', autospec=True)
+def test_start_per_response(thread):
+    batcher_ = make_batcher()
+
+    batcher_.start()
+
+    thread.assert_not_called()
+    assert batcher_._thread is None
+
+
+@mock.patch('threading.Thread', autospec=True)
+def test_start_already_started(thread):
+    batcher_ = make_batcher(max_latency=1)
+    batcher_._thread = mock.sentinel.thread
+
+    with pytest.raises(ValueError):
+        batcher_.start()
+
+    thread.assert_not_called()
+
+
+def test_stop():
+    batcher_ = make_batcher(max_latency=60)
+    thread = mock.create_autospec(threading.Thread, instance=True)
+    batcher_._thread = thread
+    batcher_.add(['a'])
+
+    batcher_.stop()
+
+    assert batcher_._stopped
+    assert batcher_._messages == []
+    thread.join.assert_called_once()
+    assert batcher_._thread is None
+    assert batcher_._take_due() is None
+    batcher_._flush.assert_not_called()
+
+
+def test_stop_no_join():
+    batcher_ = make_batcher()
+
+    batcher_.stop()
@@ -45,6 +45,24 @@ def test_dispatch_callback(item, method_name):
     method.assert_called_once_with([item])
 
 
+def test_dispatch_callback_request_lists():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True)
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    acks = [requests.AckRequest(0, 0, 0), requests.AckRequest(1, 0, 0)]
+    nack = requests.NackRequest(2, 0)
+    items = [acks, nack, [requests.AckRequest(3, 0, 0)]]
+
+    with mock.patch.multiple(
+            dispatcher_, ack=mock.DEFAULT, nack=mock.DEFAULT) as methods:
+        dispatcher_.dispatch_callback(items)
+
+    methods['ack'].assert_called_once_with(
+        acks + [requests.AckRequest(3, 0, 0)])
+    methods['nack'].assert_called_once_with([nack])
+
+
 def test_dispatch_callback_inactive():
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True)
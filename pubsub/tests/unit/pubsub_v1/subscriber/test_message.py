@@ -156,6 +156,59 @@ def test_nack():
         check_call_types(put, requests.NackRequest)
 
 
+def test_no_autolease():
+    msg = message.Message(
+        types.PubsubMessage(data=b'foo'), 'ACKID', queue.Queue(),
+        autolease=False)
+
+    assert msg._request_queue.empty()
+
+
+def create_batch(*ack_ids):
+    messages = [create_message(b'foo', ack_id=ack_id) for ack_id in ack_ids]
+    return message.MessageBatch(messages, queue.Queue())
+
+
+def test_batch_sequence():
+    batch = create_batch('ack_id_a', 'ack_id_b')
+
+    assert len(batch) == 2
+    assert [msg.ack_id for msg in batch] == ['ack_id_a', 'ack_id_b']
+    assert batch[1].ack_id == 'ack_id_b'
+    assert batch.messages == list(batch)
+    assert repr(batch) == '<MessageBatch of 2 messages>'
+
+
+def test_batch_ack_all():
+    batch = create_batch('ack_id_a', 'ack_id_b')
+    with mock.patch.object(batch._request_queue, 'put') as put:
+        batch.ack_all()
+        put.assert_called_once_with([
+            requests.AckRequest(
+                ack_id='ack_id_a', byte_size=30, time_to_ack=mock.ANY),
+            requests.AckRequest(
+                ack_id='ack_id_b', byte_size=30, time_to_ack=mock.ANY),
+        ])
+
+
+def test_batch_nack_all():
+    batch = create_batch('ack_id_a', 'ack_id_b')
+    with mock.patch.object(batch._request_queue, 'put') as put:
+        batch.nack_all()
+        put.assert_called_once_with([
+            requests.NackRequest(ack_id='ack_id_a', byte_size=30),
+            requests.NackRequest(ack_id='ack_id_b', byte_size=30),
+        ])
+
+
+def test_batch_empty():
+    batch = create_batch()
+    with mock.patch.object(batch._request_queue, 'put') as put:
+        batch.ack_all()
+        batch.nack_all()
+        put.assert_not_called()
+
+
 def test_repr():
     data = b'foo'
     msg = create_message(data, snow='cones', orange='juice')
@@ -13,12 +13,17 @@
 # limitations under the License.
 
 import concurrent.futures
+import functools
 import threading
 
 import mock
 from six.moves import queue
 
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import message
 from google.cloud.pubsub_v1.subscriber import scheduler
+from google.cloud.pubsub_v1.subscriber._protocol import requests
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
 
 
 def test_constructor_defaults():
@@ -51,3 +56,240 @@ def test_schedule():
     scheduler_.shutdown()
 
     assert called_with == [(('arg1',), {'kwarg1': 'meep'})]
+
+
+def create_message(queue_, ack_id='ack_id', data=b'foo'):
+    return message.Message(
+        types.PubsubMessage(data=data, message_id='1'), ack_id, queue_,
+        autolease=False)
+
+
+# Callbacks sent to worker processes must be module-level functions.
+def ack_callback(msg):
+    msg.modify_ack_deadline(60)
+    msg.ack()
+
+
+def ack_all_callback(batch):
+    batch.ack_all()
+
+
+def failing_callback(msg):
+    raise ValueError(msg.data)
+
+
+def test_process_constructor_defaults():
+    scheduler_ = scheduler.ProcessScheduler()
+
+    assert isinstance(scheduler_.queue, queue.Queue)
+    assert isinstance(
+        scheduler_._executor, concurrent.futures.ProcessPoolExecutor)
+    scheduler_.shutdown()
+
+
+def test_process_constructor_options():
+    scheduler_ = scheduler.ProcessScheduler(
+        executor=mock.sentinel.executor)
+
+    assert scheduler_._executor == mock.sentinel.executor
+
+
+def test_process_schedule():
+    scheduler_ = scheduler.ProcessScheduler(
+        concurrent.futures.ProcessPoolExecutor(max_workers=1))
+    msg = create_message(scheduler_.queue)
+
+    scheduler_.schedule(ack_callback, msg)
+    scheduler_.shutdown()
+
+    assert scheduler_.queue.get_nowait() == requests.ModAckRequest(
+        ack_id='ack_id', seconds=60)
+    assert scheduler_.queue.get_nowait() == requests.AckRequest(
+        ack_id='ack_id', byte_size=msg.size, time_to_ack=mock.ANY)
+    assert scheduler_.queue.empty()
+    # The message of the parent process is left as is.
+    assert msg._request_queue is scheduler_.queue
+
+
+def test_process_schedule_batch():
+    scheduler_ = scheduler.ProcessScheduler(
+        concurrent.futures.ProcessPoolExecutor(max_workers=1))
+    batch = message.MessageBatch([
+        create_message(scheduler_.queue, ack_id='ack_id_a'),
+        create_message(scheduler_.queue, ack_id='ack_id_b'),
+    ], scheduler_.queue)
+
+    scheduler_.schedule(ack_all_callback, batch=batch)
+    scheduler_.shutdown()
+
+    acks = scheduler_.queue.get_nowait()
+    assert [ack.ack_id for ack in acks] == ['ack_id_a', 'ack_id_b']
+    assert scheduler_.queue.empty()
+
+
+def test_process_schedule_wrapped_callback_error():
+    scheduler_ = scheduler.ProcessScheduler(
+        concurrent.futures.ProcessPoolExecutor(max_workers=1))
+    msg = create_message(scheduler_.queue)
+
+    # This is how the streaming pull manager wraps the callback.
+    scheduler_.schedule(
+        functools.partial(
+            streaming_pull_manager._wrap_callback_errors, failing_callback),
+        msg)
+    scheduler_.shutdown()
+
+    assert scheduler_.queue.get_nowait() == requests.NackRequest(
+        ack_id='ack_id', byte_size=msg.size)
+    assert scheduler_.queue.empty()
+
+
+def test_process_on_done_error_nacks():
+    scheduler_ = scheduler.ProcessScheduler(executor=mock.sentinel.executor)
+    msg = create_message(scheduler_.queue)
+    batch = message.MessageBatch(
+        [create_message(scheduler_.queue, ack_id='ack_id_b')],
+        scheduler_.queue)
+    future = concurrent.futures.Future()
+    future.set_exception(RuntimeError('worker died'))
+
+    scheduler_._on_done(future, (msg, 'other'), {'batch': batch})
+
+    assert scheduler_.queue.get_nowait() == [
+        requests.NackRequest(ack_id='ack_id', byte_size=msg.size),
+        requests.NackRequest(ack_id='ack_id_b', byte_size=msg.size),
+    ]
+    assert scheduler_.queue.empty()
+
+
+def test_process_on_done_error_without_messages():
+    scheduler_ = scheduler.ProcessScheduler(executor=mock.sentinel.executor)
+    future = concurrent.futures.Future()
+    future.set_exception(RuntimeError('worker died'))
+
+    scheduler_._on_done(future, ('other',), {})
+
+    assert scheduler_.queue.empty()
+
+
+def test_process_on_done_cancelled():
+    scheduler_ = scheduler.ProcessScheduler(executor=mock.sentinel.executor)
+    future = concurrent.futures.Future()
+    future.cancel()
+
+    scheduler_._on_done(
+        future, (create_message(scheduler_.queue),), {})
+
+    assert scheduler_.queue.empty()
+
+
+def test_process_shutdown_cancels_pending():
+    executor = mock.create_autospec(
+        concurrent.futures.ProcessPoolExecutor, instance=True)
+    work_item = mock.Mock(spec=['future'])
+    executor._pending_work_items = {0: work_item}
+    scheduler_ = scheduler.ProcessScheduler(executor=executor)
+
+    scheduler_.shutdown()
+
+    work_item.future.cancel.assert_called_once_with()
+    executor.shutdown.assert_called_once_with()
+
+
+def test_process_schedule_unpicklable_callback_nacks():
+    scheduler_ = scheduler.ProcessScheduler(
+        concurrent.futures.ProcessPoolExecutor(max_workers=1))
+    msg = create_message(scheduler_.queue)
+
+    # A lambda can not be pickled to be sent to the worker process.
+    scheduler_.schedule(lambda msg: msg.ack(), msg)
+    # Wait for the failure before shutting down, as shutting down during a
+    # pickling failure can hang on older versions of Python.
+    nacks = scheduler_.queue.get(timeout=5)
+    scheduler_.shutdown()
+
+    assert nacks == [
+        requests.NackRequest(ack_id='ack_id', byte_size=msg.size)]
+    assert scheduler_.queue.empty()
+
+
+def test_detach_message():
+    queue_ = queue.Queue()
+    msg = create_message(queue_)
+
+    detached = scheduler._detach(msg)
+
+    assert detached is not msg
+    assert detached._request_queue is None
+    assert detached.ack_id == 'ack_id'
+    assert msg._request_queue is queue_
+
+
+def test_detach_batch():
+    queue_ = queue.Queue()
+    msg = create_message(queue_)
+    batch = message.MessageBatch([msg], queue_)
+
+    detached = scheduler._detach(batch)
+
+    assert isinstance(detached, message.MessageBatch)
+    assert detached._request_queue is None
+    detached_msg, = list(detached)
+    assert detached_msg is not msg
+    assert detached_msg._request_queue is None
+    assert batch._request_queue is queue_
+    assert msg._request_queue is queue_
+
+
+def test_detach_other():
+    assert scheduler._detach(mock.sentinel.arg) is mock.sentinel.arg
+
+
+def test_attach_batch():
+    batch = scheduler._detach(message.MessageBatch(
+        [create_message(None), create_message(None)], None))
+    collector = scheduler._RequestCollector()
+
+    scheduler._attach(batch, collector)
+
+    assert batch._request_queue is collector
+    assert [msg._request_queue for msg in batch] == [collector] * 2
+
+
+def test_attach_other():
+    collector = scheduler._RequestCollector()
+
+    # Arguments which are neither messages nor batches are left as is.
+    scheduler._attach(mock.sentinel.arg, collector)
+
+
+def test_run_in_worker_message():
+    msg = scheduler._detach(create_message(queue.Queue()))
+
+    collected = scheduler._run_in_worker(ack_callback, (msg,), {})
+
+    assert collected == [
+        requests.ModAckRequest(ack_id='ack_id', seconds=60),
+        requests.AckRequest(
+            ack_id='ack_id', byte_size=msg.size, time_to_ack=mock.ANY),
+    ]
+
+
+def test_run_in_worker_batch():
+    queue_ = queue.Queue()
+    batch = scheduler._detach(message.MessageBatch([
+        create_message(queue_, ack_id='ack_id_a'),
+        create_message(queue_, ack_id='ack_id_b'),
+    ], queue_))
+
+    def callback(batch, msg=None):
+        batch.ack_all()
+        msg.nack()
+
+    msg = scheduler._detach(create_message(queue_, ack_id='ack_id_c'))
+    collected = scheduler._run_in_worker(callback, (batch,), {'msg': msg})
+
+    acks, nack = collected
+    assert [ack.ack_id for ack in acks] == ['ack_id_a', 'ack_id_b']
+    assert nack == requests.NackRequest(ack_id='ack_id_c', byte_size=msg.size)
+    assert queue_.empty()
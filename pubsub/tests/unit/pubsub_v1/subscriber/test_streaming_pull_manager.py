@@ -23,6 +23,7 @@ from google.cloud.pubsub_v1.gapic import subscriber_client_config
 from google.cloud.pubsub_v1.subscriber import client
 from google.cloud.pubsub_v1.subscriber import message
 from google.cloud.pubsub_v1.subscriber import scheduler
+from google.cloud.pubsub_v1.subscriber._protocol import batcher
 from google.cloud.pubsub_v1.subscriber._protocol import bidi
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
@@ -46,8 +47,9 @@ def test__wrap_callback_errors_no_error():
     msg = mock.create_autospec(message.Message, instance=True)
     callback = mock.Mock()
 
-    streaming_pull_manager._wrap_callback_errors(callback, msg)
+    result = streaming_pull_manager._wrap_callback_errors(callback, msg)
 
+    assert result is callback.return_value
     callback.assert_called_once_with(msg)
     msg.nack.assert_not_called()
 
@@ -61,6 +63,27 @@ def test__wrap_callback_errors_error():
     msg.nack.assert_called_once()
 
 
+def test__wrap_batch_callback_errors_no_error():
+    batch = mock.create_autospec(message.MessageBatch, instance=True)
+    callback = mock.Mock()
+
+    result = streaming_pull_manager._wrap_batch_callback_errors(
+        callback, batch)
+
+    assert result is callback.return_value
+    callback.assert_called_once_with(batch)
+    batch.nack_all.assert_not_called()
+
+
+def test__wrap_batch_callback_errors_error():
+    batch = mock.create_autospec(message.MessageBatch, instance=True)
+    callback = mock.Mock(side_effect=ValueError('meep'))
+
+    streaming_pull_manager._wrap_batch_callback_errors(callback, batch)
+
+    batch.nack_all.assert_called_once()
+
+
 def test_constructor_and_default_state():
     manager = streaming_pull_manager.StreamingPullManager(
         mock.sentinel.client,
@@ -74,6 +97,7 @@ def test_constructor_and_default_state():
     assert manager.ack_histogram is not None
     assert manager.ack_deadline == 10
     assert manager.load == 0
+    assert manager.callback_batch_settings is None
 
     # Private state
     assert manager._client == mock.sentinel.client
@@ -86,10 +110,13 @@ def test_constructor_with_options():
         mock.sentinel.client,
         mock.sentinel.subscription,
         flow_control=mock.sentinel.flow_control,
-        scheduler=mock.sentinel.scheduler)
+        scheduler=mock.sentinel.scheduler,
+        callback_batch_settings=mock.sentinel.callback_batch_settings)
 
     assert manager.flow_control == mock.sentinel.flow_control
     assert manager._scheduler == mock.sentinel.scheduler
+    assert (manager.callback_batch_settings ==
+            mock.sentinel.callback_batch_settings)
 
 
 def make_manager(**kwargs):
@@ -303,6 +330,38 @@ def test_open(
 
     manager._consumer.is_active = True
     assert manager.is_active is True
+    assert manager._batcher is None
+
+
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.bidi.ResumableBidiRpc',
+    autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.bidi.BackgroundConsumer',
+    autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser',
+    autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher',
+    autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater',
+    autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.batcher.Batcher',
+    autospec=True)
+def test_open_callback_batches(batcher, *unused_helpers):
+    settings = types.CallbackBatchSettings(max_latency=0.1)
+    manager = make_manager(callback_batch_settings=settings)
+
+    manager.open(mock.sentinel.callback)
+
+    batcher.assert_called_once_with(settings, manager._schedule_batch)
+    batcher.return_value.start.assert_called_once()
+    assert manager._batcher == batcher.return_value
+    assert manager._callback.func is (
+        streaming_pull_manager._wrap_batch_callback_errors)
 
 
 def test_open_already_active():
@@ -355,6 +414,18 @@ def test_close():
     assert manager.is_active is False
 
 
+def test_close_callback_batcher():
+    manager, _, _, _, _, scheduler = make_running_manager()
+    batcher_ = mock.create_autospec(batcher.Batcher, instance=True)
+    manager._batcher = batcher_
+    batcher_.stop.side_effect = lambda: scheduler.shutdown.assert_not_called()
+
+    manager.close()
+
+    batcher_.stop.assert_called_once()
+    assert manager._batcher is None
+
+
 def test_close_inactive_consumer():
     manager, consumer, dispatcher, leaser, heartbeater, scheduler = (
         make_running_manager())
@@ -438,6 +509,65 @@ def test_on_response():
         assert isinstance(call[1][1], message.Message)
 
 
+def test_on_response_callback_batches():
+    manager, _, dispatcher, _, _, scheduler = make_running_manager()
+    manager._batcher = mock.create_autospec(batcher.Batcher, instance=True)
+
+    response = types.StreamingPullResponse(
+        received_messages=[
+            types.ReceivedMessage(
+                ack_id='fack',
+                message=types.PubsubMessage(data=b'foo', message_id='1')
+            ),
+            types.ReceivedMessage(
+                ack_id='back',
+                message=types.PubsubMessage(data=b'bar', message_id='2')
+            ),
+        ],
+    )
+
+    manager._on_response(response)
+
+    dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest('fack', 10),
+         requests.ModAckRequest('back', 10)]
+    )
+
+    # The messages are leased by a single queued item, and handed to the
+    # batcher rather than scheduled one by one.
+    scheduler.queue.put.assert_called_once_with([
+        requests.LeaseRequest(ack_id='fack', byte_size=mock.ANY),
+        requests.LeaseRequest(ack_id='back', byte_size=mock.ANY),
+    ])
+    scheduler.schedule.assert_not_called()
+    messages, = manager._batcher.add.call_args[0]
+    assert [msg.ack_id for msg in messages] == ['fack', 'back']
+
+
+def test_on_response_callback_batches_empty():
+    manager, _, _, _, _, scheduler = make_running_manager()
+    manager._batcher = mock.create_autospec(batcher.Batcher, instance=True)
+
+    manager._on_response(types.StreamingPullResponse())
+
+    scheduler.queue.put.assert_not_called()
+    manager._batcher.add.assert_not_called()
+
+
+def test__schedule_batch():
+    manager, _, _, _, _, scheduler = make_running_manager()
+    manager._callback = mock.sentinel.callback
+    messages = [mock.sentinel.message_a, mock.sentinel.message_b]
+
+    manager._schedule_batch(messages)
+
+    callback, batch = scheduler.schedule.call_args[0]
+    assert callback == mock.sentinel.callback
+    assert isinstance(batch, message.MessageBatch)
+    assert batch.messages == messages
+    assert batch._request_queue is scheduler.queue
+
+
 def test_retryable_stream_errors():
     # Make sure the config matches our hard-coded tuple of exceptions.
     interfaces = subscriber_client_config.config['interfaces']
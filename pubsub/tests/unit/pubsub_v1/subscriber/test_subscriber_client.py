@@ -77,3 +77,21 @@ def test_subscribe_options(manager_open):
     assert future._manager._scheduler == scheduler
     manager_open.assert_called_once_with(
         mock.ANY, mock.sentinel.callback)
+
+
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager.'
+    'StreamingPullManager.open', autospec=True)
+def test_subscribe_callback_batches(manager_open):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+
+    future = client.subscribe(
+        'sub_name_a',
+        callback=mock.sentinel.callback,
+        callback_batch_settings=(100, 0.5))
+
+    assert future._manager.callback_batch_settings == (
+        types.CallbackBatchSettings(max_messages=100, max_latency=0.5))
+    manager_open.assert_called_once_with(
+        mock.ANY, mock.sentinel.callback)
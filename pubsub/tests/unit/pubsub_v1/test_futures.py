@@ -134,6 +134,20 @@ def test_trigger():
     callback.assert_called_once_with(future)
 
 
+def test_add_done_callback_while_completing():
+    future = _future()
+    callback = mock.Mock(spec=())
+
+    def trigger_callback(completing_future):
+        # Adding a callback from another callback, once the future is done,
+        # calls it right away.
+        completing_future.add_done_callback(callback)
+
+    future.add_done_callback(trigger_callback)
+    future.set_result('12345')
+    callback.assert_called_once_with(future)
+
+
 def test_set_result_once_only():
     future = _future()
     future.set_result('12345')
@@ -0,0 +1,108 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark for signing many blob URLs.
+
+Compares :meth:`~google.cloud.storage.blob.Blob.generate_signed_url`, once
+per blob, against :meth:`~google.cloud.storage.URLSigner.sign_many`, in the
+calling thread and on a pool of processes. The service account key is
+generated locally: no project, credentials or network access are needed.
+
+Usage: ``python sign_urls.py [--urls N] [--processes N] [--repeat N]``
+"""
+
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import multiprocessing
+import timeit
+
+from google.oauth2 import service_account
+import rsa
+
+from google.cloud import storage
+
+
+EXPIRATION = 2000000000
+
+
+def make_service_account_info(key_size):
+    """Build service account info around a newly generated RSA key."""
+    _, private_key = rsa.newkeys(key_size)
+    return {
+        'type': 'service_account',
+        'client_email': 'benchmark@example.iam.gserviceaccount.com',
+        'private_key': private_key.save_pkcs1().decode('ascii'),
+        'private_key_id': 'benchmark',
+        'token_uri': 'https://oauth2.googleapis.com/token',
+    }
+
+
+def make_blobs(num_urls):
+    """Build blobs in a bucket, without a client or any request."""
+    bucket = storage.Bucket(None, 'benchmark-bucket')
+    return [bucket.blob('images/{:08d}.png'.format(index))
+            for index in range(num_urls)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--urls', type=int, default=2000,
+                        help='URLs signed per timing run')
+    parser.add_argument('--processes', type=int,
+                        default=multiprocessing.cpu_count(),
+                        help='worker processes of the process pool')
+    parser.add_argument('--key-size', type=int, default=2048,
+                        help='bits of the generated RSA key')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='timing runs; the fastest is reported')
+    args = parser.parse_args()
+
+    info = make_service_account_info(args.key_size)
+    credentials = service_account.Credentials.from_service_account_info(info)
+    blobs = make_blobs(args.urls)
+    signer = storage.URLSigner(credentials)
+    pooled_signer = storage.URLSigner.from_service_account_info(
+        info, processes=args.processes)
+
+    expected = [
+        blob.generate_signed_url(EXPIRATION, credentials=credentials)
+        for blob in blobs]
+    assert signer.sign_many(blobs, EXPIRATION) == expected
+    assert pooled_signer.sign_many(blobs, EXPIRATION) == expected
+
+    scenarios = (
+        ('generate_signed_url', lambda: [
+            blob.generate_signed_url(EXPIRATION, credentials=credentials)
+            for blob in blobs]),
+        ('sign_many', lambda: signer.sign_many(blobs, EXPIRATION)),
+        ('sign_many x{}'.format(args.processes),
+         lambda: pooled_signer.sign_many(blobs, EXPIRATION)),
+    )
+    results = {}
+    with pooled_signer:
+        for name, sign in scenarios:
+            best = min(timeit.repeat(sign, repeat=args.repeat, number=1))
+            results[name] = best
+            print('{:<22} {:>8.3f} s {:>10,.0f} URLs/s'.format(
+                name, best, args.urls / best))
+
+    baseline = results['generate_signed_url']
+    for name, best in sorted(results.items()):
+        print('speedup {:<14} {:>8.2f}x'.format(name, baseline / best))
+
+
+if __name__ == '__main__':
+    main()
@@ -19,6 +19,23 @@ These are *not* part of the API.
 
 import base64
 from hashlib import md5
+import struct
+
+try:
+    import crcmod.predefined
+except ImportError:  # pragma: NO COVER
+    crcmod = None
+
+
+_CRC32C_POLYNOMIAL = 0x82F63B78
+"""int: The Castagnoli polynomial, with its bits reversed."""
+
+if crcmod is None:  # pragma: NO COVER
+    _CRCMOD_CRC32C = None
+    _FAST_CRC32C = False
+else:  # pragma: NO COVER
+    _CRCMOD_CRC32C = crcmod.predefined.mkPredefinedCrcFun('crc-32c')
+    _FAST_CRC32C = crcmod.crcmod._usingExtension
 
 
 def _validate_name(name):
@@ -234,3 +251,178 @@ def _base64_md5hash(buffer_object):
     _write_buffer_to_hash(buffer_object, hash_obj)
     digest_bytes = hash_obj.digest()
     return base64.b64encode(digest_bytes)
+
+
+def _make_crc32c_table():
+    """Make the table used to compute CRC32C checksums one byte at a time.
+
+    :rtype: list
+    :returns: The 256 entries of the table.
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ _CRC32C_POLYNOMIAL
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+
+# Built at import time, as checksums are computed from several threads.
+_CRC32C_TABLE = _make_crc32c_table()
+
+
+def _has_fast_crc32c():
+    """Check whether CRC32C checksums are computed by a C extension.
+
+    The pure Python implementation runs at a few MB/s and holds the global
+    interpreter lock.
+
+    :rtype: bool
+    :returns: :data:`True` if :mod:`crcmod` is installed with its C
+              extension.
+    """
+    return _FAST_CRC32C
+
+
+def _crc32c_update_python(crc, data):
+    """Update a CRC32C checksum with bytes, in pure Python.
+
+    :type crc: int
+    :param crc: The checksum of the preceding bytes, or ``0``.
+
+    :type data: bytes
+    :param data: The next bytes.
+
+    :rtype: int
+    :returns: The checksum of the preceding bytes followed by ``data``.
+    """
+    table = _CRC32C_TABLE
+    crc ^= 0xFFFFFFFF
+    for byte in bytearray(data):
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _crc32c_update(crc, data):
+    """Update a CRC32C checksum with bytes.
+
+    Uses the C extension of :mod:`crcmod` if it is installed, which is much
+    faster than the pure Python fallback.
+
+    :type crc: int
+    :param crc: The checksum of the preceding bytes, or ``0``.
+
+    :type data: bytes
+    :param data: The next bytes.
+
+    :rtype: int
+    :returns: The checksum of the preceding bytes followed by ``data``.
+    """
+    if _CRCMOD_CRC32C is None:
+        return _crc32c_update_python(crc, data)
+    return _CRCMOD_CRC32C(data, crc)
+
+
+def _gf2_matrix_times(matrix, vector):
+    """Multiply a 32x32 GF(2) matrix by a 32-bit vector."""
+    result = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return result
+
+
+def _gf2_matrix_square(matrix):
+    """Square a 32x32 GF(2) matrix."""
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
+
+
+def _crc32c_combine(crc1, crc2, length2):
+    """Get the CRC32C checksum of two concatenated byte strings.
+
+    This lets the checksums of the parts of a file be computed separately,
+    for instance while downloading them concurrently. It takes time
+    logarithmic in ``length2``, using the same method as zlib's
+    ``crc32_combine``.
+
+    :type crc1: int
+    :param crc1: The checksum of the first bytes.
+
+    :type crc2: int
+    :param crc2: The checksum of the second bytes.
+
+    :type length2: int
+    :param length2: The number of second bytes.
+
+    :rtype: int
+    :returns: The checksum of the first bytes followed by the second bytes.
+    """
+    if length2 <= 0:
+        return crc1
+
+    # The operator which appends one zero bit to a checksum.
+    odd = [_CRC32C_POLYNOMIAL] + [1 << bit for bit in range(31)]
+    even = _gf2_matrix_square(odd)  # Two zero bits.
+    odd = _gf2_matrix_square(even)  # Four zero bits.
+
+    # Append length2 zero bytes to crc1, squaring the operator each bit.
+    while True:
+        even = _gf2_matrix_square(odd)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+        odd = _gf2_matrix_square(even)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+
+    return crc1 ^ crc2
+
+
+def _base64_crc32c(crc):
+    """Encode a CRC32C checksum the way the API does.
+
+    :type crc: int
+    :param crc: The checksum.
+
+    :rtype: str
+    :returns: The base64 encoding of the big-endian checksum.
+    """
+    return base64.b64encode(struct.pack('>I', crc)).decode('ascii')
+
+
+class _Crc32cHash(object):
+    """Compute a CRC32C checksum with the interface of a :mod:`hashlib` hash.
+
+    This lets CRC32C and MD5 checksums be computed by the same code.
+    """
+
+    def __init__(self):
+        self._crc = 0
+
+    def update(self, data):
+        """Add bytes to the checksum.
+
+        :type data: bytes
+        :param data: The next bytes.
+        """
+        self._crc = _crc32c_update(self._crc, data)
+
+    def digest(self):
+        """Get the big-endian checksum of the bytes added so far.
+
+        :rtype: bytes
+        :returns: The four bytes of the checksum.
+        """
+        return struct.pack('>I', self._crc)
@@ -15,8 +15,12 @@
 
 import base64
 import datetime
+import multiprocessing
 
 import six
+from six.moves.urllib.parse import quote
+from six.moves.urllib.parse import quote_plus
+from six.moves.urllib.parse import urlencode
 
 import google.auth.credentials
 from google.cloud import _helpers
@@ -24,6 +28,11 @@ from google.cloud import _helpers
 
 NOW = datetime.datetime.utcnow  # To be replaced by tests.
 
+_API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
+
+_PROCESS_SIGNER = None
+"""The signer of a worker process of a :class:`URLSigner`."""
+
 
 def ensure_signed_credentials(credentials):
     """Raise AttributeError if the credentials are unsigned.
@@ -208,3 +217,260 @@ def generate_signed_url(credentials, resource, expiration,
     return '{endpoint}{resource}?{querystring}'.format(
         endpoint=api_access_endpoint, resource=resource,
         querystring=six.moves.urllib.parse.urlencode(query_params))
+
+
+class URLSigner(object):
+    """Sign URLs for many blobs with the same credentials.
+
+    :func:`generate_signed_url` checks the credentials, and builds the
+    whole URL, for each URL. A signer does that work once: it keeps the
+    credentials' signer, the access ID and the resource prefix of each
+    bucket, and signs each URL locally when the credentials hold a private
+    key.
+
+    RSA signing holds the interpreter lock, so signers made with
+    :meth:`from_service_account_info` can also sign on a pool of
+    ``processes``, which each load the private key once. Call
+    :meth:`close`, or use the signer as a context manager, to stop them.
+
+    .. literalinclude:: snippets.py
+        :start-after: [START url_signer]
+        :end-before: [END url_signer]
+
+    :type credentials: :class:`google.auth.credentials.Signing`
+    :param credentials: Credentials object with an associated private key to
+                        sign text.
+
+    :type api_access_endpoint: str
+    :param api_access_endpoint: (Optional) URI base of the URLs. Defaults to
+                                ``'https://storage.googleapis.com'``.
+
+    :raises AttributeError: If the credentials cannot sign.
+    """
+
+    def __init__(self, credentials, api_access_endpoint=_API_ACCESS_ENDPOINT):
+        ensure_signed_credentials(credentials)
+        self._credentials = credentials
+        # Service account credentials sign with a parsed private key: use it
+        # directly, rather than through the credentials, for each URL.
+        signer = getattr(credentials, 'signer', None)
+        if signer is not None:
+            self._sign_bytes = signer.sign
+        else:
+            self._sign_bytes = credentials.sign_bytes
+        self._access_id = credentials.signer_email
+        self._api_access_endpoint = api_access_endpoint
+        self._resource_prefixes = {}
+        self._service_account_info = None
+        self._processes = None
+        self._pool = None
+
+    @classmethod
+    def from_service_account_info(cls, info, processes=None, **kwargs):
+        """Make a signer from the information of a service account key.
+
+        :type info: dict
+        :param info: The service account info, in Google format, as loaded
+                     from its JSON key file.
+
+        :type processes: int
+        :param processes: (Optional) The number of worker processes which
+                          sign the URLs of :meth:`sign_many`. If not passed,
+                          URLs are signed in the calling thread.
+
+        :type kwargs: dict
+        :param kwargs: (Optional) Passed to the constructor.
+
+        :rtype: :class:`URLSigner`
+        :returns: The signer.
+        """
+        from google.oauth2 import service_account
+
+        credentials = service_account.Credentials.from_service_account_info(
+            info)
+        signer = cls(credentials, **kwargs)
+        signer._service_account_info = info
+        signer._processes = processes
+        return signer
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Stop the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def sign(self, blob, expiration, method='GET', content_type=None,
+             response_type=None, response_disposition=None, generation=None):
+        """Generate a signed URL for a blob.
+
+        The URL signs the same string as
+        :meth:`~google.cloud.storage.blob.Blob.generate_signed_url`.
+
+        :type blob: :class:`~google.cloud.storage.blob.Blob`
+        :param blob: The blob to sign a URL for.
+
+        See :meth:`sign_many` for the other arguments.
+
+        :rtype: str
+        :returns: A signed URL you can use to access the blob until
+                  expiration.
+        """
+        url, = self.sign_many(
+            [blob], expiration, method=method, content_type=content_type,
+            response_type=response_type,
+            response_disposition=response_disposition,
+            generation=generation)
+        return url
+
+    def sign_many(self, blobs, expiration, method='GET', content_type=None,
+                  response_type=None, response_disposition=None,
+                  generation=None):
+        """Generate a signed URL for each of a list of blobs.
+
+        All the URLs share one expiration and set of options, so the parts
+        of the URLs other than the resource and signature are built once.
+
+        :type blobs: list
+        :param blobs: The :class:`~google.cloud.storage.blob.Blob` objects
+                      to sign URLs for.
+
+        :type expiration: :class:`int`, :class:`long`,
+                          :class:`datetime.datetime`,
+                          :class:`datetime.timedelta`
+        :param expiration: When the signed URLs should expire.
+
+        :type method: str
+        :param method: (Optional) The HTTP verb that will be used when
+                       requesting the URLs. Defaults to ``'GET'``. See
+                       :func:`generate_signed_url` for ``'RESUMABLE'``.
+
+        :type content_type: str
+        :param content_type: (Optional) The content type of the objects.
+
+        :type response_type: str
+        :param response_type: (Optional) Content type of responses to
+                              requests for the signed URLs.
+
+        :type response_disposition: str
+        :param response_disposition: (Optional) Content disposition of
+                                     responses to requests for the signed
+                                     URLs.
+
+        :type generation: str
+        :param generation: (Optional) A value that indicates which
+                           generation of the resources to fetch.
+
+        :rtype: list of str
+        :returns: The signed URLs, in the order of ``blobs``.
+        """
+        expiration = get_expiration_seconds(expiration)
+
+        header = 'x-goog-resumable:start\n' if method == 'RESUMABLE' else ''
+        if method == 'RESUMABLE':
+            method = 'POST'
+        string_to_sign_prefix = '\n'.join([
+            method,
+            '',
+            content_type or '',
+            str(expiration),
+            header,
+        ])
+
+        extra_params = []
+        if response_type is not None:
+            extra_params.append(('response-content-type', response_type))
+        if response_disposition is not None:
+            extra_params.append(
+                ('response-content-disposition', response_disposition))
+        if generation is not None:
+            extra_params.append(('generation', generation))
+        query_prefix = urlencode([
+            ('GoogleAccessId', self._access_id),
+            ('Expires', str(expiration)),
+        ]) + '&Signature='
+        query_suffix = ''
+        if extra_params:
+            query_suffix = '&' + urlencode(extra_params)
+
+        resources = [self._get_resource(blob) for blob in blobs]
+        signatures = self._sign_all(
+            [string_to_sign_prefix + resource for resource in resources])
+
+        return [
+            '{endpoint}{resource}?{prefix}{signature}{suffix}'.format(
+                endpoint=self._api_access_endpoint, resource=resource,
+                prefix=query_prefix, signature=quote_plus(signature),
+                suffix=query_suffix)
+            for resource, signature in zip(resources, signatures)]
+
+    def _get_resource(self, blob):
+        """Get the canonical resource of a blob.
+
+        :type blob: :class:`~google.cloud.storage.blob.Blob`
+        :param blob: The blob.
+
+        :rtype: str
+        :returns: The resource, ``/bucket-name/quoted-blob-name``.
+        """
+        bucket_name = blob.bucket.name
+        prefix = self._resource_prefixes.get(bucket_name)
+        if prefix is None:
+            prefix = self._resource_prefixes[bucket_name] = (
+                '/{}/'.format(bucket_name))
+        return prefix + quote(blob.name.encode('utf-8'))
+
+    def _sign_all(self, strings_to_sign):
+        """Sign strings, on the worker processes if there are some.
+
+        :type strings_to_sign: list of str
+        :param strings_to_sign: The strings to sign.
+
+        :rtype: list of bytes
+        :returns: The base64-encoded signatures.
+        """
+        if self._processes is None or len(strings_to_sign) < 2:
+            sign_bytes = self._sign_bytes
+            return [
+                base64.b64encode(sign_bytes(string_to_sign))
+                for string_to_sign in strings_to_sign]
+
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(
+                self._processes, _init_process_signer,
+                (self._service_account_info,))
+        chunksize = max(1, len(strings_to_sign) // (self._processes * 4))
+        return self._pool.map(
+            _sign_in_process, strings_to_sign, chunksize=chunksize)
+
+
+def _init_process_signer(info):
+    """Load the signer of a worker process of a :class:`URLSigner`.
+
+    :type info: dict
+    :param info: The service account info, in Google format.
+    """
+    from google.oauth2 import service_account
+
+    global _PROCESS_SIGNER
+    credentials = service_account.Credentials.from_service_account_info(
+        info)
+    _PROCESS_SIGNER = credentials.signer
+
+
+def _sign_in_process(string_to_sign):
+    """Sign a string in a worker process of a :class:`URLSigner`.
+
+    :type string_to_sign: str
+    :param string_to_sign: The string to sign.
+
+    :rtype: bytes
+    :returns: The base64-encoded signature.
+    """
+    return base64.b64encode(_PROCESS_SIGNER.sign(string_to_sign))
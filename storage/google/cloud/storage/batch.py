@@ -21,8 +21,10 @@ from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.parser import Parser
 import io
+import itertools
 import json
 
+from concurrent import futures
 import requests
 import six
 
@@ -31,6 +33,13 @@ from google.cloud import exceptions
 from google.cloud.storage._http import Connection
 
 
+_MAX_SERVER_BATCH_SIZE = 100
+"""The most requests the server accepts in one batch."""
+
+_DEFAULT_BATCH_WORKERS = 4
+"""The number of batches sent concurrently by :func:`_send_in_batches`."""
+
+
 class MIMEApplicationHTTP(MIMEApplication):
     """MIME type for ``application/http``.
 
@@ -139,13 +148,19 @@ class Batch(Connection):
 
     :type client: :class:`google.cloud.storage.client.Client`
     :param client: The client to use for making connections.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) Whether :meth:`finish` raises an
+                            exception if a request in the batch failed.
+                            Defaults to True.
     """
     _MAX_BATCH_SIZE = 1000
 
-    def __init__(self, client):
+    def __init__(self, client, raise_exception=True):
         super(Batch, self).__init__(client)
         self._requests = []
         self._target_objects = []
+        self._raise_exception = raise_exception
 
     def _do_request(self, method, url, headers, data, target_object):
         """Override Connection:  defer actual HTTP request.
@@ -220,7 +235,8 @@ class Batch(Connection):
         :param responses: List of headers and payloads from each response in
                           the batch.
 
-        :raises: :class:`ValueError` if no requests have been deferred.
+        :raises: :class:`ValueError` if no requests have been deferred, or
+                 the first error response if ``raise_exception`` is set.
         """
         # If a bad status occurs, we track it, but don't raise an exception
         # until all futures have been populated.
@@ -239,7 +255,7 @@ class Batch(Connection):
                 except ValueError:
                     target_object._properties = subresponse.content
 
-        if exception_args is not None:
+        if exception_args is not None and self._raise_exception:
             raise exceptions.from_http_response(exception_args)
 
     def finish(self):
@@ -247,6 +263,7 @@ class Batch(Connection):
 
         :rtype: list of tuples
         :returns: one ``(headers, payload)`` tuple per deferred request.
+        :raises: the error of the batch request itself, if it failed.
         """
         headers, body = self._prepare_batch_request()
 
@@ -257,6 +274,8 @@ class Batch(Connection):
         # current batch.
         response = self._client._base_connection._make_request(
             'POST', url, data=body, headers=headers)
+        if not 200 <= response.status_code < 300:
+            raise exceptions.from_http_response(response)
         responses = list(_unpack_batch_response(response))
         self._finish_futures(responses)
         return responses
@@ -277,6 +296,96 @@ class Batch(Connection):
             self._client._pop_batch()
 
 
+class _SubResponse(object):
+    """Receive the response to a request which may be deferred in a batch.
+
+    Pass it as the ``_target_object`` of the request: a :class:`Batch` sets
+    its ``_properties`` once the batch is finished.
+    """
+    _properties = None
+
+
+def _send_in_batches(client, items, send, max_workers=None):
+    """Send one request for each item, in concurrent batches.
+
+    The requests are packed into batches of up to ``_MAX_SERVER_BATCH_SIZE``
+    requests, which are sent from a pool of threads. A single request is
+    sent without a batch.
+
+    :type client: :class:`google.cloud.storage.client.Client`
+    :param client: The client to use for making connections.
+
+    :type items: list
+    :param items: The items to make requests for.
+
+    :type send: callable
+    :param send: Takes an item and makes exactly one API request for it,
+                 through ``client._connection``.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of batches to send
+                        concurrently. Defaults to ``_DEFAULT_BATCH_WORKERS``.
+
+    :rtype: list
+    :returns: For each item, the exception its request failed with, or
+              ``None`` if it succeeded.
+    """
+    items = list(items)
+    if len(items) == 1:
+        try:
+            send(items[0])
+        except exceptions.GoogleCloudError as exc:
+            return [exc]
+        return [None]
+
+    if max_workers is None:
+        max_workers = _DEFAULT_BATCH_WORKERS
+
+    chunks = [
+        items[start:start + _MAX_SERVER_BATCH_SIZE]
+        for start in range(0, len(items), _MAX_SERVER_BATCH_SIZE)]
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        errors = executor.map(
+            lambda chunk: _send_batch(client, chunk, send), chunks)
+        return list(itertools.chain.from_iterable(errors))
+
+
+def _send_batch(client, items, send):
+    """Send one request for each item in a single batch.
+
+    The client's batch stack is local to the thread, so batches may be
+    sent concurrently from several threads.
+
+    See :func:`_send_in_batches` for the arguments.
+
+    :rtype: list
+    :returns: For each item, the exception its request failed with, or
+              ``None`` if it succeeded.
+    :raises: :class:`ValueError` if ``send`` did not make one request for
+             each item.
+    """
+    batch = Batch(client, raise_exception=False)
+    client._push_batch(batch)
+    try:
+        for item in items:
+            send(item)
+    finally:
+        client._pop_batch()
+
+    if len(batch._requests) != len(items):
+        raise ValueError('Expected one request for every item.')
+
+    try:
+        responses = batch.finish()
+    except exceptions.GoogleCloudError as exc:
+        return [exc] * len(items)
+
+    return [
+        None if 200 <= response.status_code < 300
+        else exceptions.from_http_response(response)
+        for response in responses]
+
+
 def _generate_faux_mime_message(parser, response):
     """Convert response, content -> (multipart) email.message.
 
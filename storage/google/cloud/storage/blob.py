@@ -26,14 +26,18 @@
 """
 
 import base64
+import binascii
 import copy
 import hashlib
 from io import BytesIO
+from io import TextIOWrapper
+import logging
 import mimetypes
 import os
 import time
 import warnings
 
+from concurrent import futures
 from six.moves.urllib.parse import parse_qsl
 from six.moves.urllib.parse import quote
 from six.moves.urllib.parse import urlencode
@@ -52,14 +56,23 @@ from google.cloud._helpers import _to_bytes
 from google.cloud._helpers import _bytes_to_unicode
 from google.cloud.exceptions import NotFound
 from google.cloud.iam import Policy
+from google.cloud.storage._helpers import _base64_crc32c
+from google.cloud.storage._helpers import _crc32c_combine
+from google.cloud.storage._helpers import _crc32c_update
+from google.cloud.storage._helpers import _has_fast_crc32c
+from google.cloud.storage._helpers import _Crc32cHash
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
+from google.cloud.storage._signing import _API_ACCESS_ENDPOINT
 from google.cloud.storage._signing import generate_signed_url
 from google.cloud.storage.acl import ACL
 from google.cloud.storage.acl import ObjectACL
+from google.cloud.storage.chunking import _transmit_chunks
+from google.cloud.storage.fileio import BlobReader
+from google.cloud.storage.fileio import BlobWriter
 
 
-_API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
+_LOGGER = logging.getLogger(__name__)
 _DEFAULT_CONTENT_TYPE = u'application/octet-stream'
 _DOWNLOAD_URL_TEMPLATE = (
     u'https://www.googleapis.com/download/storage/v1{path}?alt=media')
@@ -95,7 +108,34 @@ _READ_LESS_THAN_SIZE = (
     '{:d} bytes remaining.')
 
 _DEFAULT_CHUNKSIZE = 104857600  # 1024 * 1024 B * 100 = 100 MB
+_DEFAULT_SLICE_CHUNKSIZE = 33554432  # 1024 * 1024 B * 32 = 32 MB
+_SLICED_CHECKSUM_MISMATCH = (
+    'Checksum mismatch while downloading:\n\n'
+    '  {}\n\n'
+    'The CRC32C checksum of the slices is {} but the object has {}.')
+_SLOW_CRC32C_MESSAGE = (
+    'Not verifying the CRC32C checksum of the sliced download: crcmod is '
+    'not installed with its C extension, and the pure Python checksum is '
+    'slower than the download. Install google-cloud-storage[crc32c], or '
+    'pass checksum="crc32c" to verify it anyway.')
+_CHECKSUM_FIELDS = {
+    'crc32c': 'crc32c',
+    'md5': 'md5Hash',
+}
+_HASH_HEADER = 'x-goog-hash'
+_DOWNLOAD_CHECKSUM_MISMATCH = (
+    'Checksum mismatch while downloading:\n\n'
+    '  {}\n\n'
+    'The {} checksum of the downloaded bytes is {} but the object has {}.')
+_UPLOAD_CHECKSUM_MISMATCH = (
+    'Checksum mismatch while uploading {!r}:\n\n'
+    'The {} checksum of the local bytes is {} but the uploaded object has '
+    '{}. The uploaded object has been deleted.')
 _MAX_MULTIPART_SIZE = 8388608  # 8 MB
+_DEFAULT_COMPONENT_SIZE = 67108864  # 1024 * 1024 B * 64 = 64 MB
+_DEFAULT_UPLOAD_WORKERS = 8
+_MAX_COMPOSE_SOURCES = 32
+_COMPONENT_NAME_TEMPLATE = u'{name}.parallel-upload-{upload_id}-{index:05d}'
 
 
 class Blob(_PropertyMixin):
@@ -444,12 +484,16 @@ class Blob(_PropertyMixin):
         return _add_query_parameters(base_url, name_value_pairs)
 
     def _do_download(self, transport, file_obj, download_url, headers,
-                     start=None, end=None):
+                     start=None, end=None, checksum=None):
         """Perform a download without any error handling.
 
         This is intended to be called by :meth:`download_to_file` so it can
         be wrapped with error handling / remapping.
 
+        With ``checksum``, each chunk is hashed as it is written to
+        ``file_obj``, and the checksum is compared with the one in the
+        ``X-Goog-Hash`` header of the response.
+
         :type transport:
             :class:`~google.auth.transport.requests.AuthorizedSession`
         :param transport: The transport (with credentials) that will
@@ -469,21 +513,45 @@ class Blob(_PropertyMixin):
 
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
+
+        :type checksum: str
+        :param checksum: Optional, the checksum to verify: ``'md5'``,
+                         ``'crc32c'`` or :data:`None`.
+
+        :raises: :class:`ValueError` if ``checksum`` is passed with ``start``
+                 or ``end``, or is not a known checksum type.
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the downloaded bytes does not match.
         """
+        hash_obj = _make_checksum_object(checksum)
+        if hash_obj is not None and (start is not None or end is not None):
+            raise ValueError(
+                'Cannot verify the checksum of a range of a blob.')
+        if self.chunk_size is None and checksum == 'md5':
+            # ``Download`` already verifies the MD5 hash as it streams.
+            hash_obj = None
+        if hash_obj is not None:
+            file_obj = _ChecksumWriter(file_obj, hash_obj)
+
         if self.chunk_size is None:
             download = Download(
                 download_url, stream=file_obj, headers=headers,
                 start=start, end=end)
-            download.consume(transport)
+            response = download.consume(transport)
         else:
             download = ChunkedDownload(
                 download_url, self.chunk_size, file_obj, headers=headers,
                 start=start if start else 0, end=end)
 
             while not download.finished:
-                download.consume_next_chunk(transport)
+                response = download.consume_next_chunk(transport)
+
+        if hash_obj is not None:
+            _verify_download_checksum(
+                response, download_url, checksum, hash_obj)
 
-    def download_to_file(self, file_obj, client=None, start=None, end=None):
+    def download_to_file(self, file_obj, client=None, start=None, end=None,
+                         checksum=None):
         """Download the contents of this blob into a file-like object.
 
         .. note::
@@ -509,6 +577,13 @@ class Blob(_PropertyMixin):
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
+        With ``checksum``, the MD5 hash or CRC32C checksum of the blob is
+        computed as its bytes are written, and compared with the one the
+        server sends. Objects served decompressed, and composite objects
+        when ``checksum`` is ``'md5'``, cannot be verified. Install
+        :mod:`crcmod` with its C extension to compute CRC32C checksums
+        quickly.
+
         :type file_obj: file
         :param file_obj: A file handle to which to write the blob's data.
 
@@ -523,7 +598,14 @@ class Blob(_PropertyMixin):
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
 
+        :type checksum: str
+        :param checksum: Optional, the checksum to verify the whole blob
+                         with: ``'md5'``, ``'crc32c'`` or :data:`None`.
+                         Cannot be used with ``start`` or ``end``.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the downloaded bytes does not match.
         """
         download_url = self._get_download_url()
         headers = _get_encryption_headers(self._encryption_key)
@@ -532,17 +614,33 @@ class Blob(_PropertyMixin):
         transport = self._get_transport(client)
         try:
             self._do_download(
-                transport, file_obj, download_url, headers, start, end)
+                transport, file_obj, download_url, headers, start, end,
+                checksum=checksum)
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
     def download_to_filename(self, filename, client=None,
-                             start=None, end=None):
+                             start=None, end=None, slices=None,
+                             checksum=None):
         """Download the contents of this blob into a named file.
 
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
+        With ``slices``, the blob is split into that many byte ranges which
+        are downloaded concurrently, each straight into its place in the
+        file, and the file's CRC32C checksum is checked against
+        :attr:`crc32c`. This is much faster for large blobs on fast
+        networks. Each slice is read in chunks of :attr:`chunk_size` bytes,
+        or 32 MB, held in memory. The checksum is only verified by default
+        if :mod:`crcmod` is installed with its C extension (install
+        ``google-cloud-storage[crc32c]``): otherwise a warning is emitted
+        instead, as the pure Python checksum is slower than the download.
+
+        Without ``slices``, pass ``checksum`` to verify the download as in
+        :meth:`download_to_file`. If the checksum does not match, the file
+        is deleted.
+
         :type filename: str
         :param filename: A filename to be passed to ``open``.
 
@@ -557,12 +655,36 @@ class Blob(_PropertyMixin):
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
 
+        :type slices: int
+        :param slices: Optional, the number of byte ranges to download
+                       concurrently. Cannot be used with ``start`` or
+                       ``end``.
+
+        :type checksum: str
+        :param checksum: Optional, the checksum to verify the whole blob
+                         with: ``'md5'``, ``'crc32c'`` or :data:`None`.
+                         Sliced downloads verify the CRC32C checksum if it
+                         is fast to compute, or if this is ``'crc32c'``.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
+        :raises: :class:`ValueError` if ``slices`` is passed with ``start``
+                 or ``end``.
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the downloaded bytes does not match.
         """
+        if slices is not None and (start is not None or end is not None):
+            raise ValueError(
+                'Cannot download a range of a blob in slices.')
+
         try:
-            with open(filename, 'wb') as file_obj:
-                self.download_to_file(
-                    file_obj, client=client, start=start, end=end)
+            if slices is not None and slices > 1:
+                self._download_to_filename_sliced(
+                    filename, client, slices, checksum)
+            else:
+                with open(filename, 'wb') as file_obj:
+                    self.download_to_file(
+                        file_obj, client=client, start=start, end=end,
+                        checksum=checksum)
         except resumable_media.DataCorruption:
             # Delete the corrupt downloaded file.
             os.remove(filename)
@@ -571,9 +693,128 @@ class Blob(_PropertyMixin):
         updated = self.updated
         if updated is not None:
             mtime = time.mktime(updated.timetuple())
-            os.utime(file_obj.name, (mtime, mtime))
+            os.utime(filename, (mtime, mtime))
+
+    def _download_to_filename_sliced(self, filename, client, slices,
+                                     checksum=None):
+        """Download the blob in concurrent slices into a named file.
+
+        Loads the blob's properties first if its size is not known, so
+        that all slices are read from the same generation.
+
+        :type filename: str
+        :param filename: A filename to be passed to ``open``.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.
+
+        :type slices: int
+        :param slices: The number of byte ranges to download concurrently.
+
+        :type checksum: str
+        :param checksum: Optional, ``'crc32c'`` to verify the checksum even
+                         if it is slow to compute.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the file does not match :attr:`crc32c`.
+        """
+        if self.size is None:
+            self.reload(client=client)
 
-    def download_as_string(self, client=None, start=None, end=None):
+        if self.content_encoding == 'gzip' or self.size < 2:
+            # Byte ranges of objects served decompressed are unreliable.
+            with open(filename, 'wb') as file_obj:
+                self.download_to_file(file_obj, client=client)
+            return
+
+        verify = self.crc32c is not None and (
+            checksum == 'crc32c' or _has_fast_crc32c())
+        if self.crc32c is not None and not verify:
+            warnings.warn(_SLOW_CRC32C_MESSAGE, RuntimeWarning)
+
+        download_url = self._get_download_url()
+        headers = _get_encryption_headers(self._encryption_key)
+        transport = self._get_transport(client)
+        ranges = _slice_ranges(self.size, slices)
+
+        # Preallocate the file, so each slice can be written at its offset.
+        with open(filename, 'wb') as file_obj:
+            file_obj.truncate(self.size)
+
+        executor = futures.ThreadPoolExecutor(max_workers=len(ranges))
+        with executor:
+            slice_futures = [
+                executor.submit(
+                    self._download_slice, transport, filename, download_url,
+                    headers, slice_start, slice_end, verify)
+                for slice_start, slice_end in ranges]
+            checksums = _wait_for_all(slice_futures)
+
+        if not verify:
+            return
+        crc = checksums[0]
+        for checksum, (slice_start, slice_end) in zip(
+                checksums[1:], ranges[1:]):
+            crc = _crc32c_combine(crc, checksum, slice_end - slice_start + 1)
+        actual = _base64_crc32c(crc)
+        if actual != self.crc32c:
+            raise resumable_media.DataCorruption(
+                None, _SLICED_CHECKSUM_MISMATCH.format(
+                    download_url, actual, self.crc32c))
+
+    def _download_slice(self, transport, filename, download_url, headers,
+                        start, end, verify=True):
+        """Download one byte range of the blob into its place in a file.
+
+        This is safe to call from a background thread: each slice writes
+        through its own file handle.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type filename: str
+        :param filename: The preallocated file to write to.
+
+        :type download_url: str
+        :param download_url: The URL where the media can be accessed.
+
+        :type headers: dict
+        :param headers: Headers to be sent with the request(s).
+
+        :type start: int
+        :param start: The first byte of the slice.
+
+        :type end: int
+        :param end: The last byte of the slice.
+
+        :type verify: bool
+        :param verify: Whether to compute the checksum of the slice.
+
+        :rtype: int
+        :returns: The CRC32C checksum of the slice, or :data:`None` if not
+                  ``verify``.
+        """
+        chunk_size = min(
+            self.chunk_size or _DEFAULT_SLICE_CHUNKSIZE, end - start + 1)
+        with open(filename, 'r+b') as file_obj:
+            file_obj.seek(start)
+            writer = _Crc32cWriter(file_obj) if verify else file_obj
+            download = ChunkedDownload(
+                download_url, chunk_size, writer, headers=dict(headers),
+                start=start, end=end)
+            try:
+                while not download.finished:
+                    download.consume_next_chunk(transport)
+            except resumable_media.InvalidResponse as exc:
+                _raise_from_invalid_response(exc)
+        if verify:
+            return writer.crc32c
+
+    def download_as_string(self, client=None, start=None, end=None,
+                           checksum=None):
         """Download the contents of this blob as a string.
 
         If :attr:`user_project` is set on the bucket, bills the API request
@@ -590,13 +831,21 @@ class Blob(_PropertyMixin):
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
 
+        :type checksum: str
+        :param checksum: Optional, the checksum to verify the whole blob
+                         with: ``'md5'``, ``'crc32c'`` or :data:`None`.
+                         See :meth:`download_to_file`.
+
         :rtype: bytes
         :returns: The data stored in this blob.
         :raises: :class:`google.cloud.exceptions.NotFound`
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the downloaded bytes does not match.
         """
         string_buffer = BytesIO()
         self.download_to_file(
-            string_buffer, client=client, start=start, end=end)
+            string_buffer, client=client, start=start, end=end,
+            checksum=checksum)
         return string_buffer.getvalue()
 
     def _get_content_type(self, content_type, filename=None):
@@ -685,9 +934,14 @@ class Blob(_PropertyMixin):
         return headers, object_metadata, content_type
 
     def _do_multipart_upload(self, client, stream, content_type,
-                             size, num_retries, predefined_acl):
+                             size, num_retries, predefined_acl,
+                             checksum=None):
         """Perform a multipart upload.
 
+        With ``checksum``, the checksum of the bytes read from ``stream`` is
+        sent in the object metadata, so the server rejects the upload if
+        the bytes it receives do not match.
+
         The content type of the upload will be determined in order
         of precedence:
 
@@ -717,12 +971,18 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: str
+        :param checksum: (Optional) The checksum to send: ``'md5'``,
+                         ``'crc32c'`` or :data:`None`.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the multipart
                   upload request.
         :raises: :exc:`ValueError` if ``size`` is not :data:`None` but the
                  ``stream`` has fewer than ``size`` bytes remaining.
         """
+        hash_obj = _make_checksum_object(checksum)
+
         if size is None:
             data = stream.read()
         else:
@@ -734,6 +994,11 @@ class Blob(_PropertyMixin):
         transport = self._get_transport(client)
         info = self._get_upload_arguments(content_type)
         headers, object_metadata, content_type = info
+        if hash_obj is not None:
+            hash_obj.update(data)
+            # A checksum set on the blob is kept, to be checked instead.
+            object_metadata.setdefault(
+                _CHECKSUM_FIELDS[checksum], _base64_digest(hash_obj))
 
         base_url = _MULTIPART_URL_TEMPLATE.format(
             bucket_path=self.bucket.path)
@@ -852,11 +1117,16 @@ class Blob(_PropertyMixin):
         return upload, transport
 
     def _do_resumable_upload(self, client, stream, content_type,
-                             size, num_retries, predefined_acl):
+                             size, num_retries, predefined_acl,
+                             checksum=None, chunk_sizer=None):
         """Perform a resumable upload.
 
         Assumes ``chunk_size`` is not :data:`None` on the current blob.
 
+        With ``checksum``, each chunk is hashed as it is read from
+        ``stream``, and the checksum is compared with the one of the
+        uploaded object. If they do not match, the object is deleted.
+
         The content type of the upload will be determined in order
         of precedence:
 
@@ -886,21 +1156,85 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: str
+        :param checksum: (Optional) The checksum to verify: ``'md5'``,
+                         ``'crc32c'`` or :data:`None`.
+
+        :type chunk_sizer:
+            :class:`~google.cloud.storage.chunking.AdaptiveChunkSizer`
+        :param chunk_sizer: (Optional) Picks the size of each chunk, in
+                            place of :attr:`chunk_size`.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the final chunk
                   is uploaded.
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the uploaded object does not match.
         """
+        hash_obj = _make_checksum_object(checksum)
+        if hash_obj is not None:
+            stream = _ChecksumReader(stream, hash_obj)
+
+        chunk_size = None
+        if chunk_sizer is not None:
+            chunk_size = chunk_sizer.start()
         upload, transport = self._initiate_resumable_upload(
             client, stream, content_type, size, num_retries,
-            predefined_acl=predefined_acl)
+            predefined_acl=predefined_acl, chunk_size=chunk_size)
 
-        while not upload.finished:
-            response = upload.transmit_next_chunk(transport)
+        if chunk_sizer is not None:
+            response = _transmit_chunks(upload, transport, chunk_sizer)
+        else:
+            while not upload.finished:
+                response = upload.transmit_next_chunk(transport)
+
+        if hash_obj is not None:
+            self._verify_upload_checksum(
+                client, response, checksum, stream.base64_digest())
 
         return response
 
+    def _verify_upload_checksum(self, client, response, checksum, expected):
+        """Check the checksum of an uploaded object, deleting it if wrong.
+
+        Only the uploaded generation is deleted, so a newer upload to the
+        same name is kept.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.
+
+        :type response: :class:`~requests.Response`
+        :param response: The response to the final request of the upload.
+
+        :type checksum: str
+        :param checksum: The checksum type: ``'md5'`` or ``'crc32c'``.
+
+        :type expected: str
+        :param expected: The base64 checksum of the local bytes, or
+                         :data:`None` if it could not be computed.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksums do not match.
+        """
+        resource = response.json()
+        actual = resource.get(_CHECKSUM_FIELDS[checksum])
+        if expected is None or actual is None or actual == expected:
+            return
+
+        client = self._require_client(client)
+        query_params = {'generation': resource['generation']}
+        if self.user_project is not None:
+            query_params['userProject'] = self.user_project
+        client._connection.api_request(
+            method='DELETE', path=self.path, query_params=query_params,
+            _target_object=None)
+        raise resumable_media.DataCorruption(
+            response, _UPLOAD_CHECKSUM_MISMATCH.format(
+                self.name, checksum, expected, actual))
+
     def _do_upload(self, client, stream, content_type,
-                   size, num_retries, predefined_acl):
+                   size, num_retries, predefined_acl, checksum=None,
+                   chunk_sizer=None):
         """Determine an upload strategy and then perform the upload.
 
         If the size of the data to be uploaded exceeds 5 MB a resumable media
@@ -936,6 +1270,15 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: str
+        :param checksum: (Optional) The checksum to verify: ``'md5'``,
+                         ``'crc32c'`` or :data:`None`.
+
+        :type chunk_sizer:
+            :class:`~google.cloud.storage.chunking.AdaptiveChunkSizer`
+        :param chunk_sizer: (Optional) Picks the size of each chunk of a
+                            resumable upload.
+
         :rtype: dict
         :returns: The parsed JSON from the "200 OK" response. This will be the
                   **only** response in the multipart case and it will be the
@@ -944,17 +1287,19 @@ class Blob(_PropertyMixin):
         if size is not None and size <= _MAX_MULTIPART_SIZE:
             response = self._do_multipart_upload(
                 client, stream, content_type,
-                size, num_retries, predefined_acl)
+                size, num_retries, predefined_acl, checksum=checksum)
         else:
             response = self._do_resumable_upload(
                 client, stream, content_type, size,
-                num_retries, predefined_acl)
+                num_retries, predefined_acl, checksum=checksum,
+                chunk_sizer=chunk_sizer)
 
         return response.json()
 
     def upload_from_file(self, file_obj, rewind=False, size=None,
                          content_type=None, num_retries=None, client=None,
-                         predefined_acl=None):
+                         predefined_acl=None, checksum=None,
+                         chunk_sizer=None):
         """Upload the contents of this blob from a file-like object.
 
         The content type of the upload will be determined in order
@@ -986,6 +1331,19 @@ class Blob(_PropertyMixin):
         For more fine-grained over the upload process, check out
         `google-resumable-media`_.
 
+        With ``checksum``, the MD5 hash or CRC32C checksum of the bytes is
+        computed as they are read from ``file_obj``. Uploads sent in a
+        single request (of up to 8 MB with a known ``size``) send it to the
+        server as a precondition, so corrupt bytes are never stored. Larger
+        uploads compare it with the checksum of the uploaded object, which
+        is deleted if they differ. To make the server check a checksum
+        known beforehand, set :attr:`crc32c` or :attr:`md5_hash`.
+
+        Resumable uploads send chunks of :attr:`chunk_size` bytes, or 100 MB.
+        With a ``chunk_sizer``, the size of each chunk is picked from the
+        throughput and errors measured for the previous ones instead, and
+        the sizer's ``stats`` describe the upload.
+
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
@@ -1015,8 +1373,20 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: str
+        :param checksum: (Optional) The checksum to verify the upload with:
+                         ``'md5'``, ``'crc32c'`` or :data:`None`.
+
+        :type chunk_sizer:
+            :class:`~google.cloud.storage.chunking.AdaptiveChunkSizer`
+        :param chunk_sizer: (Optional) Picks the size of each chunk of a
+                            resumable upload. Uploads sent in a single
+                            request do not use it.
+
         :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
                  if the upload response returns an error status.
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the uploaded object does not match.
 
         .. _object versioning: https://cloud.google.com/storage/\
                                docs/object-versioning
@@ -1031,13 +1401,17 @@ class Blob(_PropertyMixin):
         try:
             created_json = self._do_upload(
                 client, file_obj, content_type,
-                size, num_retries, predefined_acl)
+                size, num_retries, predefined_acl, checksum=checksum,
+                chunk_sizer=chunk_sizer)
             self._set_properties(created_json)
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
     def upload_from_filename(self, filename, content_type=None, client=None,
-                             predefined_acl=None):
+                             predefined_acl=None, parallel_threshold=None,
+                             component_size=_DEFAULT_COMPONENT_SIZE,
+                             max_workers=None, checksum=None,
+                             chunk_sizer=None):
         """Upload this blob's contents from the content of a named file.
 
         The content type of the upload will be determined in order
@@ -1059,6 +1433,14 @@ class Blob(_PropertyMixin):
            `lifecycle <https://cloud.google.com/storage/docs/lifecycle>`_
            API documents for details.
 
+        Files of at least ``parallel_threshold`` bytes are uploaded as a
+        `parallel composite upload`_: slices of ``component_size`` bytes
+        are uploaded concurrently as temporary blobs, which are then
+        composed into this blob and deleted. The composed blob has a
+        CRC32C checksum but no MD5 hash. Blobs with a customer-supplied
+        encryption key or a KMS key, and uploads with a
+        ``predefined_acl``, are always uploaded in one stream.
+
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
@@ -1074,17 +1456,140 @@ class Blob(_PropertyMixin):
 
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
+
+        :type parallel_threshold: int
+        :param parallel_threshold: (Optional) The size, in bytes, from which
+                                   files are uploaded in parallel. By
+                                   default, files are uploaded in one stream.
+
+        :type component_size: int
+        :param component_size: (Optional) The size, in bytes, of each slice
+                               of a parallel upload. Defaults to 64 MB.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of slices of a parallel
+                            upload sent concurrently. Defaults to 8.
+
+        :type checksum: str
+        :param checksum: (Optional) The checksum to verify the upload with:
+                         ``'md5'``, ``'crc32c'`` or :data:`None`. See
+                         :meth:`upload_from_file`. Each slice of a parallel
+                         upload is verified separately.
+
+        :type chunk_sizer:
+            :class:`~google.cloud.storage.chunking.AdaptiveChunkSizer`
+        :param chunk_sizer: (Optional) Picks the size of each chunk of a
+                            resumable upload. See :meth:`upload_from_file`.
+                            Parallel uploads do not use it.
+
+        .. _parallel composite upload: https://cloud.google.com/storage/\
+                                       docs/gsutil/commands/cp#parallel-\
+                                       composite-uploads
         """
         content_type = self._get_content_type(content_type, filename=filename)
 
         with open(filename, 'rb') as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
-            self.upload_from_file(
-                file_obj, content_type=content_type, client=client,
-                size=total_bytes, predefined_acl=predefined_acl)
+            parallel = (
+                parallel_threshold is not None and
+                total_bytes >= parallel_threshold and
+                total_bytes > component_size and
+                predefined_acl is None and
+                self._encryption_key is None and
+                self.kms_key_name is None)
+            if not parallel:
+                self.upload_from_file(
+                    file_obj, content_type=content_type, client=client,
+                    size=total_bytes, predefined_acl=predefined_acl,
+                    checksum=checksum, chunk_sizer=chunk_sizer)
+                return
+
+        self._do_parallel_composite_upload(
+            client, filename, content_type, total_bytes, component_size,
+            max_workers or _DEFAULT_UPLOAD_WORKERS, checksum=checksum)
+
+    def _do_parallel_composite_upload(self, client, filename, content_type,
+                                      size, component_size, max_workers,
+                                      checksum=None):
+        """Upload slices of a file concurrently, then compose them.
+
+        The temporary component blobs, and the intermediate blobs composed
+        from them when there are more than 32 components, are deleted
+        whether or not the upload succeeds. Failing to delete them is
+        logged, rather than raised, so that it does not hide the error of
+        the upload.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type size: int
+        :param size: The size of the file.
+
+        :type component_size: int
+        :param component_size: The size of each slice of the file.
+
+        :type max_workers: int
+        :param max_workers: The number of requests sent concurrently.
+
+        :type checksum: str
+        :param checksum: (Optional) The checksum to verify each slice with.
+        """
+        upload_id = binascii.hexlify(os.urandom(8)).decode('ascii')
+        temporary_blobs = []
+
+        def make_temporary_blob():
+            blob = Blob(
+                _COMPONENT_NAME_TEMPLATE.format(
+                    name=self.name, upload_id=upload_id,
+                    index=len(temporary_blobs)),
+                bucket=self.bucket, chunk_size=self.chunk_size)
+            blob.content_type = content_type
+            temporary_blobs.append(blob)
+            return blob
+
+        try:
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                components = []
+                uploads = []
+                for start in range(0, size, component_size):
+                    component = make_temporary_blob()
+                    components.append(component)
+                    uploads.append(pool.submit(
+                        _upload_component, component, filename, start,
+                        min(component_size, size - start), client,
+                        checksum))
+                _wait_for_all(uploads)
+
+                while len(components) > _MAX_COMPOSE_SOURCES:
+                    groups = [
+                        components[index:index + _MAX_COMPOSE_SOURCES]
+                        for index in range(
+                            0, len(components), _MAX_COMPOSE_SOURCES)]
+                    components = [make_temporary_blob() for _ in groups]
+                    _wait_for_all([
+                        pool.submit(composed.compose, group, client=client)
+                        for composed, group in zip(components, groups)])
+
+            self.content_type = content_type
+            self.compose(components, client=client)
+        finally:
+            try:
+                self.bucket.delete_blobs(
+                    temporary_blobs, on_error=lambda blob: None,
+                    client=client)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    'Failed to delete the temporary blobs of the parallel '
+                    'upload of %s.', self.name)
 
     def upload_from_string(self, data, content_type='text/plain', client=None,
-                           predefined_acl=None):
+                           predefined_acl=None, checksum=None):
         """Upload contents of this blob from the provided string.
 
         .. note::
@@ -1116,13 +1621,18 @@ class Blob(_PropertyMixin):
 
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
+
+        :type checksum: str
+        :param checksum: (Optional) The checksum to verify the upload with:
+                         ``'md5'``, ``'crc32c'`` or :data:`None`. See
+                         :meth:`upload_from_file`.
         """
         data = _to_bytes(data, encoding='utf-8')
         string_buffer = BytesIO(data)
         self.upload_from_file(
             file_obj=string_buffer, size=len(data),
             content_type=content_type, client=client,
-            predefined_acl=predefined_acl)
+            predefined_acl=predefined_acl, checksum=checksum)
 
     def create_resumable_upload_session(
             self,
@@ -1215,6 +1725,84 @@ class Blob(_PropertyMixin):
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
+    def open(self, mode='r', chunk_size=None, encoding=None, errors=None,
+             newline=None, client=None, **kwargs):
+        """Open the blob as a file-like object, to read or write.
+
+        Reading downloads the byte ranges which are read, with at least
+        ``chunk_size`` bytes per request; the reader can :meth:`seek` and
+        read into a caller's buffer with :meth:`readinto`. Writing sends
+        the bytes written through a resumable upload, ``chunk_size`` bytes
+        at a time, and creates or replaces the blob when the file is
+        closed.
+
+        .. literalinclude:: snippets.py
+            :start-after: [START blob_open]
+            :end-before: [END blob_open]
+
+        If :attr:`user_project` is set on the bucket, bills the API requests
+        to that project.
+
+        :type mode: str
+        :param mode: (Optional) One of ``'rb'`` or ``'wb'`` for bytes, or
+                     ``'r'``, ``'rt'``, ``'w'`` or ``'wt'`` for text.
+                     Defaults to ``'r'``.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) The number of bytes per request; when
+                           writing, a multiple of 256 KB. Defaults to the
+                           chunk size of the blob, if set, else to
+                           :data:`~google.cloud.storage.fileio.DEFAULT_CHUNK_SIZE`.
+
+        :type encoding: str
+        :param encoding: (Optional) For text modes only, as for
+                         :func:`io.open`.
+
+        :type errors: str
+        :param errors: (Optional) For text modes only, as for :func:`io.open`.
+
+        :type newline: str
+        :param newline: (Optional) For text modes only, as for
+                        :func:`io.open`.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type kwargs: dict
+        :param kwargs: (Optional) When writing, ``content_type`` and
+                       ``predefined_acl`` for the upload.
+
+        :rtype: :class:`~google.cloud.storage.fileio.BlobReader`,
+                :class:`~google.cloud.storage.fileio.BlobWriter` or
+                :class:`io.TextIOWrapper`
+        :returns: The file-like object for ``mode``.
+        :raises: :exc:`ValueError` if ``mode`` is not supported, or if text
+                 options are passed with a binary mode.
+        """
+        if mode == 'rb' or mode == 'wb':
+            if encoding or errors or newline:
+                raise ValueError(
+                    'encoding, errors and newline are not supported in '
+                    'binary mode.')
+        elif mode not in ('r', 'rt', 'w', 'wt'):
+            raise ValueError('Unsupported mode: %r' % (mode,))
+
+        if mode.startswith('r'):
+            if kwargs:
+                raise ValueError(
+                    'Unsupported options for reading: %s' % (
+                        ', '.join(sorted(kwargs)),))
+            result = BlobReader(self, chunk_size=chunk_size, client=client)
+        else:
+            result = BlobWriter(
+                self, chunk_size=chunk_size, client=client, **kwargs)
+
+        if mode.endswith('b'):
+            return result
+        return TextIOWrapper(
+            result, encoding=encoding, errors=errors, newline=newline)
+
     def get_iam_policy(self, client=None):
         """Retrieve the IAM policy for the object.
 
@@ -1477,9 +2065,28 @@ class Blob(_PropertyMixin):
             raise ValueError("Invalid storage class: %s" % (new_class,))
 
         client = self._require_client(client)
+        api_response = client._connection.api_request(
+            _target_object=self, **self._storage_class_rewrite(new_class))
+        self._finish_storage_class_rewrite(new_class, api_response, client)
+
+    def _storage_class_rewrite(self, new_class, token=None):
+        """Build a request to rewrite this blob in place to a storage class.
 
+        :type new_class: str
+        :param new_class: new storage class for the object
+
+        :type token: str
+        :param token: Optional. Token returned from an earlier, not-completed
+                      call to the same rewrite.
+
+        :rtype: dict
+        :returns: The keyword arguments for ``api_request``.
+        """
         query_params = {}
 
+        if token:
+            query_params['rewriteToken'] = token
+
         if self.user_project is not None:
             query_params['userProject'] = self.user_project
 
@@ -1487,13 +2094,33 @@ class Blob(_PropertyMixin):
         headers.update(_get_encryption_headers(
             self._encryption_key, source=True))
 
-        api_response = client._connection.api_request(
-            method='POST',
-            path=self.path + '/rewriteTo' + self.path,
-            query_params=query_params,
-            data={'storageClass': new_class},
-            headers=headers,
-            _target_object=self)
+        return {
+            'method': 'POST',
+            'path': self.path + '/rewriteTo' + self.path,
+            'query_params': query_params,
+            'data': {'storageClass': new_class},
+            'headers': headers,
+        }
+
+    def _finish_storage_class_rewrite(self, new_class, api_response, client):
+        """Continue a rewrite to a storage class until it is complete.
+
+        Large objects may need more than one rewrite call: each incomplete
+        call returns a token to continue the rewrite with.
+
+        :type new_class: str
+        :param new_class: new storage class for the object
+
+        :type api_response: dict
+        :param api_response: The response to the first rewrite call.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+        """
+        while api_response.get('rewriteToken'):
+            api_response = client._connection.api_request(
+                **self._storage_class_rewrite(
+                    new_class, api_response['rewriteToken']))
         self._set_properties(api_response['resource'])
 
     cache_control = _scalar_property('cacheControl')
@@ -1794,6 +2421,139 @@ class Blob(_PropertyMixin):
             return _rfc3339_to_datetime(value)
 
 
+def _listed_property(fieldname, converter=None):
+    """Create a read-only property for a field of a listed blob.
+
+    :type fieldname: str
+    :param fieldname: The name of the field in the blob's resource.
+
+    :type converter: callable
+    :param converter: (Optional) Converts the value of the field, if set.
+
+    :rtype: property
+    :returns: The property, which is ``None`` when the field is not set.
+    """
+    def _getter(self):
+        value = self._properties.get(fieldname)
+        if value is not None and converter is not None:
+            value = converter(value)
+        return value
+
+    return property(_getter)
+
+
+class BlobListItem(object):
+    """A blob returned by a listing, without the state of a full blob.
+
+    Listing millions of blobs as :class:`Blob` objects spends most of its
+    time and memory on the ACL and change tracking of each blob. A
+    listed item only keeps the resource returned by the server, whose
+    fields can be limited with the ``fields`` argument of the listing, and
+    makes a :class:`Blob` on demand with :meth:`to_blob`.
+
+    :type bucket: :class:`google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to which this blob belongs.
+
+    :type properties: dict
+    :param properties: The resource of the blob returned by the server.
+    """
+
+    __slots__ = ('bucket', '_properties')
+
+    def __init__(self, bucket, properties):
+        self.bucket = bucket
+        self._properties = properties
+
+    def __repr__(self):
+        return '<BlobListItem: %s, %s>' % (self.bucket.name, self.name)
+
+    name = _listed_property('name')
+    """The name of the blob.
+
+    :rtype: str or ``NoneType``
+    """
+
+    content_type = _listed_property(_CONTENT_TYPE_FIELD)
+    """HTTP 'Content-Type' header for this object.
+
+    :rtype: str or ``NoneType``
+    """
+
+    crc32c = _listed_property('crc32c')
+    """CRC32C checksum for this object.
+
+    :rtype: str or ``NoneType``
+    """
+
+    etag = _listed_property('etag')
+    """The ETag for the object.
+
+    :rtype: str or ``NoneType``
+    """
+
+    generation = _listed_property('generation', int)
+    """The generation for the object.
+
+    :rtype: int or ``NoneType``
+    """
+
+    md5_hash = _listed_property('md5Hash')
+    """MD5 hash for this object.
+
+    :rtype: str or ``NoneType``
+    """
+
+    metageneration = _listed_property('metageneration', int)
+    """The metageneration for the object.
+
+    :rtype: int or ``NoneType``
+    """
+
+    size = _listed_property('size', int)
+    """Size of the object, in bytes.
+
+    :rtype: int or ``NoneType``
+    """
+
+    storage_class = _listed_property('storageClass')
+    """The storage class of the object.
+
+    :rtype: str or ``NoneType``
+    """
+
+    time_created = _listed_property('timeCreated', _rfc3339_to_datetime)
+    """The timestamp at which the object was created.
+
+    :rtype: :class:`datetime.datetime` or ``NoneType``
+    """
+
+    updated = _listed_property('updated', _rfc3339_to_datetime)
+    """The timestamp at which the object was updated.
+
+    :rtype: :class:`datetime.datetime` or ``NoneType``
+    """
+
+    @property
+    def metadata(self):
+        """Retrieve arbitrary/application specific metadata for the object.
+
+        :rtype: dict or ``NoneType``
+        :returns: The metadata associated with the blob or ``None`` if the
+                  property is not set.
+        """
+        return copy.deepcopy(self._properties.get('metadata'))
+
+    def to_blob(self):
+        """Make a full blob with the properties of this item.
+
+        :rtype: :class:`Blob`
+        :returns: A new blob, in the same bucket.
+        """
+        blob = Blob(self.name, bucket=self.bucket)
+        blob._set_properties(copy.deepcopy(self._properties))
+        return blob
+
+
 def _get_encryption_headers(key, source=False):
     """Builds customer encryption key headers
 
@@ -1827,6 +2587,334 @@ def _get_encryption_headers(key, source=False):
     }
 
 
+def _slice_ranges(size, slices):
+    """Split the bytes of a blob into ranges of about the same size.
+
+    :type size: int
+    :param size: The size of the blob.
+
+    :type slices: int
+    :param slices: The number of ranges. Capped at ``size``.
+
+    :rtype: list
+    :returns: The first and last byte of each range.
+    """
+    slices = max(1, min(slices, size))
+    slice_size = -(-size // slices)  # Round up.
+    return [
+        (start, min(start + slice_size, size) - 1)
+        for start in range(0, size, slice_size)]
+
+
+def _wait_for_all(pending):
+    """Wait for futures, cancelling those not started if one fails.
+
+    :type pending: list
+    :param pending: The :class:`concurrent.futures.Future` to wait for.
+
+    :rtype: list
+    :returns: Their results.
+    """
+    try:
+        return [future.result() for future in pending]
+    except Exception:
+        for future in pending:
+            future.cancel()
+        raise
+
+
+def _upload_component(component, filename, start, size, client,
+                      checksum=None):
+    """Upload a slice of a file as a blob.
+
+    Each call reads the file through its own file handle, so this is safe
+    to call from a background thread.
+
+    :type component: :class:`Blob`
+    :param component: The blob to upload.
+
+    :type filename: str
+    :param filename: The path to the file.
+
+    :type start: int
+    :param start: The offset of the slice in the file.
+
+    :type size: int
+    :param size: The size of the slice.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.
+
+    :type checksum: str
+    :param checksum: (Optional) The checksum to verify the upload with.
+    """
+    with open(filename, 'rb') as file_obj:
+        component.upload_from_file(
+            _FileSlice(file_obj, start, size), size=size, client=client,
+            checksum=checksum)
+
+
+class _FileSlice(object):
+    """Read part of a file as if it were the whole file.
+
+    :type file_obj: file
+    :param file_obj: A file open for reading.
+
+    :type start: int
+    :param start: The offset of the part in the file.
+
+    :type size: int
+    :param size: The size of the part.
+    """
+
+    def __init__(self, file_obj, start, size):
+        self._file_obj = file_obj
+        self._start = start
+        self._size = size
+        file_obj.seek(start)
+
+    def tell(self):
+        """Get the position in the part.
+
+        :rtype: int
+        :returns: The position.
+        """
+        return self._file_obj.tell() - self._start
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move to a position in the part.
+
+        :type offset: int
+        :param offset: The position, relative to ``whence``.
+
+        :type whence: int
+        :param whence: One of :data:`os.SEEK_SET`, :data:`os.SEEK_CUR` or
+                       :data:`os.SEEK_END`.
+
+        :rtype: int
+        :returns: The new position.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self.tell()
+        elif whence == os.SEEK_END:
+            offset += self._size
+        self._file_obj.seek(self._start + offset)
+        return offset
+
+    def read(self, size=-1):
+        """Read bytes up to the end of the part.
+
+        :type size: int
+        :param size: (Optional) The most bytes to read. By default, reads to
+                     the end of the part.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        remaining = max(self._size - self.tell(), 0)
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        return self._file_obj.read(size)
+
+
+class _Crc32cWriter(object):
+    """Write to a file, keeping the CRC32C checksum of the written bytes.
+
+    :type file_obj: file
+    :param file_obj: The file to write to.
+    """
+
+    def __init__(self, file_obj):
+        self._file_obj = file_obj
+        self.crc32c = 0
+
+    def write(self, data):
+        """Write bytes to the file.
+
+        :type data: bytes
+        :param data: The bytes to write.
+        """
+        self._file_obj.write(data)
+        self.crc32c = _crc32c_update(self.crc32c, data)
+
+
+class _ChecksumWriter(object):
+    """Write to a file, hashing the written bytes.
+
+    :type file_obj: file
+    :param file_obj: The file to write to.
+
+    :type hash_obj: object
+    :param hash_obj: A :mod:`hashlib` hash, or a :class:`_Crc32cHash`.
+    """
+
+    def __init__(self, file_obj, hash_obj):
+        self._file_obj = file_obj
+        self._hash_obj = hash_obj
+
+    def write(self, data):
+        """Write bytes to the file.
+
+        :type data: bytes
+        :param data: The bytes to write.
+        """
+        self._file_obj.write(data)
+        self._hash_obj.update(data)
+
+
+class _ChecksumReader(object):
+    """Read from a stream, hashing each byte the first time it is read.
+
+    Resumable uploads seek back in the stream to resend the bytes the
+    server did not receive; those bytes are not hashed again.
+
+    :type stream: IO[bytes]
+    :param stream: A bytes IO object open for reading.
+
+    :type hash_obj: object
+    :param hash_obj: A :mod:`hashlib` hash, or a :class:`_Crc32cHash`.
+    """
+
+    def __init__(self, stream, hash_obj):
+        self._stream = stream
+        self._hash_obj = hash_obj
+        self._hashed_to = stream.tell()
+
+    def tell(self):
+        """Get the position in the stream.
+
+        :rtype: int
+        :returns: The position.
+        """
+        return self._stream.tell()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move to a position in the stream.
+
+        :type offset: int
+        :param offset: The position, relative to ``whence``.
+
+        :type whence: int
+        :param whence: One of :data:`os.SEEK_SET`, :data:`os.SEEK_CUR` or
+                       :data:`os.SEEK_END`.
+
+        :rtype: int
+        :returns: The new position.
+        """
+        return self._stream.seek(offset, whence)
+
+    def read(self, size=-1):
+        """Read bytes, hashing those not read before.
+
+        :type size: int
+        :param size: (Optional) The most bytes to read. By default, reads to
+                     the end of the stream.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        start = self._stream.tell()
+        data = self._stream.read(size)
+        end = start + len(data)
+        if self._hash_obj is not None and start <= self._hashed_to < end:
+            if start == self._hashed_to:
+                self._hash_obj.update(data)
+            else:
+                self._hash_obj.update(
+                    memoryview(data)[self._hashed_to - start:])
+            self._hashed_to = end
+        elif start > self._hashed_to:
+            # Bytes were skipped, so the checksum cannot be computed.
+            self._hash_obj = None
+        return data
+
+    def base64_digest(self):
+        """Get the checksum of the bytes read so far.
+
+        :rtype: str
+        :returns: The base64 checksum, or :data:`None` if bytes of the
+                  stream were skipped.
+        """
+        if self._hash_obj is None:
+            return None
+        return _base64_digest(self._hash_obj)
+
+
+def _make_checksum_object(checksum):
+    """Make an object to compute a checksum with.
+
+    :type checksum: str
+    :param checksum: The checksum type: ``'md5'``, ``'crc32c'`` or
+                     :data:`None`.
+
+    :rtype: object
+    :returns: A :mod:`hashlib` hash, a :class:`_Crc32cHash`, or
+              :data:`None` if ``checksum`` is :data:`None`.
+    :raises: :class:`ValueError` if ``checksum`` is not a known type.
+    """
+    if checksum is None:
+        return None
+    if checksum == 'md5':
+        return hashlib.md5()
+    if checksum == 'crc32c':
+        return _Crc32cHash()
+    raise ValueError(
+        'Unknown checksum type {!r}; expected "md5" or "crc32c".'.format(
+            checksum))
+
+
+def _base64_digest(hash_obj):
+    """Encode a checksum the way the API does.
+
+    :type hash_obj: object
+    :param hash_obj: A :mod:`hashlib` hash, or a :class:`_Crc32cHash`.
+
+    :rtype: str
+    :returns: The base64 encoding of the digest.
+    """
+    return base64.b64encode(hash_obj.digest()).decode('ascii')
+
+
+def _verify_download_checksum(response, download_url, checksum, hash_obj):
+    """Compare the checksum of downloaded bytes with the server's.
+
+    The checksum is skipped if the response has no checksum of the type,
+    as for the MD5 hash of composite objects, or if the object was served
+    decompressed, since the server's checksum is of the stored bytes.
+
+    :type response: :class:`~requests.Response`
+    :param response: The (last) response of the download.
+
+    :type download_url: str
+    :param download_url: The URL where the media was accessed.
+
+    :type checksum: str
+    :param checksum: The checksum type: ``'md5'`` or ``'crc32c'``.
+
+    :type hash_obj: object
+    :param hash_obj: The hash of the downloaded bytes.
+
+    :raises: :class:`google.resumable_media.DataCorruption` if the
+             checksums do not match.
+    """
+    headers = response.headers
+    if headers.get('content-encoding', '').lower() == 'gzip':
+        return
+    expected = None
+    for value in headers.get(_HASH_HEADER, '').split(','):
+        name, _, digest = value.strip().partition('=')
+        if name == checksum:
+            expected = digest
+    if expected is None:
+        return
+
+    actual = _base64_digest(hash_obj)
+    if actual != expected:
+        raise resumable_media.DataCorruption(
+            response, _DOWNLOAD_CHECKSUM_MISMATCH.format(
+                download_url, checksum, actual, expected))
+
+
 def _quote(value):
     """URL-quote a string.
 
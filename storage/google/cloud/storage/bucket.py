@@ -17,28 +17,59 @@
 import base64
 import copy
 import datetime
+import functools
 import json
+import threading
 
+from concurrent import futures
 import six
+from six.moves import queue
 
 from google.api_core import page_iterator
 from google.cloud._helpers import _datetime_to_rfc3339
 from google.cloud._helpers import _NOW
 from google.cloud._helpers import _rfc3339_to_datetime
+from google.cloud.exceptions import GoogleCloudError
 from google.cloud.exceptions import NotFound
 from google.cloud.iam import Policy
 from google.cloud.storage import _signing
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._helpers import _validate_name
+from google.cloud.storage.acl import _ACLEntity
 from google.cloud.storage.acl import BucketACL
 from google.cloud.storage.acl import DefaultObjectACL
 from google.cloud.storage.blob import Blob
+from google.cloud.storage.blob import BlobListItem
 from google.cloud.storage.blob import _get_encryption_headers
+from google.cloud.storage.batch import _send_in_batches
+from google.cloud.storage.batch import _SubResponse
 from google.cloud.storage.notification import BucketNotification
 from google.cloud.storage.notification import NONE_PAYLOAD_FORMAT
 
 
+_DEFAULT_LIST_WORKERS = 8
+"""The number of ranges listed concurrently by default."""
+
+_SHARDS_PER_WORKER = 4
+"""The most ranges per worker made from discovered split points."""
+
+_DISCOVERY_PAGES = 1
+"""The pages of each delimiter listing read to discover split points."""
+
+_DISCOVERY_DEPTH = 3
+"""The most levels of prefixes listed to discover split points."""
+
+_SHARD_QUEUE_PAGES = 4
+"""The most pages of a range listed ahead of the consumer."""
+
+_SHARD_QUEUE_TIMEOUT = 0.5
+"""Seconds between checks that the consumer still wants more pages."""
+
+_SHARD_DONE = object()
+"""Marks the end of the pages of a range."""
+
+
 def _blobs_page_start(iterator, page, response):
     """Grab prefixes after a :class:`~google.cloud.iterator.Page` started.
 
@@ -78,6 +109,173 @@ def _item_to_blob(iterator, item):
     return blob
 
 
+def _item_to_blob_list_item(iterator, item):
+    """Convert a JSON blob to a lightweight listed item.
+
+    .. note::
+
+        This assumes that the ``bucket`` attribute has been
+        added to the iterator after being created.
+
+    :type iterator: :class:`~google.api_core.page_iterator.Iterator`
+    :param iterator: The iterator that has retrieved the item.
+
+    :type item: dict
+    :param item: An item to be converted.
+
+    :rtype: :class:`~google.cloud.storage.blob.BlobListItem`
+    :returns: The next item in the page.
+    """
+    return BlobListItem(iterator.bucket, item)
+
+
+def _iterate_shards(shards, ordered, max_workers):
+    """Iterate over the items of several listings run concurrently.
+
+    Each worker lists a few pages ahead of the consumer, then waits. When
+    the consumer stops iterating, the workers stop after their current
+    page.
+
+    :type shards: list of callable
+    :param shards: Each returns an iterator of pages for one listing.
+
+    :type ordered: bool
+    :param ordered: Whether to return all the items of each listing, in
+                    the order of ``shards``. Otherwise, each page is
+                    returned as soon as it is received.
+
+    :type max_workers: int
+    :param max_workers: The number of listings run concurrently.
+
+    :rtype: iterator
+    :returns: The items of all the pages of the listings.
+    """
+    stop = threading.Event()
+    if ordered:
+        queues = [queue.Queue(_SHARD_QUEUE_PAGES) for _ in shards]
+    else:
+        queues = [queue.Queue(_SHARD_QUEUE_PAGES * max_workers)] * len(shards)
+
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending = [
+        executor.submit(_list_shard, shard, shard_queue, stop)
+        for shard, shard_queue in zip(shards, queues)]
+    try:
+        if ordered:
+            for shard_queue in queues:
+                for item in _drain_shards(shard_queue, 1):
+                    yield item
+        else:
+            for item in _drain_shards(queues[0], len(shards)):
+                yield item
+    finally:
+        stop.set()
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _list_shard(shard, shard_queue, stop):
+    """Put the pages of one listing on a queue, as lists of items.
+
+    Any error is put on the queue in place of the next page.
+
+    :type shard: callable
+    :param shard: Returns an iterator of pages for the listing.
+
+    :type shard_queue: :class:`~six.moves.queue.Queue`
+    :param shard_queue: The queue to put the pages on.
+
+    :type stop: :class:`threading.Event`
+    :param stop: Set when no more pages are wanted.
+    """
+    try:
+        for page in shard():
+            if not _put_page(shard_queue, list(page), stop):
+                return
+    except Exception as exc:  # pylint: disable=broad-except
+        _put_page(shard_queue, exc, stop)
+    else:
+        _put_page(shard_queue, _SHARD_DONE, stop)
+
+
+def _put_page(shard_queue, page, stop):
+    """Put a page on a queue, unless no more pages are wanted.
+
+    :type shard_queue: :class:`~six.moves.queue.Queue`
+    :param shard_queue: The queue to put the page on.
+
+    :type page: object
+    :param page: The page to put.
+
+    :type stop: :class:`threading.Event`
+    :param stop: Set when no more pages are wanted.
+
+    :rtype: bool
+    :returns: Whether the page was put on the queue.
+    """
+    while not stop.is_set():
+        try:
+            shard_queue.put(page, timeout=_SHARD_QUEUE_TIMEOUT)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _drain_shards(shard_queue, num_shards):
+    """Iterate over the items put on a queue, until each listing is done.
+
+    :type shard_queue: :class:`~six.moves.queue.Queue`
+    :param shard_queue: The queue the pages are put on.
+
+    :type num_shards: int
+    :param num_shards: The number of listings putting pages on the queue.
+
+    :rtype: iterator
+    :returns: The items of the pages.
+    :raises: The first error of a listing.
+    """
+    while num_shards:
+        page = shard_queue.get()
+        if page is _SHARD_DONE:
+            num_shards -= 1
+        elif isinstance(page, Exception):
+            raise page
+        else:
+            for item in page:
+                yield item
+
+
+def _report_blob_errors(blobs, errors, on_error):
+    """Report the errors of a bulk operation on blobs.
+
+    :type blobs: list
+    :param blobs: The blobs (or blob names) of the operation.
+
+    :type errors: list
+    :param errors: For each blob, the exception its request failed with, or
+                   ``None`` if it succeeded.
+
+    :type on_error: callable
+    :param on_error: (Optional) Called with each blob whose request raised
+                     :class:`~google.cloud.exceptions.NotFound`.
+
+    :raises: The first error not passed to ``on_error``.
+    """
+    unhandled = None
+    for blob, error in zip(blobs, errors):
+        if error is None:
+            continue
+        if on_error is not None and isinstance(error, NotFound):
+            on_error(blob)
+        elif unhandled is None:
+            unhandled = error
+
+    if unhandled is not None:
+        raise unhandled
+
+
 def _item_to_notification(iterator, item):
     """Convert a JSON blob to the native object.
 
@@ -411,7 +609,8 @@ class Bucket(_PropertyMixin):
 
     def list_blobs(self, max_results=None, page_token=None, prefix=None,
                    delimiter=None, versions=None,
-                   projection='noAcl', fields=None, client=None):
+                   projection='noAcl', fields=None, client=None,
+                   start_offset=None, end_offset=None, lightweight=False):
         """Return an iterator used to find blobs in the bucket.
 
         If :attr:`user_project` is set, bills the API request to that project.
@@ -451,8 +650,24 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type start_offset: str
+        :param start_offset: (Optional) Only blobs whose names are
+                             lexicographically equal to or after this are
+                             returned.
+
+        :type end_offset: str
+        :param end_offset: (Optional) Only blobs whose names are
+                           lexicographically before this are returned.
+
+        :type lightweight: bool
+        :param lightweight: (Optional) If true, returns
+                            :class:`~google.cloud.storage.blob.BlobListItem`
+                            objects, which are cheaper to make and keep than
+                            blobs. Defaults to false.
+
         :rtype: :class:`~google.api_core.page_iterator.Iterator`
         :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
+                  (or :class:`~google.cloud.storage.blob.BlobListItem`)
                   in this bucket matching the arguments.
         """
         extra_params = {'projection': projection}
@@ -460,6 +675,12 @@ class Bucket(_PropertyMixin):
         if prefix is not None:
             extra_params['prefix'] = prefix
 
+        if start_offset is not None:
+            extra_params['startOffset'] = start_offset
+
+        if end_offset is not None:
+            extra_params['endOffset'] = end_offset
+
         if delimiter is not None:
             extra_params['delimiter'] = delimiter
 
@@ -472,13 +693,18 @@ class Bucket(_PropertyMixin):
         if self.user_project is not None:
             extra_params['userProject'] = self.user_project
 
+        if lightweight:
+            item_to_value = _item_to_blob_list_item
+        else:
+            item_to_value = _item_to_blob
+
         client = self._require_client(client)
         path = self.path + '/o'
         iterator = page_iterator.HTTPIterator(
             client=client,
             api_request=client._connection.api_request,
             path=path,
-            item_to_value=_item_to_blob,
+            item_to_value=item_to_value,
             page_token=page_token,
             max_results=max_results,
             extra_params=extra_params,
@@ -487,6 +713,168 @@ class Bucket(_PropertyMixin):
         iterator.prefixes = set()
         return iterator
 
+    def list_blobs_parallel(self, prefix=None, split_points=None,
+                            delimiter='/', ordered=True, max_workers=None,
+                            versions=None, projection='noAcl', fields=None,
+                            client=None, lightweight=False):
+        """Iterate over the blobs in the bucket, listing ranges concurrently.
+
+        The names are split into lexicographic ranges at ``split_points``,
+        and each range is listed page after page by its own worker. Unless
+        ``split_points`` are passed, they are the prefixes found by listing
+        ``prefix`` with ``delimiter``: with the default delimiter, each
+        top-level "directory" is listed separately. If there are fewer
+        prefixes than workers, the prefixes within them are listed too, a
+        few levels deep. Only the first page of each of these listings is
+        read, so a bucket without prefixes is listed as a single range.
+
+        If :attr:`user_project` is set, bills the API requests to that
+        project.
+
+        :type prefix: str
+        :param prefix: (Optional) prefix used to filter blobs.
+
+        :type split_points: list of str
+        :param split_points: (Optional) The blob names at which to split the
+                             listing. Each range starts at a split point,
+                             and stops before the next one.
+
+        :type delimiter: str
+        :param delimiter: (Optional) Delimiter used to discover the split
+                          points, if ``split_points`` is not passed.
+                          Defaults to ``'/'``.
+
+        :type ordered: bool
+        :param ordered: (Optional) If true (the default), blobs are returned
+                        in name order, like :meth:`list_blobs`. If false,
+                        each page is returned as soon as it is received.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of ranges listed
+                            concurrently. Defaults to 8.
+
+        :type versions: bool
+        :param versions: (Optional) Whether object versions should be returned
+                         as separate blobs.
+
+        :type projection: str
+        :param projection: (Optional) If used, must be 'full' or 'noAcl'.
+                           Defaults to ``'noAcl'``. Specifies the set of
+                           properties to return.
+
+        :type fields: str
+        :param fields: (Optional) The blob properties to request, which must
+                       include ``name``, e.g. ``'name,size'``. Other
+                       properties of the blobs are left unset.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type lightweight: bool
+        :param lightweight: (Optional) If true, returns
+                            :class:`~google.cloud.storage.blob.BlobListItem`
+                            objects, which are cheaper to make and keep than
+                            blobs. Defaults to false.
+
+        :rtype: iterator
+        :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
+                  (or :class:`~google.cloud.storage.blob.BlobListItem`)
+                  in this bucket matching the arguments.
+        """
+        client = self._require_client(client)
+        if max_workers is None:
+            max_workers = _DEFAULT_LIST_WORKERS
+
+        if split_points is None:
+            split_points = self._discover_split_points(
+                prefix, delimiter, max_workers, client)
+        bounds = [None] + sorted(set(split_points)) + [None]
+
+        if fields is not None:
+            fields = 'items({}),nextPageToken'.format(fields)
+
+        def list_range(start_offset, end_offset):
+            return self.list_blobs(
+                prefix=prefix, versions=versions, projection=projection,
+                fields=fields, client=client, start_offset=start_offset,
+                end_offset=end_offset, lightweight=lightweight).pages
+
+        shards = [
+            functools.partial(list_range, start_offset, end_offset)
+            for start_offset, end_offset in zip(bounds[:-1], bounds[1:])]
+        return _iterate_shards(shards, ordered, max_workers)
+
+    def _discover_split_points(self, prefix, delimiter, max_workers, client):
+        """Find names to split a listing of the bucket at.
+
+        Lists the prefixes of ``prefix``, then the prefixes within those
+        while there are fewer than ``max_workers``, up to
+        ``_DISCOVERY_DEPTH`` levels. Any names are valid split points, so
+        only the first ``_DISCOVERY_PAGES`` pages of each listing are read.
+
+        :type prefix: str
+        :param prefix: The prefix of the listing.
+
+        :type delimiter: str
+        :param delimiter: The delimiter whose prefixes are the split points.
+
+        :type max_workers: int
+        :param max_workers: The number of ranges listed concurrently. The
+                            listing is split into at most
+                            ``_SHARDS_PER_WORKER`` ranges per worker: if
+                            there are more prefixes, some are merged.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :rtype: list of str
+        :returns: The split points, in order.
+        """
+        found = set()
+        parents = [prefix]
+        for _ in range(_DISCOVERY_DEPTH):
+            children = []
+            for parent in parents:
+                children.extend(
+                    self._list_prefixes(parent, delimiter, client))
+            found.update(children)
+            if not children or len(found) >= max_workers:
+                break
+            parents = children
+
+        prefixes = sorted(found)
+        max_shards = max_workers * _SHARDS_PER_WORKER
+        if len(prefixes) < max_shards:
+            return prefixes
+        return [
+            prefixes[index * len(prefixes) // max_shards]
+            for index in range(1, max_shards)]
+
+    def _list_prefixes(self, prefix, delimiter, client):
+        """List the first prefixes directly within a prefix.
+
+        :type prefix: str
+        :param prefix: The prefix to list.
+
+        :type delimiter: str
+        :param delimiter: The delimiter ending the prefixes.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :rtype: list of str
+        :returns: The sorted prefixes in the first ``_DISCOVERY_PAGES``
+                  pages of the listing.
+        """
+        iterator = self.list_blobs(
+            prefix=prefix, delimiter=delimiter,
+            fields='prefixes,nextPageToken', client=client)
+        for _, _page in six.moves.zip(
+                range(_DISCOVERY_PAGES), iterator.pages):
+            pass
+        return sorted(iterator.prefixes)
+
     def list_notifications(self, client=None):
         """List Pub / Sub notifications for this bucket.
 
@@ -622,10 +1010,12 @@ class Bucket(_PropertyMixin):
             query_params=query_params,
             _target_object=None)
 
-    def delete_blobs(self, blobs, on_error=None, client=None):
+    def delete_blobs(self, blobs, on_error=None, client=None,
+                     max_workers=None):
         """Deletes a list of blobs from the current bucket.
 
-        Uses :meth:`delete_blob` to delete each individual blob.
+        The deletes are sent in batches of up to 100 requests, several
+        batches at a time.
 
         If :attr:`user_project` is set, bills the API request to that project.
 
@@ -643,20 +1033,239 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type max_workers: int
+        :param max_workers: (Optional) The number of batches to send
+                            concurrently.
+
+        :raises: :class:`~google.cloud.exceptions.NotFound` (if
+                 `on_error` is not passed), or the first other error a
+                 delete failed with, once all the deletes have been sent.
+        """
+        client = self._require_client(client)
+        blobs = list(blobs)
+
+        def send(blob):
+            blob_name = blob
+            if not isinstance(blob_name, six.string_types):
+                blob_name = blob.name
+            self.delete_blob(blob_name, client=client)
+
+        errors = _send_in_batches(client, blobs, send, max_workers)
+        _report_blob_errors(blobs, errors, on_error)
+
+    def make_blobs_public(self, blobs, on_error=None, client=None,
+                          max_workers=None):
+        """Give all users read access to each of a list of blobs.
+
+        Unlike :meth:`~google.cloud.storage.blob.Blob.make_public`, this
+        does not load the ACL of each blob: it adds the ``allUsers`` entry
+        directly, in batches of up to 100 requests, several batches at a
+        time. The ACL of each blob is reset, and is loaded again when next
+        accessed.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type blobs: list
+        :param blobs: A list of :class:`~google.cloud.storage.blob.Blob`-s.
+
+        :type on_error: callable
+        :param on_error: (Optional) Takes single argument: ``blob``. Called
+                         called once for each blob raising
+                         :class:`~google.cloud.exceptions.NotFound`;
+                         otherwise, the exception is propagated.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of batches to send
+                            concurrently.
+
+        :raises: :class:`~google.cloud.exceptions.NotFound` (if
+                 `on_error` is not passed), or the first other error a
+                 request failed with, once all the requests have been sent.
+        """
+        client = self._require_client(client)
+        blobs = list(blobs)
+        query_params = {}
+
+        if self.user_project is not None:
+            query_params['userProject'] = self.user_project
+
+        def send(blob):
+            blob.acl.reset()
+            client._connection.api_request(
+                method='POST',
+                path=blob.path + '/acl',
+                data={
+                    'entity': 'allUsers',
+                    'role': _ACLEntity.READER_ROLE,
+                },
+                query_params=query_params,
+                _target_object=None)
+
+        errors = _send_in_batches(client, blobs, send, max_workers)
+        _report_blob_errors(blobs, errors, on_error)
+
+    def make_blobs_private(self, blobs, on_error=None, client=None,
+                           max_workers=None):
+        """Remove the read access of all users to each of a list of blobs.
+
+        Unlike :meth:`~google.cloud.storage.blob.Blob.make_private`, this
+        does not load the ACL of each blob: it deletes the ``allUsers``
+        entry directly, in batches of up to 100 requests, several batches
+        at a time. The ACL of each blob is reset, and is loaded again when
+        next accessed.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type blobs: list
+        :param blobs: A list of :class:`~google.cloud.storage.blob.Blob`-s.
+
+        :type on_error: callable
+        :param on_error: (Optional) Takes single argument: ``blob``. Called
+                         called once for each blob raising
+                         :class:`~google.cloud.exceptions.NotFound`, which
+                         includes the blobs which are not public; otherwise,
+                         the exception is propagated.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of batches to send
+                            concurrently.
+
         :raises: :class:`~google.cloud.exceptions.NotFound` (if
-                 `on_error` is not passed).
+                 `on_error` is not passed), or the first other error a
+                 request failed with, once all the requests have been sent.
         """
-        for blob in blobs:
+        client = self._require_client(client)
+        blobs = list(blobs)
+        query_params = {}
+
+        if self.user_project is not None:
+            query_params['userProject'] = self.user_project
+
+        def send(blob):
+            blob.acl.reset()
+            client._connection.api_request(
+                method='DELETE',
+                path=blob.path + '/acl/allUsers',
+                query_params=query_params,
+                _target_object=None)
+
+        errors = _send_in_batches(client, blobs, send, max_workers)
+        _report_blob_errors(blobs, errors, on_error)
+
+    def update_blobs_storage_class(self, blobs, new_class, on_error=None,
+                                   client=None, max_workers=None):
+        """Update the storage class of each of a list of blobs.
+
+        The first rewrite call of each blob is sent in batches of up to 100
+        requests, several batches at a time. Rewrites which are not complete
+        after one call are then continued one blob at a time.
+
+        See
+        https://cloud.google.com/storage/docs/per-object-storage-class
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type blobs: list
+        :param blobs: A list of :class:`~google.cloud.storage.blob.Blob`-s.
+
+        :type new_class: str
+        :param new_class: new storage class for the objects
+
+        :type on_error: callable
+        :param on_error: (Optional) Takes single argument: ``blob``. Called
+                         called once for each blob raising
+                         :class:`~google.cloud.exceptions.NotFound`;
+                         otherwise, the exception is propagated.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of batches to send
+                            concurrently.
+
+        :raises: :exc:`ValueError` if ``new_class`` is invalid;
+                 :class:`~google.cloud.exceptions.NotFound` (if
+                 `on_error` is not passed), or the first other error a
+                 rewrite failed with, once all the rewrites have been sent.
+        """
+        if new_class not in Blob._STORAGE_CLASSES:
+            raise ValueError("Invalid storage class: %s" % (new_class,))
+
+        client = self._require_client(client)
+        blobs = list(blobs)
+        responses = [_SubResponse() for _ in blobs]
+
+        def send(index):
+            response = responses[index]
+            response._properties = client._connection.api_request(
+                _target_object=response,
+                **blobs[index]._storage_class_rewrite(new_class))
+
+        errors = _send_in_batches(client, range(len(blobs)), send, max_workers)
+        for index, blob in enumerate(blobs):
+            if errors[index] is not None:
+                continue
             try:
-                blob_name = blob
-                if not isinstance(blob_name, six.string_types):
-                    blob_name = blob.name
-                self.delete_blob(blob_name, client=client)
-            except NotFound:
-                if on_error is not None:
-                    on_error(blob)
-                else:
-                    raise
+                blob._finish_storage_class_rewrite(
+                    new_class, responses[index]._properties, client)
+            except GoogleCloudError as exc:
+                errors[index] = exc
+        _report_blob_errors(blobs, errors, on_error)
+
+    def patch_blobs(self, blobs, on_error=None, client=None,
+                    max_workers=None):
+        """Send the changed properties of each of a list of blobs.
+
+        Like :meth:`~google.cloud.storage.blob.Blob.patch` on each blob, but
+        the PATCH requests are sent in batches of up to 100 requests,
+        several batches at a time. The properties of the blobs whose request
+        failed are left unchanged.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type blobs: list
+        :param blobs: A list of :class:`~google.cloud.storage.blob.Blob`-s.
+
+        :type on_error: callable
+        :param on_error: (Optional) Takes single argument: ``blob``. Called
+                         called once for each blob raising
+                         :class:`~google.cloud.exceptions.NotFound`;
+                         otherwise, the exception is propagated.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of batches to send
+                            concurrently.
+
+        :raises: :class:`~google.cloud.exceptions.NotFound` (if
+                 `on_error` is not passed), or the first other error a
+                 patch failed with, once all the patches have been sent.
+        """
+        client = self._require_client(client)
+        blobs = list(blobs)
+        # A failed request in a batch leaves the blob's properties unset.
+        saved = [(blob._properties, blob._changes) for blob in blobs]
+
+        errors = _send_in_batches(
+            client, blobs, lambda blob: blob.patch(client=client),
+            max_workers)
+        for blob, error, (properties, changes) in zip(blobs, errors, saved):
+            if error is not None:
+                blob._properties, blob._changes = properties, changes
+        _report_blob_errors(blobs, errors, on_error)
 
     def copy_blob(self, blob, destination_bucket, new_name=None,
                   client=None, preserve_acl=True, source_generation=None):
@@ -0,0 +1,349 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Size the chunks of resumable uploads from their measured throughput.
+
+A resumable upload holds one chunk in memory at a time, and resends the
+whole chunk when a request fails. With a fixed chunk size, large chunks
+waste memory and retries on slow or flaky links, while small chunks make
+too many requests on fast ones. An :class:`AdaptiveChunkSizer` starts
+small, then sizes each chunk to take about ``target_seconds`` at the
+throughput measured so far, shrinking chunks after errors:
+
+.. literalinclude:: snippets.py
+    :start-after: [START adaptive_chunk_size]
+    :end-before: [END adaptive_chunk_size]
+
+The :class:`UploadStats` of each upload can be logged to tune the default
+chunk sizes used across many machines.
+"""
+
+import time
+
+import requests
+
+
+DEFAULT_INITIAL_CHUNK_SIZE = 8388608  # 1024 * 1024 B * 8 = 8 MB
+"""The size of the first chunk of an upload, before any is measured."""
+
+DEFAULT_MAX_CHUNK_SIZE = 104857600  # 1024 * 1024 B * 100 = 100 MB
+"""The largest chunk, which bounds the memory held by each upload."""
+
+DEFAULT_TARGET_SECONDS = 5.0
+"""How long each chunk should take to send."""
+
+DEFAULT_MAX_CONSECUTIVE_ERRORS = 3
+"""How many dropped connections in a row are recovered from."""
+
+_CHUNK_SIZE_MULTIPLE = 262144  # 256 KB
+"""Every chunk of a resumable upload, but the last, is a multiple of this."""
+
+_SMOOTHING = 0.5
+"""The weight of the latest chunk in the throughput estimate."""
+
+_RECOVERABLE_TYPES = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class UploadStats(object):
+    """Measurements of the chunks sent by one resumable upload.
+
+    Attempts which failed, either with a response which was retried or with
+    a dropped connection, are counted in :attr:`errors`.
+    """
+
+    def __init__(self):
+        self.chunk_sizes = []
+        """The size of each chunk sent, in order."""
+
+        self.chunk_seconds = []
+        """The time taken to send each chunk, including retries."""
+
+        self.attempts = 0
+        """The number of requests sent for chunks."""
+
+        self.errors = 0
+        """The number of requests for chunks which failed."""
+
+    @property
+    def bytes_uploaded(self):
+        """The number of bytes sent in chunks.
+
+        :rtype: int
+        :returns: The sum of the chunk sizes.
+        """
+        return sum(self.chunk_sizes)
+
+    @property
+    def seconds(self):
+        """The time spent sending chunks.
+
+        :rtype: float
+        :returns: The sum of the chunk times, in seconds.
+        """
+        return sum(self.chunk_seconds)
+
+    @property
+    def throughput(self):
+        """The average throughput of the upload.
+
+        :rtype: float
+        :returns: The bytes sent per second, or :data:`None` if no time
+                  was measured.
+        """
+        seconds = self.seconds
+        if not seconds:
+            return None
+        return self.bytes_uploaded / seconds
+
+    @property
+    def error_rate(self):
+        """The fraction of the requests for chunks which failed.
+
+        :rtype: float
+        :returns: The rate, from 0 to 1.
+        """
+        if not self.attempts:
+            return 0.0
+        return float(self.errors) / self.attempts
+
+    def to_dict(self):
+        """Summarize the stats, for instance to log them.
+
+        :rtype: dict
+        :returns: The stats, keyed by name.
+        """
+        return {
+            'chunks': len(self.chunk_sizes),
+            'bytes_uploaded': self.bytes_uploaded,
+            'seconds': self.seconds,
+            'throughput': self.throughput,
+            'attempts': self.attempts,
+            'errors': self.errors,
+            'error_rate': self.error_rate,
+            'min_chunk_size': min(self.chunk_sizes or [0]),
+            'max_chunk_size': max(self.chunk_sizes or [0]),
+        }
+
+
+class AdaptiveChunkSizer(object):
+    """Pick the size of each chunk of resumable uploads.
+
+    After each chunk, the next one is sized to take ``target_seconds`` at
+    the measured throughput, scaled down by the error rate of the upload,
+    and is at most twice the size of the last. A chunk which needed
+    retries halves the size of the next. Sizes are multiples of 256 KB,
+    from ``min_size`` to ``max_size``.
+
+    Pass the sizer to
+    :meth:`~google.cloud.storage.blob.Blob.upload_from_file` or
+    :meth:`~google.cloud.storage.blob.Blob.upload_from_filename`. A sizer
+    can be reused for uploads one after the other, which start from the
+    chunk size it last picked; :attr:`stats` describes the latest upload.
+    It must not be shared by concurrent uploads.
+
+    :type initial_size: int
+    :param initial_size: (Optional) The size of the first chunk. Defaults
+                         to :data:`DEFAULT_INITIAL_CHUNK_SIZE`.
+
+    :type min_size: int
+    :param min_size: (Optional) The smallest chunk. Defaults to 256 KB.
+
+    :type max_size: int
+    :param max_size: (Optional) The largest chunk. Defaults to
+                     :data:`DEFAULT_MAX_CHUNK_SIZE`.
+
+    :type target_seconds: float
+    :param target_seconds: (Optional) How long each chunk should take to
+                           send. Defaults to :data:`DEFAULT_TARGET_SECONDS`.
+
+    :type max_consecutive_errors: int
+    :param max_consecutive_errors: (Optional) How many dropped connections
+                                   in a row the upload recovers from, by
+                                   resending a smaller chunk, before it
+                                   fails. Defaults to
+                                   :data:`DEFAULT_MAX_CONSECUTIVE_ERRORS`.
+
+    :raises: :class:`ValueError` if a size is not a multiple of 256 KB, or
+             the sizes are not in order.
+    """
+
+    def __init__(self, initial_size=DEFAULT_INITIAL_CHUNK_SIZE,
+                 min_size=_CHUNK_SIZE_MULTIPLE,
+                 max_size=DEFAULT_MAX_CHUNK_SIZE,
+                 target_seconds=DEFAULT_TARGET_SECONDS,
+                 max_consecutive_errors=DEFAULT_MAX_CONSECUTIVE_ERRORS):
+        for size in (initial_size, min_size, max_size):
+            if size <= 0 or size % _CHUNK_SIZE_MULTIPLE:
+                raise ValueError(
+                    'Chunk sizes must be positive multiples of {:d}.'.format(
+                        _CHUNK_SIZE_MULTIPLE))
+        if not min_size <= initial_size <= max_size:
+            raise ValueError(
+                'Chunk sizes must satisfy min_size <= initial_size <= '
+                'max_size.')
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_seconds = target_seconds
+        self.max_consecutive_errors = max_consecutive_errors
+        self.chunk_size = initial_size
+        self.stats = UploadStats()
+        self._throughput = None
+
+    def start(self):
+        """Start measuring a new upload.
+
+        :rtype: int
+        :returns: The size of its first chunk.
+        """
+        self.stats = UploadStats()
+        return self.chunk_size
+
+    def record_chunk(self, size, seconds, attempts=1):
+        """Record a chunk which was sent, and size the next one.
+
+        :type size: int
+        :param size: The size of the chunk.
+
+        :type seconds: float
+        :param seconds: The time taken to send it.
+
+        :type attempts: int
+        :param attempts: (Optional) The number of requests sent for it,
+                         which is more than one if it was retried.
+
+        :rtype: int
+        :returns: The size of the next chunk.
+        """
+        self.stats.chunk_sizes.append(size)
+        self.stats.chunk_seconds.append(seconds)
+        self.stats.attempts += attempts
+        self.stats.errors += attempts - 1
+
+        if attempts > 1:
+            return self._resize(self.chunk_size // 2)
+
+        if seconds > 0:
+            sample = size / float(seconds)
+            if self._throughput is None:
+                self._throughput = sample
+            else:
+                self._throughput += _SMOOTHING * (sample - self._throughput)
+        if self._throughput is None:
+            return self.chunk_size
+
+        target = self._throughput * self.target_seconds
+        target *= 1.0 - self.stats.error_rate
+        return self._resize(min(target, 2 * self.chunk_size))
+
+    def record_failure(self, attempts=1):
+        """Record a chunk which could not be sent, and shrink the next one.
+
+        :type attempts: int
+        :param attempts: (Optional) The number of requests sent for it.
+
+        :rtype: int
+        :returns: The size of the next chunk.
+        """
+        self.stats.attempts += attempts
+        self.stats.errors += attempts
+        return self._resize(self.chunk_size // 2)
+
+    def _resize(self, size):
+        """Round a chunk size to a multiple of 256 KB within the bounds.
+
+        :type size: float
+        :param size: The wanted size.
+
+        :rtype: int
+        :returns: The new :attr:`chunk_size`.
+        """
+        size = int(size) // _CHUNK_SIZE_MULTIPLE * _CHUNK_SIZE_MULTIPLE
+        self.chunk_size = max(self.min_size, min(self.max_size, size))
+        return self.chunk_size
+
+
+class _CountingTransport(object):
+    """Count the requests made through a transport.
+
+    :type transport:
+        :class:`~google.auth.transport.requests.AuthorizedSession`
+    :param transport: The transport to make the requests.
+    """
+
+    def __init__(self, transport):
+        self._transport = transport
+        self.requests = 0
+
+    def request(self, *args, **kwargs):
+        """Make a request.
+
+        :rtype: :class:`~requests.Response`
+        :returns: The response.
+        """
+        self.requests += 1
+        return self._transport.request(*args, **kwargs)
+
+
+def _transmit_chunks(upload, transport, sizer):
+    """Send the chunks of an initiated upload, sized by a sizer.
+
+    Dropped connections are recovered from, up to the sizer's
+    ``max_consecutive_errors`` in a row.
+
+    :type upload: :class:`~google.resumable_media.requests.ResumableUpload`
+    :param upload: The initiated upload.
+
+    :type transport:
+        :class:`~google.auth.transport.requests.AuthorizedSession`
+    :param transport: The transport to make the requests.
+
+    :type sizer: :class:`AdaptiveChunkSizer`
+    :param sizer: The sizer to pick the size of each chunk.
+
+    :rtype: :class:`~requests.Response`
+    :returns: The response to the final chunk.
+    """
+    counter = _CountingTransport(transport)
+    consecutive_errors = 0
+    response = None
+    while not upload.finished:
+        # ``ResumableUpload`` reads ``_chunk_size`` for each chunk, and has
+        # no public way to change it.
+        upload._chunk_size = sizer.chunk_size
+        bytes_before = upload.bytes_uploaded
+        requests_before = counter.requests
+        started = time.time()
+        try:
+            response = upload.transmit_next_chunk(counter)
+        except _RECOVERABLE_TYPES:
+            sizer.record_failure(
+                max(counter.requests - requests_before, 1))
+            consecutive_errors += 1
+            if consecutive_errors > sizer.max_consecutive_errors:
+                raise
+            # A dropped connection leaves the upload valid, but only an
+            # invalid upload asks the server how many bytes it received.
+            upload._make_invalid()
+            upload.recover(transport)
+            continue
+
+        consecutive_errors = 0
+        sizer.record_chunk(
+            upload.bytes_uploaded - bytes_before, time.time() - started,
+            counter.requests - requests_before)
+    return response
@@ -0,0 +1,505 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File-like objects to stream the contents of blobs.
+
+These are usually created with :meth:`~google.cloud.storage.blob.Blob.open`
+rather than directly:
+
+.. literalinclude:: snippets.py
+    :start-after: [START blob_open]
+    :end-before: [END blob_open]
+
+A :class:`BlobReader` downloads the byte ranges which are read, as they
+are read, so that only part of a large blob needs to be fetched. A
+:class:`BlobWriter` sends what is written through a resumable upload, one
+chunk at a time, so that it never holds much more than one chunk.
+"""
+
+import io
+
+from google import resumable_media
+from google.cloud.exceptions import RequestRangeNotSatisfiable
+
+
+DEFAULT_CHUNK_SIZE = 41943040  # 1024 * 1024 B * 40 = 40 MB
+"""The chunk size when neither the caller nor the blob sets one."""
+
+_CHUNK_SIZE_MULTIPLE = 262144  # 256 KB
+"""Every chunk of a resumable upload, but the last, is a multiple of this."""
+
+_CLOSED_MESSAGE = 'I/O operation on closed file.'
+
+
+class BlobReader(io.BufferedIOBase):
+    """A file-like object which reads the contents of a blob.
+
+    Each read which goes beyond the buffered data downloads at least
+    ``chunk_size`` bytes, starting from the current position, so that
+    small sequential reads do not each make a request. :meth:`seek` keeps
+    the buffer when the new position is inside it.
+
+    If the generation of the blob is not known, the first download loads
+    the properties of the blob, so that every range is read from the same
+    generation, even if the blob is replaced while it is being read.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to read.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The least number of bytes to download in
+                       each request. Defaults to the ``chunk_size`` of the
+                       blob, else :data:`DEFAULT_CHUNK_SIZE`.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+    """
+
+    def __init__(self, blob, chunk_size=None, client=None):
+        if chunk_size is None:
+            chunk_size = blob.chunk_size or DEFAULT_CHUNK_SIZE
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._client = client
+        self._pos = 0
+        self._buffer = b''
+        self._buffer_start = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        self._check_not_closed()
+        return self._pos
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        """Change the position to read from.
+
+        Seeking relative to the end of the blob loads its properties, if
+        its size is not known yet.
+
+        :type pos: int
+        :param pos: The new position, relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) One of :data:`io.SEEK_SET`,
+                       :data:`io.SEEK_CUR` or :data:`io.SEEK_END`.
+
+        :rtype: int
+        :returns: The new position, from the start of the blob.
+        :raises: :exc:`ValueError` if the new position would be negative.
+        """
+        self._check_not_closed()
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            if self._blob.size is None:
+                self._blob.reload(client=self._client)
+            pos += self._blob.size
+        elif whence != io.SEEK_SET:
+            raise ValueError('Invalid whence: %r' % (whence,))
+
+        if pos < 0:
+            raise ValueError('Negative seek position: %d' % (pos,))
+        self._pos = pos
+        return pos
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes from the current position.
+
+        :type size: int
+        :param size: (Optional) The most bytes to read. If negative or
+                     :data:`None`, reads to the end of the blob.
+
+        :rtype: bytes
+        :returns: The bytes read, which are fewer than ``size`` only at
+                  the end of the blob.
+        """
+        self._check_not_closed()
+        if size is None or size < 0:
+            size = None
+
+        offset = self._pos - self._buffer_start
+        if 0 <= offset < len(self._buffer):
+            result = self._buffer[offset:]
+            if size is not None:
+                result = result[:size]
+        else:
+            result = b''
+
+        missing = None if size is None else size - len(result)
+        if missing is None or missing > 0:
+            start = self._pos + len(result)
+            fetch_size = missing
+            if fetch_size is not None:
+                fetch_size = max(missing, self._chunk_size)
+            fetched = self._download(start, fetch_size)
+            self._buffer, self._buffer_start = fetched, start
+            result += fetched[:missing]
+
+        self._pos += len(result)
+        return result
+
+    read1 = read
+
+    def readinto(self, buffer_):
+        """Read bytes into a writable buffer, such as a ``bytearray``.
+
+        A read at least ``chunk_size`` long, with no buffered data to
+        start from, is downloaded straight into ``buffer_``.
+
+        :type buffer_: bytes-like object
+        :param buffer_: The buffer to fill, from its start.
+
+        :rtype: int
+        :returns: The number of bytes read, which is less than the length
+                  of ``buffer_`` only at the end of the blob.
+        """
+        self._check_not_closed()
+        view = memoryview(buffer_)
+        offset = self._pos - self._buffer_start
+        if (len(view) < self._chunk_size or
+                0 <= offset < len(self._buffer)):
+            data = self.read(len(view))
+            view[:len(data)] = data
+            return len(data)
+
+        writer = _MemoryViewWriter(view)
+        self._download(self._pos, len(view), writer)
+        self._pos += writer.written
+        return writer.written
+
+    readinto1 = readinto
+
+    def close(self):
+        self._buffer = b''
+        super(BlobReader, self).close()
+
+    def _check_not_closed(self):
+        """Raise if the reader is closed.
+
+        :raises: :exc:`ValueError` if the reader is closed.
+        """
+        if self.closed:
+            raise ValueError(_CLOSED_MESSAGE)
+
+    def _download(self, start, size, file_obj=None):
+        """Download a range of the blob.
+
+        :type start: int
+        :param start: The first byte to download.
+
+        :type size: int
+        :param size: The number of bytes to download. If :data:`None`,
+                     downloads to the end of the blob.
+
+        :type file_obj: file
+        :param file_obj: (Optional) A file handle to write the bytes to. If
+                         not passed, the bytes are returned.
+
+        :rtype: bytes
+        :returns: The bytes downloaded, if ``file_obj`` is not passed.
+        """
+        if self._blob.generation is None:
+            # Ranges of a blob without a generation are read from its
+            # latest generation, which may change between requests.
+            self._blob.reload(client=self._client)
+
+        blob_size = self._blob.size
+        if blob_size is not None and start >= blob_size:
+            return b''
+
+        end = None
+        if size is not None:
+            end = start + size - 1
+            if blob_size is not None:
+                end = min(end, blob_size - 1)
+
+        if file_obj is None:
+            file_obj = io.BytesIO()
+            result = file_obj
+        else:
+            result = None
+
+        try:
+            self._blob.download_to_file(
+                file_obj, client=self._client, start=start, end=end)
+        except RequestRangeNotSatisfiable:
+            # The start of the range is past the end of the blob.
+            pass
+
+        if result is not None:
+            return result.getvalue()
+
+
+class BlobWriter(io.BufferedIOBase):
+    """A file-like object which writes the contents of a blob.
+
+    The bytes written are buffered, and sent through a resumable upload
+    whenever at least ``chunk_size`` bytes are waiting. The upload is only
+    started once the first chunk is full, and is finished by :meth:`close`,
+    which sends the rest of the buffer: the blob is not created or replaced
+    until then.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to write.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes sent in each request
+                       of the upload, a multiple of 256 KB. Defaults to the
+                       ``chunk_size`` of the blob, else
+                       :data:`DEFAULT_CHUNK_SIZE`.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type content_type: str
+    :param content_type: (Optional) Type of content being uploaded.
+
+    :type predefined_acl: str
+    :param predefined_acl: (Optional) predefined access control list
+
+    :raises: :exc:`ValueError` if ``chunk_size`` is not a multiple of
+             256 KB.
+    """
+
+    def __init__(self, blob, chunk_size=None, client=None, content_type=None,
+                 predefined_acl=None):
+        if chunk_size is None:
+            chunk_size = blob.chunk_size or DEFAULT_CHUNK_SIZE
+        if chunk_size <= 0 or chunk_size % _CHUNK_SIZE_MULTIPLE != 0:
+            raise ValueError(
+                'Chunk size must be a positive multiple of %d.' % (
+                    _CHUNK_SIZE_MULTIPLE,))
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._client = client
+        self._content_type = content_type
+        self._predefined_acl = predefined_acl
+        self._buffer = _SlidingBuffer()
+        self._upload = None
+        self._transport = None
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._buffer.size
+
+    def write(self, data):
+        """Write bytes to the blob.
+
+        Sends every full chunk which is waiting once ``data`` is buffered.
+
+        :type data: bytes-like object
+        :param data: The bytes to write.
+
+        :rtype: int
+        :returns: The number of bytes written, all of ``data``.
+        :raises: :exc:`ValueError` if the writer is closed.
+        """
+        if self.closed:
+            raise ValueError(_CLOSED_MESSAGE)
+        written = self._buffer.write(data)
+        if self._buffer.unread >= self._chunk_size:
+            self._send_chunks(final=False)
+        return written
+
+    def flush(self):
+        """Do nothing: only full chunks can be sent before :meth:`close`."""
+
+    def close(self):
+        """Send the rest of the buffer and finish the upload.
+
+        The properties of the blob are set from the response.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
+                 if the upload response returns an error status.
+        """
+        if self.closed:
+            return
+        try:
+            self._send_chunks(final=True)
+        finally:
+            self._buffer = None
+            super(BlobWriter, self).close()
+
+    def _send_chunks(self, final):
+        """Send the chunks waiting in the buffer.
+
+        :type final: bool
+        :param final: Whether to send the last, partial chunk, which
+                      finishes the upload.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
+                 if the upload response returns an error status.
+        """
+        # Imported here to avoid a circular import with the blob module.
+        from google.cloud.storage.blob import _raise_from_invalid_response
+
+        try:
+            if self._upload is None:
+                self._upload, self._transport = (
+                    self._blob._initiate_resumable_upload(
+                        self._client, self._buffer, self._content_type,
+                        None, None, predefined_acl=self._predefined_acl,
+                        chunk_size=self._chunk_size))
+
+            while not self._upload.finished and (
+                    final or self._buffer.unread >= self._chunk_size):
+                self._buffer.seek(self._upload.bytes_uploaded)
+                response = self._upload.transmit_next_chunk(self._transport)
+                self._buffer.discard(self._upload.bytes_uploaded)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+
+        if final:
+            self._blob._set_properties(response.json())
+
+
+class _SlidingBuffer(object):
+    """A stream for a resumable upload which only holds unsent bytes.
+
+    Positions are offsets from the start of the upload, as the upload
+    expects, but the bytes before the last :meth:`discard` are dropped, and
+    cannot be read again.
+    """
+
+    def __init__(self):
+        self._data = io.BytesIO()
+        self._start = 0
+        self._length = 0
+
+    @property
+    def size(self):
+        """The number of bytes written, including the discarded ones.
+
+        :rtype: int
+        :returns: The position of the end of the stream.
+        """
+        return self._start + self._length
+
+    @property
+    def unread(self):
+        """The number of bytes after the current position.
+
+        :rtype: int
+        :returns: The number of bytes left to read.
+        """
+        return self.size - self.tell()
+
+    def write(self, data):
+        """Append bytes at the end of the stream.
+
+        The position is not changed.
+
+        :type data: bytes-like object
+        :param data: The bytes to append.
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+        pos = self._data.tell()
+        self._data.seek(0, io.SEEK_END)
+        written = self._data.write(data)
+        self._data.seek(pos)
+        self._length += written
+        return written
+
+    def read(self, size=-1):
+        """Read bytes from the current position.
+
+        :type size: int
+        :param size: (Optional) The most bytes to read. If negative, reads
+                     to the end of the stream.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        return self._data.read(size)
+
+    def tell(self):
+        return self._start + self._data.tell()
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        """Change the current position.
+
+        :type pos: int
+        :param pos: The new position, relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) :data:`io.SEEK_SET` or :data:`io.SEEK_END`.
+
+        :rtype: int
+        :returns: The new position.
+        :raises: :exc:`ValueError` if the new position is before the
+                 discarded bytes.
+        """
+        if whence == io.SEEK_END:
+            pos += self.size
+        if pos < self._start:
+            raise ValueError(
+                'Cannot seek to %d: the bytes before %d were discarded.' % (
+                    pos, self._start))
+        self._data.seek(pos - self._start)
+        return pos
+
+    def discard(self, pos):
+        """Drop the bytes before a position.
+
+        :type pos: int
+        :param pos: The position of the first byte to keep.
+        """
+        offset = min(pos - self._start, self._length)
+        if offset <= 0:
+            return
+        current = self.tell()
+        self._data = io.BytesIO(self._data.getvalue()[offset:])
+        self._start += offset
+        self._length -= offset
+        self.seek(max(current, self._start))
+
+
+class _MemoryViewWriter(object):
+    """Write downloaded bytes into a memoryview, from its start.
+
+    :type view: memoryview
+    :param view: The memory to fill.
+    """
+
+    def __init__(self, view):
+        self._view = view
+        self.written = 0
+
+    def write(self, data):
+        """Copy bytes to the next part of the memoryview.
+
+        :type data: bytes
+        :param data: The bytes to copy.
+
+        :rtype: int
+        :returns: The number of bytes written.
+        :raises: :exc:`ValueError` if ``data`` does not fit.
+        """
+        end = self.written + len(data)
+        if end > len(self._view):
+            raise ValueError('Received more bytes than requested.')
+        self._view[self.written:end] = data
+        self.written = end
+        return len(data)
@@ -0,0 +1,331 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Upload and download many blobs concurrently.
+
+Uploading a directory of small files with
+:meth:`~google.cloud.storage.blob.Blob.upload_from_filename`, one file
+after the other, spends most of its time waiting on each request. The
+functions in this module run the transfers on a bounded pool of workers
+instead, retry each transfer on its own, and report the outcome of every
+transfer rather than stopping at the first failure.
+
+.. literalinclude:: snippets.py
+    :start-after: [START transfer_manager_upload_many]
+    :end-before: [END transfer_manager_upload_many]
+"""
+
+import collections
+import errno
+import os
+
+from concurrent import futures
+import requests
+import requests.adapters
+
+from google.api_core import exceptions
+from google.api_core import retry as retries
+
+
+THREAD = 'thread'
+"""Run the transfers on a pool of threads sharing one client."""
+
+PROCESS = 'process'
+"""Run the transfers on a pool of processes, each with its own client."""
+
+DEFAULT_MAX_WORKERS = 8
+"""The number of concurrent transfers when ``max_workers`` is not passed."""
+
+_RETRYABLE_TYPES = (
+    exceptions.TooManyRequests,
+    exceptions.InternalServerError,
+    exceptions.BadGateway,
+    exceptions.ServiceUnavailable,
+    exceptions.GatewayTimeout,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+_PROCESS_CLIENTS = {}
+"""Clients created by the workers of a process pool, keyed by project."""
+
+TransferResult = collections.namedtuple(
+    'TransferResult', ['filename', 'blob_name', 'error'])
+"""The outcome of one transfer.
+
+``error`` is :data:`None` if the transfer succeeded, else the exception it
+raised once retries were exhausted.
+"""
+
+
+def _should_retry(exc):
+    """Predicate for retrying a transfer.
+
+    Transient server errors and dropped connections are retried.
+
+    :type exc: Exception
+    :param exc: The error raised by the transfer.
+
+    :rtype: bool
+    :returns: Whether to retry the transfer.
+    """
+    return isinstance(exc, _RETRYABLE_TYPES)
+
+
+DEFAULT_RETRY = retries.Retry(predicate=_should_retry)
+"""The default retry object for each transfer.
+
+To disable retries, pass ``retry=None``. To change the retry behavior, call
+a ``with_XXX`` method on ``DEFAULT_RETRY``, e.g. ``with_deadline(300)``.
+"""
+
+
+def upload_many_from_filenames(
+        bucket, file_blob_pairs, max_workers=None, worker_type=THREAD,
+        retry=DEFAULT_RETRY, progress_callback=None):
+    """Upload many files to blobs in a bucket concurrently.
+
+    .. note::
+
+       With ``worker_type=PROCESS``, each worker process creates its own
+       :class:`~google.cloud.storage.client.Client` for the bucket's
+       project, using the default credentials of the environment.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to upload to.
+
+    :type file_blob_pairs: list
+    :param file_blob_pairs: ``(filename, blob_name)`` tuples: the path of
+                            each local file and the name of the blob to
+                            upload it to.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of concurrent uploads.
+                        Defaults to :data:`DEFAULT_MAX_WORKERS`.
+
+    :type worker_type: str
+    :param worker_type: (Optional) :data:`THREAD` (the default) or
+                        :data:`PROCESS`.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) How to retry each upload. Pass :data:`None`
+                  not to retry.
+
+    :type progress_callback: callable
+    :param progress_callback: (Optional) Called with the
+                              :class:`TransferResult` of each upload, in
+                              the calling thread, as each upload finishes.
+
+    :rtype: list
+    :returns: The :class:`TransferResult` of each upload, in the order of
+              ``file_blob_pairs``.
+    :raises: :class:`ValueError` if ``worker_type`` is invalid.
+    """
+    return _transfer_many(
+        _upload_one, bucket, file_blob_pairs, max_workers, worker_type,
+        retry, progress_callback)
+
+
+def download_many_to_filenames(
+        bucket, file_blob_pairs, max_workers=None, worker_type=THREAD,
+        retry=DEFAULT_RETRY, progress_callback=None):
+    """Download many blobs from a bucket to files concurrently.
+
+    Missing parent directories of the files are created.
+
+    .. note::
+
+       With ``worker_type=PROCESS``, each worker process creates its own
+       :class:`~google.cloud.storage.client.Client` for the bucket's
+       project, using the default credentials of the environment.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to download from.
+
+    :type file_blob_pairs: list
+    :param file_blob_pairs: ``(filename, blob_name)`` tuples: the path to
+                            download each blob to and the name of the blob.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of concurrent downloads.
+                        Defaults to :data:`DEFAULT_MAX_WORKERS`.
+
+    :type worker_type: str
+    :param worker_type: (Optional) :data:`THREAD` (the default) or
+                        :data:`PROCESS`.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) How to retry each download. Pass :data:`None`
+                  not to retry.
+
+    :type progress_callback: callable
+    :param progress_callback: (Optional) Called with the
+                              :class:`TransferResult` of each download, in
+                              the calling thread, as each download
+                              finishes.
+
+    :rtype: list
+    :returns: The :class:`TransferResult` of each download, in the order
+              of ``file_blob_pairs``.
+    :raises: :class:`ValueError` if ``worker_type`` is invalid.
+    """
+    return _transfer_many(
+        _download_one, bucket, file_blob_pairs, max_workers, worker_type,
+        retry, progress_callback)
+
+
+def _transfer_many(transfer, bucket, file_blob_pairs, max_workers,
+                   worker_type, retry, progress_callback):
+    """Run a transfer function for many files on a pool of workers.
+
+    :type transfer: callable
+    :param transfer: :func:`_upload_one` or :func:`_download_one`.
+
+    See :func:`upload_many_from_filenames` for the other arguments.
+
+    :rtype: list
+    :returns: The :class:`TransferResult` of each transfer.
+    """
+    if max_workers is None:
+        max_workers = DEFAULT_MAX_WORKERS
+
+    if worker_type == THREAD:
+        client = bucket._require_client(None)
+        _ensure_pool_size(client._http, max_workers)
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        # Threads share the bucket, and so its client and connections.
+        target = bucket
+    elif worker_type == PROCESS:
+        executor = futures.ProcessPoolExecutor(max_workers=max_workers)
+        # Buckets hold their client, which cannot be pickled.
+        target = (bucket.client.project, bucket.name, bucket.user_project)
+    else:
+        raise ValueError('Unknown worker type: {!r}'.format(worker_type))
+
+    file_blob_pairs = list(file_blob_pairs)
+    results = [None] * len(file_blob_pairs)
+    with executor:
+        indexes = {}
+        for index, (filename, blob_name) in enumerate(file_blob_pairs):
+            future = executor.submit(
+                transfer, target, filename, blob_name, retry)
+            indexes[future] = index
+
+        for future in futures.as_completed(indexes):
+            index = indexes[future]
+            filename, blob_name = file_blob_pairs[index]
+            results[index] = TransferResult(
+                filename, blob_name, future.exception())
+            if progress_callback is not None:
+                progress_callback(results[index])
+
+    return results
+
+
+def _ensure_pool_size(transport, size):
+    """Let a transport keep enough connections open for the workers.
+
+    A :class:`requests.Session` keeps 10 connections per host by default:
+    more concurrent workers would open a new connection for most requests.
+
+    :type transport: :class:`~requests.Session`
+    :param transport: The client's transport.
+
+    :type size: int
+    :param size: The number of connections to keep open.
+    """
+    adapters = getattr(transport, 'adapters', {})
+    adapter = adapters.get('https://')
+    if not isinstance(adapter, requests.adapters.HTTPAdapter):
+        return
+    if adapter._pool_maxsize >= size:
+        return
+    transport.mount('https://', requests.adapters.HTTPAdapter(
+        pool_connections=adapter._pool_connections, pool_maxsize=size,
+        max_retries=adapter.max_retries))
+
+
+def _get_bucket(target):
+    """Get the bucket to transfer from or to in a worker.
+
+    :type target: :class:`~google.cloud.storage.bucket.Bucket` or tuple
+    :param target: The bucket itself in a thread worker, or its
+                   ``(project, name, user_project)`` in a process worker.
+
+    :rtype: :class:`~google.cloud.storage.bucket.Bucket`
+    :returns: The bucket.
+    """
+    if not isinstance(target, tuple):
+        return target
+
+    from google.cloud.storage.client import Client
+
+    project, name, user_project = target
+    client = _PROCESS_CLIENTS.get(project)
+    if client is None:
+        client = _PROCESS_CLIENTS[project] = Client(project=project)
+    return client.bucket(name, user_project=user_project)
+
+
+def _call_with_retry(func, retry):
+    """Call a function, retrying it if ``retry`` is set."""
+    if retry is not None:
+        func = retry(func)
+    return func()
+
+
+def _upload_one(target, filename, blob_name, retry):
+    """Upload a file to a blob from a worker.
+
+    :type target: :class:`~google.cloud.storage.bucket.Bucket` or tuple
+    :param target: See :func:`_get_bucket`.
+
+    :type filename: str
+    :param filename: The path of the file to upload.
+
+    :type blob_name: str
+    :param blob_name: The name of the blob to upload to.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: How to retry the upload, or :data:`None`.
+    """
+    blob = _get_bucket(target).blob(blob_name)
+    _call_with_retry(lambda: blob.upload_from_filename(filename), retry)
+
+
+def _download_one(target, filename, blob_name, retry):
+    """Download a blob to a file from a worker.
+
+    :type target: :class:`~google.cloud.storage.bucket.Bucket` or tuple
+    :param target: See :func:`_get_bucket`.
+
+    :type filename: str
+    :param filename: The path of the file to download to.
+
+    :type blob_name: str
+    :param blob_name: The name of the blob to download.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: How to retry the download, or :data:`None`.
+    """
+    directory = os.path.dirname(filename)
+    if directory:
+        try:
+            os.makedirs(directory)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST or not os.path.isdir(directory):
+                raise
+
+    blob = _get_bucket(target).blob(blob_name)
+    _call_with_retry(lambda: blob.download_to_filename(filename), retry)
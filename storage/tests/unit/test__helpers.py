@@ -289,6 +289,116 @@ class Test__base64_md5hash(unittest.TestCase):
         self.assertEqual(MD5.hash_obj._blocks, [BYTES_TO_SIGN])
 
 
+class Test__crc32c_update(unittest.TestCase):
+
+    def test_check_value(self):
+        from google.cloud.storage._helpers import _crc32c_update
+
+        self.assertEqual(_crc32c_update(0, b'123456789'), 0xE3069283)
+        self.assertEqual(_crc32c_update(0, b''), 0)
+
+    def test_incremental(self):
+        from google.cloud.storage._helpers import _crc32c_update
+
+        crc = _crc32c_update(_crc32c_update(0, b'1234'), b'56789')
+        self.assertEqual(crc, 0xE3069283)
+
+    def test_pure_python(self):
+        from google.cloud.storage._helpers import _crc32c_update_python
+
+        crc = _crc32c_update_python(0, b'1234')
+        self.assertEqual(_crc32c_update_python(crc, b'56789'), 0xE3069283)
+
+    def test_wo_crcmod(self):
+        import mock
+        from google.cloud.storage._helpers import _crc32c_update
+
+        with mock.patch(
+                'google.cloud.storage._helpers._CRCMOD_CRC32C', new=None):
+            self.assertEqual(_crc32c_update(0, b'123456789'), 0xE3069283)
+
+    def test_w_crcmod(self):
+        import mock
+        from google.cloud.storage._helpers import _crc32c_update
+
+        crcmod_crc32c = mock.Mock(return_value=17)
+        with mock.patch(
+                'google.cloud.storage._helpers._CRCMOD_CRC32C',
+                new=crcmod_crc32c):
+            self.assertEqual(_crc32c_update(5, b'abc'), 17)
+
+        crcmod_crc32c.assert_called_once_with(b'abc', 5)
+
+
+class Test__make_crc32c_table(unittest.TestCase):
+
+    def test_it(self):
+        from google.cloud.storage._helpers import _CRC32C_TABLE
+        from google.cloud.storage._helpers import _make_crc32c_table
+
+        table = _make_crc32c_table()
+
+        self.assertEqual(len(table), 256)
+        self.assertEqual(table[:2], [0, 0xF26B8303])
+        self.assertEqual(table, _CRC32C_TABLE)
+
+
+class Test__has_fast_crc32c(unittest.TestCase):
+
+    def test_it(self):
+        import mock
+        from google.cloud.storage._helpers import _has_fast_crc32c
+
+        with mock.patch(
+                'google.cloud.storage._helpers._FAST_CRC32C', new=True):
+            self.assertTrue(_has_fast_crc32c())
+        with mock.patch(
+                'google.cloud.storage._helpers._FAST_CRC32C', new=False):
+            self.assertFalse(_has_fast_crc32c())
+
+
+class Test__crc32c_combine(unittest.TestCase):
+
+    def _call_fut(self, crc1, crc2, length2):
+        from google.cloud.storage._helpers import _crc32c_combine
+
+        return _crc32c_combine(crc1, crc2, length2)
+
+    def test_it(self):
+        from google.cloud.storage._helpers import _crc32c_update
+
+        data = bytes(bytearray(range(256))) * 5
+        expected = _crc32c_update(0, data)
+        for split in (1, 7, 256, 1000, len(data) - 1):
+            crc1 = _crc32c_update(0, data[:split])
+            crc2 = _crc32c_update(0, data[split:])
+            self.assertEqual(
+                self._call_fut(crc1, crc2, len(data) - split), expected)
+
+    def test_empty_second(self):
+        self.assertEqual(self._call_fut(0xE3069283, 0, 0), 0xE3069283)
+
+
+class Test__base64_crc32c(unittest.TestCase):
+
+    def test_it(self):
+        from google.cloud.storage._helpers import _base64_crc32c
+
+        self.assertEqual(_base64_crc32c(0xE3069283), u'4waSgw==')
+
+
+class Test_Crc32cHash(unittest.TestCase):
+
+    def test_digest(self):
+        from google.cloud.storage._helpers import _Crc32cHash
+
+        hash_obj = _Crc32cHash()
+        self.assertEqual(hash_obj.digest(), b'\x00\x00\x00\x00')
+        hash_obj.update(b'1234')
+        hash_obj.update(memoryview(b'56789'))
+        self.assertEqual(hash_obj.digest(), b'\xe3\x06\x92\x83')
+
+
 class _Connection(object):
 
     def __init__(self, *responses):
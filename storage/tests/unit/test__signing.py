@@ -211,6 +211,179 @@ class Test_generate_signed_url(unittest.TestCase):
                           resource=resource, expiration=expiration)
 
 
+class TestURLSigner(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage._signing import URLSigner
+
+        return URLSigner
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_blob(bucket_name, blob_name):
+        blob = mock.Mock(spec=['bucket', 'name'])
+        blob.bucket.name = bucket_name
+        blob.name = blob_name
+        return blob
+
+    @staticmethod
+    def _make_signing_credentials():
+        credentials = _make_credentials(
+            signing=True, signer_email='service@example.com')
+        credentials.signer.sign.side_effect = (
+            lambda string_to_sign: string_to_sign[-4:].encode('ascii'))
+        credentials.sign_bytes.side_effect = (
+            credentials.signer.sign.side_effect)
+        return credentials
+
+    def test_ctor_w_unsigned_credentials(self):
+        with self.assertRaises(AttributeError):
+            self._make_one(_make_credentials())
+
+    def test_ctor_wo_signer(self):
+        credentials = self._make_signing_credentials()
+        credentials.signer = None
+        signer = self._make_one(credentials)
+        self.assertEqual(signer._sign_bytes, credentials.sign_bytes)
+
+    def test_sign_many_matches_generate_signed_url(self):
+        from google.cloud.storage._signing import generate_signed_url
+
+        credentials = self._make_signing_credentials()
+        signer = self._make_one(
+            credentials, api_access_endpoint='http://api.example.com')
+        blobs = [
+            self._make_blob('bucket-1', u'a b/c\u00e9'),
+            self._make_blob('bucket-1', u'd'),
+            self._make_blob('bucket-2', u'e'),
+        ]
+        cases = [
+            {},
+            {'method': 'RESUMABLE', 'content_type': 'text/plain'},
+            {
+                'method': 'PUT',
+                'response_type': 'text/plain',
+                'response_disposition': 'attachment; filename=blob.png',
+                'generation': '123',
+            },
+        ]
+
+        for kwargs in cases:
+            urls = signer.sign_many(blobs, 1000, **kwargs)
+            expected = [
+                generate_signed_url(
+                    credentials, '/{}/{}'.format(
+                        blob.bucket.name,
+                        urllib_parse.quote(blob.name.encode('utf-8'))),
+                    1000, api_access_endpoint='http://api.example.com',
+                    **kwargs)
+                for blob in blobs]
+            self.assertEqual(urls, expected)
+
+        self.assertEqual(
+            signer._resource_prefixes,
+            {'bucket-1': '/bucket-1/', 'bucket-2': '/bucket-2/'})
+
+    def test_sign(self):
+        credentials = self._make_signing_credentials()
+        signer = self._make_one(credentials)
+        blob = self._make_blob('bucket', u'blob')
+
+        url = signer.sign(blob, 1000, generation='1')
+
+        scheme, netloc, path, qs, _ = urllib_parse.urlsplit(url)
+        self.assertEqual(scheme, 'https')
+        self.assertEqual(netloc, 'storage.googleapis.com')
+        self.assertEqual(path, '/bucket/blob')
+        self.assertEqual(urllib_parse.parse_qs(qs), {
+            'GoogleAccessId': ['service@example.com'],
+            'Expires': ['1000'],
+            'Signature': [base64.b64encode(b'blob').decode('ascii')],
+            'generation': ['1'],
+        })
+        credentials.signer.sign.assert_called_once_with(
+            'GET\n\n\n1000\n/bucket/blob')
+        credentials.sign_bytes.assert_not_called()
+
+    def test_close_wo_pool(self):
+        credentials = self._make_signing_credentials()
+        signer = self._make_one(credentials)
+        blob = self._make_blob('bucket', u'blob')
+        pool_patch = mock.patch('multiprocessing.Pool')
+
+        with pool_patch as pool_class:
+            with signer:
+                signer.sign(blob, 1000)
+            signer.close()
+
+        pool_class.assert_not_called()
+        self.assertIsNone(signer._pool)
+
+    def test_sign_many_w_processes(self):
+        credentials = self._make_signing_credentials()
+        signer = self._make_one(credentials)
+        signer._service_account_info = info = {'private_key': 'KEY'}
+        signer._processes = 2
+        blobs = [self._make_blob('bucket', name) for name in ('a', 'b')]
+        pool_patch = mock.patch('multiprocessing.Pool')
+
+        with pool_patch as pool_class:
+            pool = pool_class.return_value
+            pool.map.return_value = [b'c2lnMQ==', b'c2lnMg==']
+            with signer:
+                urls = signer.sign_many(blobs, 1000)
+                signer.sign_many(blobs, 1000)
+
+        from google.cloud.storage._signing import _init_process_signer
+        from google.cloud.storage._signing import _sign_in_process
+
+        pool_class.assert_called_once_with(2, _init_process_signer, (info,))
+        pool.map.assert_called_with(
+            _sign_in_process,
+            ['GET\n\n\n1000\n/bucket/a', 'GET\n\n\n1000\n/bucket/b'],
+            chunksize=1)
+        pool.close.assert_called_once_with()
+        pool.join.assert_called_once_with()
+        self.assertIsNone(signer._pool)
+        self.assertTrue(urls[0].endswith('&Signature=c2lnMQ%3D%3D'))
+        self.assertTrue(urls[1].endswith('&Signature=c2lnMg%3D%3D'))
+        credentials.signer.sign.assert_not_called()
+
+    def test_from_service_account_info_and_process_signer(self):
+        from google.cloud.storage import _signing
+
+        info = _make_service_account_info()
+        signer = self._get_target_class().from_service_account_info(
+            info, processes=3, api_access_endpoint='http://api.example.com')
+
+        self.assertEqual(signer._access_id, info['client_email'])
+        self.assertIs(signer._service_account_info, info)
+        self.assertEqual(signer._processes, 3)
+        self.assertEqual(signer._api_access_endpoint, 'http://api.example.com')
+
+        local_signature = base64.b64encode(signer._sign_bytes('text'))
+        with mock.patch.object(_signing, '_PROCESS_SIGNER', None):
+            _signing._init_process_signer(info)
+            self.assertEqual(
+                _signing._sign_in_process('text'), local_signature)
+
+
+def _make_service_account_info():
+    import rsa
+
+    _, private_key = rsa.newkeys(512)
+    return {
+        'type': 'service_account',
+        'client_email': 'service@example.com',
+        'private_key': private_key.save_pkcs1().decode('ascii'),
+        'private_key_id': 'key-id',
+        'token_uri': 'https://oauth2.example.com/token',
+    }
+
+
 def _make_credentials(signing=False, signer_email=None):
     import google.auth.credentials
 
@@ -112,6 +112,7 @@ class TestBatch(unittest.TestCase):
         self.assertIs(batch._client, client)
         self.assertEqual(len(batch._requests), 0)
         self.assertEqual(len(batch._target_objects), 0)
+        self.assertTrue(batch._raise_exception)
 
     def test_current(self):
         from google.cloud.storage.client import Client
@@ -414,6 +415,44 @@ class TestBatch(unittest.TestCase):
         self._check_subrequest_payload(chunks[0], 'GET', url, {})
         self._check_subrequest_payload(chunks[1], 'GET', url, {})
 
+    def test_finish_nonempty_with_status_failure_wo_raise(self):
+        url = 'http://api.example.com/other_api'
+        expected_response = _make_response(
+            content=_TWO_PART_MIME_RESPONSE_WITH_FAIL,
+            headers={'content-type': 'multipart/mixed; boundary="DEADBEEF="'})
+        http = _make_requests_session([expected_response])
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client, raise_exception=False)
+        batch.API_BASE_URL = 'http://api.example.com'
+        target1 = _MockObject()
+        target2 = _MockObject()
+
+        batch._do_request('GET', url, {}, None, target1)
+        batch._do_request('GET', url, {}, None, target2)
+        target2_future_before = target2._properties
+
+        response1, response2 = batch.finish()
+
+        self.assertEqual(response1.status_code, http_client.OK)
+        self.assertEqual(response2.status_code, http_client.NOT_FOUND)
+        self.assertEqual(target1._properties, {'foo': 1, 'bar': 2})
+        self.assertIs(target2._properties, target2_future_before)
+
+    def test_finish_batch_request_failure(self):
+        from google.cloud.exceptions import InternalServerError
+
+        url = 'http://api.example.com/other_api'
+        http = _make_requests_session([
+            _make_response(status=http_client.INTERNAL_SERVER_ERROR)])
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client)
+        batch._do_request('GET', url, {}, None, None)
+
+        with self.assertRaises(InternalServerError):
+            batch.finish()
+
     def test_finish_nonempty_non_multipart_response(self):
         url = 'http://api.example.com/other_api'
         http = _make_requests_session([_make_response()])
@@ -504,6 +543,125 @@ class TestBatch(unittest.TestCase):
         self.assertIsInstance(target3._properties, _FutureDict)
 
 
+class Test__send_in_batches(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kw):
+        from google.cloud.storage.batch import _send_in_batches
+
+        return _send_in_batches(*args, **kw)
+
+    def test_single_item(self):
+        client = object()
+        send = mock.Mock(return_value=None)
+        patch = mock.patch('google.cloud.storage.batch._send_batch')
+
+        with patch as send_batch:
+            errors = self._call_fut(client, ['a'], send)
+
+        self.assertEqual(errors, [None])
+        send.assert_called_once_with('a')
+        send_batch.assert_not_called()
+
+    def test_single_item_failure(self):
+        from google.cloud.exceptions import NotFound
+
+        error = NotFound('miss')
+        send = mock.Mock(side_effect=error)
+
+        errors = self._call_fut(object(), ['a'], send)
+
+        self.assertEqual(errors, [error])
+
+    def test_many_items(self):
+        from google.cloud.exceptions import NotFound
+
+        client = object()
+        send = mock.Mock()
+        error = NotFound('miss')
+
+        def send_batch(client_, chunk, send_):
+            self.assertIs(client_, client)
+            self.assertIs(send_, send)
+            return [error if item == 'c' else None for item in chunk]
+
+        patch_size = mock.patch(
+            'google.cloud.storage.batch._MAX_SERVER_BATCH_SIZE', new=2)
+        patch_send = mock.patch(
+            'google.cloud.storage.batch._send_batch', side_effect=send_batch)
+
+        with patch_size, patch_send as patched:
+            errors = self._call_fut(
+                client, iter(['a', 'b', 'c', 'd', 'e']), send, max_workers=2)
+
+        self.assertEqual(errors, [None, None, error, None, None])
+        chunks = sorted(call[0][1] for call in patched.call_args_list)
+        self.assertEqual(chunks, [['a', 'b'], ['c', 'd'], ['e']])
+
+
+class Test__send_batch(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kw):
+        from google.cloud.storage.batch import _send_batch
+
+        return _send_batch(*args, **kw)
+
+    @staticmethod
+    def _make_client(http):
+        from google.cloud.storage.client import Client
+
+        client = Client(project='PROJECT', credentials=_make_credentials())
+        client._http_internal = http
+        return client
+
+    def test_w_failure(self):
+        from google.cloud.exceptions import NotFound
+
+        http = _make_requests_session([_make_response(
+            content=_TWO_PART_MIME_RESPONSE_WITH_FAIL,
+            headers={'content-type': 'multipart/mixed; boundary="DEADBEEF="'},
+        )])
+        client = self._make_client(http)
+
+        def send(name):
+            client._connection.api_request(method='GET', path='/b/' + name)
+
+        error1, error2 = self._call_fut(client, ['a', 'b'], send)
+
+        self.assertIsNone(error1)
+        self.assertIsInstance(error2, NotFound)
+        self.assertIsNone(client.current_batch)
+        http.request.assert_called_once_with(
+            method='POST', url=mock.ANY, headers=mock.ANY, data=mock.ANY)
+
+    def test_batch_request_failure(self):
+        from google.cloud.exceptions import InternalServerError
+
+        http = _make_requests_session([
+            _make_response(status=http_client.INTERNAL_SERVER_ERROR)])
+        client = self._make_client(http)
+
+        def send(name):
+            client._connection.api_request(method='GET', path='/b/' + name)
+
+        errors = self._call_fut(client, ['a', 'b'], send)
+
+        self.assertEqual(len(errors), 2)
+        self.assertIsInstance(errors[0], InternalServerError)
+        self.assertIs(errors[1], errors[0])
+
+    def test_requests_mismatch(self):
+        http = _make_requests_session([])
+        client = self._make_client(http)
+
+        with self.assertRaises(ValueError):
+            self._call_fut(client, ['a', 'b'], lambda name: None)
+
+        self.assertIsNone(client.current_batch)
+        http.request.assert_not_called()
+
+
 class Test__unpack_batch_response(unittest.TestCase):
 
     def _call_fut(self, headers, content):
@@ -865,6 +865,112 @@ class Test_Blob(unittest.TestCase):
             'name/o/blob-name?alt=media')
         self._check_session_mocks(client, transport, expected_url)
 
+    def _do_download_checksum_helper(
+            self, checksum, hash_header, chunk_size=3, start=None,
+            content_encoding=None):
+        client = mock.Mock(
+            _credentials=_make_credentials(), spec=['_credentials'])
+        bucket = _Bucket(client)
+        blob = self._make_one('blob-name', bucket=bucket)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = chunk_size
+
+        response_headers = {'x-goog-hash': hash_header}
+        if content_encoding is not None:
+            response_headers['content-encoding'] = content_encoding
+        transport = mock.Mock(spec=['request'])
+        if chunk_size is None:
+            response_headers['content-length'] = '6'
+            transport.request.return_value = self._mock_requests_response(
+                http_client.OK, response_headers, content=b'abcdef',
+                stream=True)
+        else:
+            transport.request.side_effect = [
+                self._mock_requests_response(
+                    http_client.PARTIAL_CONTENT,
+                    dict(response_headers, **{
+                        'content-length': '3',
+                        'content-range': content_range,
+                    }),
+                    content=content)
+                for content_range, content in (
+                    ('bytes 0-2/6', b'abc'), ('bytes 3-5/6', b'def'))]
+        file_obj = io.BytesIO()
+        blob._do_download(
+            transport, file_obj, 'http://test.invalid', {}, start=start,
+            checksum=checksum)
+        return file_obj
+
+    def test__do_download_chunked_with_crc32c(self):
+        file_obj = self._do_download_checksum_helper(
+            'crc32c', 'crc32c=U7zv8Q==,md5=6AtQFwmJUPxYqtg8jBSXjg==')
+
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+
+    def test__do_download_chunked_with_md5(self):
+        file_obj = self._do_download_checksum_helper(
+            'md5', 'crc32c=U7zv8Q==,md5=6AtQFwmJUPxYqtg8jBSXjg==')
+
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+
+    def test__do_download_chunked_with_checksum_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        with self.assertRaises(DataCorruption) as exc_info:
+            self._do_download_checksum_helper(
+                'crc32c', 'crc32c=AAAAAA==,md5=6AtQFwmJUPxYqtg8jBSXjg==')
+
+        self.assertIn('U7zv8Q==', exc_info.exception.args[0])
+
+    def test__do_download_chunked_with_checksum_missing(self):
+        file_obj = self._do_download_checksum_helper(
+            'md5', 'crc32c=U7zv8Q==')
+
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+
+    def test__do_download_chunked_with_checksum_gzip(self):
+        file_obj = self._do_download_checksum_helper(
+            'crc32c', 'crc32c=AAAAAA==', content_encoding='gzip')
+
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+
+    def test__do_download_simple_with_crc32c(self):
+        from google.resumable_media import DataCorruption
+
+        with self.assertRaises(DataCorruption):
+            self._do_download_checksum_helper(
+                'crc32c', 'crc32c=AAAAAA==', chunk_size=None)
+
+    def test_download_to_file_simple_with_md5_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        transport = self._mock_download_transport()
+        client = mock.Mock(_http=transport, spec=[u'_http'])
+        bucket = _Bucket(client)
+        properties = {'mediaLink': 'http://example.com/media/'}
+        blob = self._make_one(
+            'blob-name', bucket=bucket, properties=properties)
+        response_headers = {
+            'content-length': '6',
+            'x-goog-hash': 'md5=AAAAAAAAAAAAAAAAAAAAAA==',
+        }
+        transport.request.side_effect = [self._mock_requests_response(
+            http_client.OK, response_headers, content=b'abcdef',
+            stream=True)]
+
+        # Without a chunk size, the MD5 hash is checked by ``Download``.
+        with self.assertRaises(DataCorruption):
+            blob.download_to_file(io.BytesIO(), checksum='md5')
+
+    def test__do_download_with_checksum_and_range(self):
+        with self.assertRaises(ValueError):
+            self._do_download_checksum_helper(
+                'crc32c', 'crc32c=U7zv8Q==', start=1)
+
+    def test__do_download_with_bad_checksum_type(self):
+        with self.assertRaises(ValueError):
+            self._do_download_checksum_helper('sha1', 'crc32c=U7zv8Q==')
+
     def _download_to_file_helper(self, use_chunks=False):
         blob_name = 'blob-name'
         transport = self._mock_download_transport()
@@ -1022,6 +1128,175 @@ class Test_Blob(unittest.TestCase):
             stream=True,
         )
 
+    def _mock_sliced_download_transport(self, data):
+        import re
+
+        transport = mock.Mock(spec=['request'])
+
+        def request(method, url, data=None, headers=None, **kwargs):
+            first, last = re.match(
+                r'bytes=(\d+)-(\d+)', headers['range']).groups()
+            content = blob_data[int(first):int(last) + 1]
+            return self._mock_requests_response(
+                http_client.PARTIAL_CONTENT,
+                {'content-length': str(len(content)),
+                 'content-range': 'bytes {}-{}/{}'.format(
+                     first, int(first) + len(content) - 1, len(blob_data))},
+                content=content)
+
+        blob_data = data
+        transport.request.side_effect = request
+        return transport
+
+    def _make_sliced_blob(self, transport, data, crc32c=None, **properties):
+        from google.cloud.storage._helpers import _base64_crc32c
+        from google.cloud.storage._helpers import _crc32c_update
+
+        if crc32c is None:
+            crc32c = _base64_crc32c(_crc32c_update(0, data))
+        client = mock.Mock(_http=transport, spec=['_http'])
+        bucket = _Bucket(client)
+        properties.update({
+            'mediaLink': 'http://example.com/media/',
+            'size': str(len(data)),
+            'crc32c': crc32c,
+        })
+        return self._make_one('blob-name', bucket=bucket,
+                              properties=properties)
+
+    def _download_sliced(self, blob, slices, checksum='crc32c'):
+        filehandle, filename = tempfile.mkstemp()
+        os.close(filehandle)
+        self.addCleanup(
+            lambda: os.path.exists(filename) and os.remove(filename))
+        blob.download_to_filename(filename, slices=slices, checksum=checksum)
+        with open(filename, 'rb') as file_obj:
+            return file_obj.read()
+
+    def test_download_to_filename_w_slices(self):
+        data = b'0123456789'
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data)
+
+        self.assertEqual(self._download_sliced(blob, 3), data)
+
+        ranges = sorted(
+            call[2]['headers']['range']
+            for call in transport.request.mock_calls)
+        self.assertEqual(
+            ranges, ['bytes=0-3', 'bytes=4-7', 'bytes=8-9'])
+
+    def test_download_to_filename_w_slices_and_chunk_size(self):
+        data = b'0123456789'
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 2
+
+        self.assertEqual(self._download_sliced(blob, 2), data)
+
+        self.assertEqual(transport.request.call_count, 6)
+
+    def test_download_to_filename_w_slices_wo_checksum(self):
+        data = b'0123456789'
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data)
+        del blob._properties['crc32c']
+
+        self.assertEqual(self._download_sliced(blob, 4), data)
+
+    def test_download_to_filename_w_slices_corrupted(self):
+        from google.resumable_media import DataCorruption
+
+        data = b'0123456789'
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, crc32c=u'AAAAAA==')
+        filehandle, filename = tempfile.mkstemp()
+        os.close(filehandle)
+
+        with self.assertRaises(DataCorruption):
+            blob.download_to_filename(filename, slices=3, checksum='crc32c')
+
+        self.assertFalse(os.path.exists(filename))
+
+    def test_download_to_filename_w_slices_w_fast_crc32c(self):
+        from google.resumable_media import DataCorruption
+
+        data = b'0123456789'
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, crc32c=u'AAAAAA==')
+        fast_patch = mock.patch(
+            'google.cloud.storage.blob._has_fast_crc32c', return_value=True)
+
+        with fast_patch, self.assertRaises(DataCorruption):
+            self._download_sliced(blob, 3, checksum=None)
+
+    def test_download_to_filename_w_slices_w_slow_crc32c(self):
+        import warnings
+
+        data = b'0123456789'
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, crc32c=u'AAAAAA==')
+        slow_patch = mock.patch(
+            'google.cloud.storage.blob._has_fast_crc32c', return_value=False)
+        crc_patch = mock.patch(
+            'google.cloud.storage.blob._crc32c_update')
+
+        with slow_patch, crc_patch as crc32c_update:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                self.assertEqual(
+                    self._download_sliced(blob, 3, checksum=None), data)
+
+        crc32c_update.assert_not_called()
+        self.assertEqual(len(caught), 1)
+        self.assertIs(caught[0].category, RuntimeWarning)
+        self.assertIn('crcmod', str(caught[0].message))
+
+    def test_download_to_filename_w_slices_reloads_size(self):
+        data = b'0123456789'
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data)
+        properties = dict(blob._properties)
+        blob._properties.clear()
+        blob._properties['name'] = 'blob-name'
+
+        def reload(client=None):
+            blob._properties.update(properties)
+
+        with mock.patch.object(blob, 'reload', side_effect=reload) as patch:
+            self.assertEqual(self._download_sliced(blob, 3), data)
+
+        patch.assert_called_once_with(client=None)
+
+    def test_download_to_filename_w_slices_gzip_encoded(self):
+        data = b'0123456789'
+        blob = self._make_sliced_blob(
+            mock.sentinel.transport, data, contentEncoding='gzip')
+
+        with mock.patch.object(blob, 'download_to_file') as patch:
+            self._download_sliced(blob, 3)
+
+        patch.assert_called_once_with(mock.ANY, client=None)
+
+    def test_download_to_filename_w_slices_and_range(self):
+        blob = self._make_sliced_blob(mock.sentinel.transport, b'0123')
+
+        with self.assertRaises(ValueError):
+            blob.download_to_filename('file', start=1, slices=2)
+
+    def test_download_to_filename_w_slices_not_found(self):
+        from google.cloud import exceptions
+
+        data = b'0123456789'
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.NOT_FOUND, {}, content=b'Not found')
+        blob = self._make_sliced_blob(transport, data)
+
+        with self.assertRaises(exceptions.NotFound):
+            self._download_sliced(blob, 2)
+
     def test_download_to_filename_w_key(self):
         import os
         import time
@@ -1285,6 +1560,48 @@ class Test_Blob(unittest.TestCase):
             'was specified but the file-like object only had', exc_contents)
         self.assertEqual(stream.tell(), len(data))
 
+    @mock.patch(u'google.resumable_media._upload.get_boundary',
+                return_value=b'==0==')
+    def test__do_multipart_upload_with_checksum(self, mock_get_boundary):
+        bucket = _Bucket(name='w00t')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        transport = self._mock_transport(http_client.OK, {})
+        client = mock.Mock(_http=transport, spec=['_http'])
+        stream = io.BytesIO(b'123456789')
+
+        blob._do_multipart_upload(
+            client, stream, u'text/plain', None, None, None,
+            checksum='crc32c')
+
+        payload = transport.request.call_args[1]['data']
+        self.assertIn(
+            b'{"name": "blob-name", "crc32c": "4waSgw=="}', payload)
+
+    @mock.patch(u'google.resumable_media._upload.get_boundary',
+                return_value=b'==0==')
+    def test__do_multipart_upload_with_checksum_set_on_blob(
+            self, mock_get_boundary):
+        bucket = _Bucket(name='w00t')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        blob.md5_hash = u'expected=='
+        transport = self._mock_transport(http_client.OK, {})
+        client = mock.Mock(_http=transport, spec=['_http'])
+        stream = io.BytesIO(b'123456789')
+
+        blob._do_multipart_upload(
+            client, stream, u'text/plain', None, None, None, checksum='md5')
+
+        payload = transport.request.call_args[1]['data']
+        self.assertIn(b'"md5Hash": "expected=="', payload)
+
+    def test__do_multipart_upload_with_bad_checksum_type(self):
+        blob = self._make_one(u'blob-name', bucket=None)
+        stream = io.BytesIO(b'123456789')
+
+        with self.assertRaises(ValueError):
+            blob._do_multipart_upload(
+                None, stream, None, None, None, None, checksum='sha1')
+
     def _initiate_resumable_helper(
             self, size=None, extra_headers=None, chunk_size=None,
             num_retries=None, user_project=None, predefined_acl=None,
@@ -1557,6 +1874,109 @@ class Test_Blob(unittest.TestCase):
     def test__do_resumable_upload_with_predefined_acl(self):
         self._do_resumable_helper(predefined_acl='private')
 
+    def _do_resumable_checksum_helper(self, uploaded_crc32c):
+        from google.cloud.storage._helpers import _base64_crc32c
+        from google.cloud.storage._helpers import _crc32c_update
+
+        bucket = _Bucket(name='yesterday')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        blob.chunk_size = blob._CHUNK_SIZE_MULTIPLE
+        data = b'<html>' + (b'A' * blob.chunk_size) + b'</html>'
+        local_crc32c = _base64_crc32c(_crc32c_update(0, data))
+        if uploaded_crc32c is None:
+            uploaded_crc32c = local_crc32c
+
+        resumable_url = 'http://test.invalid?upload_id=and-then-there-was-1'
+        headers1 = {'location': resumable_url}
+        headers2 = {'range': 'bytes=0-{:d}'.format(blob.chunk_size - 1)}
+        transport, responses = self._make_resumable_transport(
+            headers1, headers2, {}, len(data))
+        responses[2]._content = json.dumps({
+            'crc32c': uploaded_crc32c,
+            'generation': '12',
+        }).encode('utf-8')
+        connection = _Connection(({}, None))
+        client = mock.Mock(
+            _http=transport, _connection=connection,
+            spec=['_http', '_connection'])
+        stream = io.BytesIO(data)
+
+        response = blob._do_resumable_upload(
+            client, stream, u'text/html', None, None, None,
+            checksum='crc32c')
+
+        self.assertIs(response, responses[2])
+        self.assertEqual(connection._requested, [])
+
+    def test__do_resumable_upload_with_checksum(self):
+        self._do_resumable_checksum_helper(None)
+
+    def test__do_resumable_upload_with_checksum_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        with self.assertRaises(DataCorruption) as exc_info:
+            self._do_resumable_checksum_helper(u'AAAAAA==')
+
+        self.assertIn('has been deleted', exc_info.exception.args[0])
+
+    def test__do_resumable_upload_with_chunk_sizer(self):
+        from google.cloud.storage.chunking import AdaptiveChunkSizer
+
+        bucket = _Bucket(name='yesterday')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        sizer = AdaptiveChunkSizer(initial_size=blob._CHUNK_SIZE_MULTIPLE)
+        # The chunk size of the blob is not used.
+        blob.chunk_size = 4 * blob._CHUNK_SIZE_MULTIPLE
+        data = b'<html>' + (b'A' * blob._CHUNK_SIZE_MULTIPLE) + b'</html>'
+
+        resumable_url = 'http://test.invalid?upload_id=and-then-there-was-1'
+        headers1 = {'location': resumable_url}
+        headers2 = {
+            'range': 'bytes=0-{:d}'.format(blob._CHUNK_SIZE_MULTIPLE - 1)}
+        transport, responses = self._make_resumable_transport(
+            headers1, headers2, {}, len(data))
+        client = mock.Mock(_http=transport, spec=['_http'])
+
+        response = blob._do_resumable_upload(
+            client, io.BytesIO(data), u'text/html', None, None, None,
+            chunk_sizer=sizer)
+
+        self.assertIs(response, responses[2])
+        self.assertEqual(transport.request.call_count, 3)
+        self.assertEqual(
+            sizer.stats.chunk_sizes, [blob._CHUNK_SIZE_MULTIPLE, 13])
+        self.assertEqual(sizer.stats.attempts, 2)
+
+    def test__verify_upload_checksum_deletes_generation(self):
+        from google.resumable_media import DataCorruption
+
+        bucket = _Bucket(name='yesterday', user_project='user-project-123')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        response = mock.Mock(spec=['json'])
+        response.json.return_value = {'md5Hash': 'b==', 'generation': '12'}
+        connection = _Connection(({}, None))
+        client = _Client(connection)
+
+        with self.assertRaises(DataCorruption):
+            blob._verify_upload_checksum(client, response, 'md5', 'a==')
+
+        self.assertEqual(connection._requested, [{
+            'method': 'DELETE',
+            'path': '/b/yesterday/o/blob-name',
+            'query_params': {
+                'generation': '12',
+                'userProject': 'user-project-123',
+            },
+            '_target_object': None,
+        }])
+
+    def test__verify_upload_checksum_wo_local_checksum(self):
+        blob = self._make_one(u'blob-name', bucket=None)
+        response = mock.Mock(spec=['json'])
+        response.json.return_value = {'crc32c': 'b==', 'generation': '12'}
+
+        blob._verify_upload_checksum(None, response, 'crc32c', None)
+
     def _do_upload_helper(
             self, chunk_size=None, num_retries=None, predefined_acl=None,
             size=None):
@@ -1589,13 +2009,13 @@ class Test_Blob(unittest.TestCase):
                 size <= google.cloud.storage.blob._MAX_MULTIPART_SIZE:
             blob._do_multipart_upload.assert_called_once_with(
                 client, stream, content_type, size, num_retries,
-                predefined_acl)
+                predefined_acl, checksum=None)
             blob._do_resumable_upload.assert_not_called()
         else:
             blob._do_multipart_upload.assert_not_called()
             blob._do_resumable_upload.assert_called_once_with(
                 client, stream, content_type, size, num_retries,
-                predefined_acl)
+                predefined_acl, checksum=None, chunk_sizer=None)
 
     def test__do_upload_uses_multipart(self):
         self._do_upload_helper(
@@ -1641,7 +2061,8 @@ class Test_Blob(unittest.TestCase):
         num_retries = kwargs.get('num_retries')
         blob._do_upload.assert_called_once_with(
             client, stream, content_type,
-            len(data), num_retries, predefined_acl)
+            len(data), num_retries, predefined_acl, checksum=None,
+            chunk_sizer=None)
         return stream
 
     def test_upload_from_file_success(self):
@@ -1690,7 +2111,7 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(pos_args[3], size)
         self.assertIsNone(pos_args[4])  # num_retries
         self.assertIsNone(pos_args[5])  # predefined_acl
-        self.assertEqual(kwargs, {})
+        self.assertEqual(kwargs, {'checksum': None, 'chunk_sizer': None})
 
         return pos_args[1]
 
@@ -1725,6 +2146,157 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, 'rb')
         self.assertEqual(stream.name, temp.name)
 
+    def _parallel_upload_helper(self, data, upload_error=None,
+                                delete_error=None, **kwargs):
+        from google.cloud.storage.blob import Blob
+
+        bucket = mock.Mock(
+            path='/b/name', user_project=None,
+            spec=['delete_blobs', 'path', 'user_project'])
+        bucket.delete_blobs.side_effect = delete_error
+        blob = self._make_one('blob-name', bucket=bucket)
+        uploaded = {}
+        composed = []
+
+        def upload_from_file(component, stream, size=None, client=None,
+                             checksum=None):
+            if upload_error is not None:
+                raise upload_error
+            self.assertEqual(component.content_type, u'text/plain')
+            self.assertEqual(stream.tell(), 0)
+            uploaded[component.name] = stream.read()
+            self.assertEqual(len(uploaded[component.name]), size)
+
+        def compose(destination, sources, client=None):
+            composed.append((destination.name, [
+                source.name for source in sources]))
+            uploaded[destination.name] = b''.join(
+                uploaded[source.name] for source in sources)
+
+        filehandle, filename = tempfile.mkstemp()
+        os.close(filehandle)
+        self.addCleanup(os.remove, filename)
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(data)
+
+        upload_patch = mock.patch.object(
+            Blob, 'upload_from_file', autospec=True,
+            side_effect=upload_from_file)
+        compose_patch = mock.patch.object(
+            Blob, 'compose', autospec=True, side_effect=compose)
+        with upload_patch, compose_patch:
+            blob.upload_from_filename(
+                filename, content_type=u'text/plain', **kwargs)
+
+        self.assertEqual(uploaded['blob-name'], data)
+        self.assertEqual(blob.content_type, u'text/plain')
+        return blob, uploaded, composed
+
+    def test_upload_from_filename_parallel(self):
+        data = b'0123456789'
+
+        blob, uploaded, composed = self._parallel_upload_helper(
+            data, parallel_threshold=8, component_size=4)
+
+        self.assertEqual(len(composed), 1)
+        destination, sources = composed[0]
+        self.assertEqual(destination, 'blob-name')
+        self.assertEqual(len(sources), 3)
+        self.assertTrue(all(
+            source.startswith('blob-name.parallel-upload-')
+            for source in sources))
+        self.assertEqual(
+            [uploaded[source] for source in sources],
+            [b'0123', b'4567', b'89'])
+        deleted, = blob.bucket.delete_blobs.call_args[0]
+        self.assertEqual([blob.name for blob in deleted], sources)
+        # Components which are already gone are ignored.
+        on_error = blob.bucket.delete_blobs.call_args[1]['on_error']
+        self.assertIsNone(on_error(deleted[0]))
+
+    def test_upload_from_filename_parallel_w_compose_tree(self):
+        data = bytes(bytearray(range(70)))
+
+        blob, uploaded, composed = self._parallel_upload_helper(
+            data, parallel_threshold=1, component_size=1, max_workers=4)
+
+        # 70 components are composed into 3 intermediate blobs first.
+        self.assertEqual(
+            [len(sources) for _, sources in composed], [32, 32, 6, 3])
+        self.assertEqual(composed[-1][0], 'blob-name')
+        deleted, = blob.bucket.delete_blobs.call_args[0]
+        self.assertEqual(len(deleted), 73)
+
+    def test_upload_from_filename_parallel_deletes_components_on_error(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        error = ServiceUnavailable('try again')
+        with self.assertRaises(ServiceUnavailable):
+            self._parallel_upload_helper(
+                b'0123456789', upload_error=error, parallel_threshold=8,
+                component_size=4)
+
+    def test_upload_from_filename_parallel_delete_error_logged(self):
+        from google.cloud.exceptions import Forbidden
+
+        error = Forbidden('denied')
+        with mock.patch('google.cloud.storage.blob._LOGGER') as logger:
+            blob, uploaded, _ = self._parallel_upload_helper(
+                b'0123456789', delete_error=error, parallel_threshold=8,
+                component_size=4)
+
+        self.assertEqual(uploaded['blob-name'], b'0123456789')
+        blob.bucket.delete_blobs.assert_called_once()
+        logger.exception.assert_called_once_with(mock.ANY, 'blob-name')
+
+    def test_upload_from_filename_parallel_delete_error_keeps_error(self):
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.exceptions import ServiceUnavailable
+
+        upload_error = ServiceUnavailable('try again')
+        with mock.patch('google.cloud.storage.blob._LOGGER') as logger:
+            with self.assertRaises(ServiceUnavailable) as exc_info:
+                self._parallel_upload_helper(
+                    b'0123456789', upload_error=upload_error,
+                    delete_error=Forbidden('denied'), parallel_threshold=8,
+                    component_size=4)
+
+        # The error of the upload is raised, not the one of the cleanup.
+        self.assertIs(exc_info.exception, upload_error)
+        logger.exception.assert_called_once_with(mock.ANY, 'blob-name')
+
+    def test_upload_from_filename_below_parallel_threshold(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_one('blob-name', bucket=None)
+        blob._do_upload = mock.Mock(return_value={}, spec=[])
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'0123456789')
+            blob.upload_from_filename(
+                temp.name, parallel_threshold=11, component_size=4)
+            blob.upload_from_filename(
+                temp.name, parallel_threshold=1, component_size=10)
+
+        self.assertEqual(blob._do_upload.call_count, 2)
+
+    def test_upload_from_filename_parallel_w_encryption_key(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_one(
+            'blob-name', bucket=None,
+            encryption_key=b'aa426195405adee2c8081bb9e7e74b19')
+        blob._do_upload = mock.Mock(return_value={}, spec=[])
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'0123456789')
+            blob.upload_from_filename(
+                temp.name, parallel_threshold=1, component_size=4)
+
+        blob._do_upload.assert_called_once()
+
     def _upload_from_string_helper(self, data, **kwargs):
         from google.cloud._helpers import _to_bytes
 
@@ -1824,6 +2396,59 @@ class Test_Blob(unittest.TestCase):
         self.assertIn(message, exc_info.exception.message)
         self.assertEqual(exc_info.exception.errors, [])
 
+    def test_open_rb(self):
+        from google.cloud.storage.fileio import BlobReader
+
+        blob = self._make_one(u'blob-name', bucket=_Bucket())
+        client = object()
+        reader = blob.open('rb', chunk_size=1024, client=client)
+        self.assertIsInstance(reader, BlobReader)
+        self.assertIs(reader._blob, blob)
+        self.assertEqual(reader._chunk_size, 1024)
+        self.assertIs(reader._client, client)
+
+    def test_open_r(self):
+        from google.cloud.storage.fileio import BlobReader
+
+        blob = self._make_one(u'blob-name', bucket=_Bucket())
+        reader = blob.open(encoding='latin-1', newline='')
+        self.assertIsInstance(reader, io.TextIOWrapper)
+        self.assertIsInstance(reader.buffer, BlobReader)
+        self.assertEqual(reader.encoding, 'latin-1')
+
+    def test_open_wb(self):
+        from google.cloud.storage.fileio import BlobWriter
+
+        blob = self._make_one(u'blob-name', bucket=_Bucket())
+        writer = blob.open(
+            'wb', chunk_size=blob._CHUNK_SIZE_MULTIPLE,
+            content_type=u'text/csv', predefined_acl='private')
+        self.assertIsInstance(writer, BlobWriter)
+        self.assertIs(writer._blob, blob)
+        self.assertEqual(writer._chunk_size, blob._CHUNK_SIZE_MULTIPLE)
+        self.assertEqual(writer._content_type, u'text/csv')
+        self.assertEqual(writer._predefined_acl, 'private')
+
+    def test_open_wt(self):
+        from google.cloud.storage.fileio import BlobWriter
+
+        blob = self._make_one(u'blob-name', bucket=_Bucket())
+        writer = blob.open('wt', encoding='utf-8')
+        self.assertIsInstance(writer, io.TextIOWrapper)
+        self.assertIsInstance(writer.buffer, BlobWriter)
+
+    def test_open_invalid(self):
+        blob = self._make_one(u'blob-name', bucket=_Bucket())
+
+        with self.assertRaises(ValueError):
+            blob.open('a')
+
+        with self.assertRaises(ValueError):
+            blob.open('rb', encoding='utf-8')
+
+        with self.assertRaises(ValueError):
+            blob.open('r', content_type=u'text/plain')
+
     def test_get_iam_policy(self):
         from google.cloud.storage.iam import STORAGE_OWNER_ROLE
         from google.cloud.storage.iam import STORAGE_EDITOR_ROLE
@@ -2863,6 +3488,181 @@ class Test_Blob(unittest.TestCase):
         self.assertIsNone(blob.updated)
 
 
+class TestBlobListItem(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.blob import BlobListItem
+
+        return BlobListItem
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_and_properties(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        bucket = _Bucket()
+        properties = {
+            'name': 'blob-name',
+            'contentType': 'text/plain',
+            'crc32c': 'CRC',
+            'etag': 'ETAG',
+            'generation': '12',
+            'md5Hash': 'MD5',
+            'metageneration': '3',
+            'metadata': {'foo': 'bar'},
+            'size': '1024',
+            'storageClass': 'NEARLINE',
+            'timeCreated': '2018-05-19T04:00:00.000Z',
+            'updated': '2018-05-20T04:00:00.000Z',
+        }
+        item = self._make_one(bucket, properties)
+
+        self.assertIs(item.bucket, bucket)
+        self.assertEqual(item.name, 'blob-name')
+        self.assertEqual(item.content_type, 'text/plain')
+        self.assertEqual(item.crc32c, 'CRC')
+        self.assertEqual(item.etag, 'ETAG')
+        self.assertEqual(item.generation, 12)
+        self.assertEqual(item.md5_hash, 'MD5')
+        self.assertEqual(item.metageneration, 3)
+        self.assertEqual(item.metadata, {'foo': 'bar'})
+        self.assertIsNot(item.metadata, properties['metadata'])
+        self.assertEqual(item.size, 1024)
+        self.assertEqual(item.storage_class, 'NEARLINE')
+        self.assertEqual(
+            item.time_created,
+            datetime.datetime(2018, 5, 19, 4, 0, 0, tzinfo=UTC))
+        self.assertEqual(
+            item.updated, datetime.datetime(2018, 5, 20, 4, 0, 0, tzinfo=UTC))
+        self.assertEqual(repr(item), '<BlobListItem: name, blob-name>')
+
+    def test_properties_unset(self):
+        item = self._make_one(_Bucket(), {'name': 'blob-name'})
+
+        self.assertIsNone(item.size)
+        self.assertIsNone(item.generation)
+        self.assertIsNone(item.updated)
+        self.assertIsNone(item.metadata)
+
+    def test_no_instance_dict(self):
+        item = self._make_one(_Bucket(), {'name': 'blob-name'})
+
+        self.assertFalse(hasattr(item, '__dict__'))
+        with self.assertRaises(AttributeError):
+            item.other = 1
+
+    def test_to_blob(self):
+        from google.cloud.storage.blob import Blob
+
+        bucket = _Bucket()
+        properties = {'name': 'blob-name', 'size': '7', 'metadata': {'a': 1}}
+        item = self._make_one(bucket, properties)
+
+        blob = item.to_blob()
+
+        self.assertIsInstance(blob, Blob)
+        self.assertIs(blob.bucket, bucket)
+        self.assertEqual(blob.name, 'blob-name')
+        self.assertEqual(blob.size, 7)
+        self.assertEqual(blob._properties, properties)
+        self.assertIsNot(blob._properties, properties)
+        self.assertIsNot(item.to_blob(), blob)
+
+
+class Test__slice_ranges(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(size, slices):
+        from google.cloud.storage.blob import _slice_ranges
+
+        return _slice_ranges(size, slices)
+
+    def test_even(self):
+        self.assertEqual(
+            self._call_fut(8, 4), [(0, 1), (2, 3), (4, 5), (6, 7)])
+
+    def test_uneven(self):
+        self.assertEqual(self._call_fut(10, 3), [(0, 3), (4, 7), (8, 9)])
+
+    def test_more_slices_than_bytes(self):
+        self.assertEqual(self._call_fut(2, 5), [(0, 0), (1, 1)])
+
+
+class Test__FileSlice(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args, **kw):
+        from google.cloud.storage.blob import _FileSlice
+
+        return _FileSlice(*args, **kw)
+
+    def test_read(self):
+        file_slice = self._make_one(io.BytesIO(b'0123456789'), 3, 4)
+
+        self.assertEqual(file_slice.tell(), 0)
+        self.assertEqual(file_slice.read(3), b'345')
+        self.assertEqual(file_slice.tell(), 3)
+        self.assertEqual(file_slice.read(3), b'6')
+        self.assertEqual(file_slice.read(), b'')
+
+    def test_read_all(self):
+        file_slice = self._make_one(io.BytesIO(b'0123456789'), 3, 4)
+
+        self.assertEqual(file_slice.read(), b'3456')
+
+    def test_seek(self):
+        file_slice = self._make_one(io.BytesIO(b'0123456789'), 3, 4)
+
+        self.assertEqual(file_slice.seek(2), 2)
+        self.assertEqual(file_slice.read(1), b'5')
+        self.assertEqual(file_slice.seek(-1, os.SEEK_CUR), 2)
+        self.assertEqual(file_slice.read(), b'56')
+        self.assertEqual(file_slice.seek(-3, os.SEEK_END), 1)
+        self.assertEqual(file_slice.read(1), b'4')
+
+
+class Test__ChecksumReader(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args, **kw):
+        from google.cloud.storage.blob import _ChecksumReader
+
+        return _ChecksumReader(*args, **kw)
+
+    def test_read_hashes_each_byte_once(self):
+        reader = self._make_one(io.BytesIO(b'0123456789'), hashlib.md5())
+
+        self.assertEqual(reader.read(4), b'0123')
+        self.assertEqual(reader.seek(2), 2)
+        self.assertEqual(reader.read(4), b'2345')
+        self.assertEqual(reader.tell(), 6)
+        self.assertEqual(reader.read(), b'6789')
+
+        expected = base64.b64encode(hashlib.md5(b'0123456789').digest())
+        self.assertEqual(reader.base64_digest(), expected.decode('ascii'))
+
+    def test_read_hashed_bytes_again(self):
+        reader = self._make_one(io.BytesIO(b'0123456789'), hashlib.md5())
+        self.assertEqual(reader.read(), b'0123456789')
+
+        # A retried request reads the stream again from an earlier position.
+        reader.seek(2)
+        self.assertEqual(reader.read(4), b'2345')
+
+        expected = base64.b64encode(hashlib.md5(b'0123456789').digest())
+        self.assertEqual(reader.base64_digest(), expected.decode('ascii'))
+
+    def test_read_after_skipping_bytes(self):
+        reader = self._make_one(io.BytesIO(b'0123456789'), hashlib.md5())
+        reader.seek(4, os.SEEK_CUR)
+
+        self.assertEqual(reader.read(), b'456789')
+        self.assertIsNone(reader.base64_digest())
+
+
 class Test__quote(unittest.TestCase):
 
     @staticmethod
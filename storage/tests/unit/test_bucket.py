@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+import threading
 import unittest
 
 import mock
@@ -31,6 +32,20 @@ def _create_signing_credentials():
     return credentials
 
 
+def _send_serially(client, items, send, max_workers=None):
+    from google.cloud.exceptions import GoogleCloudError
+
+    errors = []
+    for item in items:
+        try:
+            send(item)
+        except GoogleCloudError as exc:
+            errors.append(exc)
+        else:
+            errors.append(None)
+    return errors
+
+
 class Test_Bucket(unittest.TestCase):
 
     @staticmethod
@@ -465,10 +480,14 @@ class Test_Bucket(unittest.TestCase):
         VERSIONS = True
         PROJECTION = 'full'
         FIELDS = 'items/contentLanguage,nextPageToken'
+        START_OFFSET = 'subfolder/a'
+        END_OFFSET = 'subfolder/m'
         EXPECTED = {
             'maxResults': 10,
             'pageToken': PAGE_TOKEN,
             'prefix': PREFIX,
+            'startOffset': START_OFFSET,
+            'endOffset': END_OFFSET,
             'delimiter': DELIMITER,
             'versions': VERSIONS,
             'projection': PROJECTION,
@@ -487,6 +506,8 @@ class Test_Bucket(unittest.TestCase):
             projection=PROJECTION,
             fields=FIELDS,
             client=client,
+            start_offset=START_OFFSET,
+            end_offset=END_OFFSET,
         )
         blobs = list(iterator)
         self.assertEqual(blobs, [])
@@ -495,6 +516,20 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o' % NAME)
         self.assertEqual(kw['query_params'], EXPECTED)
 
+    def test_list_blobs_lightweight(self):
+        from google.cloud.storage.blob import BlobListItem
+
+        NAME = 'name'
+        ITEM = {'name': 'blob-name', 'size': '3'}
+        connection = _Connection({'items': [ITEM]})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        item, = list(bucket.list_blobs(lightweight=True))
+        self.assertIsInstance(item, BlobListItem)
+        self.assertIs(item.bucket, bucket)
+        self.assertIs(item._properties, ITEM)
+        self.assertEqual(item.size, 3)
+
     def test_list_blobs(self):
         NAME = 'name'
         connection = _Connection({'items': []})
@@ -508,6 +543,169 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o' % NAME)
         self.assertEqual(kw['query_params'], {'projection': 'noAcl'})
 
+    def _list_blobs_parallel_helper(self, names, **kw):
+        connection = _ListingConnection(names)
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+        blobs = list(bucket.list_blobs_parallel(**kw))
+        return connection, blobs
+
+    def test_list_blobs_parallel_w_split_points(self):
+        NAMES = ['a/1', 'a/2', 'a/3', 'b/1', 'c', 'd/1', 'd/2']
+        connection, blobs = self._list_blobs_parallel_helper(
+            NAMES, split_points=['d/', 'b/'], max_workers=2,
+            fields='name,size')
+
+        self.assertEqual([blob.name for blob in blobs], NAMES)
+        self.assertTrue(all(blob.bucket.name == 'name' for blob in blobs))
+        ranges = set(
+            (kw['query_params'].get('startOffset'),
+             kw['query_params'].get('endOffset'))
+            for kw in connection._requested)
+        self.assertEqual(
+            ranges, set([(None, 'b/'), ('b/', 'd/'), ('d/', None)]))
+        for kw in connection._requested:
+            self.assertEqual(
+                kw['query_params']['fields'],
+                'items(name,size),nextPageToken')
+            self.assertNotIn('delimiter', kw['query_params'])
+
+    def test_list_blobs_parallel_lightweight(self):
+        from google.cloud.storage.blob import BlobListItem
+
+        NAMES = ['a/1', 'b/1', 'b/2']
+        _, items = self._list_blobs_parallel_helper(
+            NAMES, lightweight=True, fields='name,size')
+
+        self.assertEqual([item.name for item in items], NAMES)
+        for item in items:
+            self.assertIsInstance(item, BlobListItem)
+            self.assertEqual(item.size, 1)
+
+    def test_list_blobs_parallel_discovers_split_points(self):
+        NAMES = ['p/a/1', 'p/a/2', 'p/b/1', 'p/c', 'q/1']
+        connection, blobs = self._list_blobs_parallel_helper(
+            NAMES, prefix='p/')
+
+        self.assertEqual(
+            [blob.name for blob in blobs], ['p/a/1', 'p/a/2', 'p/b/1', 'p/c'])
+        discovery = connection._requested[0]['query_params']
+        self.assertEqual(discovery['delimiter'], '/')
+        self.assertEqual(discovery['prefix'], 'p/')
+        self.assertEqual(discovery['fields'], 'prefixes,nextPageToken')
+        # There are fewer prefixes than workers, so they are listed too.
+        self.assertEqual(
+            [kw['query_params']['prefix']
+             for kw in connection._requested[1:3]],
+            ['p/a/', 'p/b/'])
+        ranges = set(
+            (kw['query_params'].get('startOffset'),
+             kw['query_params'].get('endOffset'))
+            for kw in connection._requested[3:])
+        self.assertEqual(
+            ranges, set([(None, 'p/a/'), ('p/a/', 'p/b/'), ('p/b/', None)]))
+
+    def test_list_blobs_parallel_unordered(self):
+        NAMES = ['a/%d' % (index,) for index in range(9)] + ['b/1', 'c/1']
+        _, blobs = self._list_blobs_parallel_helper(
+            NAMES, ordered=False, max_workers=3)
+
+        self.assertEqual(sorted(blob.name for blob in blobs), NAMES)
+
+    def test_list_blobs_parallel_w_error(self):
+        from google.cloud.exceptions import NotFound
+
+        connection = _ListingConnection(['a/1', 'b/1'])
+        connection._fail_offset = 'b/'
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+        iterator = bucket.list_blobs_parallel(split_points=['b/'])
+
+        self.assertEqual(next(iterator).name, 'a/1')
+        with self.assertRaises(NotFound):
+            next(iterator)
+
+    def test_list_blobs_parallel_stop_early(self):
+        import threading
+
+        NAMES = ['a/%d' % (index,) for index in range(40)]
+        connection = _ListingConnection(NAMES)
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+        threads_before = threading.active_count()
+        patch = mock.patch(
+            'google.cloud.storage.bucket._SHARD_QUEUE_TIMEOUT', new=0.01)
+
+        with patch:
+            iterator = bucket.list_blobs_parallel(split_points=[])
+            self.assertEqual(next(iterator).name, 'a/0')
+            iterator.close()
+            for _ in range(100):
+                if threading.active_count() <= threads_before:
+                    break
+                threading.Event().wait(0.01)
+
+        self.assertLessEqual(threading.active_count(), threads_before)
+        # Only a few pages are listed ahead of the consumer.
+        self.assertLess(len(connection._requested), len(NAMES) // 2)
+
+    def _discover_split_points_helper(self, names, max_workers):
+        connection = _ListingConnection(names)
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+
+        split_points = bucket._discover_split_points(
+            None, '/', max_workers, client)
+
+        return connection, split_points
+
+    def test__discover_split_points_merges_prefixes(self):
+        NAMES = ['%s/1' % (letter,) for letter in 'abcdefgh']
+
+        connection, split_points = self._discover_split_points_helper(
+            NAMES, 1)
+
+        self.assertEqual(split_points, ['c/', 'e/', 'g/'])
+        self.assertEqual(len(connection._requested), 1)
+
+    def test__discover_split_points_flat_namespace(self):
+        NAMES = ['%d' % (index,) for index in range(100)]
+
+        connection, split_points = self._discover_split_points_helper(
+            NAMES, 8)
+
+        self.assertEqual(split_points, [])
+        # Only the first page of names is read.
+        kw, = connection._requested
+        self.assertNotIn('pageToken', kw['query_params'])
+
+    def test__discover_split_points_single_prefix(self):
+        NAMES = ['top/%s/%d' % (letter, index)
+                 for letter in 'abcd' for index in range(10)]
+
+        connection, split_points = self._discover_split_points_helper(
+            NAMES, 4)
+
+        self.assertEqual(
+            split_points,
+            ['top/', 'top/a/', 'top/b/', 'top/c/', 'top/d/'])
+        self.assertEqual(
+            [kw['query_params'].get('prefix')
+             for kw in connection._requested],
+            [None, 'top/'])
+
+    def test__discover_split_points_max_depth(self):
+        from google.cloud.storage import bucket as bucket_module
+
+        NAMES = ['a/b/c/d/1']
+
+        with mock.patch.object(bucket_module, '_DISCOVERY_DEPTH', new=2):
+            connection, split_points = self._discover_split_points_helper(
+                NAMES, 8)
+
+        self.assertEqual(split_points, ['a/', 'a/b/'])
+        self.assertEqual(len(connection._requested), 2)
+
     def test_list_notifications(self):
         from google.cloud.storage.notification import BucketNotification
         from google.cloud.storage.notification import _TOPIC_REF_FMT
@@ -595,6 +793,8 @@ class Test_Bucket(unittest.TestCase):
         }]
         self.assertEqual(connection._deleted_buckets, expected_cw)
 
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
     def test_delete_force_delete_blobs(self):
         NAME = 'name'
         BLOB_NAME1 = 'blob-name1'
@@ -712,6 +912,8 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw[0]['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
         self.assertEqual(kw[0]['query_params'], {'userProject': USER_PROJECT})
 
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
     def test_delete_blobs_miss_no_on_error(self):
         from google.cloud.exceptions import NotFound
 
@@ -729,6 +931,8 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw[1]['method'], 'DELETE')
         self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
 
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
     def test_delete_blobs_miss_w_on_error(self):
         NAME = 'name'
         BLOB_NAME = 'blob-name'
@@ -746,6 +950,267 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw[1]['method'], 'DELETE')
         self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
 
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
+    def test_delete_blobs_miss_w_on_error_other_error(self):
+        from google.cloud.exceptions import Forbidden
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        NONESUCH = 'nonesuch'
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        errors = []
+        with mock.patch.object(
+                bucket, 'delete_blob',
+                side_effect=[Forbidden('denied'), None]) as delete_blob:
+            with self.assertRaises(Forbidden):
+                bucket.delete_blobs([BLOB_NAME, NONESUCH], errors.append)
+        self.assertEqual(errors, [])
+        self.assertEqual(delete_blob.call_count, 2)
+
+    def test_delete_blobs_w_max_workers(self):
+        NAME = 'name'
+        BLOB_NAMES = ['blob-name1', 'blob-name2']
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        patch = mock.patch(
+            'google.cloud.storage.bucket._send_in_batches',
+            return_value=[None, None])
+        with patch as send_in_batches:
+            bucket.delete_blobs(iter(BLOB_NAMES), max_workers=2)
+        send_in_batches.assert_called_once_with(
+            client, BLOB_NAMES, mock.ANY, 2)
+
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
+    def test_make_blobs_public_w_user_project(self):
+        from google.cloud.storage.acl import _ACLEntity
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        NONESUCH = 'nonesuch'
+        USER_PROJECT = 'user-project-123'
+        connection = _Connection({})
+        client = _Client(connection)
+        bucket = self._make_one(
+            client=client, name=NAME, user_project=USER_PROJECT)
+        blob = Blob(BLOB_NAME, bucket=bucket)
+        missing = Blob(NONESUCH, bucket=bucket)
+        blob.acl.loaded = True
+        errors = []
+        bucket.make_blobs_public([blob, missing], errors.append)
+        self.assertEqual(errors, [missing])
+        self.assertFalse(blob.acl.loaded)
+        kw = connection._requested
+        self.assertEqual(len(kw), 2)
+        self.assertEqual(kw[0], {
+            'method': 'POST',
+            'path': '/b/%s/o/%s/acl' % (NAME, BLOB_NAME),
+            'data': {'entity': 'allUsers', 'role': _ACLEntity.READER_ROLE},
+            'query_params': {'userProject': USER_PROJECT},
+            '_target_object': None,
+        })
+        self.assertEqual(
+            kw[1]['path'], '/b/%s/o/%s/acl' % (NAME, NONESUCH))
+
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
+    def test_make_blobs_public_wo_user_project(self):
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        connection = _Connection({})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        blob = Blob(BLOB_NAME, bucket=bucket)
+        bucket.make_blobs_public([blob])
+        kw, = connection._requested
+        self.assertEqual(kw['path'], '/b/%s/o/%s/acl' % (NAME, BLOB_NAME))
+        self.assertEqual(kw['query_params'], {})
+
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
+    def test_make_blobs_private_w_user_project(self):
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        USER_PROJECT = 'user-project-123'
+        connection = _Connection({})
+        client = _Client(connection)
+        bucket = self._make_one(
+            client=client, name=NAME, user_project=USER_PROJECT)
+        blob = Blob(BLOB_NAME, bucket=bucket)
+        blob.acl.loaded = True
+        bucket.make_blobs_private([blob])
+        self.assertFalse(blob.acl.loaded)
+        kw, = connection._requested
+        self.assertEqual(kw, {
+            'method': 'DELETE',
+            'path': '/b/%s/o/%s/acl/allUsers' % (NAME, BLOB_NAME),
+            'query_params': {'userProject': USER_PROJECT},
+            '_target_object': None,
+        })
+
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
+    def test_make_blobs_private_miss_no_on_error(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        NONESUCH = 'nonesuch'
+        connection = _Connection({})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        blob = Blob(BLOB_NAME, bucket=bucket)
+        missing = Blob(NONESUCH, bucket=bucket)
+        with self.assertRaises(NotFound):
+            bucket.make_blobs_private([blob, missing])
+        kw = connection._requested
+        self.assertEqual(len(kw), 2)
+        self.assertEqual(kw[0], {
+            'method': 'DELETE',
+            'path': '/b/%s/o/%s/acl/allUsers' % (NAME, BLOB_NAME),
+            'query_params': {},
+            '_target_object': None,
+        })
+        self.assertEqual(
+            kw[1]['path'], '/b/%s/o/%s/acl/allUsers' % (NAME, NONESUCH))
+
+    def test_update_blobs_storage_class_invalid(self):
+        from google.cloud.storage.blob import Blob
+
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+        blob = Blob('blob-name', bucket=bucket)
+        with self.assertRaises(ValueError):
+            bucket.update_blobs_storage_class([blob], 'BOGUS')
+        self.assertEqual(connection._requested, [])
+
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
+    def test_update_blobs_storage_class_w_rewrite_token(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        NONESUCH = 'nonesuch'
+        STORAGE_CLASS = 'NEARLINE'
+        TOKEN = 'TOKEN'
+        RESOURCE = {'name': BLOB_NAME, 'storageClass': STORAGE_CLASS}
+        connection = _Connection(
+            {'rewriteToken': TOKEN, 'done': False},
+            {'done': True, 'resource': RESOURCE})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        blob = Blob(BLOB_NAME, bucket=bucket)
+        missing = Blob(NONESUCH, bucket=bucket)
+        errors = []
+
+        def api_request(**kw):
+            if kw['path'].startswith(missing.path + '/'):
+                connection._requested.append(kw)
+                raise NotFound('miss')
+            return _Connection.api_request(connection, **kw)
+
+        connection.api_request = api_request
+        bucket.update_blobs_storage_class(
+            [blob, missing], STORAGE_CLASS, errors.append)
+
+        self.assertEqual(errors, [missing])
+        self.assertEqual(blob.storage_class, STORAGE_CLASS)
+        kw = connection._requested
+        self.assertEqual(len(kw), 3)
+        path = '/b/%s/o/%s' % (NAME, BLOB_NAME)
+        self.assertEqual(kw[0]['method'], 'POST')
+        self.assertEqual(kw[0]['path'], path + '/rewriteTo' + path)
+        self.assertEqual(kw[0]['query_params'], {})
+        self.assertEqual(kw[0]['data'], {'storageClass': STORAGE_CLASS})
+        self.assertEqual(kw[1]['path'], '/b/%s/o/%s/rewriteTo/b/%s/o/%s' % (
+            NAME, NONESUCH, NAME, NONESUCH))
+        self.assertEqual(kw[2]['path'], path + '/rewriteTo' + path)
+        self.assertEqual(kw[2]['query_params'], {'rewriteToken': TOKEN})
+
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
+    def test_update_blobs_storage_class_continue_fails(self):
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        STORAGE_CLASS = 'NEARLINE'
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        blobs = [
+            Blob(blob_name, bucket=bucket)
+            for blob_name in ('denied-1', 'denied-2', 'deleted', 'done')]
+        resource = {'name': 'done', 'storageClass': STORAGE_CLASS}
+        continuation_errors = {
+            'denied-1': Forbidden('denied 1'),
+            'denied-2': Forbidden('denied 2'),
+            'deleted': NotFound('deleted'),
+        }
+        errors = []
+
+        def api_request(**kw):
+            connection._requested.append(kw)
+            blob_name = kw['path'].split('/')[4]
+            if 'rewriteToken' not in kw['query_params']:
+                return {'rewriteToken': 'TOKEN', 'done': False}
+            if blob_name in continuation_errors:
+                raise continuation_errors[blob_name]
+            return {'done': True, 'resource': resource}
+
+        connection.api_request = api_request
+        with self.assertRaises(Forbidden) as exc_info:
+            bucket.update_blobs_storage_class(
+                blobs, STORAGE_CLASS, errors.append)
+
+        # The first error is raised once each rewrite has been continued.
+        self.assertIs(exc_info.exception, continuation_errors['denied-1'])
+        self.assertEqual(errors, [blobs[2]])
+        self.assertEqual(blobs[3].storage_class, STORAGE_CLASS)
+        self.assertEqual(len(connection._requested), 8)
+
+    @mock.patch('google.cloud.storage.bucket._send_in_batches',
+                new=_send_serially)
+    def test_patch_blobs_miss_w_on_error(self):
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        NONESUCH = 'nonesuch'
+        connection = _Connection({'name': BLOB_NAME, 'contentType': 'a/b'})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        blob = Blob(BLOB_NAME, bucket=bucket)
+        missing = Blob(NONESUCH, bucket=bucket)
+        blob.content_type = 'a/b'
+        missing.content_type = 'c/d'
+        errors = []
+        bucket.patch_blobs([blob, missing], errors.append)
+        self.assertEqual(errors, [missing])
+        self.assertEqual(blob.content_type, 'a/b')
+        self.assertEqual(blob._changes, set())
+        self.assertEqual(missing.content_type, 'c/d')
+        self.assertEqual(missing._changes, set(['contentType']))
+        kw = connection._requested
+        self.assertEqual(len(kw), 2)
+        self.assertEqual(kw[0]['method'], 'PATCH')
+        self.assertEqual(kw[0]['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
+        self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
+
     def test_copy_blobs_wo_name(self):
         SOURCE = 'source'
         DEST = 'dest'
@@ -1963,6 +2428,55 @@ class Test_Bucket(unittest.TestCase):
             bucket.generate_upload_policy([])
 
 
+class Test__put_page(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(shard_queue, page, stop):
+        from google.cloud.storage.bucket import _put_page
+
+        return _put_page(shard_queue, page, stop)
+
+    def test_w_room(self):
+        from six.moves import queue
+
+        shard_queue = queue.Queue(maxsize=1)
+
+        self.assertTrue(self._call_fut(shard_queue, 'page', threading.Event()))
+        self.assertEqual(shard_queue.get_nowait(), 'page')
+
+    def test_w_full_queue_retries(self):
+        from six.moves import queue
+
+        shard_queue = mock.Mock(spec=['put'])
+        shard_queue.put.side_effect = [queue.Full(), None]
+
+        with mock.patch(
+                'google.cloud.storage.bucket._SHARD_QUEUE_TIMEOUT', new=0.01):
+            self.assertTrue(
+                self._call_fut(shard_queue, 'page', threading.Event()))
+
+        self.assertEqual(
+            shard_queue.put.mock_calls,
+            [mock.call('page', timeout=0.01)] * 2)
+
+    def test_w_full_queue_stopped(self):
+        from six.moves import queue
+
+        shard_queue = queue.Queue(maxsize=1)
+        shard_queue.put('other')
+        stop = threading.Event()
+        timer = threading.Timer(0.05, stop.set)
+        timer.start()
+
+        with mock.patch(
+                'google.cloud.storage.bucket._SHARD_QUEUE_TIMEOUT', new=0.01):
+            self.assertFalse(self._call_fut(shard_queue, 'page', stop))
+
+        timer.join()
+        self.assertEqual(shard_queue.get_nowait(), 'other')
+        self.assertTrue(shard_queue.empty())
+
+
 class _Connection(object):
     _delete_bucket = False
 
@@ -1999,6 +2513,53 @@ class _Connection(object):
             return response
 
 
+class _ListingConnection(object):
+    """Serve object listings from a list of names, two items a page."""
+
+    _fail_offset = None
+
+    def __init__(self, names):
+        self._names = sorted(names)
+        self._requested = []
+        self._lock = threading.Lock()
+
+    def api_request(self, **kw):
+        from google.cloud.exceptions import NotFound
+
+        with self._lock:
+            self._requested.append(kw)
+        params = kw['query_params']
+        start = params.get('startOffset')
+        if start is not None and start == self._fail_offset:
+            raise NotFound('miss')
+
+        prefix = params.get('prefix', '')
+        end = params.get('endOffset')
+        delimiter = params.get('delimiter')
+        items, prefixes = [], set()
+        for name in self._names:
+            if not name.startswith(prefix):
+                continue
+            if start is not None and name < start:
+                continue
+            if end is not None and name >= end:
+                continue
+            rest = name[len(prefix):]
+            if delimiter is not None and delimiter in rest:
+                prefixes.add(
+                    prefix + rest[:rest.index(delimiter) + len(delimiter)])
+            else:
+                items.append({'name': name, 'size': '1'})
+
+        index = int(params.get('pageToken', 0))
+        response = {'items': items[index:index + 2]}
+        if prefixes:
+            response['prefixes'] = sorted(prefixes)
+        if index + 2 < len(items):
+            response['nextPageToken'] = str(index + 2)
+        return response
+
+
 class _Client(object):
 
     def __init__(self, connection, project=None):
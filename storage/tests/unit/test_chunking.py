@@ -0,0 +1,276 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import unittest
+
+import mock
+import requests
+
+
+_KB = 1024
+_MB = 1024 * 1024
+
+
+class TestUploadStats(unittest.TestCase):
+
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage.chunking import UploadStats
+
+        return UploadStats()
+
+    def test_empty(self):
+        stats = self._make_one()
+
+        self.assertEqual(stats.bytes_uploaded, 0)
+        self.assertIsNone(stats.throughput)
+        self.assertEqual(stats.error_rate, 0.0)
+        self.assertEqual(stats.to_dict(), {
+            'chunks': 0,
+            'bytes_uploaded': 0,
+            'seconds': 0,
+            'throughput': None,
+            'attempts': 0,
+            'errors': 0,
+            'error_rate': 0.0,
+            'min_chunk_size': 0,
+            'max_chunk_size': 0,
+        })
+
+    def test_to_dict(self):
+        stats = self._make_one()
+        stats.chunk_sizes = [4 * _MB, 2 * _MB]
+        stats.chunk_seconds = [1.0, 2.0]
+        stats.attempts = 4
+        stats.errors = 1
+
+        self.assertEqual(stats.to_dict(), {
+            'chunks': 2,
+            'bytes_uploaded': 6 * _MB,
+            'seconds': 3.0,
+            'throughput': 2 * _MB,
+            'attempts': 4,
+            'errors': 1,
+            'error_rate': 0.25,
+            'min_chunk_size': 2 * _MB,
+            'max_chunk_size': 4 * _MB,
+        })
+
+
+class TestAdaptiveChunkSizer(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args, **kw):
+        from google.cloud.storage.chunking import AdaptiveChunkSizer
+
+        return AdaptiveChunkSizer(*args, **kw)
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage import chunking
+
+        sizer = self._make_one()
+
+        self.assertEqual(
+            sizer.chunk_size, chunking.DEFAULT_INITIAL_CHUNK_SIZE)
+        self.assertEqual(sizer.min_size, 256 * _KB)
+        self.assertEqual(sizer.max_size, chunking.DEFAULT_MAX_CHUNK_SIZE)
+        self.assertEqual(sizer.stats.attempts, 0)
+
+    def test_ctor_w_bad_multiple(self):
+        with self.assertRaises(ValueError):
+            self._make_one(initial_size=300 * _KB)
+
+    def test_ctor_w_sizes_out_of_order(self):
+        with self.assertRaises(ValueError):
+            self._make_one(initial_size=8 * _MB, max_size=4 * _MB)
+
+    def test_start_resets_stats(self):
+        sizer = self._make_one(initial_size=_MB)
+        sizer.record_chunk(_MB, 1.0)
+
+        self.assertEqual(sizer.start(), 2 * _MB)
+        self.assertEqual(sizer.stats.chunk_sizes, [])
+
+    def test_record_chunk_grows_at_most_twice(self):
+        sizer = self._make_one(initial_size=_MB, target_seconds=5.0)
+
+        self.assertEqual(sizer.record_chunk(_MB, 0.1), 2 * _MB)
+        self.assertEqual(sizer.stats.chunk_sizes, [_MB])
+        self.assertEqual(sizer.stats.attempts, 1)
+
+    def test_record_chunk_targets_seconds(self):
+        sizer = self._make_one(initial_size=8 * _MB, target_seconds=2.0)
+
+        # 8 MB in 4 seconds is 2 MB/s, so 4 MB take 2 seconds.
+        self.assertEqual(sizer.record_chunk(8 * _MB, 4.0), 4 * _MB)
+
+    def test_record_chunk_rounds_and_clamps(self):
+        sizer = self._make_one(
+            initial_size=_MB, min_size=512 * _KB, max_size=3 * _MB,
+            target_seconds=1.0)
+
+        self.assertEqual(sizer.record_chunk(_MB, 100.0), 512 * _KB)
+        self.assertEqual(sizer.record_chunk(512 * _KB, 0.001), _MB)
+        self.assertEqual(sizer.record_chunk(_MB, 0.001), 2 * _MB)
+        self.assertEqual(sizer.record_chunk(2 * _MB, 0.001), 3 * _MB)
+
+    def test_record_chunk_wo_time(self):
+        sizer = self._make_one(initial_size=_MB)
+
+        self.assertEqual(sizer.record_chunk(_MB, 0.0), _MB)
+
+    def test_record_chunk_w_retries_halves(self):
+        sizer = self._make_one(initial_size=4 * _MB)
+
+        self.assertEqual(sizer.record_chunk(4 * _MB, 0.1, attempts=3), 2 * _MB)
+        self.assertEqual(sizer.stats.attempts, 3)
+        self.assertEqual(sizer.stats.errors, 2)
+
+    def test_record_chunk_scaled_by_error_rate(self):
+        sizer = self._make_one(initial_size=4 * _MB, target_seconds=1.0)
+        sizer.record_failure()
+
+        # 2 MB/s for one second, halved by one error in two attempts.
+        self.assertEqual(sizer.record_chunk(2 * _MB, 1.0), _MB)
+
+    def test_record_failure(self):
+        sizer = self._make_one(initial_size=512 * _KB)
+
+        self.assertEqual(sizer.record_failure(attempts=2), 256 * _KB)
+        self.assertEqual(sizer.record_failure(), 256 * _KB)
+        self.assertEqual(sizer.stats.attempts, 3)
+        self.assertEqual(sizer.stats.errors, 3)
+
+
+class _Upload(object):
+    """Fake resumable upload, sending chunks according to ``outcomes``.
+
+    Each outcome is a pair of the number of retried requests for a chunk
+    and the exception the chunk raises, if any.
+    """
+
+    def __init__(self, total_bytes, outcomes=()):
+        self._total_bytes = total_bytes
+        self._outcomes = list(outcomes)
+        self._chunk_size = None
+        self.bytes_uploaded = 0
+        self.chunk_sizes = []
+        self.invalid = False
+        self.recovered = 0
+
+    @property
+    def finished(self):
+        return self.bytes_uploaded >= self._total_bytes
+
+    def transmit_next_chunk(self, transport):
+        self.chunk_sizes.append(self._chunk_size)
+        retries, error = (0, None)
+        if self._outcomes:
+            retries, error = self._outcomes.pop(0)
+        for _ in range(retries + 1):
+            transport.request('PUT', 'http://test.invalid')
+        if error is not None:
+            raise error
+        self.bytes_uploaded = min(
+            self._total_bytes, self.bytes_uploaded + self._chunk_size)
+        return self.bytes_uploaded
+
+    def _make_invalid(self):
+        self.invalid = True
+
+    def recover(self, transport):
+        assert self.invalid
+        self.invalid = False
+        self.recovered += 1
+
+
+class Test__transmit_chunks(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(upload, transport, sizer):
+        from google.cloud.storage.chunking import _transmit_chunks
+
+        # Each chunk takes one second.
+        clock = itertools.count()
+        with mock.patch('time.time', new=lambda: next(clock)):
+            return _transmit_chunks(upload, transport, sizer)
+
+    @staticmethod
+    def _make_sizer(**kw):
+        from google.cloud.storage.chunking import AdaptiveChunkSizer
+
+        kw.setdefault('initial_size', _MB)
+        kw.setdefault('target_seconds', 100.0)
+        return AdaptiveChunkSizer(**kw)
+
+    def test_grows_chunks(self):
+        upload = _Upload(8 * _MB)
+        transport = mock.Mock(spec=['request'])
+        sizer = self._make_sizer()
+
+        response = self._call_fut(upload, transport, sizer)
+
+        self.assertEqual(response, 8 * _MB)
+        self.assertEqual(upload.chunk_sizes, [_MB, 2 * _MB, 4 * _MB, 8 * _MB])
+        self.assertEqual(sizer.stats.chunk_sizes, [_MB, 2 * _MB, 4 * _MB, _MB])
+        self.assertEqual(sizer.stats.chunk_seconds, [1, 1, 1, 1])
+        self.assertEqual(transport.request.call_count, 4)
+
+    def test_shrinks_chunks_after_retries(self):
+        upload = _Upload(4 * _MB, outcomes=[(0, None), (2, None)])
+        transport = mock.Mock(spec=['request'])
+        sizer = self._make_sizer(initial_size=2 * _MB)
+
+        self._call_fut(upload, transport, sizer)
+
+        self.assertEqual(upload.chunk_sizes, [2 * _MB, 4 * _MB])
+        self.assertEqual(sizer.chunk_size, 2 * _MB)
+        self.assertEqual(sizer.stats.attempts, 4)
+        self.assertEqual(sizer.stats.errors, 2)
+
+    def test_recovers_from_dropped_connection(self):
+        error = requests.exceptions.ConnectionError('reset')
+        upload = _Upload(2 * _MB, outcomes=[(0, error), (0, error)])
+        transport = mock.Mock(spec=['request'])
+        sizer = self._make_sizer(initial_size=2 * _MB)
+
+        self._call_fut(upload, transport, sizer)
+
+        self.assertEqual(upload.recovered, 2)
+        self.assertEqual(
+            upload.chunk_sizes, [2 * _MB, _MB, 512 * _KB, _MB, 2 * _MB])
+        self.assertEqual(sizer.stats.errors, 2)
+        self.assertEqual(sizer.stats.attempts, 5)
+
+    def test_gives_up_after_consecutive_errors(self):
+        error = requests.exceptions.ConnectionError('reset')
+        upload = _Upload(2 * _MB, outcomes=[(0, error)] * 3)
+        transport = mock.Mock(spec=['request'])
+        sizer = self._make_sizer(max_consecutive_errors=2)
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self._call_fut(upload, transport, sizer)
+
+        self.assertEqual(upload.recovered, 2)
+        self.assertEqual(sizer.stats.errors, 3)
+
+    def test_other_errors_propagate(self):
+        upload = _Upload(2 * _MB, outcomes=[(0, ValueError('bad'))])
+        transport = mock.Mock(spec=['request'])
+
+        with self.assertRaises(ValueError):
+            self._call_fut(upload, transport, self._make_sizer())
+
+        self.assertEqual(upload.recovered, 0)
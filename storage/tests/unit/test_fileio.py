@@ -0,0 +1,424 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+
+import mock
+from six.moves import http_client
+
+_CHUNK_SIZE = 262144
+
+
+def _make_reader_blob(data, size=None, generation=1):
+    """Make a blob whose ranged downloads are served from ``data``."""
+    blob = mock.Mock(spec=[
+        'chunk_size', 'download_to_file', 'generation', 'reload', 'size'])
+    blob.chunk_size = None
+    blob.generation = generation
+    blob.size = size
+
+    def download_to_file(file_obj, client=None, start=None, end=None):
+        from google.cloud.exceptions import RequestRangeNotSatisfiable
+
+        if start >= len(data):
+            raise RequestRangeNotSatisfiable('past the end')
+        stop = len(data) if end is None else end + 1
+        file_obj.write(data[start:stop])
+
+    def reload(client=None):
+        blob.generation = 1
+        blob.size = len(data)
+
+    blob.download_to_file.side_effect = download_to_file
+    blob.reload.side_effect = reload
+    return blob
+
+
+def _make_response(status_code, headers, content=b''):
+    import requests
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = content
+    response.request = requests.Request(
+        'PUT', 'http://example.com').prepare()
+    return response
+
+
+class TestBlobReader(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobReader
+
+        return BlobReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.fileio import DEFAULT_CHUNK_SIZE
+
+        blob = _make_reader_blob(b'')
+        reader = self._make_one(blob)
+        self.assertIs(reader._blob, blob)
+        self.assertEqual(reader._chunk_size, DEFAULT_CHUNK_SIZE)
+        self.assertIsNone(reader._client)
+        self.assertTrue(reader.readable())
+        self.assertTrue(reader.seekable())
+        self.assertFalse(reader.writable())
+        self.assertEqual(reader.tell(), 0)
+
+    def test_ctor_w_blob_chunk_size(self):
+        blob = _make_reader_blob(b'')
+        blob.chunk_size = 2 * _CHUNK_SIZE
+        reader = self._make_one(blob)
+        self.assertEqual(reader._chunk_size, 2 * _CHUNK_SIZE)
+
+    def test_read_w_read_ahead(self):
+        client = object()
+        blob = _make_reader_blob(b'abcdefghij')
+        reader = self._make_one(blob, chunk_size=4, client=client)
+
+        self.assertEqual(reader.read(1), b'a')
+        self.assertEqual(reader.read(2), b'bc')
+        self.assertEqual(reader.read(3), b'def')
+        self.assertEqual(reader.read(), b'ghij')
+        self.assertEqual(reader.read(), b'')
+        self.assertEqual(reader.tell(), 10)
+
+        calls = blob.download_to_file.call_args_list
+        self.assertEqual(
+            [(call[1]['start'], call[1]['end']) for call in calls],
+            [(0, 3), (4, 7), (8, None), (10, None)])
+        for call in calls:
+            self.assertIs(call[1]['client'], client)
+
+    def test_read_w_size_known(self):
+        blob = _make_reader_blob(b'abcdef', size=6)
+        reader = self._make_one(blob, chunk_size=4)
+
+        self.assertEqual(reader.read(5), b'abcde')
+        self.assertEqual(reader.read(5), b'f')
+        self.assertEqual(reader.read(5), b'')
+
+        calls = blob.download_to_file.call_args_list
+        self.assertEqual(
+            [(call[1]['start'], call[1]['end']) for call in calls],
+            [(0, 4), (5, 5)])
+
+    def test_seek_keeps_buffer(self):
+        blob = _make_reader_blob(b'abcdefghij')
+        reader = self._make_one(blob, chunk_size=8)
+
+        self.assertEqual(reader.read(2), b'ab')
+        self.assertEqual(reader.seek(1), 1)
+        self.assertEqual(reader.read(3), b'bcd')
+        self.assertEqual(reader.seek(2, io.SEEK_CUR), 6)
+        self.assertEqual(reader.read(2), b'gh')
+        self.assertEqual(blob.download_to_file.call_count, 1)
+
+    def test_seek_from_end_loads_size(self):
+        blob = _make_reader_blob(b'abcdefghij')
+        reader = self._make_one(blob, chunk_size=4)
+
+        self.assertEqual(reader.seek(-3, io.SEEK_END), 7)
+        self.assertEqual(reader.read(), b'hij')
+        blob.reload.assert_called_once_with(client=None)
+
+    def test_seek_from_end_w_size_known(self):
+        blob = _make_reader_blob(b'abcdefghij', size=10)
+        reader = self._make_one(blob, chunk_size=4)
+
+        self.assertEqual(reader.seek(-3, io.SEEK_END), 7)
+        blob.reload.assert_not_called()
+
+    def test_read_loads_generation(self):
+        client = object()
+        blob = _make_reader_blob(b'abcdefghij', generation=None)
+        reader = self._make_one(blob, chunk_size=4, client=client)
+
+        self.assertEqual(reader.read(5), b'abcde')
+        self.assertEqual(reader.read(), b'fghij')
+        blob.reload.assert_called_once_with(client=client)
+
+    def test_read_pins_generation_in_download_url(self):
+        from google.cloud.storage.blob import Blob
+
+        data = b'abcdefghij'
+        bucket = mock.Mock(
+            path='/b/name', user_project=None,
+            spec=['client', 'path', 'user_project'])
+        blob = Blob('blob-name', bucket=bucket)
+        client = mock.Mock(_http=object(), spec=['_http'])
+
+        def reload(client=None):
+            blob._set_properties({'generation': '1234', 'size': '10'})
+
+        def do_download(transport, file_obj, download_url, headers,
+                        start=None, end=None, checksum=None):
+            stop = len(data) if end is None else end + 1
+            file_obj.write(data[start:stop])
+
+        reader = self._make_one(blob, chunk_size=4, client=client)
+        patch_reload = mock.patch.object(blob, 'reload', side_effect=reload)
+        patch_download = mock.patch.object(
+            blob, '_do_download', side_effect=do_download)
+        with patch_reload as reload_mock, patch_download as download_mock:
+            self.assertEqual(reader.read(2), b'ab')
+            reader.seek(6)
+            self.assertEqual(reader.read(), b'ghij')
+
+        reload_mock.assert_called_once_with(client=client)
+        urls = [call[0][2] for call in download_mock.call_args_list]
+        self.assertEqual(len(urls), 2)
+        for url in urls:
+            self.assertIn('generation=1234', url)
+
+    def test_seek_invalid(self):
+        reader = self._make_one(_make_reader_blob(b'abc'))
+
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+
+        with self.assertRaises(ValueError):
+            reader.seek(0, 42)
+
+    def test_readinto_small(self):
+        blob = _make_reader_blob(b'abcdefghij')
+        reader = self._make_one(blob, chunk_size=4)
+        buffer_ = bytearray(3)
+
+        self.assertEqual(reader.readinto(buffer_), 3)
+        self.assertEqual(buffer_, bytearray(b'abc'))
+        self.assertEqual(reader.read(1), b'd')
+        self.assertEqual(blob.download_to_file.call_count, 1)
+
+    def test_readinto_direct(self):
+        blob = _make_reader_blob(b'abcdefghij')
+        reader = self._make_one(blob, chunk_size=4)
+        reader.seek(3)
+        buffer_ = bytearray(8)
+
+        self.assertEqual(reader.readinto(buffer_), 7)
+        self.assertEqual(buffer_, bytearray(b'defghij\x00'))
+        self.assertEqual(reader.tell(), 10)
+        self.assertEqual(reader._buffer, b'')
+
+        call = blob.download_to_file.call_args
+        self.assertEqual((call[1]['start'], call[1]['end']), (3, 10))
+
+    def test_readinto_direct_w_too_many_bytes(self):
+        blob = _make_reader_blob(b'abcdefghij')
+        reader = self._make_one(blob, chunk_size=4)
+        buffer_ = bytearray(5)
+
+        def download_to_file(file_obj, client=None, start=None, end=None):
+            # The range is ignored, and the whole blob is sent.
+            file_obj.write(b'abcdefghij')
+
+        blob.download_to_file.side_effect = download_to_file
+        with self.assertRaises(ValueError) as exc_info:
+            reader.readinto(buffer_)
+
+        self.assertIn('more bytes', exc_info.exception.args[0])
+        self.assertEqual(buffer_, bytearray(5))
+        self.assertEqual(reader.tell(), 0)
+
+    def test_close(self):
+        reader = self._make_one(_make_reader_blob(b'abc'))
+        reader.read(1)
+        reader.close()
+
+        self.assertTrue(reader.closed)
+        self.assertEqual(reader._buffer, b'')
+        with self.assertRaises(ValueError):
+            reader.read()
+        with self.assertRaises(ValueError):
+            reader.tell()
+
+
+class TestBlobWriter(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobWriter
+
+        return BlobWriter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_blob(chunk_size=None):
+        from google.cloud.storage.blob import Blob
+
+        bucket = mock.Mock(path='/b/name', user_project=None, spec=[
+            'path', 'user_project'])
+        return Blob(u'blob-name', bucket, chunk_size=chunk_size)
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.fileio import DEFAULT_CHUNK_SIZE
+
+        blob = self._make_blob()
+        writer = self._make_one(blob)
+        self.assertIs(writer._blob, blob)
+        self.assertEqual(writer._chunk_size, DEFAULT_CHUNK_SIZE)
+        self.assertIsNone(writer._upload)
+        self.assertTrue(writer.writable())
+        self.assertFalse(writer.readable())
+        self.assertEqual(writer.tell(), 0)
+
+    def test_ctor_w_blob_chunk_size(self):
+        blob = self._make_blob(chunk_size=2 * _CHUNK_SIZE)
+        writer = self._make_one(blob)
+        self.assertEqual(writer._chunk_size, 2 * _CHUNK_SIZE)
+
+    def test_ctor_invalid_chunk_size(self):
+        blob = self._make_blob()
+        with self.assertRaises(ValueError):
+            self._make_one(blob, chunk_size=_CHUNK_SIZE + 1)
+
+    def test_write_and_close(self):
+        from google import resumable_media
+
+        blob = self._make_blob()
+        data = b'A' * _CHUNK_SIZE + b'B' * 10
+        resumable_url = 'http://test.invalid?upload_id=id'
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = [
+            _make_response(http_client.OK, {'location': resumable_url}),
+            _make_response(
+                resumable_media.PERMANENT_REDIRECT,
+                {'range': 'bytes=0-{:d}'.format(_CHUNK_SIZE - 1)}),
+            _make_response(
+                http_client.OK, {},
+                content=b'{"size": "262154", "name": "blob-name"}'),
+        ]
+        client = mock.Mock(_http=transport, spec=['_http'])
+        writer = self._make_one(
+            blob, chunk_size=_CHUNK_SIZE, client=client,
+            content_type=u'text/plain')
+
+        writer.write(data[:10])
+        self.assertIsNone(writer._upload)
+        writer.write(data[10:])
+        self.assertEqual(transport.request.call_count, 2)
+        self.assertEqual(writer.tell(), len(data))
+        # Only the bytes of the last, partial chunk are kept.
+        self.assertEqual(writer._buffer._start, _CHUNK_SIZE)
+        self.assertEqual(writer._buffer.read(), b'B' * 10)
+        writer._buffer.seek(_CHUNK_SIZE)
+
+        writer.close()
+
+        self.assertTrue(writer.closed)
+        self.assertEqual(blob.size, len(data))
+        self.assertEqual(transport.request.call_count, 3)
+        initiate, chunk1, chunk2 = transport.request.call_args_list
+        self.assertEqual(
+            initiate[1]['headers']['x-upload-content-type'], u'text/plain')
+        self.assertEqual(chunk1[1]['data'], data[:_CHUNK_SIZE])
+        self.assertEqual(
+            chunk1[1]['headers']['content-range'],
+            'bytes 0-{:d}/*'.format(_CHUNK_SIZE - 1))
+        self.assertEqual(chunk2[1]['data'], b'B' * 10)
+        self.assertEqual(
+            chunk2[1]['headers']['content-range'],
+            'bytes {:d}-{:d}/{:d}'.format(
+                _CHUNK_SIZE, len(data) - 1, len(data)))
+
+        # Closing again does nothing.
+        writer.close()
+        self.assertEqual(transport.request.call_count, 3)
+        with self.assertRaises(ValueError):
+            writer.write(b'more')
+
+    def test_close_empty(self):
+        blob = self._make_blob()
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = [
+            _make_response(
+                http_client.OK, {'location': 'http://test.invalid'}),
+            _make_response(http_client.OK, {}, content=b'{"size": "0"}'),
+        ]
+        client = mock.Mock(_http=transport, spec=['_http'])
+        writer = self._make_one(blob, client=client)
+
+        writer.close()
+
+        self.assertEqual(blob.size, 0)
+        chunk = transport.request.call_args_list[1]
+        self.assertEqual(chunk[1]['headers']['content-range'], 'bytes */0')
+
+    def test_close_w_error(self):
+        from google.cloud.exceptions import Forbidden
+
+        blob = self._make_blob()
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = [
+            _make_response(http_client.FORBIDDEN, {}, content=b'denied'),
+        ]
+        client = mock.Mock(_http=transport, spec=['_http'])
+        writer = self._make_one(blob, client=client)
+        writer.write(b'data')
+
+        with self.assertRaises(Forbidden):
+            writer.close()
+
+        self.assertTrue(writer.closed)
+
+
+class Test_SlidingBuffer(unittest.TestCase):
+
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage.fileio import _SlidingBuffer
+
+        return _SlidingBuffer()
+
+    def test_write_read_discard(self):
+        buffer_ = self._make_one()
+        self.assertEqual(buffer_.write(b'abcdef'), 6)
+        self.assertEqual(buffer_.tell(), 0)
+        self.assertEqual(buffer_.read(4), b'abcd')
+        self.assertEqual(buffer_.unread, 2)
+
+        buffer_.discard(3)
+        self.assertEqual(buffer_.tell(), 4)
+        self.assertEqual(buffer_.size, 6)
+        self.assertEqual(buffer_.seek(3), 3)
+        self.assertEqual(buffer_.read(), b'def')
+
+        buffer_.write(b'gh')
+        self.assertEqual(buffer_.read(), b'gh')
+        self.assertEqual(buffer_.seek(0, io.SEEK_END), 8)
+
+    def test_discard_past_end(self):
+        buffer_ = self._make_one()
+        buffer_.write(b'abc')
+        buffer_.discard(10)
+        self.assertEqual(buffer_.size, 3)
+        self.assertEqual(buffer_.tell(), 3)
+        buffer_.discard(1)
+        self.assertEqual(buffer_.tell(), 3)
+
+    def test_seek_before_discarded(self):
+        buffer_ = self._make_one()
+        buffer_.write(b'abc')
+        buffer_.discard(2)
+        with self.assertRaises(ValueError):
+            buffer_.seek(1)
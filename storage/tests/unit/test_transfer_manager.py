@@ -0,0 +1,248 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_bucket(transfer, client=None):
+    """Make a bucket whose blobs run ``transfer(blob_name, filename)``."""
+    bucket = mock.Mock(
+        spec=['_require_client', 'blob', 'client', 'name', 'user_project'])
+    bucket.name = 'bucket-name'
+    bucket.user_project = None
+    bucket.client = client
+    bucket._require_client.return_value = client
+
+    def make_blob(blob_name):
+        blob = mock.Mock(
+            spec=['download_to_filename', 'upload_from_filename'])
+        blob.upload_from_filename.side_effect = (
+            lambda filename: transfer(blob_name, filename))
+        blob.download_to_filename.side_effect = (
+            lambda filename: transfer(blob_name, filename))
+        return blob
+
+    bucket.blob.side_effect = make_blob
+    return bucket
+
+
+def _make_client(project='project'):
+    client = mock.Mock(_http=mock.Mock(spec=[]), spec=['_http', 'project'])
+    client.project = project
+    return client
+
+
+class Test_upload_many_from_filenames(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import (
+            upload_many_from_filenames)
+
+        return upload_many_from_filenames(*args, **kwargs)
+
+    def test_success(self):
+        from google.cloud.storage.transfer_manager import TransferResult
+
+        uploaded = []
+        bucket = _make_bucket(
+            lambda blob_name, filename: uploaded.append(
+                (filename, blob_name)),
+            client=_make_client())
+        pairs = [('file-{}'.format(i), 'blob-{}'.format(i))
+                 for i in range(20)]
+        progress = []
+
+        results = self._call_fut(
+            bucket, iter(pairs), max_workers=4,
+            progress_callback=progress.append)
+
+        self.assertEqual(
+            results, [TransferResult(filename, blob_name, None)
+                      for filename, blob_name in pairs])
+        self.assertEqual(sorted(uploaded), sorted(pairs))
+        self.assertEqual(sorted(progress), sorted(results))
+
+    def test_errors_do_not_stop_other_transfers(self):
+        from google.cloud.exceptions import NotFound
+
+        error = NotFound('missing')
+
+        def transfer(blob_name, filename):
+            if blob_name == 'blob-1':
+                raise error
+
+        bucket = _make_bucket(transfer, client=_make_client())
+        pairs = [('file-0', 'blob-0'), ('file-1', 'blob-1'),
+                 ('file-2', 'blob-2')]
+
+        results = self._call_fut(bucket, pairs, retry=None)
+
+        self.assertEqual(
+            [result.error for result in results], [None, error, None])
+
+    def test_retries_transient_errors(self):
+        from google.api_core import retry as retries
+        from google.cloud.exceptions import ServiceUnavailable
+        from google.cloud.storage.transfer_manager import _should_retry
+
+        attempts = []
+
+        def transfer(blob_name, filename):
+            attempts.append(blob_name)
+            if len(attempts) < 3:
+                raise ServiceUnavailable('try again')
+
+        bucket = _make_bucket(transfer, client=_make_client())
+        retry = retries.Retry(predicate=_should_retry, initial=0.0)
+
+        results = self._call_fut(
+            bucket, [('file', 'blob')], retry=retry)
+
+        self.assertIsNone(results[0].error)
+        self.assertEqual(attempts, ['blob'] * 3)
+
+    def test_w_process_workers(self):
+        from concurrent import futures
+
+        uploaded = []
+        bucket = _make_bucket(
+            lambda blob_name, filename: uploaded.append(
+                (filename, blob_name)))
+        bucket.client = _make_client()
+        client = mock.Mock(spec=['bucket'])
+        client.bucket.return_value = bucket
+
+        executor_patch = mock.patch(
+            'google.cloud.storage.transfer_manager.futures.'
+            'ProcessPoolExecutor', new=futures.ThreadPoolExecutor)
+        client_patch = mock.patch(
+            'google.cloud.storage.client.Client', return_value=client)
+        clients_patch = mock.patch.dict(
+            'google.cloud.storage.transfer_manager._PROCESS_CLIENTS')
+        with executor_patch, client_patch as client_class, clients_patch:
+            results = self._call_fut(
+                bucket, [('file-0', 'blob-0'), ('file-1', 'blob-1')],
+                max_workers=1, worker_type='process')
+
+        self.assertEqual([result.error for result in results], [None, None])
+        self.assertEqual(
+            uploaded, [('file-0', 'blob-0'), ('file-1', 'blob-1')])
+        client_class.assert_called_once_with(project='project')
+        client.bucket.assert_called_with('bucket-name', user_project=None)
+        bucket._require_client.assert_not_called()
+
+    def test_w_invalid_worker_type(self):
+        bucket = _make_bucket(None, client=_make_client())
+
+        with self.assertRaises(ValueError):
+            self._call_fut(bucket, [], worker_type='fiber')
+
+
+class Test_download_many_to_filenames(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import (
+            download_many_to_filenames)
+
+        return download_many_to_filenames(*args, **kwargs)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_creates_directories(self):
+        def transfer(blob_name, filename):
+            with open(filename, 'w') as file_obj:
+                file_obj.write(blob_name)
+
+        bucket = _make_bucket(transfer, client=_make_client())
+        pairs = [
+            (os.path.join(self.directory, 'a', 'b', 'c'), 'a/b/c'),
+            (os.path.join(self.directory, 'a', 'd'), 'a/d'),
+            (os.path.join(self.directory, 'e'), 'e'),
+        ]
+
+        results = self._call_fut(bucket, pairs)
+
+        self.assertEqual([result.error for result in results], [None] * 3)
+        for filename, blob_name in pairs:
+            with open(filename) as file_obj:
+                self.assertEqual(file_obj.read(), blob_name)
+
+    def test_directory_error(self):
+        blocker = os.path.join(self.directory, 'file')
+        with open(blocker, 'w'):
+            pass
+        transfer = mock.Mock()
+        bucket = _make_bucket(transfer, client=_make_client())
+
+        results = self._call_fut(
+            bucket, [(os.path.join(blocker, 'child'), 'child')])
+
+        self.assertIsInstance(results[0].error, OSError)
+        transfer.assert_not_called()
+
+    def test_wo_directory(self):
+        transfer = mock.Mock()
+        bucket = _make_bucket(transfer, client=_make_client())
+        makedirs_patch = mock.patch('os.makedirs')
+
+        with makedirs_patch as makedirs:
+            results = self._call_fut(bucket, [('blob.txt', 'blob')])
+
+        self.assertIsNone(results[0].error)
+        makedirs.assert_not_called()
+        transfer.assert_called_once_with('blob', 'blob.txt')
+
+
+class Test__ensure_pool_size(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import _ensure_pool_size
+
+        return _ensure_pool_size(*args, **kwargs)
+
+    def test_grows_pool(self):
+        import requests
+
+        session = requests.Session()
+        adapter = session.adapters['https://']
+
+        self._call_fut(session, 32)
+
+        grown = session.adapters['https://']
+        self.assertIsNot(grown, adapter)
+        self.assertEqual(grown._pool_maxsize, 32)
+        self.assertIs(grown.max_retries, adapter.max_retries)
+
+    def test_keeps_large_enough_pool(self):
+        import requests
+
+        session = requests.Session()
+        adapter = session.adapters['https://']
+
+        self._call_fut(session, 4)
+
+        self.assertIs(session.adapters['https://'], adapter)
+
+    def test_w_other_transport(self):
+        self._call_fut(mock.Mock(spec=[]), 32)